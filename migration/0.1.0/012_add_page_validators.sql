@@ -0,0 +1,26 @@
+-- =====================================================
+-- Add HTTP validators and content hashes to archon_page_metadata
+-- =====================================================
+-- This migration enables incremental recrawls. Each page records the
+-- ETag / Last-Modified headers and a SHA-256 hash of its content at
+-- crawl time, so a refresh can issue conditional requests and only
+-- re-chunk and re-embed pages whose content actually changed.
+-- =====================================================
+
+ALTER TABLE archon_page_metadata
+ADD COLUMN IF NOT EXISTS content_hash TEXT,
+ADD COLUMN IF NOT EXISTS etag TEXT,
+ADD COLUMN IF NOT EXISTS last_modified TEXT;
+
+COMMENT ON COLUMN archon_page_metadata.content_hash IS 'SHA-256 hash of full_content, used to skip unchanged pages on refresh';
+COMMENT ON COLUMN archon_page_metadata.etag IS 'ETag response header recorded at crawl time';
+COMMENT ON COLUMN archon_page_metadata.last_modified IS 'Last-Modified response header recorded at crawl time';
+
+-- Record migration application for tracking
+INSERT INTO archon_migrations (version, migration_name)
+VALUES ('0.1.0', '012_add_page_validators')
+ON CONFLICT (version, migration_name) DO NOTHING;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
@@ -0,0 +1,39 @@
+-- =====================================================
+-- Add grouped task count function
+-- =====================================================
+-- The task-counts endpoint used to download (project_id, status) for
+-- every non-archived task and count them in Python. This function does
+-- the aggregation in Postgres and returns one row per (project, status),
+-- backed by a partial index over active tasks.
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_archon_tasks_active_project_status
+ON archon_tasks(project_id, status)
+WHERE archived IS NOT TRUE;
+
+CREATE OR REPLACE FUNCTION get_project_task_counts()
+RETURNS TABLE (
+    project_id UUID,
+    status TEXT,
+    task_count BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT t.project_id, t.status::TEXT, COUNT(*) AS task_count
+    FROM archon_tasks t
+    WHERE t.archived IS NOT TRUE
+      AND t.project_id IS NOT NULL
+    GROUP BY t.project_id, t.status;
+$$;
+
+COMMENT ON FUNCTION get_project_task_counts() IS 'Non-archived task counts grouped by project and status';
+
+-- Record migration application for tracking
+INSERT INTO archon_migrations (version, migration_name)
+VALUES ('0.1.0', '013_add_task_count_function')
+ON CONFLICT (version, migration_name) DO NOTHING;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
@@ -0,0 +1,47 @@
+-- =====================================================
+-- Add task order rebalancing function
+-- =====================================================
+-- task_order is treated as a sparse rank key: inserts and moves pick a
+-- value between their neighbours and write a single row. When a column
+-- runs out of gaps, the server calls this function to respace its keys
+-- in one statement instead of issuing one UPDATE per task.
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_archon_tasks_project_status_order
+ON archon_tasks(project_id, status, task_order);
+
+CREATE OR REPLACE FUNCTION rebalance_task_order(
+    project_id_param UUID,
+    status_param TEXT,
+    step_param INTEGER DEFAULT 1000
+)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+    WITH ranked AS (
+        SELECT id, (ROW_NUMBER() OVER (ORDER BY task_order, created_at, id) * step_param)::INTEGER AS new_order
+        FROM archon_tasks
+        WHERE project_id = project_id_param
+          AND status::TEXT = status_param
+    ),
+    updated AS (
+        UPDATE archon_tasks t
+        SET task_order = r.new_order
+        FROM ranked r
+        WHERE t.id = r.id
+          AND t.task_order IS DISTINCT FROM r.new_order
+        RETURNING 1
+    )
+    SELECT COUNT(*)::INTEGER FROM updated;
+$$;
+
+COMMENT ON FUNCTION rebalance_task_order(UUID, TEXT, INTEGER) IS 'Respace task_order keys of one project/status column, preserving order';
+
+-- Record migration application for tracking
+INSERT INTO archon_migrations (version, migration_name)
+VALUES ('0.1.0', '014_add_task_order_rebalance')
+ON CONFLICT (version, migration_name) DO NOTHING;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
@@ -0,0 +1,48 @@
+-- =====================================================
+-- Add computed stats columns for lightweight project listings
+-- =====================================================
+-- PostgREST exposes functions that take a table row as computed
+-- columns. These let the lightweight project list select counts for
+-- the docs/features/data JSONB fields without transferring them.
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION docs_count(archon_projects)
+RETURNS INTEGER
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT CASE WHEN jsonb_typeof($1.docs) = 'array' THEN jsonb_array_length($1.docs) ELSE 0 END;
+$$;
+
+CREATE OR REPLACE FUNCTION features_count(archon_projects)
+RETURNS INTEGER
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT CASE
+        WHEN jsonb_typeof($1.features) = 'array' THEN jsonb_array_length($1.features)
+        WHEN jsonb_typeof($1.features) = 'object' THEN (SELECT COUNT(*)::INTEGER FROM jsonb_object_keys($1.features))
+        ELSE 0
+    END;
+$$;
+
+CREATE OR REPLACE FUNCTION has_data(archon_projects)
+RETURNS BOOLEAN
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT COALESCE($1.data NOT IN ('[]'::jsonb, '{}'::jsonb, 'null'::jsonb), FALSE);
+$$;
+
+COMMENT ON FUNCTION docs_count(archon_projects) IS 'Computed column: number of documents in archon_projects.docs';
+COMMENT ON FUNCTION features_count(archon_projects) IS 'Computed column: number of entries in archon_projects.features';
+COMMENT ON FUNCTION has_data(archon_projects) IS 'Computed column: whether archon_projects.data is non-empty';
+
+-- Record migration application for tracking
+INSERT INTO archon_migrations (version, migration_name)
+VALUES ('0.1.0', '015_add_project_stats_columns')
+ON CONFLICT (version, migration_name) DO NOTHING;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
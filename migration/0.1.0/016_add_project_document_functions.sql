@@ -0,0 +1,245 @@
+-- =====================================================
+-- Add atomic per-document functions for project docs
+-- =====================================================
+-- Project documents live as elements of the archon_projects.docs
+-- JSONB array. These functions read or modify a single element in
+-- place under a row lock, so callers no longer download and rewrite
+-- the whole array, and concurrent writers cannot lose each other's
+-- updates. Each document carries an integer "revision" that is
+-- incremented on every update and can be checked by callers for
+-- optimistic concurrency.
+--
+-- Every function returns a JSONB object with a "status" of
+-- 'ok', 'project_not_found', 'document_not_found' or 'conflict'.
+-- =====================================================
+
+-- List documents; without content only metadata and content size are returned
+CREATE OR REPLACE FUNCTION list_project_documents(
+    project_id_param UUID,
+    include_content_param BOOLEAN DEFAULT FALSE
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    project_docs JSONB;
+BEGIN
+    SELECT CASE WHEN jsonb_typeof(docs) = 'array' THEN docs ELSE '[]'::jsonb END
+    INTO project_docs
+    FROM archon_projects
+    WHERE id = project_id_param;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object('status', 'project_not_found');
+    END IF;
+
+    IF include_content_param THEN
+        RETURN jsonb_build_object('status', 'ok', 'documents', project_docs);
+    END IF;
+
+    RETURN jsonb_build_object(
+        'status', 'ok',
+        'documents', COALESCE((
+            SELECT jsonb_agg(
+                (d.doc - 'content')
+                || jsonb_build_object('content_size', length(COALESCE(d.doc->'content', '{}'::jsonb)::TEXT))
+                ORDER BY d.ord
+            )
+            FROM jsonb_array_elements(project_docs) WITH ORDINALITY AS d(doc, ord)
+        ), '[]'::jsonb)
+    );
+END;
+$$;
+
+-- Fetch a single document by id
+CREATE OR REPLACE FUNCTION get_project_document(
+    project_id_param UUID,
+    doc_id_param TEXT
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    project_docs JSONB;
+    found_doc JSONB;
+BEGIN
+    SELECT CASE WHEN jsonb_typeof(docs) = 'array' THEN docs ELSE '[]'::jsonb END
+    INTO project_docs
+    FROM archon_projects
+    WHERE id = project_id_param;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object('status', 'project_not_found');
+    END IF;
+
+    SELECT d.doc INTO found_doc
+    FROM jsonb_array_elements(project_docs) AS d(doc)
+    WHERE d.doc->>'id' = doc_id_param
+    LIMIT 1;
+
+    IF found_doc IS NULL THEN
+        RETURN jsonb_build_object('status', 'document_not_found');
+    END IF;
+
+    RETURN jsonb_build_object('status', 'ok', 'document', found_doc);
+END;
+$$;
+
+-- Append a document without rewriting the existing elements from the client
+CREATE OR REPLACE FUNCTION add_project_document(
+    project_id_param UUID,
+    document_param JSONB
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE archon_projects
+    SET docs = (CASE WHEN jsonb_typeof(docs) = 'array' THEN docs ELSE '[]'::jsonb END)
+               || jsonb_build_array(document_param),
+        updated_at = NOW()
+    WHERE id = project_id_param;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object('status', 'project_not_found');
+    END IF;
+
+    RETURN jsonb_build_object('status', 'ok', 'document', document_param);
+END;
+$$;
+
+-- Merge fields into one document, optionally checking its revision first.
+-- The pre-update docs array is only returned when a version snapshot is requested.
+CREATE OR REPLACE FUNCTION update_project_document(
+    project_id_param UUID,
+    doc_id_param TEXT,
+    fields_param JSONB,
+    expected_revision_param INTEGER DEFAULT NULL,
+    include_snapshot_param BOOLEAN DEFAULT FALSE
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    project_docs JSONB;
+    doc_index INTEGER;
+    current_doc JSONB;
+    current_revision INTEGER;
+    updated_doc JSONB;
+BEGIN
+    SELECT CASE WHEN jsonb_typeof(docs) = 'array' THEN docs ELSE '[]'::jsonb END
+    INTO project_docs
+    FROM archon_projects
+    WHERE id = project_id_param
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object('status', 'project_not_found');
+    END IF;
+
+    SELECT (d.ord - 1)::INTEGER, d.doc INTO doc_index, current_doc
+    FROM jsonb_array_elements(project_docs) WITH ORDINALITY AS d(doc, ord)
+    WHERE d.doc->>'id' = doc_id_param
+    LIMIT 1;
+
+    IF doc_index IS NULL THEN
+        RETURN jsonb_build_object('status', 'document_not_found');
+    END IF;
+
+    current_revision := COALESCE((current_doc->>'revision')::INTEGER, 1);
+
+    IF expected_revision_param IS NOT NULL AND expected_revision_param <> current_revision THEN
+        RETURN jsonb_build_object(
+            'status', 'conflict',
+            'current_revision', current_revision,
+            'document', current_doc
+        );
+    END IF;
+
+    updated_doc := current_doc || fields_param || jsonb_build_object(
+        'revision', current_revision + 1,
+        'updated_at', to_jsonb(NOW())
+    );
+
+    UPDATE archon_projects
+    SET docs = jsonb_set(project_docs, ARRAY[doc_index::TEXT], updated_doc),
+        updated_at = NOW()
+    WHERE id = project_id_param;
+
+    RETURN jsonb_build_object(
+        'status', 'ok',
+        'document', updated_doc,
+        'previous_docs', CASE WHEN include_snapshot_param THEN project_docs ELSE NULL END
+    );
+END;
+$$;
+
+-- Remove one document, optionally checking its revision first
+CREATE OR REPLACE FUNCTION delete_project_document(
+    project_id_param UUID,
+    doc_id_param TEXT,
+    expected_revision_param INTEGER DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    project_docs JSONB;
+    doc_index INTEGER;
+    current_doc JSONB;
+    current_revision INTEGER;
+BEGIN
+    SELECT CASE WHEN jsonb_typeof(docs) = 'array' THEN docs ELSE '[]'::jsonb END
+    INTO project_docs
+    FROM archon_projects
+    WHERE id = project_id_param
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object('status', 'project_not_found');
+    END IF;
+
+    SELECT (d.ord - 1)::INTEGER, d.doc INTO doc_index, current_doc
+    FROM jsonb_array_elements(project_docs) WITH ORDINALITY AS d(doc, ord)
+    WHERE d.doc->>'id' = doc_id_param
+    LIMIT 1;
+
+    IF doc_index IS NULL THEN
+        RETURN jsonb_build_object('status', 'document_not_found');
+    END IF;
+
+    current_revision := COALESCE((current_doc->>'revision')::INTEGER, 1);
+
+    IF expected_revision_param IS NOT NULL AND expected_revision_param <> current_revision THEN
+        RETURN jsonb_build_object(
+            'status', 'conflict',
+            'current_revision', current_revision,
+            'document', current_doc
+        );
+    END IF;
+
+    UPDATE archon_projects
+    SET docs = project_docs - doc_index,
+        updated_at = NOW()
+    WHERE id = project_id_param;
+
+    RETURN jsonb_build_object('status', 'ok', 'document', current_doc);
+END;
+$$;
+
+COMMENT ON FUNCTION list_project_documents(UUID, BOOLEAN) IS 'Lists a project''s documents; without content returns metadata plus content_size';
+COMMENT ON FUNCTION get_project_document(UUID, TEXT) IS 'Returns a single document from archon_projects.docs';
+COMMENT ON FUNCTION add_project_document(UUID, JSONB) IS 'Atomically appends a document to archon_projects.docs';
+COMMENT ON FUNCTION update_project_document(UUID, TEXT, JSONB, INTEGER, BOOLEAN) IS 'Atomically merges fields into one document with optional revision check';
+COMMENT ON FUNCTION delete_project_document(UUID, TEXT, INTEGER) IS 'Atomically removes one document with optional revision check';
+
+-- Record migration application for tracking
+INSERT INTO archon_migrations (version, migration_name)
+VALUES ('0.1.0', '016_add_project_document_functions')
+ON CONFLICT (version, migration_name) DO NOTHING;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
@@ -0,0 +1,33 @@
+-- =====================================================
+-- Store document version history as deltas
+-- =====================================================
+-- archon_document_versions used to hold a full copy of the versioned
+-- JSONB field in every row. New versions are now written as JSON Patch
+-- (RFC 6902) deltas against the previous version, with a full snapshot
+-- every few versions so any version can be rebuilt from a short chain.
+-- Existing rows are full copies and keep storage_kind = 'snapshot'.
+-- =====================================================
+
+ALTER TABLE archon_document_versions
+ADD COLUMN IF NOT EXISTS storage_kind TEXT NOT NULL DEFAULT 'snapshot'
+    CHECK (storage_kind IN ('snapshot', 'delta'));
+
+ALTER TABLE archon_document_versions
+ADD COLUMN IF NOT EXISTS base_version INTEGER;
+
+-- Reconstruction reads a version and the rows just before it
+CREATE INDEX IF NOT EXISTS idx_archon_document_versions_chain
+ON archon_document_versions(project_id, field_name, version_number DESC);
+
+COMMENT ON COLUMN archon_document_versions.content IS 'Full snapshot of the field, or a JSON Patch against base_version when storage_kind = ''delta''';
+COMMENT ON COLUMN archon_document_versions.storage_kind IS 'snapshot: content is the full field value; delta: content is a JSON Patch';
+COMMENT ON COLUMN archon_document_versions.base_version IS 'For deltas, the version_number the patch applies to';
+
+-- Record migration application for tracking
+INSERT INTO archon_migrations (version, migration_name)
+VALUES ('0.1.0', '017_add_version_deltas')
+ON CONFLICT (version, migration_name) DO NOTHING;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
@@ -0,0 +1,64 @@
+-- =====================================================
+-- Add a revision counter for archon_settings
+-- =====================================================
+-- Every process that reads settings keeps them in memory. A single-row
+-- counter bumped by a statement trigger lets each process detect
+-- changes made elsewhere with one tiny query, and the trigger also
+-- sends a NOTIFY on 'archon_settings_changed' for listeners.
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS archon_settings_revision (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    revision BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+INSERT INTO archon_settings_revision (id, revision)
+VALUES (TRUE, 0)
+ON CONFLICT (id) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_archon_settings_revision()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    new_revision BIGINT;
+BEGIN
+    UPDATE archon_settings_revision
+    SET revision = revision + 1,
+        updated_at = NOW()
+    WHERE id
+    RETURNING revision INTO new_revision;
+
+    PERFORM pg_notify('archon_settings_changed', COALESCE(new_revision, 0)::TEXT);
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS bump_archon_settings_revision ON archon_settings;
+CREATE TRIGGER bump_archon_settings_revision
+    AFTER INSERT OR UPDATE OR DELETE ON archon_settings
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_archon_settings_revision();
+
+ALTER TABLE archon_settings_revision ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Allow service role full access" ON archon_settings_revision;
+CREATE POLICY "Allow service role full access" ON archon_settings_revision
+    FOR ALL USING (auth.role() = 'service_role');
+
+DROP POLICY IF EXISTS "Allow authenticated users to read" ON archon_settings_revision;
+CREATE POLICY "Allow authenticated users to read" ON archon_settings_revision
+    FOR SELECT TO authenticated
+    USING (true);
+
+COMMENT ON TABLE archon_settings_revision IS 'Single-row counter bumped on every archon_settings change so services can refresh cached settings';
+
+-- Record migration application for tracking
+INSERT INTO archon_migrations (version, migration_name)
+VALUES ('0.1.0', '018_add_settings_revision')
+ON CONFLICT (version, migration_name) DO NOTHING;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
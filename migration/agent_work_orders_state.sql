@@ -91,6 +91,10 @@ CREATE INDEX IF NOT EXISTS idx_agent_work_orders_metadata
 CREATE INDEX IF NOT EXISTS idx_agent_work_order_steps_work_order_id
     ON archon_agent_work_order_steps(agent_work_order_id);
 
+-- Unique step position per work order; steps are appended by upsert on this key
+CREATE UNIQUE INDEX IF NOT EXISTS idx_agent_work_order_steps_order
+    ON archon_agent_work_order_steps(agent_work_order_id, step_order);
+
 -- Index on executed_at for temporal queries
 CREATE INDEX IF NOT EXISTS idx_agent_work_order_steps_executed_at
     ON archon_agent_work_order_steps(executed_at);
@@ -63,6 +63,54 @@ CREATE POLICY "Allow authenticated users to read and update" ON archon_settings
     FOR ALL TO authenticated
     USING (true);
 
+-- Revision counter so running services notice settings changes
+CREATE TABLE IF NOT EXISTS archon_settings_revision (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    revision BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+INSERT INTO archon_settings_revision (id, revision)
+VALUES (TRUE, 0)
+ON CONFLICT (id) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_archon_settings_revision()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    new_revision BIGINT;
+BEGIN
+    UPDATE archon_settings_revision
+    SET revision = revision + 1,
+        updated_at = NOW()
+    WHERE id
+    RETURNING revision INTO new_revision;
+
+    PERFORM pg_notify('archon_settings_changed', COALESCE(new_revision, 0)::TEXT);
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS bump_archon_settings_revision ON archon_settings;
+CREATE TRIGGER bump_archon_settings_revision
+    AFTER INSERT OR UPDATE OR DELETE ON archon_settings
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_archon_settings_revision();
+
+ALTER TABLE archon_settings_revision ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Allow service role full access" ON archon_settings_revision;
+CREATE POLICY "Allow service role full access" ON archon_settings_revision
+    FOR ALL USING (auth.role() = 'service_role');
+
+DROP POLICY IF EXISTS "Allow authenticated users to read" ON archon_settings_revision;
+CREATE POLICY "Allow authenticated users to read" ON archon_settings_revision
+    FOR SELECT TO authenticated
+    USING (true);
+
+COMMENT ON TABLE archon_settings_revision IS 'Single-row counter bumped on every archon_settings change so services can refresh cached settings';
+
 -- =====================================================
 -- SECTION 3: INITIAL SETTINGS DATA
 -- =====================================================
@@ -296,6 +344,11 @@ CREATE TABLE IF NOT EXISTS archon_page_metadata (
     char_count INT NOT NULL,
     chunk_count INT NOT NULL DEFAULT 0,
 
+    -- Incremental recrawl validators
+    content_hash TEXT,
+    etag TEXT,
+    last_modified TEXT,
+
     -- Timestamps
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW(),
@@ -334,6 +387,7 @@ COMMENT ON COLUMN archon_page_metadata.word_count IS 'Number of words in full_co
 COMMENT ON COLUMN archon_page_metadata.char_count IS 'Number of characters in full_content';
 COMMENT ON COLUMN archon_page_metadata.chunk_count IS 'Number of chunks created from this page';
 COMMENT ON COLUMN archon_page_metadata.metadata IS 'Flexible JSON metadata (page_type, knowledge_type, tags, etc)';
+COMMENT ON COLUMN archon_page_metadata.content_hash IS 'SHA-256 hash of full_content, used to skip unchanged pages on refresh';
 COMMENT ON COLUMN archon_crawled_pages.page_id IS 'Foreign key linking chunk to parent page';
 
 -- Enable RLS on archon_page_metadata
@@ -927,7 +981,9 @@ CREATE TABLE IF NOT EXISTS archon_document_versions (
   task_id UUID REFERENCES archon_tasks(id) ON DELETE CASCADE, -- DEPRECATED: No longer used, kept for historical data
   field_name TEXT NOT NULL, -- 'docs', 'features', 'data', 'prd' (task fields no longer versioned)
   version_number INTEGER NOT NULL,
-  content JSONB NOT NULL, -- Full snapshot of the field content
+  content JSONB NOT NULL, -- Full snapshot of the field content, or a JSON Patch for deltas
+  storage_kind TEXT NOT NULL DEFAULT 'snapshot' CHECK (storage_kind IN ('snapshot', 'delta')),
+  base_version INTEGER, -- For deltas, the version the patch applies to
   change_summary TEXT, -- Human-readable description of changes
   change_type TEXT DEFAULT 'update', -- 'create', 'update', 'delete', 'restore', 'backup'
   document_id TEXT, -- For docs array, store the specific document ID
@@ -957,6 +1013,7 @@ CREATE INDEX IF NOT EXISTS idx_archon_document_versions_task_id ON archon_docume
 CREATE INDEX IF NOT EXISTS idx_archon_document_versions_field_name ON archon_document_versions(field_name);
 CREATE INDEX IF NOT EXISTS idx_archon_document_versions_version_number ON archon_document_versions(version_number);
 CREATE INDEX IF NOT EXISTS idx_archon_document_versions_created_at ON archon_document_versions(created_at);
+CREATE INDEX IF NOT EXISTS idx_archon_document_versions_chain ON archon_document_versions(project_id, field_name, version_number DESC);
 
 -- Apply triggers to tables
 CREATE OR REPLACE TRIGGER update_archon_projects_updated_at
@@ -1008,6 +1065,302 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Computed columns (exposed by PostgREST) for lightweight project listings
+CREATE OR REPLACE FUNCTION docs_count(archon_projects)
+RETURNS INTEGER
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT CASE WHEN jsonb_typeof($1.docs) = 'array' THEN jsonb_array_length($1.docs) ELSE 0 END;
+$$;
+
+CREATE OR REPLACE FUNCTION features_count(archon_projects)
+RETURNS INTEGER
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT CASE
+        WHEN jsonb_typeof($1.features) = 'array' THEN jsonb_array_length($1.features)
+        WHEN jsonb_typeof($1.features) = 'object' THEN (SELECT COUNT(*)::INTEGER FROM jsonb_object_keys($1.features))
+        ELSE 0
+    END;
+$$;
+
+CREATE OR REPLACE FUNCTION has_data(archon_projects)
+RETURNS BOOLEAN
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT COALESCE($1.data NOT IN ('[]'::jsonb, '{}'::jsonb, 'null'::jsonb), FALSE);
+$$;
+
+-- Grouped task counts for the project list (one row per project/status)
+CREATE INDEX IF NOT EXISTS idx_archon_tasks_active_project_status
+ON archon_tasks(project_id, status)
+WHERE archived IS NOT TRUE;
+
+CREATE OR REPLACE FUNCTION get_project_task_counts()
+RETURNS TABLE (
+    project_id UUID,
+    status TEXT,
+    task_count BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT t.project_id, t.status::TEXT, COUNT(*) AS task_count
+    FROM archon_tasks t
+    WHERE t.archived IS NOT TRUE
+      AND t.project_id IS NOT NULL
+    GROUP BY t.project_id, t.status;
+$$;
+
+-- Respace task_order rank keys of one column when inserts run out of gaps
+CREATE INDEX IF NOT EXISTS idx_archon_tasks_project_status_order
+ON archon_tasks(project_id, status, task_order);
+
+CREATE OR REPLACE FUNCTION rebalance_task_order(
+    project_id_param UUID,
+    status_param TEXT,
+    step_param INTEGER DEFAULT 1000
+)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+    WITH ranked AS (
+        SELECT id, (ROW_NUMBER() OVER (ORDER BY task_order, created_at, id) * step_param)::INTEGER AS new_order
+        FROM archon_tasks
+        WHERE project_id = project_id_param
+          AND status::TEXT = status_param
+    ),
+    updated AS (
+        UPDATE archon_tasks t
+        SET task_order = r.new_order
+        FROM ranked r
+        WHERE t.id = r.id
+          AND t.task_order IS DISTINCT FROM r.new_order
+        RETURNING 1
+    )
+    SELECT COUNT(*)::INTEGER FROM updated;
+$$;
+
+-- Atomic single-document access to archon_projects.docs with revision checks
+-- List documents; without content only metadata and content size are returned
+CREATE OR REPLACE FUNCTION list_project_documents(
+    project_id_param UUID,
+    include_content_param BOOLEAN DEFAULT FALSE
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    project_docs JSONB;
+BEGIN
+    SELECT CASE WHEN jsonb_typeof(docs) = 'array' THEN docs ELSE '[]'::jsonb END
+    INTO project_docs
+    FROM archon_projects
+    WHERE id = project_id_param;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object('status', 'project_not_found');
+    END IF;
+
+    IF include_content_param THEN
+        RETURN jsonb_build_object('status', 'ok', 'documents', project_docs);
+    END IF;
+
+    RETURN jsonb_build_object(
+        'status', 'ok',
+        'documents', COALESCE((
+            SELECT jsonb_agg(
+                (d.doc - 'content')
+                || jsonb_build_object('content_size', length(COALESCE(d.doc->'content', '{}'::jsonb)::TEXT))
+                ORDER BY d.ord
+            )
+            FROM jsonb_array_elements(project_docs) WITH ORDINALITY AS d(doc, ord)
+        ), '[]'::jsonb)
+    );
+END;
+$$;
+
+-- Fetch a single document by id
+CREATE OR REPLACE FUNCTION get_project_document(
+    project_id_param UUID,
+    doc_id_param TEXT
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    project_docs JSONB;
+    found_doc JSONB;
+BEGIN
+    SELECT CASE WHEN jsonb_typeof(docs) = 'array' THEN docs ELSE '[]'::jsonb END
+    INTO project_docs
+    FROM archon_projects
+    WHERE id = project_id_param;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object('status', 'project_not_found');
+    END IF;
+
+    SELECT d.doc INTO found_doc
+    FROM jsonb_array_elements(project_docs) AS d(doc)
+    WHERE d.doc->>'id' = doc_id_param
+    LIMIT 1;
+
+    IF found_doc IS NULL THEN
+        RETURN jsonb_build_object('status', 'document_not_found');
+    END IF;
+
+    RETURN jsonb_build_object('status', 'ok', 'document', found_doc);
+END;
+$$;
+
+-- Append a document without rewriting the existing elements from the client
+CREATE OR REPLACE FUNCTION add_project_document(
+    project_id_param UUID,
+    document_param JSONB
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE archon_projects
+    SET docs = (CASE WHEN jsonb_typeof(docs) = 'array' THEN docs ELSE '[]'::jsonb END)
+               || jsonb_build_array(document_param),
+        updated_at = NOW()
+    WHERE id = project_id_param;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object('status', 'project_not_found');
+    END IF;
+
+    RETURN jsonb_build_object('status', 'ok', 'document', document_param);
+END;
+$$;
+
+-- Merge fields into one document, optionally checking its revision first.
+-- The pre-update docs array is only returned when a version snapshot is requested.
+CREATE OR REPLACE FUNCTION update_project_document(
+    project_id_param UUID,
+    doc_id_param TEXT,
+    fields_param JSONB,
+    expected_revision_param INTEGER DEFAULT NULL,
+    include_snapshot_param BOOLEAN DEFAULT FALSE
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    project_docs JSONB;
+    doc_index INTEGER;
+    current_doc JSONB;
+    current_revision INTEGER;
+    updated_doc JSONB;
+BEGIN
+    SELECT CASE WHEN jsonb_typeof(docs) = 'array' THEN docs ELSE '[]'::jsonb END
+    INTO project_docs
+    FROM archon_projects
+    WHERE id = project_id_param
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object('status', 'project_not_found');
+    END IF;
+
+    SELECT (d.ord - 1)::INTEGER, d.doc INTO doc_index, current_doc
+    FROM jsonb_array_elements(project_docs) WITH ORDINALITY AS d(doc, ord)
+    WHERE d.doc->>'id' = doc_id_param
+    LIMIT 1;
+
+    IF doc_index IS NULL THEN
+        RETURN jsonb_build_object('status', 'document_not_found');
+    END IF;
+
+    current_revision := COALESCE((current_doc->>'revision')::INTEGER, 1);
+
+    IF expected_revision_param IS NOT NULL AND expected_revision_param <> current_revision THEN
+        RETURN jsonb_build_object(
+            'status', 'conflict',
+            'current_revision', current_revision,
+            'document', current_doc
+        );
+    END IF;
+
+    updated_doc := current_doc || fields_param || jsonb_build_object(
+        'revision', current_revision + 1,
+        'updated_at', to_jsonb(NOW())
+    );
+
+    UPDATE archon_projects
+    SET docs = jsonb_set(project_docs, ARRAY[doc_index::TEXT], updated_doc),
+        updated_at = NOW()
+    WHERE id = project_id_param;
+
+    RETURN jsonb_build_object(
+        'status', 'ok',
+        'document', updated_doc,
+        'previous_docs', CASE WHEN include_snapshot_param THEN project_docs ELSE NULL END
+    );
+END;
+$$;
+
+-- Remove one document, optionally checking its revision first
+CREATE OR REPLACE FUNCTION delete_project_document(
+    project_id_param UUID,
+    doc_id_param TEXT,
+    expected_revision_param INTEGER DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    project_docs JSONB;
+    doc_index INTEGER;
+    current_doc JSONB;
+    current_revision INTEGER;
+BEGIN
+    SELECT CASE WHEN jsonb_typeof(docs) = 'array' THEN docs ELSE '[]'::jsonb END
+    INTO project_docs
+    FROM archon_projects
+    WHERE id = project_id_param
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object('status', 'project_not_found');
+    END IF;
+
+    SELECT (d.ord - 1)::INTEGER, d.doc INTO doc_index, current_doc
+    FROM jsonb_array_elements(project_docs) WITH ORDINALITY AS d(doc, ord)
+    WHERE d.doc->>'id' = doc_id_param
+    LIMIT 1;
+
+    IF doc_index IS NULL THEN
+        RETURN jsonb_build_object('status', 'document_not_found');
+    END IF;
+
+    current_revision := COALESCE((current_doc->>'revision')::INTEGER, 1);
+
+    IF expected_revision_param IS NOT NULL AND expected_revision_param <> current_revision THEN
+        RETURN jsonb_build_object(
+            'status', 'conflict',
+            'current_revision', current_revision,
+            'document', current_doc
+        );
+    END IF;
+
+    UPDATE archon_projects
+    SET docs = project_docs - doc_index,
+        updated_at = NOW()
+    WHERE id = project_id_param;
+
+    RETURN jsonb_build_object('status', 'ok', 'document', current_doc);
+END;
+$$;
+
 -- Add comments to document the soft delete fields
 COMMENT ON COLUMN archon_tasks.assignee IS 'The agent or user assigned to this task. Can be any valid agent name or "User"';
 COMMENT ON COLUMN archon_tasks.priority IS 'Task priority level independent of visual ordering - used for semantic importance (low, medium, high, critical)';
@@ -1018,7 +1371,9 @@ COMMENT ON COLUMN archon_tasks.archived_by IS 'User/system that archived the tas
 -- Add comments for versioning table
 COMMENT ON TABLE archon_document_versions IS 'Version control for JSONB fields in projects only - task versioning has been removed to simplify MCP operations';
 COMMENT ON COLUMN archon_document_versions.field_name IS 'Name of JSONB field being versioned (docs, features, data) - task fields and prd removed as unused';
-COMMENT ON COLUMN archon_document_versions.content IS 'Full snapshot of field content at this version';
+COMMENT ON COLUMN archon_document_versions.content IS 'Full snapshot of the field, or a JSON Patch against base_version when storage_kind = ''delta''';
+COMMENT ON COLUMN archon_document_versions.storage_kind IS 'snapshot: content is the full field value; delta: content is a JSON Patch';
+COMMENT ON COLUMN archon_document_versions.base_version IS 'For deltas, the version_number the patch applies to';
 COMMENT ON COLUMN archon_document_versions.change_type IS 'Type of change: create, update, delete, restore, backup';
 COMMENT ON COLUMN archon_document_versions.document_id IS 'For docs arrays, the specific document ID that was changed';
 COMMENT ON COLUMN archon_document_versions.task_id IS 'DEPRECATED: No longer used for new versions, kept for historical task version data';
@@ -1062,7 +1417,14 @@ VALUES
   ('0.1.0', '008_add_migration_tracking'),
   ('0.1.0', '009_add_cascade_delete_constraints'),
   ('0.1.0', '010_add_provider_placeholders'),
-  ('0.1.0', '011_add_page_metadata_table')
+  ('0.1.0', '011_add_page_metadata_table'),
+  ('0.1.0', '012_add_page_validators'),
+  ('0.1.0', '013_add_task_count_function'),
+  ('0.1.0', '014_add_task_order_rebalance'),
+  ('0.1.0', '015_add_project_stats_columns'),
+  ('0.1.0', '016_add_project_document_functions'),
+  ('0.1.0', '017_add_version_deltas'),
+  ('0.1.0', '018_add_settings_revision')
 ON CONFLICT (version, migration_name) DO NOTHING;
 
 -- Enable Row Level Security on migrations table
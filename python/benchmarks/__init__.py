@@ -0,0 +1,12 @@
+"""
+Offline performance benchmarks for Archon.
+
+Benchmarks drive the real service code with the stand-ins in ``stand_ins`` in
+place of crawl4ai, the embedding/LLM providers and Supabase, and save JSON
+results that later runs can be compared against. Run them from the python/
+directory, for example::
+
+    uv run python -m benchmarks.ingestion --pages 200
+    uv run python -m benchmarks.rag --requests 500 --concurrency 16
+    uv run python -m benchmarks.startup --repeat 5
+"""
@@ -0,0 +1,287 @@
+"""
+Ingestion pipeline benchmark.
+
+Runs ``CrawlingService.orchestrate_crawl`` end to end - recursive crawl,
+chunking, source and page records, chunk embedding and storage, and code
+extraction - against a synthetic site served by FixtureCrawler, with hashed
+embeddings, an offline LLM and an in-memory Supabase. Reports pages/sec,
+chunks/sec, peak RSS and inclusive wall time per stage (nested stages such as
+embedding are also counted in the stage that calls them).
+
+Usage (from python/)::
+
+    uv run python -m benchmarks.ingestion --pages 200
+    uv run python -m benchmarks.ingestion --pages 200 --baseline benchmarks/results/ingestion-base.json
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from src.server.services import source_management_service, threading_service
+from src.server.services.crawling import crawling_service, document_storage_operations
+from src.server.services.crawling.crawling_service import CrawlingService
+from src.server.services.crawling.document_storage_operations import DocumentStorageOperations
+from src.server.services.crawling.page_storage_operations import PageStorageOperations
+from src.server.services.credential_service import credential_service
+from src.server.services.embeddings import contextual_embedding_service, embedding_service
+from src.server.services.storage import code_storage_service, document_storage_service
+from src.server.services.storage.base_storage_service import BaseStorageService
+from src.server.services.threading_service import RateLimitConfig, ThreadingService
+from src.server.utils.progress.progress_tracker import ProgressTracker
+
+from .results import build_result, compare_results, load_results, peak_rss_mb, save_results
+from .stand_ins import (
+    FixtureCrawler,
+    FixtureSite,
+    HashingEmbeddingAdapter,
+    InMemorySupabaseClient,
+    offline_llm_client_factory,
+)
+from .timing import StageTimer, timed_stages
+
+BENCHMARK_NAME = "ingestion"
+HIGHER_IS_BETTER = {"pages_per_second", "chunks_per_second"}
+LOWER_IS_BETTER = {"duration_seconds", "peak_rss_mb"}
+
+# Settings the pipeline reads from the credential service during a benchmark run
+BENCHMARK_SETTINGS: dict[str, str] = {
+    "LLM_PROVIDER": "openai",
+    "EMBEDDING_PROVIDER": "openai",
+    "OPENAI_API_KEY": "offline-benchmark",
+    "MODEL_CHOICE": "offline-benchmark",
+    "EMBEDDING_MODEL": "local-hash",
+    "USE_CONTEXTUAL_EMBEDDINGS": "false",
+    "ENABLE_CODE_SUMMARIES": "false",
+    "EMBEDDING_BATCH_SIZE": "100",
+    "DOCUMENT_STORAGE_BATCH_SIZE": "50",
+    "CRAWL_BATCH_SIZE": "50",
+    "CRAWL_MAX_CONCURRENT": "10",
+}
+
+
+@dataclass
+class IngestionBenchmarkConfig:
+    """Parameters for one benchmark run."""
+
+    pages: int = 100
+    fanout: int = 4
+    page_latency: float = 0.0
+    embedding_latency: float = 0.0
+    db_latency: float = 0.0
+    embedding_dimensions: int = 1536
+    # Provider token budget for the embedding rate limiter; None removes the limit
+    tokens_per_minute: int | None = None
+    extract_code_examples: bool = True
+
+
+# (stage, owner, attribute) for every call site timed during a run
+TIMED_STAGES: list[tuple[str, Any, str]] = [
+    ("crawl", CrawlingService, "_crawl_by_url_type"),
+    ("chunking", BaseStorageService, "smart_chunk_text_async"),
+    ("source_records", DocumentStorageOperations, "_create_source_records"),
+    ("page_storage", PageStorageOperations, "store_pages"),
+    ("chunk_storage", document_storage_operations, "add_documents_to_supabase"),
+    ("embedding", document_storage_service, "create_embeddings_batch"),
+    ("embedding", code_storage_service, "create_embeddings_batch"),
+    ("code_extraction", DocumentStorageOperations, "extract_and_store_code_examples"),
+]
+
+
+@contextmanager
+def seeded_credentials(settings: dict[str, str]) -> Iterator[None]:
+    """Serve ``settings`` from the credential service cache instead of the database."""
+    attributes = (
+        "_cache",
+        "_cache_initialized",
+        "_rag_settings_cache",
+        "_rag_cache_timestamp",
+        "_rag_cache_ttl",
+        "_settings_snapshot",
+    )
+    saved = {name: getattr(credential_service, name) for name in attributes}
+    credential_service._cache = dict(settings)
+    credential_service._cache_initialized = True
+    credential_service._rag_settings_cache = dict(settings)
+    credential_service._rag_cache_timestamp = time.time()
+    credential_service._rag_cache_ttl = float("inf")
+    credential_service._settings_snapshot = None
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(credential_service, name, value)
+
+
+@contextmanager
+def offline_providers(
+    adapter: HashingEmbeddingAdapter, tokens_per_minute: int | None
+) -> Iterator[None]:
+    """Route embedding, LLM and rate-limiter calls to local stand-ins."""
+    get_llm_client = offline_llm_client_factory()
+
+    async def get_embedding_model(provider: str | None = None) -> str:
+        return BENCHMARK_SETTINGS["EMBEDDING_MODEL"]
+
+    rate_limits = RateLimitConfig()
+    if tokens_per_minute is None:
+        rate_limits.tokens_per_minute = sys.maxsize
+        rate_limits.requests_per_minute = sys.maxsize
+    else:
+        rate_limits.tokens_per_minute = tokens_per_minute
+
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch.object(embedding_service, "_get_embedding_adapter", lambda provider, client: adapter)
+        )
+        stack.enter_context(patch.object(embedding_service, "get_embedding_model", get_embedding_model))
+        for module in (
+            embedding_service,
+            contextual_embedding_service,
+            code_storage_service,
+            source_management_service,
+        ):
+            stack.enter_context(patch.object(module, "get_llm_client", get_llm_client))
+        stack.enter_context(
+            patch.object(
+                threading_service,
+                "_threading_service",
+                ThreadingService(rate_limit_config=rate_limits),
+            )
+        )
+        yield
+
+
+async def run_ingestion_benchmark(
+    config: IngestionBenchmarkConfig, database: InMemorySupabaseClient | None = None
+) -> dict[str, Any]:
+    """
+    Crawl and ingest a fixture site once and return the result document.
+
+    Pass ``database`` to keep the ingested rows, e.g. as a corpus for query benchmarks.
+    """
+    site = FixtureSite(pages=config.pages, fanout=config.fanout)
+    crawler = FixtureCrawler(site, page_latency=config.page_latency)
+    adapter = HashingEmbeddingAdapter(config.embedding_dimensions, latency=config.embedding_latency)
+    if database is None:
+        database = InMemorySupabaseClient(latency=config.db_latency)
+    timer = StageTimer()
+
+    settings = dict(BENCHMARK_SETTINGS, EMBEDDING_DIMENSIONS=str(config.embedding_dimensions))
+    progress_id = f"benchmark-{time.monotonic_ns()}"
+    request = {
+        "url": site.root_url,
+        "knowledge_type": "technical",
+        "tags": ["benchmark"],
+        "max_depth": site.depth,
+        "extract_code_examples": config.extract_code_examples,
+        "auto_discovery": False,
+    }
+
+    with (
+        seeded_credentials(settings),
+        offline_providers(adapter, config.tokens_per_minute),
+        timed_stages(timer, TIMED_STAGES),
+    ):
+        service = CrawlingService(crawler=crawler, supabase_client=database)
+        service.set_progress_id(progress_id)
+
+        started = time.perf_counter()
+        response = await service.orchestrate_crawl(request)
+        await response["task"]
+        duration = time.perf_counter() - started
+
+    state = ProgressTracker.get_progress(progress_id) or {}
+    ProgressTracker.clear_progress(progress_id)
+    await crawling_service.unregister_orchestration(progress_id)
+    if state.get("status") != "completed":
+        raise RuntimeError(f"Benchmark crawl did not complete: {state.get('error') or state.get('log')}")
+
+    for key, timing in database.timings.items():
+        timer.add(f"db.{key}", timing.seconds, timing.calls)
+
+    pages = len(database.tables["archon_page_metadata"])
+    chunks = len(database.tables["archon_crawled_pages"])
+    code_examples = len(database.tables["archon_code_examples"])
+
+    metrics = {
+        "pages": pages,
+        "chunks_stored": chunks,
+        "code_examples": code_examples,
+        "texts_embedded": adapter.texts_embedded,
+        "duration_seconds": round(duration, 4),
+        "pages_per_second": round(pages / duration, 2) if duration else None,
+        "chunks_per_second": round(chunks / duration, 2) if duration else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    return build_result(BENCHMARK_NAME, asdict(config), metrics, timer.snapshot())
+
+
+def format_report(result: dict[str, Any]) -> str:
+    lines = [f"Benchmark: {result['benchmark']} ({result['timestamp']})", ""]
+    lines.extend(f"  {name:<20} {value}" for name, value in result["metrics"].items())
+    lines.extend(["", f"  {'stage':<36} {'calls':>7} {'seconds':>10}"])
+    for stage, timing in result["stages"].items():
+        lines.append(f"  {stage:<36} {timing['calls']:>7} {timing['seconds']:>10.4f}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=100, help="Pages in the synthetic site")
+    parser.add_argument("--fanout", type=int, default=4, help="Links from each page to child pages")
+    parser.add_argument("--page-latency-ms", type=float, default=0.0, help="Simulated fetch time per page")
+    parser.add_argument("--embedding-latency-ms", type=float, default=0.0, help="Simulated time per embedding call")
+    parser.add_argument("--db-latency-ms", type=float, default=0.0, help="Simulated time per database call")
+    parser.add_argument("--tokens-per-minute", type=int, default=None, help="Embedding rate limit (default: none)")
+    parser.add_argument("--no-code-examples", action="store_true", help="Skip code extraction")
+    parser.add_argument("--output", type=Path, default=None, help="Result file (default: benchmarks/results/)")
+    parser.add_argument("--baseline", type=Path, default=None, help="Earlier result to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed regression as a fraction")
+    parser.add_argument("--verbose", action="store_true", help="Keep service logging enabled")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        logging.disable(logging.WARNING)
+
+    config = IngestionBenchmarkConfig(
+        pages=args.pages,
+        fanout=args.fanout,
+        page_latency=args.page_latency_ms / 1000,
+        embedding_latency=args.embedding_latency_ms / 1000,
+        db_latency=args.db_latency_ms / 1000,
+        tokens_per_minute=args.tokens_per_minute,
+        extract_code_examples=not args.no_code_examples,
+    )
+    result = asyncio.run(run_ingestion_benchmark(config))
+    print(format_report(result))
+    print(f"\nSaved results to {save_results(result, args.output)}")
+
+    if args.baseline:
+        regressions = compare_results(
+            result,
+            load_results(args.baseline),
+            HIGHER_IS_BETTER,
+            LOWER_IS_BETTER,
+            tolerance=args.tolerance,
+            min_stage_value=0.01,
+        )
+        if regressions:
+            print(f"\nRegressions against {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
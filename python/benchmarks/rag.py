@@ -0,0 +1,271 @@
+"""
+RAG query latency benchmark and load generator.
+
+Ingests a synthetic corpus with the ingestion benchmark, then replays a
+weighted query mix against ``RAGService.perform_rag_query`` and
+``search_code_examples_service`` from ``--concurrency`` concurrent workers.
+Embeddings are hashed locally, the search RPCs are served by
+InMemoryVectorSearch, and reranking uses SimulatedCrossEncoder, which blocks
+like the real model. Reports throughput, p50/p95/p99 latency per request kind
+and per stage (embed, vector RPC, hybrid fusion, rerank, page grouping), and
+event-loop lag sampled during the run - raise ``--concurrency`` and
+``--rerank-ms-per-pair`` to see synchronous work stall every in-flight query.
+
+Usage (from python/)::
+
+    uv run python -m benchmarks.rag --requests 500 --concurrency 16
+    uv run python -m benchmarks.rag --concurrency 16 --baseline benchmarks/results/rag-base.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import random
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from src.server.services.search import agentic_rag_strategy, hybrid_search_strategy, rag_service
+from src.server.services.search.base_search_strategy import BaseSearchStrategy
+from src.server.services.search.hybrid_search_strategy import HybridSearchStrategy
+from src.server.services.search.rag_service import RAGService
+from src.server.services.search.reranking_strategy import RerankingStrategy
+
+from .ingestion import (
+    BENCHMARK_SETTINGS,
+    IngestionBenchmarkConfig,
+    offline_providers,
+    run_ingestion_benchmark,
+    seeded_credentials,
+)
+from .results import build_result, compare_results, load_results, peak_rss_mb, save_results
+from .stand_ins import HashingEmbeddingAdapter, InMemorySupabaseClient, InMemoryVectorSearch, SimulatedCrossEncoder
+from .timing import LoopLagProbe, StageTimer, latency_summary, timed_stages
+
+BENCHMARK_NAME = "rag"
+HIGHER_IS_BETTER = {"throughput_qps"}
+LOWER_IS_BETTER = {"loop_lag_p99_ms"}
+DEFAULT_QUERIES = Path(__file__).parent / "fixtures" / "rag" / "queries.json"
+
+
+@dataclass
+class RagBenchmarkConfig:
+    """Parameters for one benchmark run."""
+
+    requests: int = 200
+    concurrency: int = 8
+    corpus_pages: int = 60
+    queries: str = str(DEFAULT_QUERIES)
+    hybrid: bool = True
+    rerank: bool = True
+    embedding_latency: float = 0.0
+    db_latency: float = 0.0
+    rerank_latency_per_pair: float = 0.0002
+    embedding_dimensions: int = 1536
+    seed: int = 7
+
+
+# (stage, owner, attribute) for every call site timed during a run; vector_rpc
+# samples come from the database observer instead
+TIMED_STAGES: list[tuple[str, Any, str]] = [
+    ("embed", rag_service, "create_embedding"),
+    ("embed", hybrid_search_strategy, "create_embedding"),
+    ("embed", agentic_rag_strategy, "create_embedding"),
+    ("vector_search", BaseSearchStrategy, "vector_search"),
+    ("hybrid_fusion", HybridSearchStrategy, "search_documents_hybrid"),
+    ("hybrid_fusion", HybridSearchStrategy, "search_code_examples_hybrid"),
+    ("rerank", RerankingStrategy, "rerank_results"),
+    ("page_grouping", RAGService, "_group_chunks_by_pages"),
+]
+
+
+def load_query_mix(path: Path) -> list[dict[str, Any]]:
+    """Read a query mix file: {"queries": [{"kind": "rag"|"code", "query": ..., ...}]}."""
+    queries = json.loads(path.read_text(encoding="utf-8"))["queries"]
+    for entry in queries:
+        if entry.get("kind") not in ("rag", "code") or not entry.get("query"):
+            raise ValueError(f"Invalid query mix entry in {path}: {entry}")
+    return queries
+
+
+def build_schedule(queries: list[dict[str, Any]], requests: int, seed: int) -> list[dict[str, Any]]:
+    """Deterministic weighted sample of ``requests`` queries."""
+    weights = [entry.get("weight", 1) for entry in queries]
+    return random.Random(seed).choices(queries, weights=weights, k=requests)
+
+
+@contextmanager
+def simulated_reranker(latency_per_pair: float) -> Iterator[None]:
+    """Make RAGService build its reranker around SimulatedCrossEncoder instead of loading a model."""
+
+    def factory(*args: Any, **kwargs: Any) -> RerankingStrategy:
+        return RerankingStrategy.from_model(SimulatedCrossEncoder(latency_per_pair), "simulated-cross-encoder")
+
+    with patch.object(rag_service, "RerankingStrategy", factory):
+        yield
+
+
+async def build_corpus(config: RagBenchmarkConfig) -> InMemorySupabaseClient:
+    """Ingest the fixture site into a fresh in-memory database and index it for search."""
+    database = InMemorySupabaseClient()
+    await run_ingestion_benchmark(
+        IngestionBenchmarkConfig(pages=config.corpus_pages, embedding_dimensions=config.embedding_dimensions),
+        database=database,
+    )
+    InMemoryVectorSearch(database).install()
+    database.timings.clear()
+    database.latency = config.db_latency
+    return database
+
+
+async def run_rag_benchmark(config: RagBenchmarkConfig) -> dict[str, Any]:
+    """Replay the query mix against RAGService and return the result document."""
+    schedule = build_schedule(load_query_mix(Path(config.queries)), config.requests, config.seed)
+    database = await build_corpus(config)
+    adapter = HashingEmbeddingAdapter(config.embedding_dimensions, latency=config.embedding_latency)
+    timer = StageTimer(keep_samples=True)
+    database.observer = lambda key, seconds: key.startswith("rpc:") and timer.record("vector_rpc", seconds)
+
+    settings = dict(
+        BENCHMARK_SETTINGS,
+        EMBEDDING_DIMENSIONS=str(config.embedding_dimensions),
+        USE_HYBRID_SEARCH=str(config.hybrid).lower(),
+        USE_RERANKING=str(config.rerank).lower(),
+        USE_AGENTIC_RAG="true",
+    )
+    errors: list[str] = []
+
+    with (
+        seeded_credentials(settings),
+        offline_providers(adapter, None),
+        simulated_reranker(config.rerank_latency_per_pair),
+    ):
+        service = RAGService(supabase_client=database)
+        pending = iter(schedule)
+
+        async def worker() -> None:
+            for entry in pending:
+                started = time.perf_counter()
+                if entry["kind"] == "code":
+                    success, response = await service.search_code_examples_service(
+                        entry["query"], match_count=entry.get("match_count", 5)
+                    )
+                else:
+                    success, response = await service.perform_rag_query(
+                        entry["query"],
+                        match_count=entry.get("match_count", 5),
+                        return_mode=entry.get("return_mode", "chunks"),
+                    )
+                timer.record(f"query.{entry['kind']}", time.perf_counter() - started)
+                if not success:
+                    errors.append(f"{entry['query']}: {response.get('error')}")
+
+        with timed_stages(timer, TIMED_STAGES):
+            async with LoopLagProbe() as probe:
+                started = time.perf_counter()
+                await asyncio.gather(*(worker() for _ in range(config.concurrency)))
+                duration = time.perf_counter() - started
+
+    all_queries = list(itertools.chain(timer.samples.get("query.rag", []), timer.samples.get("query.code", [])))
+    loop_lag = latency_summary(probe.samples)
+    metrics = {
+        "requests": len(schedule),
+        "errors": len(errors),
+        "corpus_chunks": len(database.tables["archon_crawled_pages"]),
+        "corpus_code_examples": len(database.tables["archon_code_examples"]),
+        "duration_seconds": round(duration, 4),
+        "throughput_qps": round(len(schedule) / duration, 2) if duration else None,
+        "query_p50_ms": latency_summary(all_queries)["p50_ms"],
+        "query_p99_ms": latency_summary(all_queries)["p99_ms"],
+        "loop_lag_p99_ms": loop_lag["p99_ms"],
+        "loop_lag_max_ms": loop_lag["max_ms"],
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    result = build_result(BENCHMARK_NAME, asdict(config), metrics, timer.latency_snapshot())
+    if errors:
+        result["errors"] = errors[:20]
+    return result
+
+
+def format_report(result: dict[str, Any]) -> str:
+    lines = [f"Benchmark: {result['benchmark']} ({result['timestamp']})", ""]
+    lines.extend(f"  {name:<22} {value}" for name, value in result["metrics"].items())
+    lines.extend(["", f"  {'stage':<16} {'calls':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"])
+    for stage, summary in result["stages"].items():
+        lines.append(
+            f"  {stage:<16} {summary['calls']:>7} {summary['p50_ms']:>9.3f} {summary['p95_ms']:>9.3f}"
+            f" {summary['p99_ms']:>9.3f} {summary['max_ms']:>9.3f}"
+        )
+    for error in result.get("errors", []):
+        lines.append(f"  error: {error}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200, help="Queries to replay")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent query workers")
+    parser.add_argument("--corpus-pages", type=int, default=60, help="Pages ingested into the search corpus")
+    parser.add_argument("--queries", type=Path, default=DEFAULT_QUERIES, help="Query mix JSON file")
+    parser.add_argument("--no-hybrid", action="store_true", help="Use vector search only")
+    parser.add_argument("--no-rerank", action="store_true", help="Disable reranking")
+    parser.add_argument("--embedding-latency-ms", type=float, default=0.0, help="Simulated time per embedding call")
+    parser.add_argument("--db-latency-ms", type=float, default=0.0, help="Simulated time per database call")
+    parser.add_argument("--rerank-ms-per-pair", type=float, default=0.2, help="Simulated blocking rerank time per pair")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for the query schedule")
+    parser.add_argument("--output", type=Path, default=None, help="Result file (default: benchmarks/results/)")
+    parser.add_argument("--baseline", type=Path, default=None, help="Earlier result to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed regression as a fraction")
+    parser.add_argument("--verbose", action="store_true", help="Keep service logging enabled")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        logging.disable(logging.WARNING)
+
+    config = RagBenchmarkConfig(
+        requests=args.requests,
+        concurrency=args.concurrency,
+        corpus_pages=args.corpus_pages,
+        queries=str(args.queries),
+        hybrid=not args.no_hybrid,
+        rerank=not args.no_rerank,
+        embedding_latency=args.embedding_latency_ms / 1000,
+        db_latency=args.db_latency_ms / 1000,
+        rerank_latency_per_pair=args.rerank_ms_per_pair / 1000,
+        seed=args.seed,
+    )
+    result = asyncio.run(run_rag_benchmark(config))
+    print(format_report(result))
+    print(f"\nSaved results to {save_results(result, args.output)}")
+
+    if result["metrics"]["errors"]:
+        print(f"\n{result['metrics']['errors']} queries failed")
+        return 1
+
+    if args.baseline:
+        regressions = compare_results(
+            result,
+            load_results(args.baseline),
+            HIGHER_IS_BETTER,
+            LOWER_IS_BETTER,
+            tolerance=args.tolerance,
+            min_stage_value=1.0,
+        )
+        if regressions:
+            print(f"\nRegressions against {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
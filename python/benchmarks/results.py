@@ -0,0 +1,123 @@
+"""
+Benchmark result files and regression comparison.
+
+Every benchmark produces a JSON document with a flat ``metrics`` mapping and a
+``stages`` mapping of per-stage timings. Saved results can be passed back as a
+baseline; ``compare_results`` flags metrics that moved in the wrong direction
+by more than the allowed tolerance.
+"""
+
+import json
+import platform
+import sys
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MiB, or None where unsupported."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB elsewhere
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def build_result(
+    benchmark: str,
+    parameters: dict[str, Any],
+    metrics: dict[str, float | int | None],
+    stages: dict[str, dict[str, Any]],
+) -> dict[str, Any]:
+    """Assemble a result document with environment details."""
+    return {
+        "benchmark": benchmark,
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "parameters": parameters,
+        "metrics": metrics,
+        "stages": stages,
+    }
+
+
+def save_results(result: dict[str, Any], output: Path | None = None) -> Path:
+    """Write a result document, defaulting to results/<benchmark>-<timestamp>.json."""
+    if output is None:
+        stamp = result["timestamp"].replace(":", "").replace("-", "").replace("+0000", "Z")
+        output = RESULTS_DIR / f"{result['benchmark']}-{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return output
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+@dataclass(frozen=True)
+class Regression:
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change_percent(self) -> float:
+        return (self.current - self.baseline) / self.baseline * 100 if self.baseline else 0.0
+
+    def __str__(self) -> str:
+        return f"{self.metric}: {self.baseline:g} -> {self.current:g} ({self.change_percent:+.1f}%)"
+
+
+def compare_results(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    higher_is_better: set[str],
+    lower_is_better: set[str],
+    tolerance: float = 0.10,
+    min_stage_value: float = 0.0,
+) -> list[Regression]:
+    """
+    Compare two result documents.
+
+    Metrics named in ``higher_is_better`` regress when they drop by more than
+    ``tolerance``; metrics in ``lower_is_better``, and every stage's seconds,
+    regress when they grow by more than ``tolerance``. Other metrics describe
+    the workload and are not compared. Stage values that stay under
+    ``min_stage_value`` in both runs are too small to compare reliably.
+    """
+    regressions: list[Regression] = []
+
+    def check(name: str, new: Any, old: Any, higher_better: bool) -> None:
+        if not isinstance(new, int | float) or not isinstance(old, int | float) or old <= 0:
+            return
+        if higher_better and new < old * (1 - tolerance):
+            regressions.append(Regression(name, old, new))
+        elif not higher_better and new > old * (1 + tolerance):
+            regressions.append(Regression(name, old, new))
+
+    for name, old in baseline.get("metrics", {}).items():
+        if name in higher_is_better or name in lower_is_better:
+            check(name, current.get("metrics", {}).get(name), old, name in higher_is_better)
+
+    for stage, old in baseline.get("stages", {}).items():
+        new = current.get("stages", {}).get(stage, {})
+        for key, old_value in old.items():
+            if key == "calls" or max(new.get(key) or 0, old_value) < min_stage_value:
+                continue
+            check(f"stages.{stage}.{key}", new.get(key), old_value, False)
+
+    return regressions
@@ -0,0 +1,626 @@
+"""
+Offline stand-ins for the external services used by the ingestion and RAG pipelines.
+
+Benchmarks swap these in for crawl4ai, the embedding provider, the LLM
+provider and Supabase so that a run measures Archon's own code path without
+network access or API keys:
+
+- FixtureCrawler serves a synthetic documentation site built from saved HTML
+  fixtures, converting pages with the markdown generator the strategy passes in.
+- HashingEmbeddingAdapter produces deterministic feature-hashed embeddings, so
+  texts that share words are close in vector space.
+- OfflineLLMClient answers chat completions with canned text.
+- SimulatedCrossEncoder scores rerank pairs by term overlap and blocks the
+  calling thread like CrossEncoder.predict.
+- InMemorySupabaseClient implements the subset of the supabase-py query builder
+  the services use, with optional per-call latency and per-table timings, and
+  InMemoryVectorSearch serves the match_* and hybrid_search_* RPCs over it.
+"""
+
+import asyncio
+import copy
+import functools
+import hashlib
+import math
+import re
+import time
+import uuid
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from src.server.services.embeddings.embedding_service import EmbeddingProviderAdapter
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+_TITLE_PATTERN = re.compile(r"<title>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+
+# ---------------------------------------------------------------------------
+# Crawler
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class FixtureCrawlResult:
+    """The attributes of crawl4ai's CrawlResult that the crawl strategies read."""
+
+    url: str
+    html: str = ""
+    success: bool = True
+    markdown: Any = None
+    links: dict[str, list[dict[str, str]]] = field(default_factory=dict)
+    response_headers: dict[str, str] = field(default_factory=dict)
+    status_code: int = 200
+    error_message: str = ""
+
+
+class FixtureSite:
+    """
+    A synthetic documentation site laid out as a tree of pages.
+
+    Page 0 is the root and page ``i`` links to pages ``i * fanout + 1`` through
+    ``i * fanout + fanout``. Each page reuses one of the saved fixtures (in
+    rotation) with a unique title and a navigation block pointing at its
+    children, so the recursive strategy discovers every page.
+    """
+
+    def __init__(
+        self,
+        pages: int,
+        fixtures_dir: Path = FIXTURES_DIR / "ingestion",
+        base_url: str = "https://docs.harbor.test",
+        fanout: int = 4,
+    ):
+        self.fixtures = [path.read_text(encoding="utf-8") for path in sorted(fixtures_dir.glob("*.html"))]
+        if not self.fixtures:
+            raise ValueError(f"No HTML fixtures found in {fixtures_dir}")
+        self.pages = max(1, pages)
+        self.base_url = base_url.rstrip("/")
+        self.fanout = max(1, fanout)
+
+    @property
+    def root_url(self) -> str:
+        return self.url_for(0)
+
+    @property
+    def depth(self) -> int:
+        """Crawl depth needed to reach every page from the root."""
+        depth, reachable, level = 1, 1, 1
+        while reachable < self.pages:
+            level *= self.fanout
+            reachable += level
+            depth += 1
+        return depth
+
+    def url_for(self, index: int) -> str:
+        return f"{self.base_url}/" if index == 0 else f"{self.base_url}/docs/page-{index}"
+
+    def index_for(self, url: str) -> int | None:
+        if url.rstrip("/") == self.base_url:
+            return 0
+        _, _, tail = url.rpartition("/page-")
+        if tail.isdigit() and 0 < int(tail) < self.pages:
+            return int(tail)
+        return None
+
+    def children(self, index: int) -> list[int]:
+        first = index * self.fanout + 1
+        return [child for child in range(first, first + self.fanout) if child < self.pages]
+
+    def render(self, index: int) -> str:
+        html = self.fixtures[index % len(self.fixtures)]
+        html = _TITLE_PATTERN.sub(lambda m: f"<title>{m.group(1).strip()} ({index})</title>", html, count=1)
+        nav = "".join(
+            f'<li><a href="{self.url_for(child)}">Page {child}</a></li>' for child in self.children(index)
+        )
+        return html.replace("</main>", f"<nav><ul>{nav}</ul></nav></main>", 1)
+
+
+class FixtureCrawler:
+    """
+    Drop-in for crawl4ai's AsyncWebCrawler that serves a FixtureSite.
+
+    Markdown is produced by the generator in the run config, exactly as the real
+    crawler does after rendering, so HTML-to-markdown conversion cost stays in
+    the measurement. ``page_latency`` adds a simulated fetch/render delay per page.
+    """
+
+    def __init__(self, site: FixtureSite, page_latency: float = 0.0):
+        self.site = site
+        self.page_latency = page_latency
+        self.pages_served = 0
+
+    async def __aenter__(self) -> "FixtureCrawler":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    async def arun(self, url: str, config: Any = None, **kwargs: Any) -> FixtureCrawlResult:
+        if self.page_latency:
+            await asyncio.sleep(self.page_latency)
+
+        index = self.site.index_for(url)
+        if index is None:
+            return FixtureCrawlResult(url=url, success=False, status_code=404, error_message="Not found")
+
+        html = self.site.render(index)
+        generator = getattr(config, "markdown_generator", None)
+        if generator is not None:
+            markdown = generator.generate_markdown(input_html=html, base_url=url)
+        else:
+            markdown = SimpleNamespace(raw_markdown=html, fit_markdown=html)
+
+        self.pages_served += 1
+        return FixtureCrawlResult(
+            url=url,
+            html=html,
+            markdown=markdown,
+            links={
+                "internal": [
+                    {"href": self.site.url_for(child), "text": f"Page {child}"}
+                    for child in self.site.children(index)
+                ],
+                "external": [],
+            },
+            response_headers={"content-type": "text/html; charset=utf-8", "etag": f'"page-{index}"'},
+        )
+
+    async def arun_many(
+        self, urls: list[str], config: Any = None, dispatcher: Any = None, **kwargs: Any
+    ) -> AsyncIterator[FixtureCrawlResult] | list[FixtureCrawlResult]:
+        if getattr(config, "stream", False):
+            return self._stream(urls, config)
+        return list(await asyncio.gather(*(self.arun(url, config) for url in urls)))
+
+    async def _stream(self, urls: list[str], config: Any) -> AsyncIterator[FixtureCrawlResult]:
+        tasks = [asyncio.ensure_future(self.arun(url, config)) for url in urls]
+        for task in asyncio.as_completed(tasks):
+            yield await task
+
+
+# ---------------------------------------------------------------------------
+# Embedding and LLM providers
+# ---------------------------------------------------------------------------
+
+
+def hashed_embedding(text: str, dimensions: int) -> list[float]:
+    """Deterministic bag-of-words embedding using signed feature hashing."""
+    vector = [0.0] * dimensions
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+        bucket = int.from_bytes(digest[:4], "little") % dimensions
+        vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm == 0:
+        vector[0] = 1.0
+        return vector
+    return [value / norm for value in vector]
+
+
+class HashingEmbeddingAdapter(EmbeddingProviderAdapter):
+    """Local embedding adapter returning hashed embeddings, with optional simulated latency."""
+
+    def __init__(self, dimensions: int = 1536, latency: float = 0.0):
+        self.dimensions = dimensions
+        self.latency = latency
+        self.texts_embedded = 0
+
+    async def create_embeddings(
+        self,
+        texts: list[str],
+        model: str,
+        dimensions: int | None = None,
+    ) -> list[list[float]]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.texts_embedded += len(texts)
+        return [hashed_embedding(text, dimensions or self.dimensions) for text in texts]
+
+
+class OfflineLLMClient:
+    """OpenAI-shaped client whose chat completions return a short canned answer."""
+
+    def __init__(self, reply: str = "Offline benchmark summary."):
+        self.reply = reply
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create_completion))
+
+    async def _create_completion(self, **kwargs: Any) -> Any:
+        message = SimpleNamespace(content=self.reply, reasoning_content=None, role="assistant")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+
+class SimulatedCrossEncoder:
+    """
+    Stand-in for sentence-transformers' CrossEncoder.
+
+    ``predict`` scores each (query, document) pair by the share of query terms
+    the document contains and sleeps ``latency_per_pair`` per pair without
+    yielding, as the real model's synchronous inference does.
+    """
+
+    def __init__(self, latency_per_pair: float = 0.0):
+        self.latency_per_pair = latency_per_pair
+
+    def predict(self, pairs: list[list[str]]) -> list[float]:
+        if self.latency_per_pair:
+            time.sleep(self.latency_per_pair * len(pairs))
+        scores = []
+        for query, document in pairs:
+            terms = set(_TOKEN_PATTERN.findall(query.lower()))
+            words = set(_TOKEN_PATTERN.findall(document.lower()))
+            scores.append(len(terms & words) / len(terms) if terms else 0.0)
+        return scores
+
+
+def offline_llm_client_factory(client: OfflineLLMClient | None = None) -> Callable[..., Any]:
+    """Build a replacement for llm_provider_service.get_llm_client."""
+    shared = client or OfflineLLMClient()
+
+    @asynccontextmanager
+    async def get_llm_client(*args: Any, **kwargs: Any) -> AsyncIterator[OfflineLLMClient]:
+        yield shared
+
+    return get_llm_client
+
+
+# ---------------------------------------------------------------------------
+# Supabase
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class QueryResponse:
+    data: Any
+    count: int | None = None
+
+
+@dataclass
+class TableTiming:
+    calls: int = 0
+    seconds: float = 0.0
+    rows: int = 0
+
+
+class InMemorySupabaseClient:
+    """
+    In-memory stand-in for the supabase-py client.
+
+    Tables are dicts of rows keyed by insertion order. ``latency`` is applied with
+    a blocking sleep on every ``execute()``, matching the synchronous client the
+    services call from async code. RPCs are served by handlers registered with
+    ``register_rpc``.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.tables: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self.timings: dict[str, TableTiming] = defaultdict(TableTiming)
+        # Called with (operation key, seconds) after every execute()
+        self.observer: Callable[[str, float], None] | None = None
+        self._rpc_handlers: dict[str, Callable[[InMemorySupabaseClient, dict[str, Any]], Any]] = {}
+
+    def table(self, name: str) -> "_Query":
+        return _Query(self, name)
+
+    def from_(self, name: str) -> "_Query":
+        return self.table(name)
+
+    def register_rpc(
+        self, name: str, handler: Callable[["InMemorySupabaseClient", dict[str, Any]], Any]
+    ) -> None:
+        self._rpc_handlers[name] = handler
+
+    def rpc(self, name: str, params: dict[str, Any] | None = None) -> "_RpcCall":
+        return _RpcCall(self, name, params or {})
+
+    def _record(self, key: str, started: float, rows: int) -> None:
+        elapsed = time.perf_counter() - started
+        timing = self.timings[key]
+        timing.calls += 1
+        timing.seconds += elapsed
+        timing.rows += rows
+        if self.observer:
+            self.observer(key, elapsed)
+
+
+class _RpcCall:
+    def __init__(self, client: InMemorySupabaseClient, name: str, params: dict[str, Any]):
+        self._client = client
+        self._name = name
+        self._params = params
+
+    def execute(self) -> QueryResponse:
+        started = time.perf_counter()
+        if self._client.latency:
+            time.sleep(self._client.latency)
+        handler = self._client._rpc_handlers.get(self._name)
+        data = handler(self._client, self._params) if handler else []
+        self._client._record(f"rpc:{self._name}", started, len(data) if isinstance(data, list) else 1)
+        return QueryResponse(data=data)
+
+
+class _Query:
+    """Chainable query builder covering the filters and writes the services use."""
+
+    def __init__(self, client: InMemorySupabaseClient, table: str):
+        self._client = client
+        self._table = table
+        self._operation = "select"
+        self._payload: Any = None
+        self._on_conflict: str | None = None
+        self._filters: list[Callable[[dict[str, Any]], bool]] = []
+        self._order: list[tuple[str, bool]] = []
+        self._limit: int | None = None
+        self._offset = 0
+        self._count: str | None = None
+        self._single = False
+
+    # Operations
+    def select(self, columns: str = "*", count: str | None = None, **kwargs: Any) -> "_Query":
+        self._operation = "select"
+        self._count = count
+        return self
+
+    def insert(self, rows: dict[str, Any] | list[dict[str, Any]], **kwargs: Any) -> "_Query":
+        self._operation = "insert"
+        self._payload = rows
+        return self
+
+    def upsert(
+        self, rows: dict[str, Any] | list[dict[str, Any]], on_conflict: str | None = None, **kwargs: Any
+    ) -> "_Query":
+        self._operation = "upsert"
+        self._payload = rows
+        self._on_conflict = on_conflict
+        return self
+
+    def update(self, values: dict[str, Any], **kwargs: Any) -> "_Query":
+        self._operation = "update"
+        self._payload = values
+        return self
+
+    def delete(self, **kwargs: Any) -> "_Query":
+        self._operation = "delete"
+        return self
+
+    # Filters
+    def eq(self, column: str, value: Any) -> "_Query":
+        return self._where(lambda row: row.get(column) == value)
+
+    def neq(self, column: str, value: Any) -> "_Query":
+        return self._where(lambda row: row.get(column) != value)
+
+    def gt(self, column: str, value: Any) -> "_Query":
+        return self._where(lambda row: row.get(column) is not None and row[column] > value)
+
+    def gte(self, column: str, value: Any) -> "_Query":
+        return self._where(lambda row: row.get(column) is not None and row[column] >= value)
+
+    def lt(self, column: str, value: Any) -> "_Query":
+        return self._where(lambda row: row.get(column) is not None and row[column] < value)
+
+    def lte(self, column: str, value: Any) -> "_Query":
+        return self._where(lambda row: row.get(column) is not None and row[column] <= value)
+
+    def in_(self, column: str, values: list[Any]) -> "_Query":
+        allowed = set(values)
+        return self._where(lambda row: row.get(column) in allowed)
+
+    def is_(self, column: str, value: Any) -> "_Query":
+        expected = None if value in (None, "null") else value
+        return self._where(lambda row: row.get(column) is expected or row.get(column) == expected)
+
+    def ilike(self, column: str, pattern: str) -> "_Query":
+        regex = re.compile("^" + re.escape(pattern).replace("%", ".*") + "$", re.IGNORECASE)
+        return self._where(lambda row: bool(regex.match(str(row.get(column) or ""))))
+
+    # Modifiers
+    def order(self, column: str, desc: bool = False, **kwargs: Any) -> "_Query":
+        self._order.append((column, desc))
+        return self
+
+    def limit(self, count: int, **kwargs: Any) -> "_Query":
+        self._limit = count
+        return self
+
+    def range(self, start: int, end: int) -> "_Query":
+        self._offset = start
+        self._limit = end - start + 1
+        return self
+
+    def single(self) -> "_Query":
+        self._single = True
+        return self
+
+    def maybe_single(self) -> "_Query":
+        return self.single()
+
+    def execute(self) -> QueryResponse:
+        started = time.perf_counter()
+        if self._client.latency:
+            time.sleep(self._client.latency)
+        data = getattr(self, f"_execute_{self._operation}")()
+        self._client._record(f"{self._operation}:{self._table}", started, len(data))
+
+        count = len(data) if self._count else None
+        if self._single:
+            return QueryResponse(data=data[0] if data else None, count=count)
+        return QueryResponse(data=data, count=count)
+
+    def _where(self, predicate: Callable[[dict[str, Any]], bool]) -> "_Query":
+        self._filters.append(predicate)
+        return self
+
+    def _matches(self, row: dict[str, Any]) -> bool:
+        return all(predicate(row) for predicate in self._filters)
+
+    def _rows(self) -> list[dict[str, Any]]:
+        return self._client.tables[self._table]
+
+    def _execute_select(self) -> list[dict[str, Any]]:
+        rows = [row for row in self._rows() if self._matches(row)]
+        for column, desc in reversed(self._order):
+            rows.sort(key=lambda row: (row.get(column) is None, row.get(column)), reverse=desc)
+        end = None if self._limit is None else self._offset + self._limit
+        return [copy.copy(row) for row in rows[self._offset:end]]
+
+    def _new_rows(self) -> list[dict[str, Any]]:
+        payload = self._payload if isinstance(self._payload, list) else [self._payload]
+        now = datetime.now(UTC).isoformat()
+        rows = []
+        for item in payload:
+            row = dict(item)
+            row.setdefault("id", str(uuid.uuid4()))
+            row.setdefault("created_at", now)
+            rows.append(row)
+        return rows
+
+    def _execute_insert(self) -> list[dict[str, Any]]:
+        rows = self._new_rows()
+        self._rows().extend(rows)
+        return [copy.copy(row) for row in rows]
+
+    def _execute_upsert(self) -> list[dict[str, Any]]:
+        keys = [key.strip() for key in (self._on_conflict or "id").split(",")]
+        table = self._rows()
+        index = {tuple(row.get(key) for key in keys): row for row in table}
+        written = []
+        for row in self._new_rows():
+            existing = index.get(tuple(row.get(key) for key in keys))
+            if existing is not None:
+                row.pop("id", None)
+                row.pop("created_at", None)
+                existing.update(row)
+                written.append(copy.copy(existing))
+            else:
+                table.append(row)
+                index[tuple(row.get(key) for key in keys)] = row
+                written.append(copy.copy(row))
+        return written
+
+    def _execute_update(self) -> list[dict[str, Any]]:
+        updated = []
+        for row in self._rows():
+            if self._matches(row):
+                row.update(self._payload)
+                updated.append(copy.copy(row))
+        return updated
+
+    def _execute_delete(self) -> list[dict[str, Any]]:
+        table = self._rows()
+        kept, removed = [], []
+        for row in table:
+            (removed if self._matches(row) else kept).append(row)
+        table[:] = kept
+        return removed
+
+
+class _SearchIndex:
+    """Sparse inverted index over one table's embeddings and words."""
+
+    def __init__(self, rows: list[dict[str, Any]]):
+        self.rows = rows
+        self.postings: dict[int, list[tuple[int, float]]] = defaultdict(list)
+        self.term_counts: list[Counter[str]] = []
+        for position, row in enumerate(rows):
+            vector = next(
+                (value for key, value in row.items() if key.startswith("embedding_") and isinstance(value, list)),
+                [],
+            )
+            for bucket, value in enumerate(vector):
+                if value:
+                    self.postings[bucket].append((position, value))
+            self.term_counts.append(Counter(_TOKEN_PATTERN.findall(str(row.get("content", "")).lower())))
+
+    def vector_matches(self, query_embedding: list[float]) -> dict[int, float]:
+        """Cosine similarity per row (embeddings are unit length), omitting rows with no overlap."""
+        scores: dict[int, float] = defaultdict(float)
+        for bucket, query_value in enumerate(query_embedding):
+            if query_value:
+                for position, value in self.postings.get(bucket, ()):
+                    scores[position] += query_value * value
+        return scores
+
+    def text_matches(self, query_text: str) -> dict[int, float]:
+        """Rows containing every query term, ranked by term frequency (like plainto_tsquery)."""
+        terms = {term for term in _TOKEN_PATTERN.findall(query_text.lower()) if len(term) > 2}
+        if not terms:
+            return {}
+        matches = {}
+        for position, counts in enumerate(self.term_counts):
+            if all(term in counts for term in terms):
+                matches[position] = sum(counts[term] for term in terms) / (10 * len(terms))
+        return matches
+
+
+class InMemoryVectorSearch:
+    """
+    Serves Archon's vector and hybrid search RPCs from an InMemorySupabaseClient.
+
+    The index is built from the rows present when ``install`` is called, so load
+    the corpus first. Results follow the SQL functions in complete_setup.sql:
+    vector and keyword candidates are limited to ``match_count`` each, merged,
+    labelled vector/keyword/hybrid, and ordered by similarity.
+    """
+
+    _RPC_TABLES = {
+        "match_archon_crawled_pages": ("archon_crawled_pages", False),
+        "match_archon_code_examples": ("archon_code_examples", False),
+        "hybrid_search_archon_crawled_pages": ("archon_crawled_pages", True),
+        "hybrid_search_archon_code_examples": ("archon_code_examples", True),
+    }
+    _COLUMNS = ("id", "url", "chunk_number", "content", "summary", "metadata", "source_id")
+
+    def __init__(self, client: InMemorySupabaseClient):
+        self.client = client
+        self.indexes: dict[str, _SearchIndex] = {}
+
+    def install(self) -> None:
+        for table in {table for table, _ in self._RPC_TABLES.values()}:
+            self.indexes[table] = _SearchIndex(list(self.client.tables[table]))
+        for name, (table, hybrid) in self._RPC_TABLES.items():
+            self.client.register_rpc(name, functools.partial(self._search, table=table, hybrid=hybrid))
+
+    def _search(
+        self, client: InMemorySupabaseClient, params: dict[str, Any], table: str, hybrid: bool
+    ) -> list[dict[str, Any]]:
+        index = self.indexes[table]
+        match_count = int(params.get("match_count", 10))
+
+        def allowed(position: int) -> bool:
+            row = index.rows[position]
+            metadata = row.get("metadata") or {}
+            source_filter = params.get("source_filter")
+            if source_filter and row.get("source_id") != source_filter:
+                return False
+            return all(metadata.get(key) == value for key, value in (params.get("filter") or {}).items())
+
+        def top(scores: dict[int, float]) -> dict[int, float]:
+            ranked = sorted((p for p in scores if allowed(p)), key=lambda p: scores[p], reverse=True)
+            return {position: scores[position] for position in ranked[:match_count]}
+
+        vector = top(index.vector_matches(params.get("query_embedding") or []))
+        keyword = top(index.text_matches(params.get("query_text", ""))) if hybrid else {}
+
+        results = []
+        for position in vector.keys() | keyword.keys():
+            row = index.rows[position]
+            result = {column: row.get(column) for column in self._COLUMNS if column in row}
+            result["similarity"] = vector.get(position, keyword.get(position, 0.0))
+            if hybrid:
+                if position in vector and position in keyword:
+                    result["match_type"] = "hybrid"
+                else:
+                    result["match_type"] = "vector" if position in vector else "keyword"
+            results.append(result)
+        results.sort(key=lambda result: result["similarity"], reverse=True)
+        return results[:match_count]
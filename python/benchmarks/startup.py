@@ -0,0 +1,240 @@
+"""
+Server startup benchmark.
+
+Imports ``src.server.main`` in fresh interpreters under ``python -X importtime``
+and runs the application lifespan up to the point where ``/health`` reports
+ready, with the configuration check, credential loading, Logfire setup and
+prompt loading stubbed out and the crawler browser launch replaced by a
+``--browser-launch-ms`` sleep. Reports median import and time-to-ready
+seconds, the packages that cost the most import time, and which heavy
+optional dependencies (crawl4ai, the OpenAI SDK, sentence-transformers, the
+PDF/Word libraries) were actually executed rather than deferred.
+
+Usage (from python/)::
+
+    uv run python -m benchmarks.startup --repeat 5
+    uv run python -m benchmarks.startup --baseline benchmarks/results/startup-base.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .results import build_result, compare_results, load_results, save_results
+
+BENCHMARK_NAME = "startup"
+HIGHER_IS_BETTER: set[str] = set()
+LOWER_IS_BETTER = {"import_seconds", "ready_seconds", "heavy_modules_loaded"}
+HEAVY_MODULES = ("crawl4ai", "openai", "sentence_transformers", "torch", "pdfplumber", "PyPDF2", "docx", "playwright")
+PYTHON_ROOT = Path(__file__).resolve().parents[1]
+PROBE_MARKER = "STARTUP_PROBE "
+
+
+@dataclass
+class StartupBenchmarkConfig:
+    """Parameters for one benchmark run."""
+
+    module: str = "src.server.main"
+    repeat: int = 5
+    lifespan: bool = True
+    browser_launch: float = 2.0
+    top: int = 15
+
+
+def executed_modules(names: tuple[str, ...] = HEAVY_MODULES) -> list[str]:
+    """Modules in ``names`` whose code has run; lazy placeholders do not count."""
+    loaded = []
+    for name in names:
+        module = sys.modules.get(name)
+        # type() rather than attribute access, which would load a lazy module
+        if module is not None and type(module).__name__ != "_LazyModule":
+            loaded.append(name)
+    return loaded
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Map module name to (self, cumulative) microseconds from ``-X importtime`` output."""
+    timings: dict[str, tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def package_of(module: str) -> str:
+    """Group Archon modules by service package and everything else by distribution."""
+    parts = module.split(".")
+    return ".".join(parts[:4]) if parts[0] == "src" else parts[0]
+
+
+def import_time_by_package(timings: dict[str, tuple[int, int]]) -> dict[str, float]:
+    """Self import time in milliseconds summed per ``package_of`` group."""
+    totals: dict[str, float] = defaultdict(float)
+    for module, (self_us, _) in timings.items():
+        totals[package_of(module)] += self_us / 1000
+    return dict(totals)
+
+
+async def _time_lifespan(main: Any, browser_launch: float) -> float:
+    """Seconds from entering the lifespan until the app reports ready."""
+    from unittest.mock import AsyncMock, patch
+
+    from src.server.services.credential_service import credential_service
+    from src.server.services.prompt_service import prompt_service
+
+    async def launch_browser() -> None:
+        await asyncio.sleep(browser_launch)
+
+    with (
+        patch("src.server.config.config.get_config"),
+        patch.object(main, "initialize_credentials", AsyncMock()),
+        patch.object(main, "setup_logfire"),
+        patch.object(main, "warm_up_crawler", launch_browser),
+        patch.object(main, "cleanup_crawler", AsyncMock()),
+        patch.object(credential_service, "start_watching"),
+        patch.object(credential_service, "stop_watching", AsyncMock()),
+        patch.object(prompt_service, "load_prompts", AsyncMock()),
+    ):
+        started = time.perf_counter()
+        async with main.lifespan(main.app):
+            ready = time.perf_counter() - started
+            if not main._initialization_complete:
+                raise RuntimeError("lifespan finished startup without marking the app ready")
+    return ready
+
+
+def probe(module: str, lifespan: bool, browser_launch: float) -> dict[str, Any]:
+    """Run inside the child interpreter: import ``module`` and optionally start its lifespan."""
+    started = time.perf_counter()
+    # __import__ rather than importlib.import_module, which -X importtime does not report
+    __import__(module)
+    import_seconds = time.perf_counter() - started
+    imported = sys.modules[module]
+    loaded = executed_modules()
+    ready_seconds = None
+    if lifespan:
+        ready_seconds = import_seconds + asyncio.run(_time_lifespan(imported, browser_launch))
+    return {"import_seconds": import_seconds, "ready_seconds": ready_seconds, "loaded": loaded}
+
+
+def run_probe(config: StartupBenchmarkConfig) -> tuple[dict[str, Any], dict[str, tuple[int, int]]]:
+    """One fresh interpreter: the probe's report and its import timings."""
+    command = [sys.executable, "-X", "importtime", "-m", "benchmarks.startup", "--probe", config.module]
+    command += ["--browser-launch-ms", str(config.browser_launch * 1000)]
+    if not config.lifespan:
+        command.append("--no-lifespan")
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    completed = subprocess.run(command, cwd=PYTHON_ROOT, env=env, capture_output=True, text=True, timeout=300)
+    report_line = next(
+        (line for line in completed.stdout.splitlines() if line.startswith(PROBE_MARKER)),
+        None,
+    )
+    if completed.returncode != 0 or report_line is None:
+        raise RuntimeError(f"Startup probe failed ({completed.returncode}):\n{completed.stderr[-2000:]}")
+    return json.loads(report_line[len(PROBE_MARKER) :]), parse_importtime(completed.stderr)
+
+
+def run_startup_benchmark(config: StartupBenchmarkConfig) -> dict[str, Any]:
+    """Probe ``config.repeat`` fresh interpreters and return the result document."""
+    reports = []
+    per_package: dict[str, list[float]] = defaultdict(list)
+    for _ in range(config.repeat):
+        report, timings = run_probe(config)
+        reports.append(report)
+        for package, ms in import_time_by_package(timings).items():
+            per_package[package].append(ms)
+
+    import_seconds = [report["import_seconds"] for report in reports]
+    ready_seconds = [report["ready_seconds"] for report in reports if report["ready_seconds"] is not None]
+    loaded = sorted({name for report in reports for name in report["loaded"]})
+    metrics = {
+        "repeat": config.repeat,
+        "import_seconds": round(statistics.median(import_seconds), 4),
+        "import_seconds_min": round(min(import_seconds), 4),
+        "ready_seconds": round(statistics.median(ready_seconds), 4) if ready_seconds else None,
+        "heavy_modules_loaded": len(loaded),
+    }
+    ranked = sorted(per_package.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    stages = {
+        package: {
+            "calls": len(samples),
+            "p50_ms": round(statistics.median(samples), 3),
+            "max_ms": round(max(samples), 3),
+        }
+        for package, samples in ranked[: config.top]
+    }
+    result = build_result(BENCHMARK_NAME, asdict(config), metrics, stages)
+    result["loaded_heavy_modules"] = loaded
+    return result
+
+
+def format_report(result: dict[str, Any]) -> str:
+    lines = [f"Benchmark: {result['benchmark']} ({result['timestamp']})", ""]
+    lines.extend(f"  {name:<22} {value}" for name, value in result["metrics"].items())
+    lines.append(f"  {'heavy modules run':<22} {', '.join(result['loaded_heavy_modules']) or 'none'}")
+    lines.extend(["", f"  {'package (self import time)':<40} {'p50 ms':>9} {'max ms':>9}"])
+    for package, summary in result["stages"].items():
+        lines.append(f"  {package:<40} {summary['p50_ms']:>9.1f} {summary['max_ms']:>9.1f}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="src.server.main", help="Module to import")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters to measure")
+    parser.add_argument("--no-lifespan", action="store_true", help="Only measure the import")
+    parser.add_argument("--browser-launch-ms", type=float, default=2000.0, help="Simulated crawler browser launch")
+    parser.add_argument("--top", type=int, default=15, help="Packages listed by import time")
+    parser.add_argument("--probe", metavar="MODULE", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--output", type=Path, default=None, help="Result file (default: benchmarks/results/)")
+    parser.add_argument("--baseline", type=Path, default=None, help="Earlier result to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed regression as a fraction")
+    args = parser.parse_args(argv)
+
+    if args.probe:
+        report = probe(args.probe, not args.no_lifespan, args.browser_launch_ms / 1000)
+        print(PROBE_MARKER + json.dumps(report))
+        return 0
+
+    config = StartupBenchmarkConfig(
+        module=args.module,
+        repeat=args.repeat,
+        lifespan=not args.no_lifespan,
+        browser_launch=args.browser_launch_ms / 1000,
+        top=args.top,
+    )
+    result = run_startup_benchmark(config)
+    print(format_report(result))
+    print(f"\nSaved results to {save_results(result, args.output)}")
+
+    if args.baseline:
+        regressions = compare_results(
+            result,
+            load_results(args.baseline),
+            HIGHER_IS_BETTER,
+            LOWER_IS_BETTER,
+            tolerance=args.tolerance,
+            min_stage_value=20.0,
+        )
+        if regressions:
+            print(f"\nRegressions against {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
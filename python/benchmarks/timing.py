@@ -0,0 +1,118 @@
+"""
+Stage timing helpers shared by the benchmarks.
+
+StageTimer wraps coroutine functions (patched in place for the duration of a
+run) and accumulates per-stage wall time, optionally keeping every sample so
+latency percentiles can be reported. LoopLagProbe measures how late the event
+loop wakes a periodic timer, which is how blocking calls made from async code
+show up under load.
+"""
+
+import asyncio
+import functools
+import math
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from typing import Any
+from unittest.mock import patch
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of ``values`` (q in 0-100); 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class StageTimer:
+    """Accumulates inclusive wall time and call counts per named stage."""
+
+    def __init__(self, keep_samples: bool = False) -> None:
+        self.keep_samples = keep_samples
+        self.stages: dict[str, dict[str, float]] = {}
+        self.samples: dict[str, list[float]] = {}
+
+    def wrap(self, stage: str, func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def timed(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                self.record(stage, time.perf_counter() - started)
+
+        return timed
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Record one call of ``stage``."""
+        self.add(stage, seconds)
+        if self.keep_samples:
+            self.samples.setdefault(stage, []).append(seconds)
+
+    def add(self, stage: str, seconds: float, calls: int = 1) -> None:
+        """Add aggregate time for ``stage`` without keeping a sample."""
+        entry = self.stages.setdefault(stage, {"calls": 0, "seconds": 0.0})
+        entry["calls"] += calls
+        entry["seconds"] += seconds
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Total calls and seconds per stage."""
+        return {
+            stage: {"calls": int(entry["calls"]), "seconds": round(entry["seconds"], 4)}
+            for stage, entry in sorted(self.stages.items())
+        }
+
+    def latency_snapshot(self) -> dict[str, dict[str, float]]:
+        """Call count and p50/p95/p99/max latency in milliseconds per sampled stage."""
+        return {stage: latency_summary(values) for stage, values in sorted(self.samples.items())}
+
+
+def latency_summary(values: list[float]) -> dict[str, float]:
+    """Percentile summary of samples given in seconds, reported in milliseconds."""
+    return {
+        "calls": len(values),
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "max_ms": round(max(values, default=0.0) * 1000, 3),
+    }
+
+
+@contextmanager
+def timed_stages(timer: StageTimer, targets: list[tuple[str, Any, str]]) -> Iterator[None]:
+    """Patch every ``(stage, owner, attribute)`` target with a timed wrapper."""
+    with ExitStack() as stack:
+        for stage, owner, attribute in targets:
+            original = getattr(owner, attribute)
+            stack.enter_context(patch.object(owner, attribute, timer.wrap(stage, original)))
+        yield
+
+
+class LoopLagProbe:
+    """Samples event-loop lag by measuring how late a periodic sleep returns."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "LoopLagProbe":
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.perf_counter() - started - self.interval))
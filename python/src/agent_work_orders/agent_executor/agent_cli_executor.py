@@ -1,11 +1,14 @@
 """Agent CLI Executor
 
-Executes Claude CLI commands for agent workflows.
+Executes Claude CLI commands for agent workflows. Output is consumed as a
+stream: each JSONL event is parsed, logged for the work order's live log
+stream and written to the output artifacts as soon as it arrives.
 """
 
 import asyncio
 import json
 import time
+from collections import deque
 from pathlib import Path
 
 from ..config import config
@@ -15,9 +18,149 @@ from ..utils.structured_logger import get_logger
 logger = get_logger(__name__)
 
 
+class _OutputArtifacts:
+    """JSONL and JSON array artifact files written as output arrives"""
+
+    def __init__(self, jsonl_path: Path, json_path: Path):
+        self.jsonl_path = jsonl_path
+        self.json_path = json_path
+        self._jsonl = open(jsonl_path, "w")
+        self._json = open(json_path, "w")
+        self._json.write("[")
+        self._json_items = 0
+
+    def write(self, line: str, message: object | None) -> None:
+        self._jsonl.write(line + "\n")
+        if message is not None:
+            self._json.write(",\n" if self._json_items else "\n")
+            self._json.write(json.dumps(message, indent=2))
+            self._json_items += 1
+
+    def close(self) -> None:
+        self._json.write("\n]\n" if self._json_items else "]\n")
+        self._jsonl.close()
+        self._json.close()
+
+
+class _AgentOutputStream:
+    """Incremental consumer of the CLI's stream-json output
+
+    Parses one JSONL event at a time, forwards it to the work order log
+    (and from there to the SSE stream), appends it to the output artifacts
+    and keeps only a bounded tail of raw output in memory.
+    """
+
+    def __init__(
+        self,
+        work_order_id: str | None,
+        artifacts: _OutputArtifacts | None,
+        log,
+        tail_bytes: int,
+    ):
+        self.work_order_id = work_order_id
+        self.session_id: str | None = None
+        self.result_message: dict[str, object] | None = None
+        self.event_count = 0
+        self._artifacts = artifacts
+        self._logger = log
+        self._tail: deque[str] = deque()
+        self._tail_size = 0
+        self._tail_bytes = tail_bytes
+
+    def feed_line(self, raw: bytes) -> None:
+        line = raw.decode(errors="replace").rstrip("\r")
+        if not line.strip():
+            return
+
+        self._tail.append(line)
+        self._tail_size += len(line) + 1
+        while self._tail_size > self._tail_bytes and len(self._tail) > 1:
+            self._tail_size -= len(self._tail.popleft()) + 1
+
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            message = None
+        if not isinstance(message, dict):
+            message = None
+
+        if self._artifacts is not None:
+            try:
+                self._artifacts.write(line, message)
+            except Exception as e:
+                self._logger.warning("output_artifacts_save_failed", error=str(e))
+                self._close_artifacts()
+
+        if message is None:
+            return
+
+        self.event_count += 1
+        if self.session_id is None and "session_id" in message:
+            self.session_id = message["session_id"]
+        if message.get("type") == "result":
+            self.result_message = message
+
+        if self.work_order_id:
+            self._logger.info(
+                "agent_stream_event_received",
+                work_order_id=self.work_order_id,
+                event_type=message.get("type"),
+                event_subtype=message.get("subtype"),
+                preview=_event_preview(message),
+            )
+
+    def tail_text(self) -> str:
+        return "\n".join(self._tail)
+
+    def close(self) -> None:
+        self._close_artifacts()
+
+    def _close_artifacts(self) -> None:
+        if self._artifacts is None:
+            return
+        artifacts, self._artifacts = self._artifacts, None
+        try:
+            artifacts.close()
+            self._logger.info(
+                "output_artifacts_saved",
+                jsonl=str(artifacts.jsonl_path),
+                json=str(artifacts.json_path),
+            )
+        except Exception as e:
+            self._logger.warning("output_artifacts_save_failed", error=str(e))
+
+
+def _event_preview(message: dict, limit: int = 200) -> str | None:
+    """Short human-readable summary of a stream-json event"""
+    if isinstance(message.get("result"), str):
+        text = message["result"]
+    else:
+        inner = message.get("message")
+        content = inner.get("content") if isinstance(inner, dict) else None
+        parts: list[str] = []
+        if isinstance(content, list):
+            for block in content:
+                if not isinstance(block, dict):
+                    continue
+                if block.get("type") == "text":
+                    parts.append(str(block.get("text", "")))
+                elif block.get("type") == "tool_use":
+                    parts.append(f"[tool: {block.get('name')}]")
+        text = " ".join(parts)
+    text = text.strip()
+    if not text:
+        return None
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
 class AgentCLIExecutor:
     """Executes Claude CLI commands"""
 
+    # Output is consumed incrementally; only this much raw stdout/stderr is kept
+    READ_CHUNK_BYTES = 64 * 1024
+    STDOUT_TAIL_BYTES = 256 * 1024
+    STDERR_TAIL_BYTES = 64 * 1024
+
     def __init__(self, cli_path: str | None = None):
         self.cli_path = cli_path or config.CLAUDE_CLI_PATH
         self._logger = logger
@@ -126,7 +269,13 @@ class AgentCLIExecutor:
             self._save_prompt(prompt_text, work_order_id)
 
         start_time = time.time()
-        session_id: str | None = None
+        stream = _AgentOutputStream(
+            work_order_id,
+            self._open_output_artifacts(work_order_id),
+            self._logger,
+            self.STDOUT_TAIL_BYTES,
+        )
+        stderr_tail: deque[bytes] = deque()
 
         try:
             process = await asyncio.create_subprocess_shell(
@@ -138,14 +287,14 @@ class AgentCLIExecutor:
             )
 
             try:
-                # Pass prompt via stdin if provided
-                stdin_data = prompt_text.encode() if prompt_text else None
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(input=stdin_data), timeout=timeout
+                await asyncio.wait_for(
+                    self._stream_process(process, prompt_text, stream, stderr_tail),
+                    timeout=timeout,
                 )
             except TimeoutError:
                 process.kill()
                 await process.wait()
+                stream.close()
                 duration = time.time() - start_time
                 self._logger.error(
                     "agent_command_timeout",
@@ -158,26 +307,18 @@ class AgentCLIExecutor:
                     stdout=None,
                     stderr=None,
                     exit_code=-1,
+                    session_id=stream.session_id,
                     error_message=f"Command timed out after {timeout}s",
                     duration_seconds=duration,
                 )
 
+            stream.close()
             duration = time.time() - start_time
 
-            # Decode output
-            stdout_text = stdout.decode() if stdout else ""
-            stderr_text = stderr.decode() if stderr else ""
-
-            # Save output artifacts if enabled
-            if work_order_id and stdout_text:
-                self._save_output_artifacts(stdout_text, work_order_id)
-
-            # Parse session ID and result message from JSONL output
-            if stdout_text:
-                session_id = self._extract_session_id(stdout_text)
-                result_message = self._extract_result_message(stdout_text)
-            else:
-                result_message = None
+            stdout_text = stream.tail_text()
+            stderr_text = b"".join(stderr_tail).decode(errors="replace")
+            session_id = stream.session_id
+            result_message = stream.result_message
 
             # Extract result text from JSONL result message
             result_text: str | None = None
@@ -226,6 +367,7 @@ class AgentCLIExecutor:
                     "agent_command_completed",
                     session_id=session_id,
                     duration=duration,
+                    event_count=stream.event_count,
                     work_order_id=work_order_id,
                 )
             else:
@@ -240,6 +382,7 @@ class AgentCLIExecutor:
             return result
 
         except Exception as e:
+            stream.close()
             duration = time.time() - start_time
             self._logger.error(
                 "agent_command_error",
@@ -257,6 +400,91 @@ class AgentCLIExecutor:
                 duration_seconds=duration,
             )
 
+    async def _stream_process(
+        self,
+        process: asyncio.subprocess.Process,
+        prompt_text: str | None,
+        stream: _AgentOutputStream,
+        stderr_tail: deque[bytes],
+    ) -> None:
+        """Feed the prompt and consume stdout/stderr as they are produced
+
+        Args:
+            process: Running CLI process
+            prompt_text: Prompt to write to stdin, if any
+            stream: Consumer for stdout JSONL events
+            stderr_tail: Receives the last STDERR_TAIL_BYTES of stderr
+        """
+
+        async def write_prompt() -> None:
+            if process.stdin is None:
+                return
+            try:
+                if prompt_text:
+                    process.stdin.write(prompt_text.encode())
+                    await process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                # CLI exited before reading its prompt; the exit code reports why
+                pass
+            finally:
+                process.stdin.close()
+
+        async def read_stdout() -> None:
+            if process.stdout is None:
+                return
+            # Pieces of a line that spans several chunks
+            partial: list[bytes] = []
+            while chunk := await process.stdout.read(self.READ_CHUNK_BYTES):
+                *lines, rest = chunk.split(b"\n")
+                if lines:
+                    partial.append(lines[0])
+                    stream.feed_line(b"".join(partial))
+                    for line in lines[1:]:
+                        stream.feed_line(line)
+                    partial = []
+                if rest:
+                    partial.append(rest)
+            if partial:
+                stream.feed_line(b"".join(partial))
+
+        async def read_stderr() -> None:
+            if process.stderr is None:
+                return
+            size = 0
+            while chunk := await process.stderr.read(self.READ_CHUNK_BYTES):
+                stderr_tail.append(chunk)
+                size += len(chunk)
+                while size > self.STDERR_TAIL_BYTES and len(stderr_tail) > 1:
+                    size -= len(stderr_tail.popleft())
+
+        await asyncio.gather(write_prompt(), read_stdout(), read_stderr())
+        await process.wait()
+
+    def _open_output_artifacts(self, work_order_id: str | None) -> _OutputArtifacts | None:
+        """Open JSONL/JSON artifact files that are appended to while the CLI runs
+
+        Args:
+            work_order_id: Work order ID for directory organization
+
+        Returns:
+            Open artifact writer, or None if disabled or not attributable
+        """
+        if not work_order_id or not config.ENABLE_OUTPUT_ARTIFACTS:
+            return None
+
+        try:
+            # Create directory: /tmp/agent-work-orders/{work_order_id}/outputs/
+            output_dir = Path(config.TEMP_DIR_BASE) / work_order_id / "outputs"
+            output_dir.mkdir(parents=True, exist_ok=True)
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            return _OutputArtifacts(
+                output_dir / f"output_{timestamp}.jsonl",
+                output_dir / f"output_{timestamp}.json",
+            )
+        except Exception as e:
+            self._logger.warning("output_artifacts_save_failed", error=str(e))
+            return None
+
     def _save_prompt(self, prompt_text: str, work_order_id: str) -> Path | None:
         """Save prompt to file for debugging
 
@@ -287,100 +515,3 @@ class AgentCLIExecutor:
         except Exception as e:
             self._logger.warning("prompt_save_failed", error=str(e))
             return None
-
-    def _save_output_artifacts(self, jsonl_output: str, work_order_id: str) -> tuple[Path | None, Path | None]:
-        """Save JSONL output and convert to JSON for easier consumption
-
-        Args:
-            jsonl_output: Raw JSONL output from Claude CLI
-            work_order_id: Work order ID for directory organization
-
-        Returns:
-            Tuple of (jsonl_path, json_path) or (None, None) if disabled
-        """
-        if not config.ENABLE_OUTPUT_ARTIFACTS:
-            return None, None
-
-        try:
-            # Create directory: /tmp/agent-work-orders/{work_order_id}/outputs/
-            output_dir = Path(config.TEMP_DIR_BASE) / work_order_id / "outputs"
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-
-            # Save JSONL
-            jsonl_file = output_dir / f"output_{timestamp}.jsonl"
-            with open(jsonl_file, "w") as f:
-                f.write(jsonl_output)
-
-            # Convert to JSON array
-            json_file = output_dir / f"output_{timestamp}.json"
-            try:
-                messages = [json.loads(line) for line in jsonl_output.strip().split("\n") if line.strip()]
-                with open(json_file, "w") as f:
-                    json.dump(messages, f, indent=2)
-            except Exception as e:
-                self._logger.warning("jsonl_to_json_conversion_failed", error=str(e))
-                json_file = None  # type: ignore[assignment]
-
-            self._logger.info("output_artifacts_saved", jsonl=str(jsonl_file), json=str(json_file) if json_file else None)
-            return jsonl_file, json_file
-        except Exception as e:
-            self._logger.warning("output_artifacts_save_failed", error=str(e))
-            return None, None
-
-    def _extract_session_id(self, jsonl_output: str) -> str | None:
-        """Extract session ID from JSONL output
-
-        Looks for session_id in JSON lines output from Claude CLI.
-
-        Args:
-            jsonl_output: JSONL output from Claude CLI
-
-        Returns:
-            Session ID if found, else None
-        """
-        try:
-            lines = jsonl_output.strip().split("\n")
-            for line in lines:
-                if not line.strip():
-                    continue
-                try:
-                    data = json.loads(line)
-                    if "session_id" in data:
-                        session_id: str = data["session_id"]
-                        return session_id
-                except json.JSONDecodeError:
-                    continue
-        except Exception as e:
-            self._logger.warning("session_id_extraction_failed", error=str(e))
-
-        return None
-
-    def _extract_result_message(self, jsonl_output: str) -> dict[str, object] | None:
-        """Extract result message from JSONL output
-
-        Looks for the final result message with error details.
-
-        Args:
-            jsonl_output: JSONL output from Claude CLI
-
-        Returns:
-            Result message dict if found, else None
-        """
-        try:
-            lines = jsonl_output.strip().split("\n")
-            # Result message should be last, but search from end to be safe
-            for line in reversed(lines):
-                if not line.strip():
-                    continue
-                try:
-                    data = json.loads(line)
-                    if data.get("type") == "result":
-                        return data  # type: ignore[no-any-return]
-                except json.JSONDecodeError:
-                    continue
-        except Exception as e:
-            self._logger.warning("result_message_extraction_failed", error=str(e))
-
-        return None
@@ -12,6 +12,7 @@ from sse_starlette.sse import EventSourceResponse
 
 from ..agent_executor.agent_cli_executor import AgentCLIExecutor
 from ..command_loader.claude_command_loader import ClaudeCommandLoader
+from ..config import config
 from ..github_integration.github_client import GitHubClient
 from ..models import (
     AgentPromptRequest,
@@ -26,6 +27,7 @@ from ..models import (
     GitHubRepositoryVerificationRequest,
     GitHubRepositoryVerificationResponse,
     GitProgressSnapshot,
+    SandboxType,
     StepHistory,
     UpdateRepositoryRequest,
 )
@@ -34,7 +36,9 @@ from ..state_manager.repository_config_repository import RepositoryConfigReposit
 from ..state_manager.repository_factory import create_repository
 from ..utils.id_generator import generate_work_order_id
 from ..utils.log_buffer import WorkOrderLogBuffer
+from ..utils.port_allocation import port_leases
 from ..utils.structured_logger import get_logger
+from ..workflow_engine.work_order_scheduler import QueueFullError, WorkOrderScheduler
 from ..workflow_engine.workflow_orchestrator import WorkflowOrchestrator
 from .sse_streams import stream_work_order_logs
 
@@ -143,6 +147,188 @@ orchestrator = WorkflowOrchestrator(
     command_loader=command_loader,
     state_repository=state_repository,
 )
+work_order_scheduler = WorkOrderScheduler(
+    max_concurrent=config.MAX_CONCURRENT_WORK_ORDERS,
+    max_queued=config.WORK_ORDER_QUEUE_LIMIT,
+)
+
+
+async def _execute_workflow_with_error_handling(
+    agent_work_order_id: str,
+    repository_url: str,
+    sandbox_type: SandboxType,
+    user_request: str,
+    selected_commands: list[str],
+    github_issue_number: str | None,
+) -> None:
+    """Execute workflow and handle any unhandled exceptions
+
+    Broad exception handler ensures all exceptions are caught and logged,
+    with full context for debugging. Status is updated to FAILED on errors.
+    """
+    try:
+        await orchestrator.execute_workflow(
+            agent_work_order_id=agent_work_order_id,
+            repository_url=repository_url,
+            sandbox_type=sandbox_type,
+            user_request=user_request,
+            selected_commands=selected_commands,
+            github_issue_number=github_issue_number,
+        )
+    except Exception as e:
+        # Catch any exceptions that weren't handled by the orchestrator
+        # (e.g., exceptions during initialization, argument validation, etc.)
+        error_msg = str(e)
+        logger.exception(
+            "workflow_execution_unhandled_exception",
+            agent_work_order_id=agent_work_order_id,
+            error=error_msg,
+            exception_type=type(e).__name__,
+            exc_info=True,
+        )
+        try:
+            # Update work order status to FAILED
+            await state_repository.update_status(
+                agent_work_order_id,
+                AgentWorkOrderStatus.FAILED,
+                error_message=f"Workflow execution failed before orchestrator could handle it: {error_msg}",
+            )
+        except Exception as update_error:
+            # Log but don't raise - we've already caught the original error
+            logger.error(
+                "workflow_status_update_failed_after_exception",
+                agent_work_order_id=agent_work_order_id,
+                update_error=str(update_error),
+                original_error=error_msg,
+                exc_info=True,
+            )
+        # Re-raise to ensure task.exception() returns the exception
+        raise
+
+
+def _schedule_work_order(
+    agent_work_order_id: str,
+    repository_url: str,
+    sandbox_type: SandboxType,
+    user_request: str,
+    selected_commands: list[str],
+    github_issue_number: str | None,
+    priority: int = 0,
+) -> int | None:
+    """Submit a work order to the scheduler
+
+    The workflow task is tracked in _workflow_tasks once it starts.
+
+    Returns:
+        Queue position, or None if the work order started immediately
+
+    Raises:
+        QueueFullError: If the queue is at capacity
+    """
+
+    def track_task(task: asyncio.Task) -> None:
+        _workflow_tasks[agent_work_order_id] = task
+        # Attach done callback to log exceptions and update status
+        task.add_done_callback(_create_task_done_callback(agent_work_order_id))
+        logger.debug(
+            "workflow_task_created_and_tracked",
+            agent_work_order_id=agent_work_order_id,
+            task_count=len(_workflow_tasks),
+        )
+
+    return work_order_scheduler.submit(
+        agent_work_order_id,
+        repository_url,
+        lambda: _execute_workflow_with_error_handling(
+            agent_work_order_id=agent_work_order_id,
+            repository_url=repository_url,
+            sandbox_type=sandbox_type,
+            user_request=user_request,
+            selected_commands=selected_commands,
+            github_issue_number=github_issue_number,
+        ),
+        priority=priority,
+        on_started=track_task,
+    )
+
+
+async def resume_pending_work_orders() -> int:
+    """Re-queue work orders left pending by a previous run of the service
+
+    Only work orders that persisted their request are resumed; with in-memory
+    state there is nothing to resume.
+
+    Returns:
+        Number of work orders re-queued
+    """
+    pending = await state_repository.list(status_filter=AgentWorkOrderStatus.PENDING)
+    pending.sort(key=lambda item: str(item[1].get("created_at", "")))
+
+    resumed = 0
+    for state, metadata in pending:
+        if not metadata.get("user_request"):
+            continue
+        try:
+            _schedule_work_order(
+                agent_work_order_id=state.agent_work_order_id,
+                repository_url=state.repository_url,
+                sandbox_type=SandboxType(metadata["sandbox_type"]),
+                user_request=metadata["user_request"],
+                selected_commands=metadata.get("selected_commands") or [],
+                github_issue_number=metadata.get("github_issue_number"),
+                priority=int(metadata.get("priority") or 0),
+            )
+            resumed += 1
+        except QueueFullError:
+            logger.warning(
+                "pending_work_order_resume_skipped",
+                agent_work_order_id=state.agent_work_order_id,
+                reason="queue_full",
+            )
+
+    if resumed:
+        logger.info("pending_work_orders_resumed", count=resumed)
+    return resumed
+
+
+async def reconcile_port_leases() -> list[str]:
+    """Reclaim port leases of work orders that are no longer pending or running
+
+    A running work order without a workflow task in this process was
+    interrupted when the service stopped; it is marked failed and its lease
+    reclaimed with the others. Call at startup, after resume_pending_work_orders.
+
+    Returns:
+        Sandbox identifiers whose leases were reclaimed
+    """
+    pending = await state_repository.list(status_filter=AgentWorkOrderStatus.PENDING)
+    active = [state.sandbox_identifier for state, _ in pending]
+
+    for state, _ in await state_repository.list(status_filter=AgentWorkOrderStatus.RUNNING):
+        if state.agent_work_order_id in _workflow_tasks:
+            active.append(state.sandbox_identifier)
+            continue
+        try:
+            await state_repository.update_status(
+                state.agent_work_order_id,
+                AgentWorkOrderStatus.FAILED,
+                error_message="Work order was interrupted by a service restart",
+            )
+        except Exception as e:
+            # Keep the lease rather than free ports a live-looking work order may claim
+            active.append(state.sandbox_identifier)
+            logger.error(
+                "stale_work_order_update_failed",
+                agent_work_order_id=state.agent_work_order_id,
+                error=str(e),
+            )
+            continue
+        logger.warning("stale_work_order_failed", agent_work_order_id=state.agent_work_order_id)
+
+    reclaimed = port_leases.reconcile(active)
+    if reclaimed:
+        logger.info("port_leases_reclaimed", count=len(reclaimed))
+    return reclaimed
 
 
 @router.post("/", status_code=201)
@@ -151,8 +337,13 @@ async def create_agent_work_order(
 ) -> AgentWorkOrderResponse:
     """Create a new agent work order
 
-    Creates a work order and starts workflow execution in the background.
+    Creates a work order and starts workflow execution in the background,
+    or queues it when all execution slots are busy. Returns 429 when the
+    queue is full.
     """
+    if not work_order_scheduler.can_admit():
+        raise HTTPException(status_code=429, detail="Work order queue is full, try again later")
+
     logger.info(
         "agent_work_order_creation_started",
         repository_url=request.repository_url,
@@ -185,81 +376,53 @@ async def create_agent_work_order(
             "git_commit_count": 0,
             "git_files_changed": 0,
             "error_message": None,
+            # Persisted so queued work orders can be resumed after a restart
+            "priority": request.priority,
+            "user_request": request.user_request,
+            "selected_commands": request.selected_commands,
         }
 
         # Save to repository
         await state_repository.create(state, metadata)
 
-        # Wrapper function to handle exceptions from workflow execution
-        async def execute_workflow_with_error_handling() -> None:
-            """Execute workflow and handle any unhandled exceptions
-            
-            Broad exception handler ensures all exceptions are caught and logged,
-            with full context for debugging. Status is updated to FAILED on errors.
-            """
-            try:
-                await orchestrator.execute_workflow(
+        # Admit through the scheduler; starts now if a slot is free, otherwise queues
+        try:
+            queue_position = _schedule_work_order(
                 agent_work_order_id=agent_work_order_id,
                 repository_url=request.repository_url,
                 sandbox_type=request.sandbox_type,
                 user_request=request.user_request,
                 selected_commands=request.selected_commands,
                 github_issue_number=request.github_issue_number,
+                priority=request.priority,
             )
-            except Exception as e:
-                # Catch any exceptions that weren't handled by the orchestrator
-                # (e.g., exceptions during initialization, argument validation, etc.)
-                error_msg = str(e)
-                logger.exception(
-                    "workflow_execution_unhandled_exception",
-                    agent_work_order_id=agent_work_order_id,
-                    error=error_msg,
-                    exception_type=type(e).__name__,
-                    exc_info=True,
-                )
-                try:
-                    # Update work order status to FAILED
-                    await state_repository.update_status(
-                        agent_work_order_id,
-                        AgentWorkOrderStatus.FAILED,
-                        error_message=f"Workflow execution failed before orchestrator could handle it: {error_msg}",
-                    )
-                except Exception as update_error:
-                    # Log but don't raise - we've already caught the original error
-                    logger.error(
-                        "workflow_status_update_failed_after_exception",
-                        agent_work_order_id=agent_work_order_id,
-                        update_error=str(update_error),
-                        original_error=error_msg,
-                        exc_info=True,
-                    )
-                # Re-raise to ensure task.exception() returns the exception
-                raise
-
-        # Create and track background workflow task
-        task = asyncio.create_task(execute_workflow_with_error_handling())
-        _workflow_tasks[agent_work_order_id] = task
-        
-        # Attach done callback to log exceptions and update status
-        task.add_done_callback(_create_task_done_callback(agent_work_order_id))
-        
-        logger.debug(
-            "workflow_task_created_and_tracked",
-            agent_work_order_id=agent_work_order_id,
-            task_count=len(_workflow_tasks),
-        )
+        except QueueFullError as e:
+            await state_repository.update_status(
+                agent_work_order_id,
+                AgentWorkOrderStatus.FAILED,
+                error_message=str(e),
+            )
+            raise HTTPException(status_code=429, detail=str(e)) from e
 
         logger.info(
             "agent_work_order_created",
             agent_work_order_id=agent_work_order_id,
+            queue_position=queue_position,
         )
 
         return AgentWorkOrderResponse(
             agent_work_order_id=agent_work_order_id,
             status=AgentWorkOrderStatus.PENDING,
-            message="Agent work order created and workflow execution started",
+            message=(
+                "Agent work order created and workflow execution started"
+                if queue_position is None
+                else f"Agent work order created and queued at position {queue_position}"
+            ),
+            queue_position=queue_position,
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("agent_work_order_creation_failed", error=str(e), exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to create work order: {e}") from e
@@ -607,6 +770,7 @@ async def get_agent_work_order(agent_work_order_id: str) -> AgentWorkOrder:
             git_commit_count=metadata.get("git_commit_count", 0),
             git_files_changed=metadata.get("git_files_changed", 0),
             error_message=metadata.get("error_message"),
+            queue_position=work_order_scheduler.queue_position(agent_work_order_id),
         )
 
         logger.info("agent_work_order_get_completed", agent_work_order_id=agent_work_order_id)
@@ -638,6 +802,7 @@ async def list_agent_work_orders(
     try:
         results = await state_repository.list(status_filter=status)
 
+        queue_positions = work_order_scheduler.queue_positions()
         work_orders = []
         for state, metadata in results:
             work_order = AgentWorkOrder(
@@ -656,6 +821,7 @@ async def list_agent_work_orders(
                 git_commit_count=metadata.get("git_commit_count", 0),
                 git_files_changed=metadata.get("git_files_changed", 0),
                 error_message=metadata.get("error_message"),
+                queue_position=queue_positions.get(state.agent_work_order_id),
             )
             work_orders.append(work_order)
 
@@ -667,6 +833,45 @@ async def list_agent_work_orders(
         raise HTTPException(status_code=500, detail=f"Failed to list work orders: {e}") from e
 
 
+@router.post("/{agent_work_order_id}/cancel")
+async def cancel_agent_work_order(agent_work_order_id: str) -> dict:
+    """Cancel a work order that is still waiting in the queue
+
+    Returns 404 if the work order does not exist and 409 if it is not queued
+    (already running or finished).
+    """
+    logger.info("agent_work_order_cancel_started", agent_work_order_id=agent_work_order_id)
+
+    result = await state_repository.get(agent_work_order_id)
+    if not result:
+        raise HTTPException(status_code=404, detail="Work order not found")
+
+    if not work_order_scheduler.cancel(agent_work_order_id):
+        raise HTTPException(status_code=409, detail="Only queued work orders can be cancelled")
+
+    try:
+        await state_repository.update_status(
+            agent_work_order_id,
+            AgentWorkOrderStatus.FAILED,
+            error_message="Cancelled while queued",
+        )
+    except Exception as e:
+        logger.error(
+            "agent_work_order_cancel_status_update_failed",
+            agent_work_order_id=agent_work_order_id,
+            error=str(e),
+            exc_info=True,
+        )
+        raise HTTPException(status_code=500, detail=f"Failed to cancel work order: {e}") from e
+
+    logger.info("agent_work_order_cancelled", agent_work_order_id=agent_work_order_id)
+    return {
+        "success": True,
+        "agent_work_order_id": agent_work_order_id,
+        "message": "Queued work order cancelled",
+    }
+
+
 @router.post("/{agent_work_order_id}/prompt")
 async def send_prompt_to_agent(
     agent_work_order_id: str,
@@ -856,12 +1061,18 @@ async def stream_agent_work_order_logs(
 
 
 @router.get("/{agent_work_order_id}/steps")
-async def get_agent_work_order_steps(agent_work_order_id: str) -> StepHistory:
+async def get_agent_work_order_steps(
+    agent_work_order_id: str,
+    after_step: int | None = Query(
+        None, ge=-1, description="Only return steps after this 0-based step index"
+    ),
+) -> StepHistory:
     """Get step execution history for a work order
 
     Returns detailed history of each step executed,
     including success/failure, duration, and errors.
     Returns empty history if work order exists but has no steps yet.
+    Pass after_step to fetch only the steps added since the last poll.
     """
     logger.info("agent_step_history_get_started", agent_work_order_id=agent_work_order_id)
 
@@ -871,7 +1082,9 @@ async def get_agent_work_order_steps(agent_work_order_id: str) -> StepHistory:
         if not result:
             raise HTTPException(status_code=404, detail="Work order not found")
 
-        step_history = await state_repository.get_step_history(agent_work_order_id)
+        step_history = await state_repository.get_step_history(
+            agent_work_order_id, after_step=after_step
+        )
 
         if not step_history:
             # Work order exists but no steps yet - return empty history
@@ -12,6 +12,8 @@ from typing import Any
 
 from ..utils.log_buffer import WorkOrderLogBuffer
 
+HEARTBEAT_INTERVAL_SECONDS = 15.0
+
 
 async def stream_work_order_logs(
     work_order_id: str,
@@ -37,14 +39,19 @@ async def stream_work_order_logs(
 
     Examples:
         async for event in stream_work_order_logs("wo-123", buffer):
-            # event = {"data": '{"timestamp": "...", "level": "info", ...}'}
+            # event = {"id": "42", "data": '{"timestamp": "...", "level": "info", ...}'}
             print(event)
 
     Notes:
         - Generator automatically handles client disconnects via CancelledError
         - Heartbeat comments prevent proxy/load balancer timeouts
-        - Non-blocking polling with 0.5s interval
+        - Wakes only when the work order logs something (or a heartbeat is due)
+        - Resumes by sequence number, so entries sharing a timestamp are
+          neither dropped nor repeated
     """
+    # Entries up to here are either in existing_logs or excluded by the filters
+    last_sequence = log_buffer.get_latest_sequence(work_order_id)
+
     # Get existing buffered logs first
     existing_logs = log_buffer.get_logs(
         work_order_id=work_order_id,
@@ -56,39 +63,27 @@ async def stream_work_order_logs(
     # Yield existing logs as SSE events
     for log_entry in existing_logs:
         yield format_log_event(log_entry)
-
-    # Track last seen timestamp to avoid duplicates
-    last_timestamp = (
-        existing_logs[-1]["timestamp"] if existing_logs else since_timestamp or ""
-    )
+        last_sequence = max(last_sequence, log_entry.get("sequence", 0))
 
     # Stream new logs as they arrive
-    heartbeat_counter = 0
-    heartbeat_interval = 30  # 30 iterations * 0.5s = 15 seconds
-
     try:
         while True:
-            # Poll for new logs
-            new_logs = log_buffer.get_logs_since(
-                work_order_id=work_order_id,
-                since_timestamp=last_timestamp,
+            has_new_logs = await log_buffer.wait_for_logs(
+                work_order_id, last_sequence, timeout=HEARTBEAT_INTERVAL_SECONDS
+            )
+            if not has_new_logs:
+                # Send heartbeat comment to keep connection alive
+                yield {"comment": "keepalive"}
+                continue
+
+            new_logs, last_sequence = log_buffer.get_logs_after(
+                work_order_id,
+                last_sequence,
                 level=level_filter,
                 step=step_filter,
             )
-
-            # Yield new logs
             for log_entry in new_logs:
                 yield format_log_event(log_entry)
-                last_timestamp = log_entry["timestamp"]
-
-            # Send heartbeat comment every 15 seconds to keep connection alive
-            heartbeat_counter += 1
-            if heartbeat_counter >= heartbeat_interval:
-                yield {"comment": "keepalive"}
-                heartbeat_counter = 0
-
-            # Non-blocking sleep before next poll
-            await asyncio.sleep(0.5)
 
     except asyncio.CancelledError:
         # Client disconnected - clean exit
@@ -102,7 +97,8 @@ def format_log_event(log_dict: dict[str, Any]) -> dict[str, str]:
         log_dict: Dictionary containing log entry data
 
     Returns:
-        SSE event dictionary with "data" key containing JSON string
+        SSE event dictionary with "data" key containing JSON string, and
+        "id" set to the entry's sequence number when it has one
 
     Examples:
         event = format_log_event({
@@ -118,7 +114,10 @@ def format_log_event(log_dict: dict[str, Any]) -> dict[str, str]:
         - JSON serialization handles datetime conversion
         - Event format follows SSE specification: data: {json}
     """
-    return {"data": json.dumps(log_dict)}
+    event = {"data": json.dumps(log_dict)}
+    if "sequence" in log_dict:
+        event["id"] = str(log_dict["sequence"])
+    return event
 
 
 def get_current_timestamp() -> str:
@@ -60,6 +60,8 @@ class AgentWorkOrdersConfig:
 
     # Worktree configuration
     WORKTREE_BASE_DIR: str = os.getenv("WORKTREE_BASE_DIR", "trees")
+    # Warm worktrees kept ready per repository (0 disables the pool)
+    WORKTREE_POOL_SIZE: int = int(os.getenv("WORKTREE_POOL_SIZE", "2"))
 
     # Port allocation for parallel execution
     BACKEND_PORT_RANGE_START: int = int(os.getenv("BACKEND_PORT_START", "9100"))
@@ -67,6 +69,14 @@ class AgentWorkOrdersConfig:
     FRONTEND_PORT_RANGE_START: int = int(os.getenv("FRONTEND_PORT_START", "9200"))
     FRONTEND_PORT_RANGE_END: int = int(os.getenv("FRONTEND_PORT_END", "9214"))
 
+    # Admission control: work orders beyond the concurrency limit wait in a queue
+    MAX_CONCURRENT_WORK_ORDERS: int = int(os.getenv("MAX_CONCURRENT_WORK_ORDERS", "3"))
+    WORK_ORDER_QUEUE_LIMIT: int = int(os.getenv("WORK_ORDER_QUEUE_LIMIT", "100"))
+
+    # Git: work orders against the same repository within this window share one fetch
+    GIT_FETCH_CACHE_SECONDS: float = float(os.getenv("GIT_FETCH_CACHE_SECONDS", "30"))
+    GIT_FETCH_TIMEOUT: int = int(os.getenv("GIT_FETCH_TIMEOUT", "300"))
+
     # State management configuration
     STATE_STORAGE_TYPE: str = os.getenv("STATE_STORAGE_TYPE", "memory")  # "memory" or "file"
     FILE_STATE_DIRECTORY: str = os.getenv("FILE_STATE_DIRECTORY", "agent-work-orders-state")
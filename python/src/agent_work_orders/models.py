@@ -92,6 +92,9 @@ class AgentWorkOrder(BaseModel):
     git_files_changed: int = 0
     error_message: str | None = None
 
+    # Scheduling (only set while the work order waits for an execution slot)
+    queue_position: int | None = None
+
 
 class CreateAgentWorkOrderRequest(BaseModel):
     """Request to create a new agent work order
@@ -112,6 +115,12 @@ class CreateAgentWorkOrderRequest(BaseModel):
         description="Commands to run in sequence"
     )
     github_issue_number: str | None = Field(None, description="Optional explicit GitHub issue number for reference")
+    priority: int = Field(
+        default=0,
+        ge=-10,
+        le=10,
+        description="Scheduling priority; higher values start first when the queue is busy"
+    )
 
     @field_validator('selected_commands')
     @classmethod
@@ -130,6 +139,7 @@ class AgentWorkOrderResponse(BaseModel):
     agent_work_order_id: str
     status: AgentWorkOrderStatus
     message: str
+    queue_position: int | None = None
 
 
 class AgentPromptRequest(BaseModel):
@@ -6,12 +6,11 @@ Enables parallel execution of multiple work orders without conflicts.
 
 import asyncio
 import os
-import subprocess
 import time
 
 from ..models import CommandExecutionResult, SandboxSetupError
-from ..utils.git_operations import get_current_branch
-from ..utils.port_allocation import find_available_port_range
+from ..utils.git_operations import get_current_branch, repository_lock, run_git
+from ..utils.port_allocation import port_leases
 from ..utils.structured_logger import get_logger
 from ..utils.worktree_operations import (
     create_worktree,
@@ -20,6 +19,7 @@ from ..utils.worktree_operations import (
     remove_worktree,
     setup_worktree_environment,
 )
+from .worktree_pool import worktree_pool
 
 logger = get_logger(__name__)
 
@@ -48,14 +48,15 @@ class GitWorktreeSandbox:
     async def setup(self) -> None:
         """Create worktree and set up isolated environment
 
-        Creates worktree from origin/main and allocates a port range.
+        Claims a warm worktree from the pool when one is ready, otherwise
+        creates one from origin/main, and allocates a port range.
         Each work order gets 10 ports for flexibility.
         """
         self._logger.info("worktree_sandbox_setup_started")
 
         try:
-            # Allocate port range deterministically
-            self.port_range_start, self.port_range_end, self.available_ports = find_available_port_range(
+            # Lease a port range that no other work order holds
+            self.port_range_start, self.port_range_end, self.available_ports = port_leases.acquire(
                 self.sandbox_identifier
             )
             self._logger.info(
@@ -70,12 +71,17 @@ class GitWorktreeSandbox:
             # The temporary branch will be cleaned up in cleanup() method
             self.temp_branch = f"wo-{self.sandbox_identifier}"
 
-            worktree_path, error = create_worktree(
-                self.repository_url,
-                self.sandbox_identifier,
-                self.temp_branch,
-                self._logger
+            worktree_path = await worktree_pool.claim(
+                self.repository_url, self.sandbox_identifier, self.temp_branch
             )
+            error = None
+            if not worktree_path:
+                worktree_path, error = await create_worktree(
+                    self.repository_url,
+                    self.sandbox_identifier,
+                    self.temp_branch,
+                    self._logger
+                )
 
             if error or not worktree_path:
                 raise SandboxSetupError(f"Failed to create worktree: {error}")
@@ -202,21 +208,24 @@ class GitWorktreeSandbox:
             return None
 
     async def cleanup(self) -> None:
-        """Remove worktree and temporary branch
+        """Release worktree and remove temporary branch
 
-        Removes the worktree directory and the temporary branch that was created
-        during setup. This ensures cleanup even if the agent failed before creating
-        the actual feature branch.
+        Returns the worktree to the pool (or removes it when the pool is full),
+        releases the port lease, and deletes the temporary branch that was
+        created during setup. This ensures cleanup even if the agent failed
+        before creating the actual feature branch.
         """
         self._logger.info("worktree_sandbox_cleanup_started")
 
         try:
-            # Remove the worktree first
-            worktree_success, error = remove_worktree(
-                self.repository_url,
-                self.sandbox_identifier,
-                self._logger
-            )
+            # Release the worktree first
+            worktree_success, error = True, None
+            if not await worktree_pool.release(self.repository_url, self.sandbox_identifier):
+                worktree_success, error = await remove_worktree(
+                    self.repository_url,
+                    self.sandbox_identifier,
+                    self._logger
+                )
             
             if not worktree_success:
                 self._logger.error(
@@ -224,6 +233,8 @@ class GitWorktreeSandbox:
                     error=error
                 )
             
+            port_leases.release(self.sandbox_identifier)
+
             # Delete the temporary branch if it was created
             # Always try to delete branch even if worktree removal failed,
             # as the branch may still exist and need cleanup
@@ -263,15 +274,10 @@ class GitWorktreeSandbox:
 
             # Delete the branch (local only - don't force push to remote)
             # Use -D to force delete even if not merged
-            cmd = ["git", "branch", "-D", self.temp_branch]
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=base_repo_path,
-            )
+            async with repository_lock(base_repo_path):
+                result = await run_git(["branch", "-D", self.temp_branch], cwd=base_repo_path)
 
-            if result.returncode == 0:
+            if result.ok:
                 self._logger.info(
                     "temp_branch_deleted",
                     temp_branch=self.temp_branch
@@ -0,0 +1,270 @@
+"""Worktree Pool
+
+Keeps a few clean, detached worktrees per repository ready in the background
+so a work order can start without waiting for a fetch and a full checkout.
+Pooled worktrees live next to the per-work-order ones under trees/ and share
+the base repository's object store, so claiming one is a `git worktree move`
+plus a `checkout -B` of the work order's branch.
+"""
+
+import asyncio
+import os
+import uuid
+from collections import deque
+
+from ..config import config
+from ..utils.git_operations import fetch_origin, repository_lock, run_git
+from ..utils.structured_logger import get_logger
+from ..utils.worktree_operations import (
+    ensure_base_repository,
+    get_base_repo_path,
+    get_worktree_path,
+)
+
+logger = get_logger(__name__)
+
+POOL_WORKTREE_PREFIX = ".pool-"
+
+
+class WorktreePool:
+    """Per-repository pool of pre-created, reset-able worktrees
+
+    A repository is warmed once a work order has run against it. Claimed
+    worktrees are replaced in the background, and released worktrees are
+    reset and returned to the pool instead of being deleted while the pool
+    is below its target size.
+    """
+
+    def __init__(self, size: int):
+        """Initialize the pool
+
+        Args:
+            size: Idle worktrees to keep per repository (0 disables pooling)
+        """
+        self.size = max(0, size)
+        self._idle: dict[str, deque[str]] = {}
+        self._warming: dict[str, asyncio.Task] = {}
+        self._adopted: set[str] = set()
+        self._logger = logger
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    def idle_count(self, repository_url: str) -> int:
+        """Number of warm worktrees ready for a repository"""
+        return len(self._idle.get(repository_url, ()))
+
+    async def claim(
+        self, repository_url: str, work_order_id: str, branch_name: str
+    ) -> str | None:
+        """Take a warm worktree for a work order
+
+        Moves the pooled worktree to the work order's path and checks out
+        branch_name at origin/main. Always schedules background warming, so
+        the first work order against a repository fills the pool for the next.
+
+        Args:
+            repository_url: Git repository URL
+            work_order_id: Work order the worktree is for
+            branch_name: Branch to create (or reset) in the worktree
+
+        Returns:
+            Worktree path, or None if no warm worktree was usable
+        """
+        if not self.enabled:
+            return None
+
+        idle = self._idle.get(repository_url)
+        base_repo_path = get_base_repo_path(repository_url)
+        worktree_path = get_worktree_path(repository_url, work_order_id)
+        claimed: str | None = None
+
+        while idle and claimed is None:
+            pooled_path = idle.popleft()
+            async with repository_lock(base_repo_path):
+                if os.path.exists(worktree_path):
+                    idle.appendleft(pooled_path)
+                    break
+
+                await fetch_origin(base_repo_path, self._logger)
+                moved = await run_git(
+                    ["worktree", "move", pooled_path, worktree_path], cwd=base_repo_path
+                )
+                if not moved.ok:
+                    self._logger.warning(
+                        "worktree_pool_claim_failed", pooled_path=pooled_path, error=moved.stderr
+                    )
+                    await self._discard(base_repo_path, pooled_path)
+                    continue
+
+                checkout = await run_git(
+                    ["checkout", "--force", "-B", branch_name, "origin/main"], cwd=worktree_path
+                )
+                if not checkout.ok:
+                    self._logger.warning(
+                        "worktree_pool_checkout_failed",
+                        worktree_path=worktree_path,
+                        error=checkout.stderr,
+                    )
+                    await self._discard(base_repo_path, worktree_path)
+                    continue
+
+                claimed = worktree_path
+
+        self.warm(repository_url)
+
+        if claimed:
+            self._logger.info(
+                "worktree_pool_claimed",
+                repository_url=repository_url,
+                work_order_id=work_order_id,
+                idle=self.idle_count(repository_url),
+            )
+        return claimed
+
+    async def release(self, repository_url: str, work_order_id: str) -> bool:
+        """Reset a finished work order's worktree and return it to the pool
+
+        Args:
+            repository_url: Git repository URL
+            work_order_id: Work order whose worktree is released
+
+        Returns:
+            True if the worktree was pooled; False if the caller should remove it
+        """
+        if not self.enabled or self.idle_count(repository_url) >= self.size:
+            return False
+
+        base_repo_path = get_base_repo_path(repository_url)
+        worktree_path = get_worktree_path(repository_url, work_order_id)
+        if not os.path.exists(worktree_path) or not os.path.exists(base_repo_path):
+            return False
+
+        pooled_path = self._new_pool_path(repository_url)
+        async with repository_lock(base_repo_path):
+            # Detach so the work order's branches can be deleted, then drop all changes
+            for args in (["checkout", "--detach", "--force"], ["clean", "-ffdx"]):
+                result = await run_git(args, cwd=worktree_path)
+                if not result.ok:
+                    self._logger.warning(
+                        "worktree_pool_reset_failed", worktree_path=worktree_path, error=result.stderr
+                    )
+                    return False
+
+            moved = await run_git(
+                ["worktree", "move", worktree_path, pooled_path], cwd=base_repo_path
+            )
+            if not moved.ok:
+                self._logger.warning(
+                    "worktree_pool_release_failed", worktree_path=worktree_path, error=moved.stderr
+                )
+                return False
+
+        self._idle.setdefault(repository_url, deque()).append(pooled_path)
+        self._logger.info(
+            "worktree_pool_released",
+            repository_url=repository_url,
+            work_order_id=work_order_id,
+            idle=self.idle_count(repository_url),
+        )
+        return True
+
+    def warm(self, repository_url: str) -> None:
+        """Top up a repository's pool in the background"""
+        if not self.enabled or repository_url in self._warming:
+            return
+        if self.idle_count(repository_url) >= self.size and repository_url in self._adopted:
+            return
+
+        task = asyncio.create_task(self._fill(repository_url))
+        self._warming[repository_url] = task
+        task.add_done_callback(lambda _: self._warming.pop(repository_url, None))
+
+    async def shutdown(self) -> None:
+        """Stop background warming; pooled worktrees stay on disk for the next start"""
+        tasks = list(self._warming.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._warming.clear()
+
+    def snapshot(self) -> dict[str, object]:
+        """Pool counters for health and monitoring endpoints"""
+        return {
+            "size": self.size,
+            "idle": {repo: len(paths) for repo, paths in self._idle.items()},
+            "warming": len(self._warming),
+        }
+
+    async def _fill(self, repository_url: str) -> None:
+        """Create detached worktrees at origin/main until the pool is full"""
+        base_repo_path = get_base_repo_path(repository_url)
+        idle = self._idle.setdefault(repository_url, deque())
+        try:
+            async with repository_lock(base_repo_path):
+                base_path, error = await ensure_base_repository(repository_url, self._logger)
+                if error or not base_path:
+                    return
+                if repository_url not in self._adopted:
+                    await self._adopt_existing(repository_url, base_path, idle)
+
+            while len(idle) < self.size:
+                pooled_path = self._new_pool_path(repository_url)
+                async with repository_lock(base_repo_path):
+                    result = await run_git(
+                        ["worktree", "add", "--detach", pooled_path, "origin/main"],
+                        cwd=base_repo_path,
+                    )
+                if not result.ok:
+                    self._logger.warning(
+                        "worktree_pool_warm_failed",
+                        repository_url=repository_url,
+                        error=result.stderr,
+                    )
+                    return
+                idle.append(pooled_path)
+
+            self._logger.info(
+                "worktree_pool_warmed", repository_url=repository_url, idle=len(idle)
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._logger.error(
+                "worktree_pool_warm_error", repository_url=repository_url, error=str(e), exc_info=True
+            )
+
+    async def _adopt_existing(
+        self, repository_url: str, base_repo_path: str, idle: deque[str]
+    ) -> None:
+        """Reuse pooled worktrees left by a previous run of the service"""
+        self._adopted.add(repository_url)
+        listing = await run_git(["worktree", "list", "--porcelain"], cwd=base_repo_path)
+        if not listing.ok:
+            return
+
+        for line in listing.stdout.splitlines():
+            if not line.startswith("worktree "):
+                continue
+            path = line[len("worktree "):]
+            if os.path.basename(path).startswith(POOL_WORKTREE_PREFIX) and path not in idle:
+                if len(idle) < self.size:
+                    idle.append(path)
+                else:
+                    await self._discard(base_repo_path, path)
+
+    async def _discard(self, base_repo_path: str, worktree_path: str) -> None:
+        """Remove a worktree that cannot be reused"""
+        result = await run_git(["worktree", "remove", "--force", worktree_path], cwd=base_repo_path)
+        if not result.ok:
+            self._logger.warning(
+                "worktree_pool_discard_failed", worktree_path=worktree_path, error=result.stderr
+            )
+
+    @staticmethod
+    def _new_pool_path(repository_url: str) -> str:
+        return get_worktree_path(repository_url, f"{POOL_WORKTREE_PREFIX}{uuid.uuid4().hex[:8]}")
+
+
+worktree_pool = WorktreePool(config.WORKTREE_POOL_SIZE)
@@ -11,12 +11,24 @@ from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from .api.routes import log_buffer, router
+from src.server.config.loop_watchdog import start_loop_watchdog, stop_loop_watchdog
+from src.server.config.metrics import PROMETHEUS_CONTENT_TYPE, render_metrics, start_event_loop_lag_monitor
+
+from .api.routes import (
+    log_buffer,
+    reconcile_port_leases,
+    resume_pending_work_orders,
+    router,
+    state_repository,
+    work_order_scheduler,
+)
 from .config import config
 from .database.client import check_database_health
+from .sandbox_manager.worktree_pool import worktree_pool
+from .state_manager.file_state_repository import FileStateRepository
 from .utils.structured_logger import (
     configure_structured_logging_with_buffer,
     get_logger,
@@ -42,6 +54,27 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Start log buffer cleanup task
     await log_buffer.start_cleanup_task()
 
+    loop_lag_monitor = start_event_loop_lag_monitor()
+    start_loop_watchdog()
+
+    # Re-queue work orders that were still waiting when the service stopped
+    try:
+        await resume_pending_work_orders()
+    except Exception as e:
+        logger.error(
+            "Failed to resume pending work orders",
+            extra={"error": str(e)},
+        )
+
+    # Fail work orders interrupted mid-run and free port ranges no live work order holds
+    try:
+        await reconcile_port_leases()
+    except Exception as e:
+        logger.error(
+            "Failed to reconcile port leases",
+            extra={"error": str(e)},
+        )
+
     # Validate Claude CLI is available
     try:
         result = subprocess.run(
@@ -96,6 +129,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Stop log buffer cleanup task
     await log_buffer.stop_cleanup_task()
+    loop_lag_monitor.cancel()
+    stop_loop_watchdog()
+
+    # Stop warming worktrees; pooled ones are adopted on the next start
+    await worktree_pool.shutdown()
+
+    # Fold the state journal into snapshot files
+    if isinstance(state_repository, FileStateRepository):
+        await state_repository.close()
 
 # Create FastAPI app with lifespan
 app = FastAPI(
@@ -128,6 +170,8 @@ async def health_check() -> dict[str, Any]:
         "version": "0.1.0",
         "enabled": config.ENABLED,
         "dependencies": {},
+        "scheduler": work_order_scheduler.snapshot(),
+        "worktree_pool": worktree_pool.snapshot(),
     }
 
     # If feature is not enabled, return early with healthy status
@@ -255,6 +299,12 @@ async def health_check() -> dict[str, Any]:
     return health_status
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Service metrics in the Prometheus text exposition format"""
+    return Response(content=render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 @app.get("/")
 async def root() -> dict:
     """Root endpoint with service information"""
@@ -2,13 +2,21 @@
 
 Provides persistent JSON-based storage for agent work orders.
 Enables state persistence across service restarts and debugging.
+
+Every change is appended to a journal (journal.jsonl) and applied to an
+in-memory index, so reads and filtered lists never touch the disk. The journal
+is periodically compacted into one pretty-printed snapshot file per work order
+(<work_order_id>.json), written atomically via a temporary file and rename.
 """
 
 import asyncio
 import json
+import os
+import time
 from datetime import datetime, timezone
+from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import IO, TYPE_CHECKING, Any, cast
 
 from ..models import AgentWorkOrderState, AgentWorkOrderStatus, StepHistory
 from ..utils.structured_logger import get_logger
@@ -18,22 +26,46 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+JOURNAL_FILE = "journal.jsonl"
+COMPACTING_JOURNAL_FILE = "journal.jsonl.compacting"
+# Journal entries written before the journal is folded into snapshot files
+JOURNAL_COMPACTION_THRESHOLD = 500
+# Seconds before compaction is tried again after a failed attempt
+COMPACTION_RETRY_SECONDS = 60.0
+
 
 class FileStateRepository:
     """File-based repository for work order state
 
     Stores state as JSON files in <state_directory>/<work_order_id>.json
     Each file contains: state, metadata, and step_history
+
+    Changes since the last compaction live in the journal. Replaying it is
+    idempotent (entries set values rather than increment them), so a crash at
+    any point of a compaction loses nothing. Mutations update the index and
+    append to the journal without awaiting, so each one is atomic with respect
+    to other coroutines and no repository-wide lock is needed.
     """
 
     def __init__(self, state_directory: str):
         self.state_directory = Path(state_directory)
         self.state_directory.mkdir(parents=True, exist_ok=True)
-        self._lock = asyncio.Lock()
         self._logger: structlog.stdlib.BoundLogger = logger.bind(
             state_directory=str(self.state_directory)
         )
-        self._logger.info("file_state_repository_initialized")
+
+        self._records: dict[str, dict[str, Any]] = {}
+        self._states: dict[str, AgentWorkOrderState] = {}
+        self._by_status: dict[str, dict[str, str]] = {}
+        self._dirty: set[str] = set()
+        self._deleted: set[str] = set()
+        self._journal_entries = 0
+        self._compaction_task: asyncio.Task | None = None
+        self._compaction_retry_at = 0.0
+
+        self._load()
+        self._journal: IO[str] = self._open_journal()
+        self._logger.info("file_state_repository_initialized", work_orders=len(self._records))
 
     def _get_state_file_path(self, agent_work_order_id: str) -> Path:
         """Get path to state file for work order
@@ -59,52 +91,221 @@ class FileStateRepository:
             return obj.isoformat()
         raise TypeError(f"Type {type(obj)} not serializable")
 
-    async def _read_state_file(self, agent_work_order_id: str) -> dict[str, Any] | None:
-        """Read state file
+    # Loading and journaling
+
+    def _load(self) -> None:
+        """Build the index from snapshot files and replay the journal over them"""
+        for state_file in self.state_directory.glob("*.json"):
+            try:
+                with state_file.open("r") as f:
+                    data = json.load(f)
+                self._records[state_file.stem] = cast(dict[str, Any], data)
+            except Exception as e:
+                self._logger.error(
+                    "state_file_load_failed",
+                    file=str(state_file),
+                    error=str(e)
+                )
 
-        Args:
-            agent_work_order_id: Work order ID
+        for journal_name in (COMPACTING_JOURNAL_FILE, JOURNAL_FILE):
+            journal_path = self.state_directory / journal_name
+            if not journal_path.exists():
+                continue
+            with journal_path.open("r") as f:
+                for line_number, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final line from a crash mid-append
+                        self._logger.warning(
+                            "state_journal_entry_skipped",
+                            journal=journal_name,
+                            line_number=line_number,
+                        )
+                        continue
+                    self._apply(entry)
+                    self._journal_entries += 1
+
+        for agent_work_order_id, record in self._records.items():
+            self._index(agent_work_order_id, record)
+
+    def _open_journal(self) -> IO[str]:
+        """Open the journal for appending, terminating a torn final line first"""
+        journal_path = self.state_directory / JOURNAL_FILE
+        torn = False
+        if journal_path.exists() and journal_path.stat().st_size > 0:
+            with journal_path.open("rb") as f:
+                f.seek(-1, os.SEEK_END)
+                torn = f.read(1) != b"\n"
+        journal = journal_path.open("a")
+        if torn:
+            journal.write("\n")
+            journal.flush()
+        return journal
+
+    def _apply(self, entry: dict[str, Any]) -> None:
+        """Apply a journal entry to the in-memory records"""
+        agent_work_order_id = entry["id"]
+        op = entry["op"]
+
+        if op == "delete":
+            self._records.pop(agent_work_order_id, None)
+            self._states.pop(agent_work_order_id, None)
+            self._dirty.discard(agent_work_order_id)
+            self._deleted.add(agent_work_order_id)
+            return
+
+        if op == "put":
+            self._records[agent_work_order_id] = entry["record"]
+        else:
+            record = self._records.get(agent_work_order_id)
+            if record is None:
+                return
+            if op == "update":
+                record["state"].update(entry.get("state", {}))
+                record["metadata"].update(entry.get("metadata", {}))
+            elif op == "steps":
+                record["step_history"] = entry["step_history"]
+            elif op == "append_steps":
+                history = record.get("step_history") or {
+                    "agent_work_order_id": agent_work_order_id,
+                    "steps": [],
+                }
+                # Truncate to the entry's start index so replays stay idempotent
+                history["steps"] = history["steps"][:entry["start"]] + entry["steps"]
+                record["step_history"] = history
 
-        Returns:
-            State dictionary or None if file doesn't exist
-        """
-        state_file = self._get_state_file_path(agent_work_order_id)
-        if not state_file.exists():
-            return None
+        self._states.pop(agent_work_order_id, None)
+        self._deleted.discard(agent_work_order_id)
+        self._dirty.add(agent_work_order_id)
 
-        try:
-            with state_file.open("r") as f:
-                data = json.load(f)
-                return cast(dict[str, Any], data)
-        except Exception as e:
-            self._logger.error(
-                "state_file_read_failed",
-                agent_work_order_id=agent_work_order_id,
-                error=str(e),
-                exc_info=True
-            )
-            return None
+    def _commit(self, entry: dict[str, Any]) -> None:
+        """Append an entry to the journal, then apply it and update the index
 
-    async def _write_state_file(self, agent_work_order_id: str, data: dict[str, Any]) -> None:
-        """Write state file
+        Values are normalized through JSON so the in-memory records look
+        exactly like records loaded back from disk.
+        """
+        line = json.dumps(entry, default=self._serialize_datetime)
+        self._journal.write(line + "\n")
+        self._journal.flush()
+        self._journal_entries += 1
+
+        agent_work_order_id = entry["id"]
+        self._unindex(agent_work_order_id)
+        self._apply(json.loads(line))
+        record = self._records.get(agent_work_order_id)
+        if record is not None:
+            self._index(agent_work_order_id, record)
+
+        if self._journal_entries >= JOURNAL_COMPACTION_THRESHOLD:
+            self._schedule_compaction()
+
+    @staticmethod
+    def _status_key(status: Any) -> str:
+        return status.value if isinstance(status, Enum) else str(status)
+
+    def _index(self, agent_work_order_id: str, record: dict[str, Any]) -> None:
+        metadata = record.get("metadata") or {}
+        status = metadata.get("status")
+        if status is None:
+            return
+        self._by_status.setdefault(self._status_key(status), {})[agent_work_order_id] = str(
+            metadata.get("created_at", "")
+        )
 
-        Args:
-            agent_work_order_id: Work order ID
-            data: State dictionary to write
+    def _unindex(self, agent_work_order_id: str) -> None:
+        record = self._records.get(agent_work_order_id)
+        status = (record or {}).get("metadata", {}).get("status")
+        if status is not None:
+            self._by_status.get(self._status_key(status), {}).pop(agent_work_order_id, None)
+
+    def _parsed_state(self, agent_work_order_id: str) -> AgentWorkOrderState:
+        state = self._states.get(agent_work_order_id)
+        if state is None:
+            state = AgentWorkOrderState(**self._records[agent_work_order_id]["state"])
+            self._states[agent_work_order_id] = state
+        return state
+
+    # Compaction
+
+    def _schedule_compaction(self) -> None:
+        if self._compaction_task is not None and not self._compaction_task.done():
+            return
+        if time.monotonic() < self._compaction_retry_at:
+            return
+        try:
+            self._compaction_task = asyncio.get_running_loop().create_task(self.compact())
+        except RuntimeError:
+            # No running loop (e.g. synchronous tooling); compact on the next write
+            pass
+
+    async def compact(self) -> None:
+        """Fold the journal into per-work-order snapshot files
+
+        The current journal is set aside and a fresh one started before the
+        snapshots are written, so concurrent writes keep landing in the new
+        journal. The set-aside journal is deleted only after every snapshot
+        has been atomically replaced.
         """
-        state_file = self._get_state_file_path(agent_work_order_id)
+        compacting_path = self.state_directory / COMPACTING_JOURNAL_FILE
+        # A set-aside journal left by an interrupted compaction was replayed at
+        # load; snapshot it first and rotate the current journal next time
+        if not compacting_path.exists():
+            self._journal.close()
+            os.replace(self.state_directory / JOURNAL_FILE, compacting_path)
+            self._journal = self._open_journal()
+            self._journal_entries = 0
+
+        snapshots = {
+            agent_work_order_id: json.dumps(
+                self._records[agent_work_order_id], indent=2, default=self._serialize_datetime
+            )
+            for agent_work_order_id in self._dirty
+            if agent_work_order_id in self._records
+        }
+        deleted = list(self._deleted)
+        self._dirty.clear()
+        self._deleted.clear()
 
         try:
-            with state_file.open("w") as f:
-                json.dump(data, f, indent=2, default=self._serialize_datetime)
+            await asyncio.to_thread(self._write_snapshots, snapshots, deleted)
+            compacting_path.unlink(missing_ok=True)
         except Exception as e:
-            self._logger.error(
-                "state_file_write_failed",
-                agent_work_order_id=agent_work_order_id,
-                error=str(e),
-                exc_info=True
-            )
-            raise
+            # Leave the set-aside journal in place; it is replayed on the next start
+            self._dirty.update(snapshots)
+            self._deleted.update(deleted)
+            self._compaction_retry_at = time.monotonic() + COMPACTION_RETRY_SECONDS
+            self._logger.error("state_journal_compaction_failed", error=str(e), exc_info=True)
+            return
+
+        self._logger.info(
+            "state_journal_compacted", snapshots_written=len(snapshots), deleted=len(deleted)
+        )
+
+    def _write_snapshots(self, snapshots: dict[str, str], deleted: list[str]) -> None:
+        for agent_work_order_id, content in snapshots.items():
+            state_file = self._get_state_file_path(agent_work_order_id)
+            tmp_file = state_file.with_name(state_file.name + ".tmp")
+            with tmp_file.open("w") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, state_file)
+
+        for agent_work_order_id in deleted:
+            self._get_state_file_path(agent_work_order_id).unlink(missing_ok=True)
+
+    async def close(self) -> None:
+        """Compact outstanding journal entries and close the journal"""
+        if self._compaction_task is not None:
+            await asyncio.gather(self._compaction_task, return_exceptions=True)
+        if self._journal_entries:
+            await self.compact()
+        self._journal.close()
+
+    # Repository interface
 
     async def create(self, work_order: AgentWorkOrderState, metadata: dict[str, Any]) -> None:
         """Create a new work order
@@ -113,19 +314,20 @@ class FileStateRepository:
             work_order: Core work order state
             metadata: Additional metadata (status, workflow_type, etc.)
         """
-        async with self._lock:
-            data = {
+        self._commit({
+            "op": "put",
+            "id": work_order.agent_work_order_id,
+            "record": {
                 "state": work_order.model_dump(mode="json"),
                 "metadata": metadata,
                 "step_history": None
-            }
-
-            await self._write_state_file(work_order.agent_work_order_id, data)
+            },
+        })
 
-            self._logger.info(
-                "work_order_created",
-                agent_work_order_id=work_order.agent_work_order_id,
-            )
+        self._logger.info(
+            "work_order_created",
+            agent_work_order_id=work_order.agent_work_order_id,
+        )
 
     async def get(self, agent_work_order_id: str) -> tuple[AgentWorkOrderState, dict[str, Any]] | None:
         """Get a work order by ID
@@ -136,18 +338,16 @@ class FileStateRepository:
         Returns:
             Tuple of (state, metadata) or None if not found
         """
-        async with self._lock:
-            data = await self._read_state_file(agent_work_order_id)
-            if not data:
-                return None
-
-            state = AgentWorkOrderState(**data["state"])
-            metadata = data["metadata"]
+        record = self._records.get(agent_work_order_id)
+        if not record:
+            return None
 
-            return (state, metadata)
+        return (self._parsed_state(agent_work_order_id), dict(record["metadata"]))
 
     async def list(self, status_filter: AgentWorkOrderStatus | None = None) -> list[tuple[AgentWorkOrderState, dict[str, Any]]]:
-        """List all work orders
+        """List work orders, oldest first
+
+        Filtering by status reads only the matching entries of the status index.
 
         Args:
             status_filter: Optional status to filter by
@@ -155,30 +355,29 @@ class FileStateRepository:
         Returns:
             List of (state, metadata) tuples
         """
-        async with self._lock:
-            results = []
-
-            # Iterate over all JSON files in state directory
-            for state_file in self.state_directory.glob("*.json"):
-                try:
-                    with state_file.open("r") as f:
-                        data = json.load(f)
-
-                    state = AgentWorkOrderState(**data["state"])
-                    metadata = data["metadata"]
-
-                    if status_filter is None or metadata.get("status") == status_filter:
-                        results.append((state, metadata))
-
-                except Exception as e:
-                    self._logger.error(
-                        "state_file_load_failed",
-                        file=str(state_file),
-                        error=str(e)
-                    )
-                    continue
+        if status_filter is None:
+            candidates = {
+                agent_work_order_id: str(record.get("metadata", {}).get("created_at", ""))
+                for agent_work_order_id, record in self._records.items()
+            }
+        else:
+            candidates = self._by_status.get(self._status_key(status_filter), {})
+
+        results = []
+        for agent_work_order_id in sorted(candidates, key=candidates.__getitem__):
+            try:
+                results.append((
+                    self._parsed_state(agent_work_order_id),
+                    dict(self._records[agent_work_order_id]["metadata"]),
+                ))
+            except Exception as e:
+                self._logger.error(
+                    "state_record_load_failed",
+                    agent_work_order_id=agent_work_order_id,
+                    error=str(e)
+                )
 
-            return results
+        return results
 
     async def update_status(
         self,
@@ -193,28 +392,25 @@ class FileStateRepository:
             status: New status
             **kwargs: Additional fields to update
         """
-        async with self._lock:
-            data = await self._read_state_file(agent_work_order_id)
-            if not data:
-                self._logger.warning(
-                    "work_order_not_found_for_update",
-                    agent_work_order_id=agent_work_order_id
-                )
-                return
-
-            data["metadata"]["status"] = status
-            data["metadata"]["updated_at"] = datetime.now(timezone.utc).isoformat()
-
-            for key, value in kwargs.items():
-                data["metadata"][key] = value
-
-            await self._write_state_file(agent_work_order_id, data)
-
-            self._logger.info(
-                "work_order_status_updated",
-                agent_work_order_id=agent_work_order_id,
-                status=status.value,
+        if agent_work_order_id not in self._records:
+            self._logger.warning(
+                "work_order_not_found_for_update",
+                agent_work_order_id=agent_work_order_id
             )
+            return
+
+        metadata = {
+            "status": status,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            **kwargs,
+        }
+        self._commit({"op": "update", "id": agent_work_order_id, "metadata": metadata})
+
+        self._logger.info(
+            "work_order_status_updated",
+            agent_work_order_id=agent_work_order_id,
+            status=status.value,
+        )
 
     async def update_git_branch(
         self, agent_work_order_id: str, git_branch_name: str
@@ -225,25 +421,25 @@ class FileStateRepository:
             agent_work_order_id: Work order ID
             git_branch_name: Git branch name
         """
-        async with self._lock:
-            data = await self._read_state_file(agent_work_order_id)
-            if not data:
-                self._logger.warning(
-                    "work_order_not_found_for_update",
-                    agent_work_order_id=agent_work_order_id
-                )
-                return
-
-            data["state"]["git_branch_name"] = git_branch_name
-            data["metadata"]["updated_at"] = datetime.now(timezone.utc).isoformat()
-
-            await self._write_state_file(agent_work_order_id, data)
-
-            self._logger.info(
-                "work_order_git_branch_updated",
-                agent_work_order_id=agent_work_order_id,
-                git_branch_name=git_branch_name,
+        if agent_work_order_id not in self._records:
+            self._logger.warning(
+                "work_order_not_found_for_update",
+                agent_work_order_id=agent_work_order_id
             )
+            return
+
+        self._commit({
+            "op": "update",
+            "id": agent_work_order_id,
+            "state": {"git_branch_name": git_branch_name},
+            "metadata": {"updated_at": datetime.now(timezone.utc).isoformat()},
+        })
+
+        self._logger.info(
+            "work_order_git_branch_updated",
+            agent_work_order_id=agent_work_order_id,
+            git_branch_name=git_branch_name,
+        )
 
     async def update_session_id(
         self, agent_work_order_id: str, agent_session_id: str
@@ -254,25 +450,25 @@ class FileStateRepository:
             agent_work_order_id: Work order ID
             agent_session_id: Claude CLI session ID
         """
-        async with self._lock:
-            data = await self._read_state_file(agent_work_order_id)
-            if not data:
-                self._logger.warning(
-                    "work_order_not_found_for_update",
-                    agent_work_order_id=agent_work_order_id
-                )
-                return
-
-            data["state"]["agent_session_id"] = agent_session_id
-            data["metadata"]["updated_at"] = datetime.now(timezone.utc).isoformat()
-
-            await self._write_state_file(agent_work_order_id, data)
-
-            self._logger.info(
-                "work_order_session_id_updated",
-                agent_work_order_id=agent_work_order_id,
-                agent_session_id=agent_session_id,
+        if agent_work_order_id not in self._records:
+            self._logger.warning(
+                "work_order_not_found_for_update",
+                agent_work_order_id=agent_work_order_id
             )
+            return
+
+        self._commit({
+            "op": "update",
+            "id": agent_work_order_id,
+            "state": {"agent_session_id": agent_session_id},
+            "metadata": {"updated_at": datetime.now(timezone.utc).isoformat()},
+        })
+
+        self._logger.info(
+            "work_order_session_id_updated",
+            agent_work_order_id=agent_work_order_id,
+            agent_session_id=agent_session_id,
+        )
 
     async def save_step_history(
         self, agent_work_order_id: str, step_history: StepHistory
@@ -283,61 +479,78 @@ class FileStateRepository:
             agent_work_order_id: Work order ID
             step_history: Step execution history
         """
-        async with self._lock:
-            data = await self._read_state_file(agent_work_order_id)
-            if not data:
-                # Create minimal state if doesn't exist
-                data = {
+        if agent_work_order_id not in self._records:
+            # Create minimal state if doesn't exist
+            self._commit({
+                "op": "put",
+                "id": agent_work_order_id,
+                "record": {
                     "state": {"agent_work_order_id": agent_work_order_id},
                     "metadata": {},
                     "step_history": None
-                }
-
-            data["step_history"] = step_history.model_dump(mode="json")
-
-            await self._write_state_file(agent_work_order_id, data)
-
-            self._logger.info(
-                "step_history_saved",
-                agent_work_order_id=agent_work_order_id,
-                step_count=len(step_history.steps),
-            )
+                },
+            })
+
+        # Journal only the steps added since the last save
+        stored = (self._records[agent_work_order_id].get("step_history") or {}).get("steps", [])
+        if len(stored) <= len(step_history.steps):
+            start = len(stored)
+            self._commit({
+                "op": "append_steps",
+                "id": agent_work_order_id,
+                "start": start,
+                "steps": [step.model_dump(mode="json") for step in step_history.steps[start:]],
+            })
+        else:
+            self._commit({
+                "op": "steps",
+                "id": agent_work_order_id,
+                "step_history": step_history.model_dump(mode="json"),
+            })
+
+        self._logger.info(
+            "step_history_saved",
+            agent_work_order_id=agent_work_order_id,
+            step_count=len(step_history.steps),
+        )
 
-    async def get_step_history(self, agent_work_order_id: str) -> StepHistory | None:
+    async def get_step_history(
+        self, agent_work_order_id: str, after_step: int | None = None
+    ) -> StepHistory | None:
         """Get step execution history
 
         Args:
             agent_work_order_id: Work order ID
+            after_step: Only return steps after this 0-based step index
 
         Returns:
             Step history or None if not found
         """
-        async with self._lock:
-            data = await self._read_state_file(agent_work_order_id)
-            if not data or not data.get("step_history"):
-                return None
+        record = self._records.get(agent_work_order_id)
+        if not record or not record.get("step_history"):
+            return None
 
-            return StepHistory(**data["step_history"])
+        history = record["step_history"]
+        steps = history["steps"] if after_step is None else history["steps"][after_step + 1:]
+        return StepHistory(agent_work_order_id=history["agent_work_order_id"], steps=steps)
 
     async def delete(self, agent_work_order_id: str) -> None:
-        """Delete a work order state file
+        """Delete a work order
 
         Args:
             agent_work_order_id: Work order ID
         """
-        async with self._lock:
-            state_file = self._get_state_file_path(agent_work_order_id)
-            if state_file.exists():
-                state_file.unlink()
-                self._logger.info(
-                    "work_order_deleted",
-                    agent_work_order_id=agent_work_order_id
-                )
+        if agent_work_order_id in self._records or self._get_state_file_path(agent_work_order_id).exists():
+            self._commit({"op": "delete", "id": agent_work_order_id})
+            self._logger.info(
+                "work_order_deleted",
+                agent_work_order_id=agent_work_order_id
+            )
 
     def list_state_ids(self) -> "list[str]":  # type: ignore[valid-type]
-        """List all work order IDs with state files
+        """List all work order IDs with stored state
 
         Returns:
             List of work order IDs
         """
-        return [f.stem for f in self.state_directory.glob("*.json")]
+        return list(self._records)
@@ -27,6 +27,10 @@ from ..utils.structured_logger import get_logger
 
 logger = get_logger(__name__)
 
+# Postgres invalid_column_reference: the ON CONFLICT target has no unique index,
+# i.e. the steps table predates idx_agent_work_order_steps_order
+MISSING_UNIQUE_INDEX_CODE = "42P10"
+
 
 class SupabaseWorkOrderRepository:
     """Supabase-backed repository for agent work orders.
@@ -54,6 +58,10 @@ class SupabaseWorkOrderRepository:
         self.client: Client = get_agent_work_orders_client()
         self.table_name: str = "archon_agent_work_orders"
         self.steps_table_name: str = "archon_agent_work_order_steps"
+        # Number of leading steps already stored per work order in this process
+        self._persisted_step_counts: dict[str, int] = {}
+        # Cleared when the steps table has no unique index to upsert against
+        self._step_upsert_supported = True
         self._logger = logger.bind(table=self.table_name)
         self._logger.info("supabase_repository_initialized")
 
@@ -362,7 +370,14 @@ class SupabaseWorkOrderRepository:
     ) -> None:
         """Save step execution history to database.
 
-        Uses delete + insert pattern for fresh save, replacing all existing steps.
+        Steps are append-only: only steps not yet stored by this process are
+        upserted, keyed by (agent_work_order_id, step_order), in one batched
+        request. The first save of a work order in this process upserts the
+        full history and trims rows beyond it, so a restarted service converges
+        without ever leaving readers with an empty history. Tables created
+        before the (agent_work_order_id, step_order) unique index existed
+        cannot be upserted into; for those the whole history is deleted and
+        re-inserted instead.
 
         Args:
             agent_work_order_id: Work order ID
@@ -391,34 +406,33 @@ class SupabaseWorkOrderRepository:
             >>> await repository.save_step_history("wo-123", history)
         """
         try:
-            # Delete existing steps (fresh save pattern)
-            self.client.table(self.steps_table_name).delete().eq("agent_work_order_id", agent_work_order_id).execute()
-
-            # Insert all steps
-            if step_history.steps:
-                steps_data = []
-                for i, step in enumerate(step_history.steps):
-                    steps_data.append({
-                        "agent_work_order_id": agent_work_order_id,
-                        "step": step.step.value,
-                        "agent_name": step.agent_name,
-                        "success": step.success,
-                        "output": step.output,
-                        "error_message": step.error_message,
-                        "duration_seconds": step.duration_seconds,
-                        "session_id": step.session_id,
-                        "executed_at": step.timestamp.isoformat(),
-                        "step_order": i,
-                    })
-
-                self.client.table(self.steps_table_name).insert(steps_data).execute()
+            steps_written = None
+            if self._step_upsert_supported:
+                try:
+                    steps_written = self._upsert_new_steps(agent_work_order_id, step_history)
+                except Exception as e:
+                    if getattr(e, "code", None) != MISSING_UNIQUE_INDEX_CODE:
+                        raise
+                    self._step_upsert_supported = False
+                    self._logger.warning(
+                        "step_history_upsert_unavailable",
+                        hint="apply migration/agent_work_orders_state.sql to add the step_order unique index",
+                        error=str(e),
+                    )
+            if steps_written is None:
+                steps_written = self._replace_steps(agent_work_order_id, step_history)
+
+            self._persisted_step_counts[agent_work_order_id] = len(step_history.steps)
 
             self._logger.info(
                 "step_history_saved",
                 agent_work_order_id=agent_work_order_id,
                 step_count=len(step_history.steps),
+                steps_written=steps_written,
             )
         except Exception as e:
+            # Rewrite everything on the next save rather than risk a gap
+            self._persisted_step_counts.pop(agent_work_order_id, None)
             self._logger.exception(
                 "save_step_history_failed",
                 agent_work_order_id=agent_work_order_id,
@@ -426,11 +440,64 @@ class SupabaseWorkOrderRepository:
             )
             raise
 
-    async def get_step_history(self, agent_work_order_id: str) -> StepHistory | None:
+    def _step_rows(
+        self, agent_work_order_id: str, step_history: StepHistory, start: int = 0
+    ) -> "list[dict[str, Any]]":  # type: ignore[valid-type]
+        """Database rows for the steps from index ``start`` onwards"""
+        return [
+            {
+                "agent_work_order_id": agent_work_order_id,
+                "step": step.step.value,
+                "agent_name": step.agent_name,
+                "success": step.success,
+                "output": step.output,
+                "error_message": step.error_message,
+                "duration_seconds": step.duration_seconds,
+                "session_id": step.session_id,
+                "executed_at": step.timestamp.isoformat(),
+                "step_order": i,
+            }
+            for i, step in enumerate(step_history.steps[start:], start=start)
+        ]
+
+    def _upsert_new_steps(self, agent_work_order_id: str, step_history: StepHistory) -> int:
+        """Upsert steps not yet stored by this process; returns the number written"""
+        persisted = self._persisted_step_counts.get(agent_work_order_id)
+        first_save = persisted is None or persisted > len(step_history.steps)
+        steps_data = self._step_rows(agent_work_order_id, step_history, 0 if first_save else persisted)
+
+        if steps_data:
+            self.client.table(self.steps_table_name).upsert(
+                steps_data, on_conflict="agent_work_order_id,step_order"
+            ).execute()
+
+        if first_save:
+            # Drop rows left over from a longer history saved earlier
+            (
+                self.client.table(self.steps_table_name)
+                .delete()
+                .eq("agent_work_order_id", agent_work_order_id)
+                .gte("step_order", len(step_history.steps))
+                .execute()
+            )
+        return len(steps_data)
+
+    def _replace_steps(self, agent_work_order_id: str, step_history: StepHistory) -> int:
+        """Delete and re-insert the whole history, for tables without the unique index"""
+        self.client.table(self.steps_table_name).delete().eq("agent_work_order_id", agent_work_order_id).execute()
+        steps_data = self._step_rows(agent_work_order_id, step_history)
+        if steps_data:
+            self.client.table(self.steps_table_name).insert(steps_data).execute()
+        return len(steps_data)
+
+    async def get_step_history(
+        self, agent_work_order_id: str, after_step: int | None = None
+    ) -> StepHistory | None:
         """Get step execution history from database.
 
         Args:
             agent_work_order_id: Work order ID
+            after_step: Only return steps whose index (step_order) is greater
 
         Returns:
             StepHistory with ordered steps, or None if no steps found
@@ -445,13 +512,14 @@ class SupabaseWorkOrderRepository:
             ...         print(f"{step.step}: {'✓' if step.success else '✗'}")
         """
         try:
-            response = (
+            query = (
                 self.client.table(self.steps_table_name)
                 .select("*")
                 .eq("agent_work_order_id", agent_work_order_id)
-                .order("step_order")
-                .execute()
             )
+            if after_step is not None:
+                query = query.gt("step_order", after_step)
+            response = query.order("step_order").execute()
 
             if not response.data:
                 self._logger.info(
@@ -161,14 +161,23 @@ class WorkOrderRepository:
                 step_count=len(step_history.steps),
             )
 
-    async def get_step_history(self, agent_work_order_id: str) -> StepHistory | None:
+    async def get_step_history(
+        self, agent_work_order_id: str, after_step: int | None = None
+    ) -> StepHistory | None:
         """Get step execution history
 
         Args:
             agent_work_order_id: Work order ID
+            after_step: Only return steps after this 0-based step index
 
         Returns:
             Step history or None if not found
         """
         async with self._lock:
-            return self._step_histories.get(agent_work_order_id)
+            history = self._step_histories.get(agent_work_order_id)
+            if history is None or after_step is None:
+                return history
+            return StepHistory(
+                agent_work_order_id=agent_work_order_id,
+                steps=history.steps[after_step + 1:],
+            )
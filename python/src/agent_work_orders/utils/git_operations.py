@@ -1,10 +1,141 @@
 """Git Operations Utilities
 
 Helper functions for git operations and inspection.
+
+Git runs in asyncio subprocesses so a slow clone or fetch never blocks the
+event loop. Commands that mutate a shared base repository take that
+repository's lock, and fetches are cached for a short window so work orders
+started together against the same repository share one fetch.
 """
 
-import subprocess
+import asyncio
+import time
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ..config import config
+
+if TYPE_CHECKING:
+    import structlog
+
+# Timeout for read-only inspection commands (rev-list, diff, log, ...)
+GIT_QUERY_TIMEOUT = 10
+
+_repository_locks: dict[str, asyncio.Lock] = {}
+_last_fetch: dict[str, float] = {}
+
+
+@dataclass
+class GitResult:
+    """Outcome of a git command"""
+
+    returncode: int
+    stdout: str
+    stderr: str
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+
+async def run_git(
+    args: list[str], cwd: str | Path | None = None, timeout: float | None = None
+) -> GitResult:
+    """Run a git command without blocking the event loop
+
+    Args:
+        args: Arguments passed to git (without the leading "git")
+        cwd: Working directory for the command
+        timeout: Seconds before the command is killed, or None for no limit
+
+    Returns:
+        GitResult; returncode is -1 if git could not be started or timed out
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            cwd=str(cwd) if cwd is not None else None,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except OSError as e:
+        return GitResult(returncode=-1, stdout="", stderr=str(e))
+
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except TimeoutError:
+        process.kill()
+        await process.wait()
+        return GitResult(
+            returncode=-1, stdout="", stderr=f"git {' '.join(args)} timed out after {timeout}s"
+        )
+
+    return GitResult(
+        returncode=process.returncode if process.returncode is not None else -1,
+        stdout=stdout.decode(errors="replace") if stdout else "",
+        stderr=stderr.decode(errors="replace") if stderr else "",
+    )
+
+
+def repository_lock(repo_path: str | Path) -> asyncio.Lock:
+    """Get the lock serializing mutating git commands on a repository
+
+    Args:
+        repo_path: Path to the repository (the shared base clone)
+
+    Returns:
+        Lock shared by every caller using the same path
+    """
+    key = str(repo_path)
+    lock = _repository_locks.get(key)
+    if lock is None:
+        lock = _repository_locks[key] = asyncio.Lock()
+    return lock
+
+
+async def fetch_origin(
+    repo_path: str | Path,
+    logger: "structlog.stdlib.BoundLogger",
+    max_age: float | None = None,
+) -> bool:
+    """Fetch origin unless the repository was fetched within max_age seconds
+
+    Must be called while holding repository_lock(repo_path).
+
+    Args:
+        repo_path: Path to the repository
+        logger: Logger instance
+        max_age: Cache window in seconds (default: config.GIT_FETCH_CACHE_SECONDS)
+
+    Returns:
+        True if the repository is up to date (fetched now or recently)
+    """
+    key = str(repo_path)
+    window = config.GIT_FETCH_CACHE_SECONDS if max_age is None else max_age
+    fetched_at = _last_fetch.get(key)
+    if fetched_at is not None and time.monotonic() - fetched_at < window:
+        logger.debug("git_fetch_cached", repo_path=key)
+        return True
+
+    result = await run_git(["fetch", "origin"], cwd=repo_path, timeout=config.GIT_FETCH_TIMEOUT)
+    if not result.ok:
+        logger.warning(f"Failed to fetch from origin: {result.stderr}")
+        return False
+
+    mark_fetched(repo_path)
+    return True
+
+
+def mark_fetched(repo_path: str | Path) -> None:
+    """Record that a repository is up to date with origin (e.g. freshly cloned)"""
+    _last_fetch[str(repo_path)] = time.monotonic()
+
+
+def invalidate_fetch_cache(repo_path: str | Path) -> None:
+    """Forget when a repository was last fetched"""
+    _last_fetch.pop(str(repo_path), None)
 
 
 async def get_commit_count(branch_name: str, repo_path: str | Path, base_branch: str = "main") -> int:
@@ -19,17 +150,15 @@ async def get_commit_count(branch_name: str, repo_path: str | Path, base_branch:
         Number of commits added on this branch (not total branch history)
     """
     try:
-        result = subprocess.run(
-            ["git", "rev-list", "--count", f"origin/{base_branch}..{branch_name}"],
-            cwd=str(repo_path),
-            capture_output=True,
-            text=True,
-            timeout=10,
+        result = await run_git(
+            ["rev-list", "--count", f"origin/{base_branch}..{branch_name}"],
+            cwd=repo_path,
+            timeout=GIT_QUERY_TIMEOUT,
         )
-        if result.returncode == 0:
+        if result.ok:
             return int(result.stdout.strip())
         return 0
-    except (subprocess.SubprocessError, ValueError):
+    except ValueError:
         return 0
 
 
@@ -44,20 +173,15 @@ async def get_files_changed(branch_name: str, repo_path: str | Path, base_branch
     Returns:
         Number of files changed
     """
-    try:
-        result = subprocess.run(
-            ["git", "diff", "--name-only", f"{base_branch}...{branch_name}"],
-            cwd=str(repo_path),
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            files = [f for f in result.stdout.strip().split("\n") if f]
-            return len(files)
-        return 0
-    except subprocess.SubprocessError:
-        return 0
+    result = await run_git(
+        ["diff", "--name-only", f"{base_branch}...{branch_name}"],
+        cwd=repo_path,
+        timeout=GIT_QUERY_TIMEOUT,
+    )
+    if result.ok:
+        files = [f for f in result.stdout.strip().split("\n") if f]
+        return len(files)
+    return 0
 
 
 async def get_latest_commit_message(branch_name: str, repo_path: str | Path) -> str | None:
@@ -70,19 +194,14 @@ async def get_latest_commit_message(branch_name: str, repo_path: str | Path) ->
     Returns:
         Latest commit message or None
     """
-    try:
-        result = subprocess.run(
-            ["git", "log", "-1", "--pretty=%B", branch_name],
-            cwd=str(repo_path),
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip() or None
-        return None
-    except subprocess.SubprocessError:
-        return None
+    result = await run_git(
+        ["log", "-1", "--pretty=%B", branch_name],
+        cwd=repo_path,
+        timeout=GIT_QUERY_TIMEOUT,
+    )
+    if result.ok:
+        return result.stdout.strip() or None
+    return None
 
 
 async def has_planning_commits(branch_name: str, repo_path: str | Path) -> bool:
@@ -100,39 +219,32 @@ async def has_planning_commits(branch_name: str, repo_path: str | Path) -> bool:
     Returns:
         True if planning commits detected
     """
-    try:
-        # Check commit messages
-        result = subprocess.run(
-            ["git", "log", "--oneline", branch_name],
-            cwd=str(repo_path),
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            log_text = result.stdout.lower()
-            if any(keyword in log_text for keyword in ["plan", "spec", "design"]):
-                return True
-
-        # Check for planning-related files
-        result = subprocess.run(
-            ["git", "ls-tree", "-r", "--name-only", branch_name],
-            cwd=str(repo_path),
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            files = result.stdout.lower()
-            if any(
-                pattern in files
-                for pattern in ["specs/", "plan/", "plan.md", "design.md"]
-            ):
-                return True
+    # Check commit messages
+    result = await run_git(
+        ["log", "--oneline", branch_name],
+        cwd=repo_path,
+        timeout=GIT_QUERY_TIMEOUT,
+    )
+    if result.ok:
+        log_text = result.stdout.lower()
+        if any(keyword in log_text for keyword in ["plan", "spec", "design"]):
+            return True
 
-        return False
-    except subprocess.SubprocessError:
-        return False
+    # Check for planning-related files
+    result = await run_git(
+        ["ls-tree", "-r", "--name-only", branch_name],
+        cwd=repo_path,
+        timeout=GIT_QUERY_TIMEOUT,
+    )
+    if result.ok:
+        files = result.stdout.lower()
+        if any(
+            pattern in files
+            for pattern in ["specs/", "plan/", "plan.md", "design.md"]
+        ):
+            return True
+
+    return False
 
 
 async def get_current_branch(repo_path: str | Path) -> str | None:
@@ -144,17 +256,12 @@ async def get_current_branch(repo_path: str | Path) -> str | None:
     Returns:
         Current branch name or None
     """
-    try:
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            cwd=str(repo_path),
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            branch = result.stdout.strip()
-            return branch if branch else None
-        return None
-    except subprocess.SubprocessError:
-        return None
+    result = await run_git(
+        ["branch", "--show-current"],
+        cwd=repo_path,
+        timeout=GIT_QUERY_TIMEOUT,
+    )
+    if result.ok:
+        branch = result.stdout.strip()
+        return branch if branch else None
+    return None
@@ -2,6 +2,10 @@
 
 Thread-safe circular buffer to store recent logs for SSE streaming.
 Automatically cleans up old work orders to prevent memory leaks.
+
+Every entry gets a monotonically increasing sequence number, so streams resume
+exactly after the last entry they sent and wait for new entries instead of
+polling.
 """
 
 import asyncio
@@ -17,7 +21,7 @@ class WorkOrderLogBuffer:
 
     Stores up to MAX_LOGS_PER_WORK_ORDER logs per work order in memory.
     Automatically removes work orders older than cleanup threshold.
-    Supports filtering by log level, step name, and timestamp.
+    Supports filtering by log level, step name, timestamp, and sequence.
     """
 
     MAX_LOGS_PER_WORK_ORDER = 1000
@@ -29,6 +33,10 @@ class WorkOrderLogBuffer:
             lambda: deque(maxlen=self.MAX_LOGS_PER_WORK_ORDER)
         )
         self._last_activity: dict[str, float] = {}
+        self._sequence = 0
+        self._subscribers: dict[str, set[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = (
+            defaultdict(set)
+        )
         self._lock = threading.Lock()
         self._cleanup_task: asyncio.Task[None] | None = None
 
@@ -59,15 +67,38 @@ class WorkOrderLogBuffer:
             )
         """
         with self._lock:
+            self._sequence += 1
             log_entry = {
                 "work_order_id": work_order_id,
                 "level": level,
                 "event": event,
                 "timestamp": timestamp or datetime.now(UTC).isoformat(),
                 **extra,
+                "sequence": self._sequence,
             }
             self._buffers[work_order_id].append(log_entry)
             self._last_activity[work_order_id] = time.time()
+            subscribers = list(self._subscribers.get(work_order_id, ()))
+
+        for loop, wakeup in subscribers:
+            self._notify(loop, wakeup)
+
+    @staticmethod
+    def _notify(loop: asyncio.AbstractEventLoop, wakeup: asyncio.Event) -> None:
+        """Set a subscriber's event from whichever thread logged the entry"""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            wakeup.set()
+            return
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            # Subscriber's loop is closed; it will be dropped when its stream ends
+            pass
 
     def get_logs(
         self,
@@ -148,6 +179,101 @@ class WorkOrderLogBuffer:
             work_order_id=work_order_id, level=level, step=step, since=since_timestamp
         )
 
+    def get_logs_after(
+        self,
+        work_order_id: str,
+        after_sequence: int,
+        level: str | None = None,
+        step: str | None = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Get logs with a sequence number greater than after_sequence.
+
+        Only the new entries are copied, walking back from the newest one, so
+        the cost depends on how many arrived rather than on the buffer size.
+
+        Args:
+            work_order_id: ID of the work order
+            after_sequence: Sequence of the last entry already seen
+            level: Optional log level filter
+            step: Optional step name filter
+
+        Returns:
+            Tuple of (matching entries in order, sequence to resume from). The
+            resume sequence also covers entries excluded by the filters.
+
+        Examples:
+            logs, last_sequence = buffer.get_logs_after("wo-123", last_sequence)
+        """
+        with self._lock:
+            buffer = self._buffers.get(work_order_id)
+            if not buffer:
+                return [], after_sequence
+            new_entries = []
+            for entry in reversed(buffer):
+                if entry["sequence"] <= after_sequence:
+                    break
+                new_entries.append(entry)
+            resume_sequence = max(after_sequence, buffer[-1]["sequence"])
+
+        new_entries.reverse()
+        if level:
+            level_lower = level.lower()
+            new_entries = [log for log in new_entries if log.get("level", "").lower() == level_lower]
+        if step:
+            new_entries = [log for log in new_entries if log.get("step") == step]
+
+        return new_entries, resume_sequence
+
+    def get_latest_sequence(self, work_order_id: str) -> int:
+        """Get the sequence number of the newest entry for a work order.
+
+        Args:
+            work_order_id: ID of the work order
+
+        Returns:
+            Latest sequence, or 0 if the work order has no buffered logs
+        """
+        with self._lock:
+            buffer = self._buffers.get(work_order_id)
+            return buffer[-1]["sequence"] if buffer else 0
+
+    async def wait_for_logs(
+        self, work_order_id: str, after_sequence: int, timeout: float | None = None
+    ) -> bool:
+        """Wait until a work order has an entry newer than after_sequence.
+
+        Args:
+            work_order_id: ID of the work order
+            after_sequence: Sequence of the last entry already seen
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if new entries are available, False on timeout
+
+        Examples:
+            if await buffer.wait_for_logs("wo-123", last_sequence, timeout=15):
+                logs, last_sequence = buffer.get_logs_after("wo-123", last_sequence)
+        """
+        subscriber = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            buffer = self._buffers.get(work_order_id)
+            if buffer and buffer[-1]["sequence"] > after_sequence:
+                return True
+            self._subscribers[work_order_id].add(subscriber)
+
+        try:
+            await asyncio.wait_for(subscriber[1].wait(), timeout=timeout)
+            return True
+        except TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(work_order_id)
+                if subscribers is not None:
+                    subscribers.discard(subscriber)
+                    if not subscribers:
+                        del self._subscribers[work_order_id]
+
     def clear_work_order(self, work_order_id: str) -> None:
         """Remove all logs for a specific work order.
 
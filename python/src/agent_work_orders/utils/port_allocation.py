@@ -9,10 +9,19 @@ Architecture:
 - Total range: 9000-9199 (200 ports)
 - Supports: 20 concurrent work orders
 - Ports can be used flexibly (CLI tools use 0, microservices use multiple)
+
+Sandboxes take their range from the PortLeaseRegistry, which hands out
+non-overlapping slots in O(1) and persists the leases so a restarted service
+does not give a live worktree's ports to another work order.
 """
 
+import json
 import os
 import socket
+from collections.abc import Iterable
+from pathlib import Path
+
+from ..config import config
 
 # Port allocation configuration
 PORT_RANGE_SIZE = 10  # Each work order gets 10 ports
@@ -95,14 +104,10 @@ def find_available_port_range(
     # Try multiple slots if first one has conflicts
     for offset in range(max_attempts):
         slot = (base_slot + offset) % MAX_CONCURRENT_WORK_ORDERS
-        current_start = PORT_BASE + (slot * PORT_RANGE_SIZE)
-        current_end = current_start + PORT_RANGE_SIZE - 1
+        current_start, current_end = _slot_range(slot)
 
         # Check which ports in this range are available
-        available = []
-        for port in range(current_start, current_end + 1):
-            if is_port_available(port):
-                available.append(port)
+        available = _available_ports(current_start, current_end)
 
         # If we have at least half the ports available, use this range
         # (allows for some port conflicts while still being usable)
@@ -115,6 +120,139 @@ def find_available_port_range(
     )
 
 
+class PortLeaseRegistry:
+    """In-process registry of port range leases, one slot per work order.
+
+    Slots are leased from a free list instead of being probed one by one. A
+    leased slot is verified with a single bind sweep; slots whose ports are
+    held by other processes are skipped without being leased.
+    """
+
+    def __init__(self, state_file: str | Path | None = None):
+        """Initialize the registry
+
+        Args:
+            state_file: JSON file the leases are persisted to (None keeps them in memory)
+        """
+        self.state_file = Path(state_file) if state_file is not None else None
+        self._leases: dict[str, int] = {}
+        self._free_slots: set[int] = set(range(MAX_CONCURRENT_WORK_ORDERS))
+        self._loaded = False
+
+    def acquire(self, work_order_id: str) -> tuple[int, int, list[int]]:
+        """Lease a port range for a work order (idempotent per work order)
+
+        Args:
+            work_order_id: The work order (or sandbox) identifier
+
+        Returns:
+            Tuple of (start_port, end_port, available_ports)
+
+        Raises:
+            RuntimeError: If every free slot is exhausted or blocked by other processes
+        """
+        self._ensure_loaded()
+
+        slot = self._leases.get(work_order_id)
+        if slot is not None:
+            start, end = _slot_range(slot)
+            return start, end, _available_ports(start, end)
+
+        preferred_start, _ = get_port_range_for_work_order(work_order_id)
+        preferred = (preferred_start - PORT_BASE) // PORT_RANGE_SIZE
+        candidates = [preferred] if preferred in self._free_slots else []
+        candidates.extend(sorted(self._free_slots - {preferred}))
+
+        for slot in candidates:
+            start, end = _slot_range(slot)
+            available = _available_ports(start, end)
+            # Allow some conflicts while still leaving the range usable
+            if len(available) >= PORT_RANGE_SIZE // 2:
+                self._free_slots.discard(slot)
+                self._leases[work_order_id] = slot
+                self._save()
+                return start, end, available
+
+        raise RuntimeError(
+            f"No suitable port range found ({len(self._leases)} leased, "
+            f"{len(self._free_slots)} free but in use by other processes). "
+            f"Try stopping other services or wait for work orders to complete."
+        )
+
+    def release(self, work_order_id: str) -> None:
+        """Return a work order's port range to the free list
+
+        Args:
+            work_order_id: The work order (or sandbox) identifier
+        """
+        self._ensure_loaded()
+        slot = self._leases.pop(work_order_id, None)
+        if slot is not None:
+            self._free_slots.add(slot)
+            self._save()
+
+    def reconcile(self, active_ids: Iterable[str]) -> list[str]:
+        """Release leases held by work orders that are no longer active
+
+        Args:
+            active_ids: Identifiers that may keep their leases
+
+        Returns:
+            Identifiers whose leases were reclaimed
+        """
+        self._ensure_loaded()
+        active = set(active_ids)
+        stale = [work_order_id for work_order_id in self._leases if work_order_id not in active]
+        for work_order_id in stale:
+            self._free_slots.add(self._leases.pop(work_order_id))
+        if stale:
+            self._save()
+        return stale
+
+    def leases(self) -> dict[str, tuple[int, int]]:
+        """Current leases as {identifier: (start_port, end_port)}"""
+        self._ensure_loaded()
+        return {work_order_id: _slot_range(slot) for work_order_id, slot in self._leases.items()}
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.state_file is None or not self.state_file.exists():
+            return
+        try:
+            with self.state_file.open("r") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        for work_order_id, slot in stored.items():
+            if slot in self._free_slots:
+                self._free_slots.discard(slot)
+                self._leases[work_order_id] = slot
+
+    def _save(self) -> None:
+        if self.state_file is None:
+            return
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.state_file.with_name(self.state_file.name + ".tmp")
+        with tmp_file.open("w") as f:
+            json.dump(self._leases, f)
+        os.replace(tmp_file, self.state_file)
+
+
+def _slot_range(slot: int) -> tuple[int, int]:
+    start_port = PORT_BASE + (slot * PORT_RANGE_SIZE)
+    return start_port, start_port + PORT_RANGE_SIZE - 1
+
+
+def _available_ports(start_port: int, end_port: int) -> list[int]:
+    return [port for port in range(start_port, end_port + 1) if is_port_available(port)]
+
+
+# Leases live next to the worktrees they belong to
+port_leases = PortLeaseRegistry(Path(config.TEMP_DIR_BASE) / "port_leases.json")
+
+
 def create_ports_env_file(
     worktree_path: str,
     start_port: int,
@@ -4,14 +4,15 @@ Provides utilities for creating and managing git worktrees under trees/<work_ord
 to enable parallel execution in isolated environments.
 """
 
+import asyncio
 import hashlib
 import os
 import shutil
-import subprocess
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from ..config import config
+from .git_operations import fetch_origin, mark_fetched, repository_lock, run_git
 from .port_allocation import create_ports_env_file
 
 if TYPE_CHECKING:
@@ -59,8 +60,12 @@ def get_worktree_path(repository_url: str, work_order_id: str) -> str:
     return str(worktree_path)
 
 
-def ensure_base_repository(repository_url: str, logger: "structlog.stdlib.BoundLogger") -> tuple[str | None, str | None]:
-    """Ensure base repository clone exists.
+async def ensure_base_repository(
+    repository_url: str, logger: "structlog.stdlib.BoundLogger"
+) -> tuple[str | None, str | None]:
+    """Ensure base repository clone exists and is recently fetched.
+
+    Callers must hold repository_lock(get_base_repo_path(repository_url)).
 
     Args:
         repository_url: Git repository URL to clone
@@ -74,14 +79,7 @@ def ensure_base_repository(repository_url: str, logger: "structlog.stdlib.BoundL
     # If base repo already exists, just fetch latest
     if os.path.exists(base_repo_path):
         logger.info(f"Base repository exists at {base_repo_path}, fetching latest")
-        fetch_result = subprocess.run(
-            ["git", "fetch", "origin"],
-            capture_output=True,
-            text=True,
-            cwd=base_repo_path
-        )
-        if fetch_result.returncode != 0:
-            logger.warning(f"Failed to fetch from origin: {fetch_result.stderr}")
+        await fetch_origin(base_repo_path, logger)
         return base_repo_path, None
 
     # Create parent directory
@@ -89,22 +87,19 @@ def ensure_base_repository(repository_url: str, logger: "structlog.stdlib.BoundL
 
     # Clone the repository
     logger.info(f"Cloning base repository from {repository_url} to {base_repo_path}")
-    clone_result = subprocess.run(
-        ["git", "clone", repository_url, base_repo_path],
-        capture_output=True,
-        text=True
-    )
+    clone_result = await run_git(["clone", repository_url, base_repo_path])
 
-    if clone_result.returncode != 0:
+    if not clone_result.ok:
         error_msg = f"Failed to clone repository: {clone_result.stderr}"
         logger.error(error_msg)
         return None, error_msg
 
+    mark_fetched(base_repo_path)
     logger.info(f"Created base repository at {base_repo_path}")
     return base_repo_path, None
 
 
-def create_worktree(
+async def create_worktree(
     repository_url: str,
     work_order_id: str,
     branch_name: str,
@@ -122,54 +117,48 @@ def create_worktree(
         Tuple of (worktree_path, error_message)
         worktree_path is the absolute path if successful, None if error
     """
-    # Ensure base repository exists
-    base_repo_path, error = ensure_base_repository(repository_url, logger)
-    if error or not base_repo_path:
-        return None, error
+    # Clone, fetch and worktree registration all write to the shared base repository
+    async with repository_lock(get_base_repo_path(repository_url)):
+        # Ensure base repository exists and has the latest changes from origin
+        base_repo_path, error = await ensure_base_repository(repository_url, logger)
+        if error or not base_repo_path:
+            return None, error
 
-    # Construct worktree path
-    worktree_path = get_worktree_path(repository_url, work_order_id)
+        # Construct worktree path
+        worktree_path = get_worktree_path(repository_url, work_order_id)
 
-    # Check if worktree already exists
-    if os.path.exists(worktree_path):
-        logger.warning(f"Worktree already exists at {worktree_path}")
-        return worktree_path, None
-
-    # Create parent directory for worktrees
-    Path(worktree_path).parent.mkdir(parents=True, exist_ok=True)
-
-    # Fetch latest changes from origin
-    logger.info("Fetching latest changes from origin")
-    fetch_result = subprocess.run(
-        ["git", "fetch", "origin"],
-        capture_output=True,
-        text=True,
-        cwd=base_repo_path
-    )
-    if fetch_result.returncode != 0:
-        logger.warning(f"Failed to fetch from origin: {fetch_result.stderr}")
+        # Check if worktree already exists
+        if os.path.exists(worktree_path):
+            logger.warning(f"Worktree already exists at {worktree_path}")
+            return worktree_path, None
+
+        # Create parent directory for worktrees
+        Path(worktree_path).parent.mkdir(parents=True, exist_ok=True)
 
-    # Create the worktree using git, branching from origin/main
-    # Use -b to create the branch as part of worktree creation
-    cmd = ["git", "worktree", "add", "-b", branch_name, worktree_path, "origin/main"]
-    result = subprocess.run(cmd, capture_output=True, text=True, cwd=base_repo_path)
+        # Create the worktree using git, branching from origin/main
+        # Use -b to create the branch as part of worktree creation
+        result = await run_git(
+            ["worktree", "add", "-b", branch_name, worktree_path, "origin/main"],
+            cwd=base_repo_path,
+        )
 
-    if result.returncode != 0:
-        # If branch already exists, try without -b
-        if "already exists" in result.stderr:
-            cmd = ["git", "worktree", "add", worktree_path, branch_name]
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=base_repo_path)
+        if not result.ok:
+            # If branch already exists, try without -b
+            if "already exists" in result.stderr:
+                result = await run_git(
+                    ["worktree", "add", worktree_path, branch_name], cwd=base_repo_path
+                )
 
-        if result.returncode != 0:
-            error_msg = f"Failed to create worktree: {result.stderr}"
-            logger.error(error_msg)
-            return None, error_msg
+            if not result.ok:
+                error_msg = f"Failed to create worktree: {result.stderr}"
+                logger.error(error_msg)
+                return None, error_msg
 
     logger.info(f"Created worktree at {worktree_path} for branch {branch_name}")
     return worktree_path, None
 
 
-def validate_worktree(
+async def validate_worktree(
     repository_url: str,
     work_order_id: str,
     state: dict[str, Any]
@@ -203,19 +192,14 @@ def validate_worktree(
     if not os.path.exists(base_repo_path):
         return False, f"Base repository not found: {base_repo_path}"
 
-    result = subprocess.run(
-        ["git", "worktree", "list"],
-        capture_output=True,
-        text=True,
-        cwd=base_repo_path
-    )
+    result = await run_git(["worktree", "list"], cwd=base_repo_path)
     if worktree_path not in result.stdout:
         return False, "Worktree not registered with git"
 
     return True, None
 
 
-def remove_worktree(
+async def remove_worktree(
     repository_url: str,
     work_order_id: str,
     logger: "structlog.stdlib.BoundLogger"
@@ -235,19 +219,16 @@ def remove_worktree(
 
     # First remove via git (if base repo exists)
     if os.path.exists(base_repo_path):
-        cmd = ["git", "worktree", "remove", worktree_path, "--force"]
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=base_repo_path
-        )
+        async with repository_lock(base_repo_path):
+            result = await run_git(
+                ["worktree", "remove", worktree_path, "--force"], cwd=base_repo_path
+            )
 
-        if result.returncode != 0:
+        if not result.ok:
             # Try to clean up manually if git command failed
             if os.path.exists(worktree_path):
                 try:
-                    shutil.rmtree(worktree_path)
+                    await asyncio.to_thread(shutil.rmtree, worktree_path)
                     logger.warning(f"Manually removed worktree directory: {worktree_path}")
                 except Exception as e:
                     return False, f"Failed to remove worktree: {result.stderr}, manual cleanup failed: {e}"
@@ -255,7 +236,7 @@ def remove_worktree(
         # If base repo doesn't exist, just remove directory
         if os.path.exists(worktree_path):
             try:
-                shutil.rmtree(worktree_path)
+                await asyncio.to_thread(shutil.rmtree, worktree_path)
                 logger.info(f"Removed worktree directory (no base repo): {worktree_path}")
             except Exception as e:
                 return False, f"Failed to remove worktree directory: {e}"
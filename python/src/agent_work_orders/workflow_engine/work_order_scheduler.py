@@ -0,0 +1,298 @@
+"""Work Order Scheduler
+
+Admission control for agent work orders. Every work order runs a Claude CLI
+process in its own sandbox, so only a bounded number execute at once and the
+rest wait in a priority queue that is shared fairly between repositories.
+"""
+
+import asyncio
+import heapq
+import itertools
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass, field
+
+from ..utils.structured_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class QueueFullError(Exception):
+    """Raised when the work order queue is at capacity"""
+
+
+@dataclass(order=True)
+class QueuedWorkOrder:
+    """A work order waiting for an execution slot
+
+    Ordering is by priority (higher first), then submission order.
+    """
+
+    sort_key: tuple[int, int] = field(init=False, repr=False)
+    agent_work_order_id: str = field(compare=False)
+    repository_url: str = field(compare=False)
+    priority: int = field(compare=False)
+    sequence: int = field(compare=False)
+    run: Callable[[], Awaitable[None]] = field(compare=False, repr=False)
+    on_started: Callable[[asyncio.Task], None] | None = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.sort_key = (-self.priority, self.sequence)
+
+
+class WorkOrderScheduler:
+    """Bounded worker pool with a per-repository fair priority queue
+
+    Dispatch picks the highest-priority queued work order. Among equal
+    priorities the repository with the fewest running work orders goes first,
+    then the one served least recently, so a burst against one repository
+    cannot starve the others. Within a repository work orders run in
+    submission order.
+    """
+
+    def __init__(self, max_concurrent: int, max_queued: int):
+        """Initialize the scheduler
+
+        Args:
+            max_concurrent: Maximum number of work orders executing at once
+            max_queued: Maximum number of work orders waiting for a slot
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queued = max(0, max_queued)
+        self._queues: dict[str, list[QueuedWorkOrder]] = {}
+        self._queued_ids: dict[str, QueuedWorkOrder] = {}
+        self._running: dict[str, asyncio.Task] = {}
+        self._running_repositories: dict[str, str] = {}
+        self._running_per_repository: Counter[str] = Counter()
+        self._last_served: dict[str, int] = {}
+        self._sequence = itertools.count()
+        self._dispatch_count = 0
+        self._logger = logger
+
+    @property
+    def queued_count(self) -> int:
+        """Number of work orders waiting for a slot"""
+        return len(self._queued_ids)
+
+    @property
+    def running_count(self) -> int:
+        """Number of work orders currently executing"""
+        return len(self._running)
+
+    def can_admit(self) -> bool:
+        """Check whether a new work order would be accepted"""
+        return len(self._running) < self.max_concurrent or len(self._queued_ids) < self.max_queued
+
+    def is_queued(self, agent_work_order_id: str) -> bool:
+        """Check whether a work order is waiting for a slot"""
+        return agent_work_order_id in self._queued_ids
+
+    def submit(
+        self,
+        agent_work_order_id: str,
+        repository_url: str,
+        run: Callable[[], Awaitable[None]],
+        priority: int = 0,
+        on_started: Callable[[asyncio.Task], None] | None = None,
+    ) -> int | None:
+        """Queue a work order and start it if a slot is free
+
+        Args:
+            agent_work_order_id: Work order ID
+            repository_url: Repository the work order runs against
+            run: Coroutine factory executing the workflow
+            priority: Higher values are dispatched first
+            on_started: Called with the task once the work order starts
+
+        Returns:
+            1-based queue position, or None if the work order started immediately
+
+        Raises:
+            QueueFullError: If the queue is at capacity
+        """
+        if agent_work_order_id in self._queued_ids or agent_work_order_id in self._running:
+            return self.queue_position(agent_work_order_id)
+
+        if not self.can_admit():
+            self._logger.warning(
+                "work_order_queue_full",
+                agent_work_order_id=agent_work_order_id,
+                queued=len(self._queued_ids),
+                running=len(self._running),
+            )
+            raise QueueFullError(
+                f"Work order queue is full ({len(self._queued_ids)} queued, "
+                f"{len(self._running)} running)"
+            )
+
+        item = QueuedWorkOrder(
+            agent_work_order_id=agent_work_order_id,
+            repository_url=repository_url,
+            priority=priority,
+            sequence=next(self._sequence),
+            run=run,
+            on_started=on_started,
+        )
+        heapq.heappush(self._queues.setdefault(repository_url, []), item)
+        self._queued_ids[agent_work_order_id] = item
+
+        self._dispatch()
+
+        position = self.queue_position(agent_work_order_id)
+        self._logger.info(
+            "work_order_admitted",
+            agent_work_order_id=agent_work_order_id,
+            repository_url=repository_url,
+            priority=priority,
+            queue_position=position,
+            running=len(self._running),
+        )
+        return position
+
+    def cancel(self, agent_work_order_id: str) -> bool:
+        """Remove a queued work order before it starts
+
+        Args:
+            agent_work_order_id: Work order ID
+
+        Returns:
+            True if the work order was queued and has been removed
+        """
+        item = self._queued_ids.pop(agent_work_order_id, None)
+        if item is None:
+            return False
+
+        queue = self._queues[item.repository_url]
+        queue.remove(item)
+        if queue:
+            heapq.heapify(queue)
+        else:
+            del self._queues[item.repository_url]
+
+        self._logger.info(
+            "work_order_dequeued",
+            agent_work_order_id=agent_work_order_id,
+            repository_url=item.repository_url,
+        )
+        return True
+
+    def queue_position(self, agent_work_order_id: str) -> int | None:
+        """Get the 1-based position a queued work order will be dispatched in
+
+        Simulates dispatch order, assuming running work orders keep their slots.
+
+        Args:
+            agent_work_order_id: Work order ID
+
+        Returns:
+            Position in the queue, or None if the work order is not queued
+        """
+        if agent_work_order_id not in self._queued_ids:
+            return None
+
+        for position, item in enumerate(self._dispatch_order(), start=1):
+            if item.agent_work_order_id == agent_work_order_id:
+                return position
+        return None
+
+    def queue_positions(self) -> dict[str, int]:
+        """Get the dispatch position of every queued work order in one pass
+
+        Returns:
+            Mapping of work order ID to 1-based queue position
+        """
+        return {
+            item.agent_work_order_id: position
+            for position, item in enumerate(self._dispatch_order(), start=1)
+        }
+
+    def _dispatch_order(self) -> Iterator[QueuedWorkOrder]:
+        """Yield queued work orders in the order they would be dispatched"""
+        queues = {repo: sorted(items) for repo, items in self._queues.items()}
+        heads = dict.fromkeys(queues, 0)
+        running = Counter(self._running_per_repository)
+        last_served = dict(self._last_served)
+        for position in range(1, len(self._queued_ids) + 1):
+            repo = self._select_repository(queues, heads, running, last_served)
+            item = queues[repo][heads[repo]]
+            heads[repo] += 1
+            running[repo] += 1
+            last_served[repo] = self._dispatch_count + position
+            yield item
+
+    def snapshot(self) -> dict[str, int]:
+        """Scheduler counters for health and monitoring endpoints"""
+        return {
+            "running": len(self._running),
+            "queued": len(self._queued_ids),
+            "max_concurrent": self.max_concurrent,
+            "max_queued": self.max_queued,
+        }
+
+    @staticmethod
+    def _select_repository(
+        queues: dict[str, list[QueuedWorkOrder]],
+        heads: dict[str, int],
+        running: Counter[str],
+        last_served: dict[str, int],
+    ) -> str:
+        """Pick the repository whose head work order should run next"""
+        best_repo = ""
+        best_key: tuple[int, int, int, int] | None = None
+        for repo, items in queues.items():
+            index = heads[repo]
+            if index >= len(items):
+                continue
+            head = items[index]
+            key = (-head.priority, running[repo], last_served.get(repo, 0), head.sequence)
+            if best_key is None or key < best_key:
+                best_repo, best_key = repo, key
+        return best_repo
+
+    def _dispatch(self) -> None:
+        """Start queued work orders while slots are free"""
+        while self._queued_ids and len(self._running) < self.max_concurrent:
+            heads = dict.fromkeys(self._queues, 0)
+            repo = self._select_repository(
+                self._queues, heads, self._running_per_repository, self._last_served
+            )
+            queue = self._queues[repo]
+            item = heapq.heappop(queue)
+            if not queue:
+                del self._queues[repo]
+            del self._queued_ids[item.agent_work_order_id]
+            self._dispatch_count += 1
+            self._last_served[repo] = self._dispatch_count
+            self._start(item)
+
+    def _start(self, item: QueuedWorkOrder) -> None:
+        """Run a work order in a background task"""
+        task = asyncio.create_task(item.run())
+        self._running[item.agent_work_order_id] = task
+        self._running_repositories[item.agent_work_order_id] = item.repository_url
+        self._running_per_repository[item.repository_url] += 1
+        task.add_done_callback(lambda _: self._on_finished(item.agent_work_order_id))
+
+        self._logger.info(
+            "work_order_dispatched",
+            agent_work_order_id=item.agent_work_order_id,
+            repository_url=item.repository_url,
+            running=len(self._running),
+            queued=len(self._queued_ids),
+        )
+
+        if item.on_started is not None:
+            item.on_started(task)
+
+    def _on_finished(self, agent_work_order_id: str) -> None:
+        """Release the slot of a finished work order and start the next one"""
+        self._running.pop(agent_work_order_id, None)
+        repo = self._running_repositories.pop(agent_work_order_id, None)
+        if repo is not None:
+            self._running_per_repository[repo] -= 1
+            if self._running_per_repository[repo] <= 0:
+                del self._running_per_repository[repo]
+                if repo not in self._queues:
+                    # Idle repositories start from a clean slate
+                    self._last_served.pop(repo, None)
+        self._dispatch()
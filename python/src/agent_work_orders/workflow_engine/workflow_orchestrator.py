@@ -3,6 +3,7 @@
 Main orchestration logic for workflow execution.
 """
 
+import asyncio
 import time
 
 from ..agent_executor.agent_cli_executor import AgentCLIExecutor
@@ -285,9 +286,11 @@ class WorkflowOrchestrator:
             return {"commit_count": 0, "files_changed": 0}
 
         try:
-            # Calculate stats compared to main branch
-            commit_count = await get_commit_count(branch_name, repo_path)
-            files_changed = await get_files_changed(branch_name, repo_path, base_branch="main")
+            # Calculate stats compared to main branch; the queries are independent
+            commit_count, files_changed = await asyncio.gather(
+                get_commit_count(branch_name, repo_path),
+                get_files_changed(branch_name, repo_path, base_branch="main"),
+            )
 
             return {
                 "commit_count": commit_count,
@@ -14,6 +14,8 @@ import httpx
 from mcp.server.fastmcp import Context, FastMCP
 from src.mcp_server.utils.error_handling import MCPErrorFormatter
 from src.mcp_server.utils.timeout_config import get_default_timeout
+from src.mcp_server.utils.http_client import get_http_client
+from src.mcp_server.utils.tool_cache import cached_get, invalidates_tool_cache
 from src.server.config.service_discovery import get_api_url
 
 logger = logging.getLogger(__name__)
@@ -71,9 +73,11 @@ def register_document_tools(mcp: FastMCP):
             
             # Single document get mode
             if document_id:
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    response = await client.get(
-                        urljoin(api_url, f"/api/projects/{project_id}/docs/{document_id}")
+                async with get_http_client(timeout=timeout) as client:
+                    response = await cached_get(
+                        client,
+                        "find_documents",
+                        urljoin(api_url, f"/api/projects/{project_id}/docs/{document_id}"),
                     )
                     
                     if response.status_code == 200:
@@ -91,9 +95,9 @@ def register_document_tools(mcp: FastMCP):
                         return MCPErrorFormatter.from_http_error(response, "get document")
             
             # List mode
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(
-                    urljoin(api_url, f"/api/projects/{project_id}/docs")
+            async with get_http_client(timeout=timeout) as client:
+                response = await cached_get(
+                    client, "find_documents", urljoin(api_url, f"/api/projects/{project_id}/docs")
                 )
                 
                 if response.status_code == 200:
@@ -139,6 +143,7 @@ def register_document_tools(mcp: FastMCP):
             return MCPErrorFormatter.from_exception(e, "list documents")
 
     @mcp.tool()
+    @invalidates_tool_cache
     async def manage_document(
         ctx: Context,
         action: str,  # "create" | "update" | "delete"
@@ -149,6 +154,7 @@ def register_document_tools(mcp: FastMCP):
         content: dict[str, Any] | None = None,
         tags: list[str] | None = None,
         author: str | None = None,
+        expected_revision: int | None = None,
     ) -> str:
         """
         Manage documents (consolidated: create/update/delete).
@@ -162,6 +168,8 @@ def register_document_tools(mcp: FastMCP):
             content: Structured JSON content
             tags: List of tags (e.g. ["backend", "auth"])
             author: Document author name
+            expected_revision: For update/delete, fail with a conflict unless the
+                document is still at this revision (from a previous read)
         
         Examples:
             manage_document("create", project_id="p-1", title="API Spec", document_type="spec")
@@ -174,7 +182,7 @@ def register_document_tools(mcp: FastMCP):
             api_url = get_api_url()
             timeout = get_default_timeout()
             
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout=timeout) as client:
                 if action == "create":
                     if not title or not document_type:
                         return MCPErrorFormatter.format_error(
@@ -229,6 +237,8 @@ def register_document_tools(mcp: FastMCP):
                             "validation_error",
                             "No fields to update"
                         )
+                    if expected_revision is not None:
+                        update_data["expected_revision"] = expected_revision
                     
                     response = await client.put(
                         urljoin(api_url, f"/api/projects/{project_id}/docs/{document_id}"),
@@ -256,8 +266,14 @@ def register_document_tools(mcp: FastMCP):
                             "document_id required for delete"
                         )
                     
+                    delete_params = (
+                        {"expected_revision": expected_revision}
+                        if expected_revision is not None
+                        else None
+                    )
                     response = await client.delete(
-                        urljoin(api_url, f"/api/projects/{project_id}/docs/{document_id}")
+                        urljoin(api_url, f"/api/projects/{project_id}/docs/{document_id}"),
+                        params=delete_params,
                     )
                     
                     if response.status_code == 200:
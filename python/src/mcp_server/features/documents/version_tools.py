@@ -14,6 +14,8 @@ import httpx
 from mcp.server.fastmcp import Context, FastMCP
 from src.mcp_server.utils.error_handling import MCPErrorFormatter
 from src.mcp_server.utils.timeout_config import get_default_timeout
+from src.mcp_server.utils.http_client import get_http_client
+from src.mcp_server.utils.tool_cache import invalidates_tool_cache
 from src.server.config.service_discovery import get_api_url
 
 logger = logging.getLogger(__name__)
@@ -68,7 +70,7 @@ def register_version_tools(mcp: FastMCP):
             
             # Single version get mode
             if field_name and version_number is not None:
-                async with httpx.AsyncClient(timeout=timeout) as client:
+                async with get_http_client(timeout=timeout) as client:
                     response = await client.get(
                         urljoin(api_url, f"/api/projects/{project_id}/versions/{field_name}/{version_number}")
                     )
@@ -92,7 +94,7 @@ def register_version_tools(mcp: FastMCP):
             if field_name:
                 params["field_name"] = field_name
             
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout=timeout) as client:
                 response = await client.get(
                     urljoin(api_url, f"/api/projects/{project_id}/versions"),
                     params=params
@@ -128,6 +130,7 @@ def register_version_tools(mcp: FastMCP):
             return MCPErrorFormatter.from_exception(e, "list versions")
 
     @mcp.tool()
+    @invalidates_tool_cache
     async def manage_version(
         ctx: Context,
         action: str,  # "create" | "restore"
@@ -164,7 +167,7 @@ def register_version_tools(mcp: FastMCP):
             api_url = get_api_url()
             timeout = get_default_timeout()
             
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout=timeout) as client:
                 if action == "create":
                     if not content:
                         return MCPErrorFormatter.format_error(
@@ -19,6 +19,8 @@ from src.mcp_server.utils.timeout_config import (
     get_polling_interval,
     get_polling_timeout,
 )
+from src.mcp_server.utils.http_client import get_http_client
+from src.mcp_server.utils.tool_cache import cached_get, invalidates_tool_cache
 from src.server.config.service_discovery import get_api_url
 
 logger = logging.getLogger(__name__)
@@ -84,8 +86,10 @@ def register_project_tools(mcp: FastMCP):
             
             # Single project get mode
             if project_id:
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    response = await client.get(urljoin(api_url, f"/api/projects/{project_id}"))
+                async with get_http_client(timeout=timeout) as client:
+                    response = await cached_get(
+                        client, "find_projects", urljoin(api_url, f"/api/projects/{project_id}")
+                    )
                     
                     if response.status_code == 200:
                         project = response.json()
@@ -101,27 +105,40 @@ def register_project_tools(mcp: FastMCP):
                     else:
                         return MCPErrorFormatter.from_http_error(response, "get project")
             
-            # List mode
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(urljoin(api_url, "/api/projects"))
+            # List mode - pagination, search and projection happen server-side
+            params = {
+                "include_content": False,
+                "limit": per_page,
+                "offset": (page - 1) * per_page,
+            }
+            if query:
+                params["q"] = query
+
+            async with get_http_client(timeout=timeout) as client:
+                response = await cached_get(
+                    client, "find_projects", urljoin(api_url, "/api/projects"), params=params
+                )
                 
                 if response.status_code == 200:
                     data = response.json()
                     projects = data.get("projects", [])
                     
-                    # Apply search filter if provided
-                    if query:
-                        query_lower = query.lower()
-                        projects = [
-                            p for p in projects
-                            if query_lower in p.get("title", "").lower()
-                            or query_lower in p.get("description", "").lower()
-                        ]
-                    
-                    # Apply pagination
-                    start_idx = (page - 1) * per_page
-                    end_idx = start_idx + per_page
-                    paginated = projects[start_idx:end_idx]
+                    if "total" in data:
+                        paginated = projects
+                        total = data["total"]
+                    else:
+                        # Older server without pagination support - filter and slice locally
+                        if query:
+                            query_lower = query.lower()
+                            projects = [
+                                p for p in projects
+                                if query_lower in p.get("title", "").lower()
+                                or query_lower in p.get("description", "").lower()
+                            ]
+                        start_idx = (page - 1) * per_page
+                        end_idx = start_idx + per_page
+                        paginated = projects[start_idx:end_idx]
+                        total = len(projects)
                     
                     # Optimize project responses
                     optimized = [optimize_project_response(p) for p in paginated]
@@ -130,7 +147,7 @@ def register_project_tools(mcp: FastMCP):
                         "success": True,
                         "projects": optimized,
                         "count": len(optimized),
-                        "total": len(projects),
+                        "total": total,
                         "page": page,
                         "per_page": per_page,
                         "query": query
@@ -145,6 +162,7 @@ def register_project_tools(mcp: FastMCP):
             return MCPErrorFormatter.from_exception(e, "list projects")
 
     @mcp.tool()
+    @invalidates_tool_cache
     async def manage_project(
         ctx: Context,
         action: str,  # "create" | "update" | "delete"
@@ -174,7 +192,7 @@ def register_project_tools(mcp: FastMCP):
             api_url = get_api_url()
             timeout = get_default_timeout()
             
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout=timeout) as client:
                 if action == "create":
                     if not title:
                         return MCPErrorFormatter.format_error(
@@ -205,7 +223,7 @@ def register_project_tools(mcp: FastMCP):
                                     sleep_interval = get_polling_interval(attempt)
                                     await asyncio.sleep(sleep_interval)
                                     
-                                    async with httpx.AsyncClient(timeout=polling_timeout) as poll_client:
+                                    async with get_http_client(timeout=polling_timeout) as poll_client:
                                         poll_response = await poll_client.get(
                                             urljoin(api_url, f"/api/progress/{result['progress_id']}")
                                         )
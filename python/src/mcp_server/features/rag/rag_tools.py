@@ -15,9 +15,12 @@ import logging
 import os
 from urllib.parse import urljoin
 
-import httpx
 from mcp.server.fastmcp import Context, FastMCP
 
+from src.mcp_server.utils.http_client import get_http_client
+from src.mcp_server.utils.timeout_config import get_search_timeout
+from src.mcp_server.utils.tool_cache import cached_get
+
 # Import service discovery for HTTP communication
 from src.server.config.service_discovery import get_api_url
 
@@ -52,10 +55,12 @@ def register_rag_tools(mcp: FastMCP):
         """
         try:
             api_url = get_api_url()
-            timeout = httpx.Timeout(30.0, connect=5.0)
+            timeout = get_search_timeout()
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(urljoin(api_url, "/api/rag/sources"))
+            async with get_http_client(timeout=timeout) as client:
+                response = await cached_get(
+                    client, "rag_get_available_sources", urljoin(api_url, "/api/rag/sources")
+                )
 
                 if response.status_code == 200:
                     result = response.json()
@@ -111,9 +116,9 @@ def register_rag_tools(mcp: FastMCP):
         """
         try:
             api_url = get_api_url()
-            timeout = httpx.Timeout(30.0, connect=5.0)
+            timeout = get_search_timeout()
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout=timeout) as client:
                 request_data = {
                     "query": query,
                     "match_count": match_count,
@@ -176,9 +181,9 @@ def register_rag_tools(mcp: FastMCP):
         """
         try:
             api_url = get_api_url()
-            timeout = httpx.Timeout(30.0, connect=5.0)
+            timeout = get_search_timeout()
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout=timeout) as client:
                 request_data = {"query": query, "match_count": match_count}
                 if source_id:
                     request_data["source"] = source_id
@@ -243,16 +248,15 @@ def register_rag_tools(mcp: FastMCP):
         """
         try:
             api_url = get_api_url()
-            timeout = httpx.Timeout(30.0, connect=5.0)
+            timeout = get_search_timeout()
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout=timeout) as client:
                 params = {"source_id": source_id}
                 if section:
                     params["section"] = section
 
-                response = await client.get(
-                    urljoin(api_url, "/api/pages"),
-                    params=params
+                response = await cached_get(
+                    client, "rag_list_pages_for_source", urljoin(api_url, "/api/pages"), params=params
                 )
 
                 if response.status_code == 200:
@@ -321,9 +325,9 @@ def register_rag_tools(mcp: FastMCP):
                 )
 
             api_url = get_api_url()
-            timeout = httpx.Timeout(30.0, connect=5.0)
+            timeout = get_search_timeout()
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout=timeout) as client:
                 if page_id:
                     response = await client.get(urljoin(api_url, f"/api/pages/{page_id}"))
                 else:
@@ -13,6 +13,8 @@ from urllib.parse import urljoin
 import httpx
 from mcp.server.fastmcp import Context, FastMCP
 
+from src.mcp_server.utils.http_client import get_http_client
+from src.mcp_server.utils.timeout_config import get_health_check_timeout, get_research_timeout
 from src.server.config.service_discovery import get_api_url
 
 logger = logging.getLogger(__name__)
@@ -63,9 +65,9 @@ def register_research_tools(mcp: FastMCP):
         """
         try:
             api_url = get_api_url()
-            timeout = httpx.Timeout(120.0, connect=10.0)  # Longer timeout for AI processing
+            timeout = get_research_timeout()  # Longer timeout for AI processing
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout=timeout) as client:
                 request_data = {
                     "query": query,
                     "match_count": match_count,
@@ -144,9 +146,9 @@ def register_research_tools(mcp: FastMCP):
         """
         try:
             api_url = get_api_url()
-            timeout = httpx.Timeout(10.0, connect=5.0)
+            timeout = get_health_check_timeout()
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout=timeout) as client:
                 response = await client.get(urljoin(api_url, "/api/research/health"))
 
                 if response.status_code == 200:
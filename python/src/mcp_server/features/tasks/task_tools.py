@@ -13,7 +13,9 @@ import httpx
 from mcp.server.fastmcp import Context, FastMCP
 
 from src.mcp_server.utils.error_handling import MCPErrorFormatter
+from src.mcp_server.utils.http_client import get_http_client
 from src.mcp_server.utils.timeout_config import get_default_timeout
+from src.mcp_server.utils.tool_cache import cached_get, invalidates_tool_cache
 from src.server.config.service_discovery import get_api_url
 
 logger = logging.getLogger(__name__)
@@ -91,8 +93,8 @@ def register_task_tools(mcp: FastMCP):
 
             # Single task get mode
             if task_id:
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    response = await client.get(urljoin(api_url, f"/api/tasks/{task_id}"))
+                async with get_http_client(timeout=timeout) as client:
+                    response = await cached_get(client, "find_tasks", urljoin(api_url, f"/api/tasks/{task_id}"))
 
                     if response.status_code == 200:
                         task = response.json()
@@ -147,8 +149,8 @@ def register_task_tools(mcp: FastMCP):
                 url = urljoin(api_url, "/api/tasks")
                 params["include_closed"] = include_closed
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(url, params=params)
+            async with get_http_client(timeout=timeout) as client:
+                response = await cached_get(client, "find_tasks", url, params=params)
                 response.raise_for_status()
 
                 result = response.json()
@@ -197,6 +199,7 @@ def register_task_tools(mcp: FastMCP):
             return MCPErrorFormatter.from_exception(e, "list tasks")
 
     @mcp.tool()
+    @invalidates_tool_cache
     async def manage_task(
         ctx: Context,
         action: str,  # "create" | "update" | "delete"
@@ -245,7 +248,7 @@ def register_task_tools(mcp: FastMCP):
             api_url = get_api_url()
             timeout = get_default_timeout()
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout=timeout) as client:
                 if action == "create":
                     if not project_id or not title:
                         return MCPErrorFormatter.format_error(
@@ -31,7 +31,7 @@ from typing import Any
 from dotenv import load_dotenv
 from mcp.server.fastmcp import Context, FastMCP
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
 # Add the project root to Python path for imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -54,8 +54,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared HTTP connection pool and response cache for tool calls
+from src.mcp_server.utils.http_client import HTTPClientPool, set_http_client_pool
+from src.mcp_server.utils.tool_cache import ToolResponseCache, set_tool_cache
+
 # Import Logfire configuration
 from src.server.config.logfire_config import mcp_logger, setup_logfire
+from src.server.config.loop_watchdog import start_loop_watchdog
+from src.server.config.metrics import PROMETHEUS_CONTENT_TYPE, render_metrics, start_event_loop_lag_monitor
 
 # Import service client for HTTP calls
 from src.server.services.mcp_service_client import get_mcp_service_client
@@ -89,6 +95,8 @@ class ArchonContext:
     """
 
     service_client: Any
+    http_pool: HTTPClientPool | None = None
+    tool_cache: ToolResponseCache | None = None
     health_status: dict = None
     startup_time: float = None
 
@@ -159,13 +167,33 @@ async def lifespan(server: FastMCP) -> AsyncIterator[ArchonContext]:
             session_manager = get_session_manager()
             logger.info("✓ Session manager initialized")
 
+            # Initialize the shared keep-alive pool used by all tools. It lives as
+            # long as the process: this lifespan runs per session, and the context
+            # (and pool) are reused by later sessions.
+            logger.info("🔌 Initializing HTTP connection pool...")
+            http_pool = HTTPClientPool()
+            set_http_client_pool(http_pool)
+            logger.info("✓ HTTP connection pool initialized")
+
+            # Read-through cache for hot read tools (cleared by manage_* tools)
+            tool_cache = ToolResponseCache()
+            set_tool_cache(tool_cache)
+            logger.info(f"✓ Tool response cache initialized (ttl={tool_cache.ttl_seconds}s)")
+
+            # Process-wide like the pool; also started by the first /metrics scrape
+            start_event_loop_lag_monitor()
+            start_loop_watchdog()
+
             # Initialize service client for HTTP calls
             logger.info("🌐 Initializing service client...")
             service_client = get_mcp_service_client()
+            service_client.http_client = http_pool.client
             logger.info("✓ Service client initialized")
 
             # Create context
-            context = ArchonContext(service_client=service_client)
+            context = ArchonContext(
+                service_client=service_client, http_pool=http_pool, tool_cache=tool_cache
+            )
 
             # Perform initial health check
             await perform_health_checks(context)
@@ -359,12 +387,16 @@ async def health_check(ctx: Context) -> str:
         if hasattr(context, "health_status") and context.health_status:
             await perform_health_checks(context)
 
-            return json.dumps({
+            health_data = {
                 "success": True,
                 "health": context.health_status,
                 "uptime_seconds": time.time() - context.startup_time,
                 "timestamp": datetime.now().isoformat(),
-            })
+            }
+            if getattr(context, "http_pool", None) is not None:
+                health_data["http_pool"] = context.http_pool.get_stats()
+
+            return json.dumps(health_data)
         else:
             return json.dumps({
                 "success": True,
@@ -404,6 +436,8 @@ async def session_info(ctx: Context) -> str:
         context = getattr(ctx.request_context, "lifespan_context", None)
         if context and hasattr(context, "startup_time"):
             session_info_data["server_uptime_seconds"] = time.time() - context.startup_time
+        if context and getattr(context, "tool_cache", None) is not None:
+            session_info_data["tool_cache"] = context.tool_cache.get_stats()
 
         return json.dumps({
             "success": True,
@@ -614,6 +648,21 @@ except Exception as e:
     logger.error(traceback.format_exc())
 
 
+async def http_metrics_endpoint(request: Request):
+    """Prometheus scrape endpoint."""
+    start_event_loop_lag_monitor()
+    start_loop_watchdog()
+    return Response(content=render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+try:
+    mcp.custom_route("/metrics", methods=["GET"])(http_metrics_endpoint)
+    logger.info("✓ HTTP /metrics endpoint registered successfully")
+except Exception as e:
+    logger.error(f"✗ Failed to register /metrics endpoint: {e}")
+    logger.error(traceback.format_exc())
+
+
 def main():
     """Main entry point for the MCP server."""
     try:
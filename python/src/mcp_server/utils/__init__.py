@@ -3,19 +3,47 @@ Utility modules for MCP Server.
 """
 
 from .error_handling import MCPErrorFormatter
-from .http_client import get_http_client
+from .http_client import (
+    HTTPClientPool,
+    get_http_client,
+    get_http_client_pool,
+    set_http_client_pool,
+)
 from .timeout_config import (
     get_default_timeout,
+    get_health_check_timeout,
     get_max_polling_attempts,
     get_polling_interval,
     get_polling_timeout,
+    get_pool_limits,
+    get_research_timeout,
+    get_search_timeout,
+)
+from .tool_cache import (
+    ToolResponseCache,
+    cached_get,
+    get_tool_cache,
+    invalidates_tool_cache,
+    set_tool_cache,
 )
 
 __all__ = [
     "MCPErrorFormatter",
+    "HTTPClientPool",
     "get_http_client",
+    "get_http_client_pool",
+    "set_http_client_pool",
     "get_default_timeout",
     "get_polling_timeout",
     "get_max_polling_attempts",
     "get_polling_interval",
+    "get_search_timeout",
+    "get_research_timeout",
+    "get_health_check_timeout",
+    "get_pool_limits",
+    "ToolResponseCache",
+    "cached_get",
+    "get_tool_cache",
+    "set_tool_cache",
+    "invalidates_tool_cache",
 ]
@@ -1,30 +1,148 @@
 """
 HTTP client utilities for MCP Server.
 
-Provides consistent HTTP client configuration.
+Provides consistent HTTP client configuration and a shared, lifespan-managed
+connection pool so tool calls reuse keep-alive connections to archon-server.
 """
 
+import os
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from typing import Any
 
 import httpx
 
-from .timeout_config import get_default_timeout, get_polling_timeout
+from .timeout_config import get_default_timeout, get_polling_timeout, get_pool_limits
+
+
+class PooledClient:
+    """
+    View of the shared pool that applies a per-call timeout to every request.
+
+    Exposes the subset of the httpx.AsyncClient API used by the MCP tools.
+    """
+
+    def __init__(self, pool: "HTTPClientPool", timeout: httpx.Timeout):
+        self._pool = pool
+        self._timeout = timeout
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        kwargs.setdefault("timeout", self._timeout)
+        return await self._pool.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+
+class HTTPClientPool:
+    """
+    Single keep-alive httpx.AsyncClient shared by all MCP tools.
+
+    Created in the MCP server lifespan and stored on ArchonContext. Tracks
+    request counters so health_check can report pool usage.
+    """
+
+    def __init__(self, limits: httpx.Limits | None = None, http2: bool | None = None):
+        if http2 is None:
+            http2 = os.getenv("MCP_HTTP2", "false").lower() == "true"
+        self.limits = limits or get_pool_limits()
+        self.http2 = http2
+        self.client = httpx.AsyncClient(
+            timeout=get_default_timeout(), limits=self.limits, http2=http2
+        )
+        self.created_at = time.time()
+        self.requests_total = 0
+        self.errors_total = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the shared client, updating pool counters."""
+        self.requests_total += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            return await self.client.request(method, url, **kwargs)
+        except Exception:
+            self.errors_total += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+    def client_with_timeout(self, timeout: httpx.Timeout) -> PooledClient:
+        """Return a view of the pool that uses the given timeout."""
+        return PooledClient(self, timeout)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Pool usage counters for health reporting."""
+        stats: dict[str, Any] = {
+            "requests_total": self.requests_total,
+            "errors_total": self.errors_total,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "http2": self.http2,
+            "closed": self.client.is_closed,
+        }
+
+        # httpcore keeps the live connections on the transport's pool
+        connections = getattr(getattr(self.client._transport, "_pool", None), "connections", None)
+        if connections is not None:
+            stats["open_connections"] = len(connections)
+            stats["idle_connections"] = sum(1 for conn in connections if conn.is_idle())
+
+        return stats
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self.client.aclose()
+
+
+# Pool installed by the MCP server lifespan; None outside a running server
+_shared_pool: HTTPClientPool | None = None
+
+
+def set_http_client_pool(pool: HTTPClientPool | None) -> None:
+    """Install (or clear) the process-wide pool used by get_http_client."""
+    global _shared_pool
+    _shared_pool = pool
+
+
+def get_http_client_pool() -> HTTPClientPool | None:
+    """Return the process-wide pool, if the server has started one."""
+    return _shared_pool
 
 
 @asynccontextmanager
 async def get_http_client(
     timeout: httpx.Timeout | None = None, for_polling: bool = False
-) -> AsyncIterator[httpx.AsyncClient]:
+) -> AsyncIterator[httpx.AsyncClient | PooledClient]:
     """
-    Create an HTTP client with consistent configuration.
+    Get an HTTP client with consistent configuration.
+
+    Uses the shared keep-alive pool when the MCP server is running, and falls
+    back to a short-lived client otherwise (scripts, tests).
 
     Args:
         timeout: Optional custom timeout. If not provided, uses defaults.
         for_polling: If True, uses polling-specific timeout configuration.
 
     Yields:
-        Configured httpx.AsyncClient
+        Configured client exposing get/post/put/patch/delete
 
     Example:
         async with get_http_client() as client:
@@ -33,6 +151,10 @@ async def get_http_client(
     if timeout is None:
         timeout = get_polling_timeout() if for_polling else get_default_timeout()
 
-    # Future: Could add retry logic, custom headers, etc. here
+    pool = _shared_pool
+    if pool is not None and not pool.client.is_closed:
+        yield pool.client_with_timeout(timeout)
+        return
+
     async with httpx.AsyncClient(timeout=timeout) as client:
         yield client
@@ -77,3 +77,74 @@ def get_polling_interval(attempt: int) -> float:
     # Exponential backoff: 1s, 2s, 4s, 5s, 5s, ...
     interval = min(base_interval * (2**attempt), max_interval)
     return float(interval)
+
+
+def get_search_timeout() -> httpx.Timeout:
+    """
+    Get timeout configuration for RAG search and source listing calls.
+
+    Environment variables:
+    - MCP_SEARCH_TIMEOUT: Total request timeout in seconds (default: 30)
+    - MCP_CONNECT_TIMEOUT: Connection timeout in seconds (default: 5)
+
+    Returns:
+        Configured httpx.Timeout object for RAG endpoints
+    """
+    return httpx.Timeout(
+        float(os.getenv("MCP_SEARCH_TIMEOUT", "30.0")),
+        connect=float(os.getenv("MCP_CONNECT_TIMEOUT", "5.0")),
+    )
+
+
+def get_research_timeout() -> httpx.Timeout:
+    """
+    Get timeout configuration for research agent calls.
+
+    Research runs an LLM agent server-side, so it needs a much longer budget.
+
+    Returns:
+        Configured httpx.Timeout object for research endpoints
+    """
+    return httpx.Timeout(
+        float(os.getenv("MCP_RESEARCH_TIMEOUT", "120.0")),
+        connect=float(os.getenv("MCP_RESEARCH_CONNECT_TIMEOUT", "10.0")),
+    )
+
+
+def get_health_check_timeout() -> httpx.Timeout:
+    """
+    Get timeout configuration for health probes.
+
+    Returns:
+        Configured httpx.Timeout object for health endpoints
+    """
+    return httpx.Timeout(
+        float(os.getenv("MCP_HEALTH_CHECK_TIMEOUT", "10.0")),
+        connect=float(os.getenv("MCP_CONNECT_TIMEOUT", "5.0")),
+    )
+
+
+def get_pool_limits() -> httpx.Limits:
+    """
+    Get connection pool limits for the shared MCP HTTP client.
+
+    Environment variables:
+    - MCP_HTTP_MAX_CONNECTIONS: Maximum open connections (default: 50)
+    - MCP_HTTP_MAX_KEEPALIVE: Idle connections kept alive (default: 20)
+    - MCP_HTTP_KEEPALIVE_EXPIRY: Seconds an idle connection is kept (default: 30)
+
+    Returns:
+        Configured httpx.Limits object
+    """
+    try:
+        max_connections = int(os.getenv("MCP_HTTP_MAX_CONNECTIONS", "50"))
+        max_keepalive = int(os.getenv("MCP_HTTP_MAX_KEEPALIVE", "20"))
+    except ValueError:
+        # Fall back to defaults if env vars are not valid integers
+        max_connections, max_keepalive = 50, 20
+
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive,
+        keepalive_expiry=float(os.getenv("MCP_HTTP_KEEPALIVE_EXPIRY", "30.0")),
+    )
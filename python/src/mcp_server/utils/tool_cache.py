@@ -0,0 +1,201 @@
+"""
+Read-through response cache for hot MCP read tools.
+
+Agents call tools like find_tasks or rag_get_available_sources repeatedly with
+identical arguments. This cache keeps successful GET responses per tool and
+normalized request for a short TTL, revalidates expired entries with the
+server's ETag, and is cleared whenever a manage_* tool succeeds.
+"""
+
+import functools
+import json
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+
+@dataclass
+class _CachedResponse:
+    url: str
+    content: bytes
+    headers: dict[str, str]
+    etag: str | None
+    stored_at: float
+
+    def to_response(self) -> httpx.Response:
+        return httpx.Response(
+            200, content=self.content, headers=self.headers, request=httpx.Request("GET", self.url)
+        )
+
+
+class ToolResponseCache:
+    """Bounded TTL cache of GET responses keyed by tool and normalized arguments."""
+
+    def __init__(self, ttl_seconds: float | None = None, max_entries: int | None = None):
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("MCP_TOOL_CACHE_TTL", "10.0"))
+        if max_entries is None:
+            try:
+                max_entries = int(os.getenv("MCP_TOOL_CACHE_MAX_ENTRIES", "256"))
+            except ValueError:
+                max_entries = 256
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _CachedResponse] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.invalidations = 0
+        # Bumped on invalidation so responses fetched across a write are not stored
+        self._generation = 0
+
+    @staticmethod
+    def make_key(tool: str, url: str, params: dict[str, Any] | None = None) -> str:
+        """Build a cache key that ignores parameter order and unset values."""
+        normalized = {k: v for k, v in (params or {}).items() if v is not None}
+        return f"{tool}|{url}|{json.dumps(normalized, sort_keys=True, default=str)}"
+
+    async def get(
+        self, client: Any, tool: str, url: str, params: dict[str, Any] | None = None
+    ) -> httpx.Response:
+        """
+        Fetch ``url`` through the cache.
+
+        Fresh entries are returned without a request. Expired entries that carry
+        an ETag are revalidated with If-None-Match, and a 304 refreshes them.
+
+        Args:
+            client: HTTP client from get_http_client
+            tool: Name of the calling tool (part of the key)
+            url: Absolute URL to GET
+            params: Query parameters
+
+        Returns:
+            An httpx.Response (cached or live)
+        """
+        key = self.make_key(tool, url, params)
+        entry = self._entries.get(key)
+        now = time.monotonic()
+
+        if entry is not None and now - entry.stored_at < self.ttl_seconds:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry.to_response()
+
+        kwargs: dict[str, Any] = {}
+        if params is not None:
+            kwargs["params"] = params
+        if entry is not None and entry.etag:
+            kwargs["headers"] = {"If-None-Match": entry.etag}
+
+        generation = self._generation
+        response = await client.get(url, **kwargs)
+
+        if generation != self._generation:
+            # A write invalidated the cache mid-request: don't store the response,
+            # and don't hand back a 304 for a body that is no longer cached
+            self.misses += 1
+            if response.status_code == 304:
+                self._entries.pop(key, None)
+                kwargs.pop("headers", None)
+                response = await client.get(url, **kwargs)
+            return response
+
+        if response.status_code == 304 and entry is not None:
+            self.revalidations += 1
+            entry.stored_at = time.monotonic()
+            self._entries.move_to_end(key)
+            return entry.to_response()
+
+        self.misses += 1
+        if response.status_code == 200:
+            headers = {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() in ("content-type", "etag")
+            }
+            self._entries[key] = _CachedResponse(
+                url=url,
+                content=response.content,
+                headers=headers,
+                etag=response.headers.get("etag"),
+                stored_at=time.monotonic(),
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.pop(key, None)
+
+        return response
+
+    def invalidate(self) -> None:
+        """Drop every cached response (called after successful writes)."""
+        self._entries.clear()
+        self._generation += 1
+        self.invalidations += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Cache counters for session_info."""
+        lookups = self.hits + self.revalidations + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "revalidations": self.revalidations,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": round((self.hits + self.revalidations) / lookups, 3) if lookups else 0.0,
+        }
+
+
+# Cache installed by the MCP server lifespan; None outside a running server
+_shared_cache: ToolResponseCache | None = None
+
+
+def set_tool_cache(cache: ToolResponseCache | None) -> None:
+    """Install (or clear) the process-wide tool response cache."""
+    global _shared_cache
+    _shared_cache = cache
+
+
+def get_tool_cache() -> ToolResponseCache | None:
+    """Return the process-wide tool response cache, if installed."""
+    return _shared_cache
+
+
+async def cached_get(
+    client: Any, tool: str, url: str, params: dict[str, Any] | None = None
+) -> httpx.Response:
+    """GET through the shared cache when installed, otherwise directly."""
+    cache = _shared_cache
+    if cache is not None:
+        return await cache.get(client, tool, url, params)
+    if params is not None:
+        return await client.get(url, params=params)
+    return await client.get(url)
+
+
+def invalidates_tool_cache(func: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """Clear the shared cache after a write tool reports success."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+        result = await func(*args, **kwargs)
+        cache = _shared_cache
+        if cache is not None:
+            try:
+                succeeded = json.loads(result).get("success") is True
+            except (TypeError, ValueError, AttributeError):
+                succeeded = False
+            if succeeded:
+                cache.invalidate()
+        return result
+
+    return wrapper
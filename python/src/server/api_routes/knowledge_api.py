@@ -687,6 +687,8 @@ async def refresh_knowledge_item(source_id: str):
             "max_depth": max_depth,
             "extract_code_examples": True,
             "generate_summary": True,
+            # Only re-process pages whose validators/content hash changed
+            "incremental": True,
         }
 
         # Create a wrapped task that acquires the semaphore
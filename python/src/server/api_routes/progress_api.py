@@ -1,10 +1,15 @@
-"""Progress API endpoints for polling operation status."""
+"""Progress API endpoints for polling and streaming operation status."""
 
+import asyncio
+import json
+from collections.abc import AsyncGenerator
 from datetime import datetime
 from email.utils import formatdate
+from typing import Any
 
-from fastapi import APIRouter, Header, HTTPException, Response
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
 from fastapi import status as http_status
+from fastapi.responses import StreamingResponse
 
 from ..config.logfire_config import get_logger, logfire
 from ..models.progress_models import create_progress_response
@@ -18,6 +23,26 @@ router = APIRouter(prefix="/api/progress", tags=["progress"])
 # Terminal states that don't require further polling
 TERMINAL_STATES = {"completed", "failed", "error", "cancelled"}
 
+# Minimum spacing between streamed events; faster updates are coalesced
+STREAM_COALESCE_SECONDS = 0.25
+# Comment frames keep idle connections open through proxies
+STREAM_KEEPALIVE_SECONDS = 15.0
+
+
+def _build_progress_payload(operation_id: str, operation: dict[str, Any]) -> dict[str, Any]:
+    """Convert raw tracker state into the camelCase API response shape."""
+    # Ensure we have the progress_id in the response without mutating shared state
+    operation_with_id = {**operation, "progress_id": operation_id}
+
+    # Get operation type for proper model selection
+    operation_type = operation.get("type", "crawl")
+
+    # Create standardized response using Pydantic model
+    progress_response = create_progress_response(operation_type, operation_with_id)
+
+    # Convert to dict with camelCase fields for API response
+    return progress_response.model_dump(by_alias=True, exclude_none=True)
+
 
 @router.get("/{operation_id}")
 async def get_progress(
@@ -45,18 +70,8 @@ async def get_progress(
             )
 
 
-        # Ensure we have the progress_id in the response without mutating shared state
-        operation_with_id = {**operation, "progress_id": operation_id}
-
-        # Get operation type for proper model selection
         operation_type = operation.get("type", "crawl")
-
-        # Create standardized response using Pydantic model
-        progress_response = create_progress_response(operation_type, operation_with_id)
-
-
-        # Convert to dict with camelCase fields for API response
-        response_data = progress_response.model_dump(by_alias=True, exclude_none=True)
+        response_data = _build_progress_payload(operation_id, operation)
 
         # Debug logging for code extraction fields
         if operation_type == "crawl" and operation.get("status") == "code_extraction":
@@ -97,6 +112,77 @@ async def get_progress(
         raise HTTPException(status_code=500, detail={"error": str(e)}) from e
 
 
+@router.get("/{operation_id}/stream")
+async def stream_progress(
+    operation_id: str,
+    request: Request,
+    last_event_id: str | None = Header(None),
+    after: int | None = Query(None, description="Resume after this sequence number"),
+):
+    """
+    Stream progress for an operation as Server-Sent Events.
+
+    Each event carries the same payload as GET /api/progress/{operation_id},
+    with the tracker's sequence number as the SSE id. Reconnecting clients
+    resume via the Last-Event-ID header (or ?after=N) and only receive a
+    state newer than the one they already have. Rapid updates are coalesced
+    and the stream closes once the operation reaches a terminal state.
+    """
+    if ProgressTracker.get_progress(operation_id) is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"error": f"Operation {operation_id} not found"}
+        )
+
+    resume_from = after
+    if resume_from is None and last_event_id:
+        try:
+            resume_from = int(last_event_id)
+        except ValueError:
+            resume_from = None
+    # -1 means "send the current state immediately"
+    last_sequence = resume_from if resume_from is not None else -1
+
+    async def event_generator() -> AsyncGenerator[str, None]:
+        nonlocal last_sequence
+        subscription = ProgressTracker.subscribe(operation_id)
+        try:
+            while True:
+                if await request.is_disconnected():
+                    break
+
+                item = await subscription.next(last_sequence, timeout=STREAM_KEEPALIVE_SECONDS)
+                if item is None:
+                    if ProgressTracker.get_progress(operation_id) is None:
+                        # State was cleaned up while we were idle
+                        break
+                    yield ": keepalive\n\n"
+                    continue
+
+                sequence, state = item
+                payload = _build_progress_payload(operation_id, state)
+                yield f"id: {sequence}\nevent: progress\ndata: {json.dumps(payload, default=str)}\n\n"
+                last_sequence = sequence
+
+                if state.get("status") in TERMINAL_STATES:
+                    break
+
+                # Let rapid-fire updates collapse into the next snapshot
+                await asyncio.sleep(STREAM_COALESCE_SECONDS)
+        finally:
+            ProgressTracker.unsubscribe(operation_id, subscription)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.get("/")
 async def list_active_operations():
     """
@@ -21,7 +21,7 @@ from pydantic import BaseModel
 # Set up standard logger for background tasks
 from ..config.logfire_config import get_logger, logfire
 from ..utils import get_supabase_client
-from ..utils.etag_utils import check_etag, generate_etag
+from ..utils.etag_utils import change_versions, check_etag, generate_etag
 
 logger = get_logger(__name__)
 
@@ -79,7 +79,10 @@ class CreateTaskRequest(BaseModel):
 async def list_projects(
     response: Response,
     include_content: bool = True,
-    if_none_match: str | None = Header(None)
+    if_none_match: str | None = Header(None),
+    limit: int | None = None,
+    offset: int = 0,
+    q: str | None = None,
 ):
     """
     List all projects.
@@ -87,13 +90,31 @@ async def list_projects(
     Args:
         include_content: If True (default), returns full project content.
                         If False, returns lightweight metadata with statistics.
+        limit: Optional page size; pagination is applied in the database query.
+        offset: Number of projects to skip when limit is set.
+        q: Optional keyword filter on title and description.
     """
     try:
+        if limit is not None and limit < 1:
+            raise HTTPException(status_code=400, detail={"error": "limit must be a positive integer"})
+        offset = max(offset, 0)
+
+        # Answer unchanged polls from the change counters before querying
+        cache_key = f"projects:include_content={include_content}:limit={limit}:offset={offset}:q={q}"
+        if change_versions.is_not_modified(cache_key, if_none_match, "projects"):
+            response.status_code = http_status.HTTP_304_NOT_MODIFIED
+            response.headers["ETag"] = if_none_match
+            response.headers["Cache-Control"] = "no-cache, must-revalidate"
+            return None
+        versions = change_versions.snapshot("projects")
+
         logfire.debug(f"Listing all projects | include_content={include_content}")
 
         # Use ProjectService to get projects with include_content parameter
         project_service = ProjectService()
-        success, result = project_service.list_projects(include_content=include_content)
+        success, result = project_service.list_projects(
+            include_content=include_content, limit=limit, offset=offset, search=q
+        )
 
         if not success:
             raise HTTPException(status_code=500, detail=result)
@@ -129,7 +150,11 @@ async def list_projects(
             "projects": formatted_projects,
             "count": len(formatted_projects)
         }
+        paginated = limit is not None or bool(q)
+        if paginated:
+            etag_data["total"] = result.get("total_count", len(formatted_projects))
         current_etag = generate_etag(etag_data)
+        change_versions.remember(cache_key, current_etag, versions)
 
         # Generate response with timestamp for polling
         response_data = {
@@ -137,6 +162,10 @@ async def list_projects(
             "timestamp": datetime.utcnow().isoformat(),
             "count": len(formatted_projects)
         }
+        if paginated:
+            response_data["total"] = etag_data["total"]
+            response_data["limit"] = limit
+            response_data["offset"] = offset
 
         # Check if client's ETag matches
         if check_etag(if_none_match, current_etag):
@@ -222,7 +251,7 @@ async def projects_health():
         try:
             project_service = ProjectService(supabase_client)
             # Try to list projects with limit 1 to test table access
-            success, _ = project_service.list_projects()
+            success, _ = project_service.list_projects(limit=1)
             projects_table_exists = success
             if success:
                 logfire.info("Projects table detected successfully")
@@ -292,6 +321,14 @@ async def get_all_task_counts(
 
         logfire.debug(f"Getting task counts for all projects | etag={if_none_match}")
 
+        if change_versions.is_not_modified("task-counts", if_none_match, "tasks"):
+            response.status_code = 304
+            response.headers["ETag"] = if_none_match
+            response.headers["Cache-Control"] = "no-cache, must-revalidate"
+            logfire.debug(f"Task counts unchanged since last read, returning 304 | etag={if_none_match}")
+            return None
+        versions = change_versions.snapshot("tasks")
+
         # Use TaskService to get batch task counts
         # Get client explicitly to ensure mocking works in tests
         supabase_client = get_supabase_client()
@@ -308,6 +345,7 @@ async def get_all_task_counts(
             "count": len(result)
         }
         current_etag = generate_etag(etag_data)
+        change_versions.remember("task-counts", current_etag, versions)
 
         # Check if client's ETag matches (304 Not Modified)
         if check_etag(if_none_match, current_etag):
@@ -565,6 +603,19 @@ async def list_project_tasks(
             f"Listing project tasks | project_id={project_id} | include_archived={include_archived} | exclude_large_fields={exclude_large_fields} | etag={if_none_match}"
         )
 
+        cache_key = (
+            f"tasks:{project_id}:include_archived={include_archived}"
+            f":exclude_large_fields={exclude_large_fields}"
+        )
+        task_scope = f"tasks:{project_id}"
+        if change_versions.is_not_modified(cache_key, if_none_match, task_scope):
+            response.status_code = 304
+            response.headers["ETag"] = if_none_match
+            response.headers["Cache-Control"] = "no-cache, must-revalidate"
+            logfire.debug(f"Tasks unchanged since last read, returning 304 | project_id={project_id}")
+            return None
+        versions = change_versions.snapshot(task_scope)
+
         # Use TaskService to list tasks
         task_service = TaskService()
         success, result = task_service.list_tasks(
@@ -619,6 +670,7 @@ async def list_project_tasks(
 
         etag_data = {"tasks": etag_tasks, "project_id": project_id, "count": len(tasks)}
         current_etag = generate_etag(etag_data)
+        change_versions.remember(cache_key, current_etag, versions)
 
         # Check if client's ETag matches (304 Not Modified)
         if check_etag(if_none_match, current_etag):
@@ -821,6 +873,8 @@ class UpdateDocumentRequest(BaseModel):
     content: dict[str, Any] | None = None
     tags: list[str] | None = None
     author: str | None = None
+    expected_revision: int | None = None
+    create_version: bool = False
 
 
 class CreateVersionRequest(BaseModel):
@@ -1077,9 +1131,17 @@ async def update_project_document(project_id: str, doc_id: str, request: UpdateD
 
         # Use DocumentService to update document
         document_service = DocumentService()
-        success, result = document_service.update_document(project_id, doc_id, update_fields)
+        success, result = document_service.update_document(
+            project_id,
+            doc_id,
+            update_fields,
+            create_version=request.create_version,
+            expected_revision=request.expected_revision,
+        )
 
         if not success:
+            if result.get("conflict"):
+                raise HTTPException(status_code=409, detail=result)
             if "not found" in result.get("error", "").lower():
                 raise HTTPException(status_code=404, detail=result.get("error"))
             else:
@@ -1099,16 +1161,22 @@ async def update_project_document(project_id: str, doc_id: str, request: UpdateD
 
 
 @router.delete("/projects/{project_id}/docs/{doc_id}")
-async def delete_project_document(project_id: str, doc_id: str):
-    """Delete a document from a project."""
+async def delete_project_document(
+    project_id: str, doc_id: str, expected_revision: int | None = None
+):
+    """Delete a document from a project, optionally only if still at expected_revision."""
     try:
         logfire.info(f"Deleting document | project_id={project_id} | doc_id={doc_id}")
 
         # Use DocumentService to delete document
         document_service = DocumentService()
-        success, result = document_service.delete_document(project_id, doc_id)
+        success, result = document_service.delete_document(
+            project_id, doc_id, expected_revision=expected_revision
+        )
 
         if not success:
+            if result.get("conflict"):
+                raise HTTPException(status_code=409, detail=result)
             if "not found" in result.get("error", "").lower():
                 raise HTTPException(status_code=404, detail=result.get("error"))
             else:
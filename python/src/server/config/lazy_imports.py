@@ -0,0 +1,54 @@
+"""
+Deferred imports for heavy dependencies.
+
+crawl4ai, the OpenAI SDK, sentence-transformers and the PDF/Word libraries
+take seconds to import between them, and most requests never touch them.
+``lazy_import`` returns a module whose code only runs on first attribute
+access, so modules can keep a top-level ``crawl4ai = lazy_import("crawl4ai")``
+and reference ``crawl4ai.CrawlerRunConfig`` where it is used. Avoid
+``from package import name`` for these packages: reading the name is an
+attribute access and loads the package immediately.
+
+Run ``python -X importtime -c "import src.server.main"`` (or
+``benchmarks.startup``) to see what the server still imports eagerly.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def is_available(name: str) -> bool:
+    """Whether a top-level package is installed, without importing it."""
+    if name in sys.modules:
+        return sys.modules[name] is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def lazy_import(name: str) -> ModuleType | None:
+    """
+    Return top-level package ``name`` without executing it yet, or None if it is not installed.
+
+    The package is imported on first attribute access. An already imported
+    package is returned as is.
+    """
+    if "." in name:
+        raise ValueError(f"lazy_import only defers top-level packages, got {name}")
+    if name in sys.modules:
+        return sys.modules[name]
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.loader is None:
+        return None
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,233 @@
+"""
+Event loop watchdog.
+
+A heartbeat task stamps the time on every event loop iteration it gets, and a
+daemon thread checks the stamp. When the heartbeat is late by more than the
+threshold, the loop thread is stuck in synchronous code - a Supabase
+``.execute()``, ``requests.get``, ``subprocess.run``, ``CrossEncoder.predict``
+- so the thread samples its stack with ``sys._current_frames`` for as long as
+the block lasts. Each blocking episode is attributed to the innermost Archon
+frame seen most often, logged once when the loop recovers, counted in the
+``/metrics`` output and kept in a top-blockers table.
+
+Sampling only happens while the loop is blocked; otherwise the thread wakes
+once per interval to compare two floats, so the watchdog is safe to leave on
+in production. Configure it with environment variables:
+
+    EVENT_LOOP_WATCHDOG_ENABLED       true/false (default true)
+    EVENT_LOOP_WATCHDOG_THRESHOLD_MS  block length worth reporting (default 250)
+    EVENT_LOOP_WATCHDOG_INTERVAL_MS   heartbeat and check interval (default 50)
+
+Like ``metrics``, this module only uses the standard library.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter as FrameCounter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# Frames under src/ are Archon code; anything else is the stdlib or a dependency
+_SOURCE_ROOT = Path(__file__).resolve().parents[2]
+_THIS_FILE = str(Path(__file__).resolve())
+
+# Distinct blocking sites kept as metric labels; later ones are counted as "other"
+MAX_SITES = 50
+STACK_DEPTH = 12
+
+LOOP_BLOCKS = registry.counter(
+    "archon_event_loop_blocks_total", "Event loop blocks longer than the watchdog threshold", ["site"]
+)
+LOOP_BLOCKED_SECONDS = registry.counter(
+    "archon_event_loop_blocked_seconds_total", "Time the event loop spent blocked past the threshold", ["site"]
+)
+
+
+@dataclass
+class Blocker:
+    """Aggregated blocking episodes attributed to one code site."""
+
+    site: str
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_seen: float = 0.0
+    stack: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "site": self.site,
+            "count": self.count,
+            "total_seconds": round(self.total_seconds, 3),
+            "max_seconds": round(self.max_seconds, 3),
+            "last_seen": self.last_seen,
+            "stack": self.stack,
+        }
+
+
+@dataclass
+class _Episode:
+    blocked_since: float
+    sites: FrameCounter = field(default_factory=FrameCounter)
+    stacks: dict[str, list[str]] = field(default_factory=dict)
+
+
+def _site_for(stack: traceback.StackSummary) -> str:
+    """``path:line function`` of the innermost Archon frame, else of the innermost frame."""
+    chosen = stack[-1]
+    for frame in reversed(stack):
+        filename = str(Path(frame.filename).resolve())
+        if filename != _THIS_FILE and filename.startswith(str(_SOURCE_ROOT)) and "site-packages" not in filename:
+            chosen = frame
+            break
+    try:
+        path = Path(chosen.filename).resolve().relative_to(_SOURCE_ROOT.parent)
+    except ValueError:
+        path = Path(chosen.filename)
+    return f"{path}:{chosen.lineno} {chosen.name}"
+
+
+class EventLoopWatchdog:
+    """Detects event loop blocks and samples the blocking stack from a helper thread."""
+
+    def __init__(self, threshold: float = 0.25, interval: float = 0.05):
+        self.threshold = threshold
+        self.interval = interval
+        self.blockers: dict[str, Blocker] = {}
+        self._labelled_sites: set[str] = set()
+        self._lock = threading.Lock()
+        self._last_beat: float | None = None
+        self._loop_thread_id: int | None = None
+        self._heartbeat_task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start watching the running event loop."""
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stop.clear()
+        self._heartbeat_task = asyncio.get_running_loop().create_task(
+            self._heartbeat(), name="event-loop-watchdog-heartbeat"
+        )
+        self._thread = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching and log the worst blockers seen."""
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval * 4)
+            self._thread = None
+        top = self.top_blockers(5)
+        if top:
+            summary = "; ".join(f"{b['site']} x{b['count']} ({b['total_seconds']:.2f}s)" for b in top)
+            logger.info(f"Top event loop blockers: {summary}")
+
+    def top_blockers(self, limit: int = 10) -> list[dict[str, Any]]:
+        """Blocking sites ordered by total time blocked."""
+        with self._lock:
+            ranked = sorted(self.blockers.values(), key=lambda b: b.total_seconds, reverse=True)
+            return [blocker.to_dict() for blocker in ranked[:limit]]
+
+    async def _heartbeat(self) -> None:
+        while True:
+            self._last_beat = time.perf_counter()
+            await asyncio.sleep(self.interval)
+
+    def _watch(self) -> None:
+        episode: _Episode | None = None
+        while not self._stop.wait(self.interval):
+            beat = self._last_beat
+            if beat is None:
+                continue
+            if episode is not None and beat != episode.blocked_since:
+                # The heartbeat ran again, so the loop is free
+                self._record(episode, max(0.0, beat - episode.blocked_since - self.interval))
+                episode = None
+            if time.perf_counter() - beat < self.threshold + self.interval:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            del frame
+            if episode is None:
+                episode = _Episode(blocked_since=beat)
+            site = _site_for(stack)
+            episode.sites[site] += 1
+            recent = traceback.StackSummary.from_list(stack[-STACK_DEPTH:])
+            episode.stacks[site] = [entry.rstrip() for entry in recent.format()]
+
+    def _record(self, episode: _Episode, seconds: float) -> None:
+        site, _ = episode.sites.most_common(1)[0]
+        with self._lock:
+            blocker = self.blockers.get(site)
+            if blocker is None:
+                blocker = self.blockers[site] = Blocker(site=site)
+            blocker.count += 1
+            blocker.total_seconds += seconds
+            blocker.max_seconds = max(blocker.max_seconds, seconds)
+            blocker.last_seen = time.time()
+            blocker.stack = episode.stacks[site]
+            if site in self._labelled_sites or len(self._labelled_sites) < MAX_SITES:
+                self._labelled_sites.add(site)
+                label = site
+            else:
+                label = "other"
+        LOOP_BLOCKS.inc(site=label)
+        LOOP_BLOCKED_SECONDS.inc(seconds, site=label)
+        logger.warning(
+            f"Event loop blocked for {seconds * 1000:.0f}ms at {site}\n" + "\n".join(episode.stacks[site]),
+            extra={"site": site, "blocked_ms": round(seconds * 1000)},
+        )
+
+
+def watchdog_from_env() -> EventLoopWatchdog | None:
+    """Build a watchdog from EVENT_LOOP_WATCHDOG_* settings, or None when disabled."""
+    if os.getenv("EVENT_LOOP_WATCHDOG_ENABLED", "true").lower() not in ("true", "1", "yes", "on"):
+        return None
+    threshold_ms = float(os.getenv("EVENT_LOOP_WATCHDOG_THRESHOLD_MS", "250"))
+    interval_ms = float(os.getenv("EVENT_LOOP_WATCHDOG_INTERVAL_MS", "50"))
+    return EventLoopWatchdog(threshold=threshold_ms / 1000, interval=interval_ms / 1000)
+
+
+_watchdog: EventLoopWatchdog | None = None
+
+
+def start_loop_watchdog() -> EventLoopWatchdog | None:
+    """Start the process-wide watchdog on the running loop if enabled; stop it with ``stop_loop_watchdog``."""
+    global _watchdog
+    if _watchdog is None:
+        _watchdog = watchdog_from_env()
+    if _watchdog is not None:
+        _watchdog.start()
+    return _watchdog
+
+
+def stop_loop_watchdog() -> None:
+    if _watchdog is not None:
+        _watchdog.stop()
+
+
+def get_loop_watchdog() -> EventLoopWatchdog | None:
+    return _watchdog
@@ -11,6 +11,7 @@ Modules:
 - projects_api: Project and task management with streaming
 """
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -39,18 +40,12 @@ from .api_routes.settings_api import router as settings_router
 
 # Import Logfire configuration
 from .config.logfire_config import api_logger, setup_logfire
-from .services.crawler_manager import cleanup_crawler, initialize_crawler
+from .config.loop_watchdog import start_loop_watchdog, stop_loop_watchdog
+from .config.metrics import PROMETHEUS_CONTENT_TYPE, render_metrics, start_event_loop_lag_monitor
+from .services.crawler_manager import cleanup_crawler, warm_up_crawler
 
 # Import utilities and core classes
-from .services.credential_service import initialize_credentials
-
-# Import missing dependencies that the modular APIs need
-try:
-    from crawl4ai import AsyncWebCrawler, BrowserConfig
-except ImportError:
-    # These are optional dependencies for full functionality
-    AsyncWebCrawler = None
-    BrowserConfig = None
+from .services.credential_service import credential_service, initialize_credentials
 
 # Logger will be initialized after credentials are loaded
 logger = logging.getLogger(__name__)
@@ -67,6 +62,19 @@ uvicorn_logger.setLevel(logging.WARNING)  # Only log warnings and errors, not ev
 _initialization_complete = False
 
 
+async def _warm_up_reranker():
+    """Load the reranking model ahead of the first query when reranking is enabled."""
+    try:
+        if not credential_service.get_bool_setting("USE_RERANKING", False):
+            return
+        from .services.search.reranking_strategy import warm_up_reranker
+
+        if await warm_up_reranker():
+            api_logger.info("✅ Reranking model loaded")
+    except Exception as e:
+        api_logger.warning(f"Could not warm up reranking model: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup and shutdown tasks."""
@@ -75,6 +83,8 @@ async def lifespan(app: FastAPI):
 
     # Startup
     logger.info("🚀 Starting Archon backend...")
+    loop_lag_monitor = start_event_loop_lag_monitor()
+    start_loop_watchdog()
 
     try:
         # Validate configuration FIRST - check for anon vs service key
@@ -91,16 +101,16 @@ async def lifespan(app: FastAPI):
 
         # Now we can safely use the logger
         logger.info("✅ Credentials initialized")
-        api_logger.info("🔥 Logfire initialized for backend")
 
-        # Initialize crawling context
-        try:
-            await initialize_crawler()
-        except Exception as e:
-            api_logger.warning(f"Could not fully initialize crawling context: {str(e)}")
+        # Pick up settings changed by other processes without waiting for cache TTLs
+        credential_service.start_watching()
+        api_logger.info("🔥 Logfire initialized for backend")
 
-        # Make crawling context available to modules
-        # Crawler is now managed by CrawlerManager
+        # Launch the crawler browser and load the reranker in the background so
+        # /health reports ready without waiting for them; crawls and reranked
+        # queries that arrive first initialize them on demand
+        crawler_warm_up = asyncio.create_task(warm_up_crawler(), name="crawler-warm-up")
+        reranker_warm_up = asyncio.create_task(_warm_up_reranker(), name="reranker-warm-up")
 
         api_logger.info("✅ Using polling for real-time updates")
 
@@ -130,12 +140,18 @@ async def lifespan(app: FastAPI):
     # Shutdown
     _initialization_complete = False
     api_logger.info("🛑 Shutting down Archon backend...")
+    loop_lag_monitor.cancel()
+    stop_loop_watchdog()
+    reranker_warm_up.cancel()
 
     try:
         # MCP Client cleanup not needed
 
-        # Cleanup crawling context
+        await credential_service.stop_watching()
+
+        # Cleanup crawling context; a browser still launching is closed once it is up
         try:
+            await crawler_warm_up
             await cleanup_crawler()
         except Exception as e:
             api_logger.warning("Could not cleanup crawling context: %s", e, exc_info=True)
@@ -169,7 +185,7 @@ app.add_middleware(
 @app.middleware("http")
 async def skip_health_check_logs(request, call_next):
     # Skip logging for health check endpoints
-    if request.url.path in ["/health", "/api/health"]:
+    if request.url.path in ["/health", "/api/health", "/metrics"]:
         # Temporarily suppress the log
         import logging
 
@@ -264,6 +280,13 @@ async def api_health_check(response: Response):
     return await health_check(response)
 
 
+# Prometheus scrape endpoint
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Service metrics in the Prometheus text exposition format."""
+    return Response(content=render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 # Cache schema check result to avoid repeated database queries
 _schema_check_cache = {"valid": None, "checked_at": 0}
 
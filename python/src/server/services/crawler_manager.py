@@ -5,17 +5,15 @@ Handles initialization and management of the Crawl4AI crawler instance.
 This avoids circular imports by providing a service-level access to the crawler.
 """
 
+import asyncio
 import os
 from typing import Optional
 
-try:
-    from crawl4ai import AsyncWebCrawler, BrowserConfig
-except ImportError:
-    AsyncWebCrawler = None
-    BrowserConfig = None
-
+from ..config.lazy_imports import lazy_import
 from ..config.logfire_config import get_logger, safe_logfire_error, safe_logfire_info
 
+crawl4ai = lazy_import("crawl4ai")
+
 logger = get_logger(__name__)
 
 
@@ -23,35 +21,40 @@ class CrawlerManager:
     """Manages the global crawler instance."""
 
     _instance: Optional["CrawlerManager"] = None
-    _crawler: AsyncWebCrawler | None = None
+    _crawler: "crawl4ai.AsyncWebCrawler | None" = None
     _initialized: bool = False
+    _initializing: asyncio.Future | None = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    async def get_crawler(self) -> AsyncWebCrawler:
+    async def get_crawler(self) -> "crawl4ai.AsyncWebCrawler":
         """Get or create the crawler instance."""
         if not self._initialized:
             await self.initialize()
         return self._crawler
 
     async def initialize(self):
-        """Initialize the crawler if not already initialized."""
+        """Initialize the crawler if not already initialized; concurrent callers share one attempt."""
         if self._initialized:
             safe_logfire_info("Crawler already initialized, skipping")
             return
 
+        if self._initializing is None or self._initializing.done():
+            self._initializing = asyncio.ensure_future(self._start_browser())
+        # Shielded so a cancelled request does not abort a launch other callers wait on
+        await asyncio.shield(self._initializing)
+
+    async def _start_browser(self):
         try:
             safe_logfire_info("Initializing Crawl4AI crawler...")
             logger.info("=== CRAWLER INITIALIZATION START ===")
 
             # Check if crawl4ai is available
-            if not AsyncWebCrawler or not BrowserConfig:
+            if crawl4ai is None:
                 logger.error("ERROR: crawl4ai not available")
-                logger.error(f"AsyncWebCrawler: {AsyncWebCrawler}")
-                logger.error(f"BrowserConfig: {BrowserConfig}")
                 raise ImportError("crawl4ai is not installed or available")
 
             # Check for Docker environment
@@ -59,7 +62,7 @@ class CrawlerManager:
 
             # Initialize browser config - same for Docker and local
             # crawl4ai/Playwright will handle Docker-specific settings internally
-            browser_config = BrowserConfig(
+            browser_config = crawl4ai.BrowserConfig(
                 headless=True,
                 verbose=False,
                 # Set viewport for proper rendering
@@ -104,7 +107,7 @@ class CrawlerManager:
             safe_logfire_info(f"Creating AsyncWebCrawler with config | in_docker={in_docker}")
 
             # Initialize crawler with the correct parameter name
-            self._crawler = AsyncWebCrawler(config=browser_config)
+            self._crawler = crawl4ai.AsyncWebCrawler(config=browser_config)
             safe_logfire_info("AsyncWebCrawler instance created, entering context...")
             await self._crawler.__aenter__()
             self._initialized = True
@@ -149,7 +152,7 @@ class CrawlerManager:
 _crawler_manager = CrawlerManager()
 
 
-async def get_crawler() -> AsyncWebCrawler | None:
+async def get_crawler() -> "crawl4ai.AsyncWebCrawler | None":
     """Get the global crawler instance."""
     global _crawler_manager
     crawler = await _crawler_manager.get_crawler()
@@ -170,6 +173,21 @@ async def initialize_crawler():
     await _crawler_manager.initialize()
 
 
+async def warm_up_crawler():
+    """
+    Import crawl4ai off the event loop, then launch the browser.
+
+    Run as a background task at startup so readiness does not wait for the
+    browser; a failed warm-up is retried by the first crawl that needs it.
+    """
+    try:
+        if crawl4ai is not None:
+            await asyncio.to_thread(getattr, crawl4ai, "AsyncWebCrawler")
+        await _crawler_manager.initialize()
+    except Exception as e:
+        logger.warning(f"Crawler warm-up failed, will retry on first crawl: {e}")
+
+
 async def cleanup_crawler():
     """Clean up the global crawler."""
     await _crawler_manager.cleanup()
@@ -7,10 +7,12 @@ Handles extraction, processing, and storage of code examples from documents.
 import asyncio
 import re
 from collections.abc import Callable
+from dataclasses import replace
 from typing import Any
 
 from ...config.logfire_config import safe_logfire_error, safe_logfire_info
 from ...services.credential_service import credential_service
+from ..ingestion_settings import IngestionSettings, current_ingestion_settings
 from ..storage.code_storage_service import (
     add_code_examples_to_supabase,
     generate_code_summaries_batch,
@@ -56,15 +58,33 @@ class CodeExtractionService:
         },
     }
 
-    def __init__(self, supabase_client):
+    # Settings read by the extraction filters, keyed by IngestionSettings field
+    _SETTING_KEYS = {
+        "min_code_block_length": "MIN_CODE_BLOCK_LENGTH",
+        "max_code_block_length": "MAX_CODE_BLOCK_LENGTH",
+        "enable_complete_block_detection": "ENABLE_COMPLETE_BLOCK_DETECTION",
+        "enable_language_specific_patterns": "ENABLE_LANGUAGE_SPECIFIC_PATTERNS",
+        "enable_prose_filtering": "ENABLE_PROSE_FILTERING",
+        "max_prose_ratio": "MAX_PROSE_RATIO",
+        "min_code_indicators": "MIN_CODE_INDICATORS",
+        "enable_diagram_filtering": "ENABLE_DIAGRAM_FILTERING",
+        "enable_contextual_length": "ENABLE_CONTEXTUAL_LENGTH",
+        "context_window_size": "CONTEXT_WINDOW_SIZE",
+        "enable_code_summaries": "ENABLE_CODE_SUMMARIES",
+    }
+
+    def __init__(self, supabase_client, settings: IngestionSettings | None = None):
         """
         Initialize the code extraction service.
 
         Args:
             supabase_client: The Supabase client for database operations
+            settings: Optional settings to use instead of resolving them per run
         """
         self.supabase_client = supabase_client
         self._settings_cache = {}
+        self._pinned_settings = settings
+        self._settings = settings or IngestionSettings()
 
     async def _get_setting(self, key: str, default: Any) -> Any:
         """Get a setting from credential service with caching."""
@@ -88,49 +108,66 @@ class CodeExtractionService:
             self._settings_cache[key] = default
             return default
 
-    async def _get_min_code_length(self) -> int:
+    async def _resolve_settings(self) -> IngestionSettings:
+        """
+        Resolve the settings used for one extraction run.
+
+        Crawls pin their settings at start; standalone runs (such as document
+        uploads) load each key once here instead of inside the per-block loops.
+        """
+        settings = self._pinned_settings or current_ingestion_settings()
+        if settings is not None:
+            return settings
+
+        defaults = IngestionSettings()
+        values = {}
+        for field_name, key in self._SETTING_KEYS.items():
+            values[field_name] = await self._get_setting(key, getattr(defaults, field_name))
+        return replace(defaults, **values)
+
+    def _get_min_code_length(self) -> int:
         """Get minimum code block length setting."""
-        return await self._get_setting("MIN_CODE_BLOCK_LENGTH", 250)
+        return self._settings.min_code_block_length
 
-    async def _get_max_code_length(self) -> int:
+    def _get_max_code_length(self) -> int:
         """Get maximum code block length setting."""
-        return await self._get_setting("MAX_CODE_BLOCK_LENGTH", 5000)
+        return self._settings.max_code_block_length
 
-    async def _is_complete_block_detection_enabled(self) -> bool:
+    def _is_complete_block_detection_enabled(self) -> bool:
         """Check if complete block detection is enabled."""
-        return await self._get_setting("ENABLE_COMPLETE_BLOCK_DETECTION", True)
+        return self._settings.enable_complete_block_detection
 
-    async def _is_language_patterns_enabled(self) -> bool:
+    def _is_language_patterns_enabled(self) -> bool:
         """Check if language-specific patterns are enabled."""
-        return await self._get_setting("ENABLE_LANGUAGE_SPECIFIC_PATTERNS", True)
+        return self._settings.enable_language_specific_patterns
 
-    async def _is_prose_filtering_enabled(self) -> bool:
+    def _is_prose_filtering_enabled(self) -> bool:
         """Check if prose filtering is enabled."""
-        return await self._get_setting("ENABLE_PROSE_FILTERING", True)
+        return self._settings.enable_prose_filtering
 
-    async def _get_max_prose_ratio(self) -> float:
+    def _get_max_prose_ratio(self) -> float:
         """Get maximum allowed prose ratio."""
-        return await self._get_setting("MAX_PROSE_RATIO", 0.15)
+        return self._settings.max_prose_ratio
 
-    async def _get_min_code_indicators(self) -> int:
+    def _get_min_code_indicators(self) -> int:
         """Get minimum required code indicators."""
-        return await self._get_setting("MIN_CODE_INDICATORS", 3)
+        return self._settings.min_code_indicators
 
-    async def _is_diagram_filtering_enabled(self) -> bool:
+    def _is_diagram_filtering_enabled(self) -> bool:
         """Check if diagram filtering is enabled."""
-        return await self._get_setting("ENABLE_DIAGRAM_FILTERING", True)
+        return self._settings.enable_diagram_filtering
 
-    async def _is_contextual_length_enabled(self) -> bool:
+    def _is_contextual_length_enabled(self) -> bool:
         """Check if contextual length adjustment is enabled."""
-        return await self._get_setting("ENABLE_CONTEXTUAL_LENGTH", True)
+        return self._settings.enable_contextual_length
 
-    async def _get_context_window_size(self) -> int:
+    def _get_context_window_size(self) -> int:
         """Get context window size for code blocks."""
-        return await self._get_setting("CONTEXT_WINDOW_SIZE", 1000)
+        return self._settings.context_window_size
 
-    async def _is_code_summaries_enabled(self) -> bool:
+    def _is_code_summaries_enabled(self) -> bool:
         """Check if code summaries generation is enabled."""
-        return await self._get_setting("ENABLE_CODE_SUMMARIES", True)
+        return self._settings.enable_code_summaries
 
     async def extract_and_store_code_examples(
         self,
@@ -157,6 +194,9 @@ class CodeExtractionService:
         Returns:
             Number of code examples stored
         """
+        # Resolve every setting once; the per-block filters read them synchronously
+        self._settings = await self._resolve_settings()
+
         # Phase 1: Extract code blocks (0-20% of overall code_extraction progress)
         extraction_callback = None
         if progress_callback:
@@ -913,7 +953,7 @@ class CodeExtractionService:
                     threshold = (
                         min_length
                         if min_length is not None
-                        else await self._get_min_code_length()
+                        else self._get_min_code_length()
                     )
                     if len(block_text) < threshold:
                         current_block = []
@@ -982,7 +1022,7 @@ class CodeExtractionService:
         safe_logfire_info(f"🔍 PDF CODE EXTRACTION START | url={url} | content_length={len(content)}")
         
         code_blocks = []
-        min_length = await self._get_min_code_length()
+        min_length = self._get_min_code_length()
         
         # Split content into paragraphs/sections
         # Use double newlines and page breaks as natural boundaries
@@ -1214,7 +1254,7 @@ class CodeExtractionService:
 
             # Cap at maximum length
             if max_length is None:
-                max_length = await self._get_max_code_length()
+                max_length = self._get_max_code_length()
             if extended_pos - start_pos > max_length:
                 break
 
@@ -1234,9 +1274,9 @@ class CodeExtractionService:
         """
         # Base lengths by language
         # Check if contextual length adjustment is enabled
-        if not await self._is_contextual_length_enabled():
+        if not self._is_contextual_length_enabled():
             # Return default minimum length
-            return await self._get_min_code_length()
+            return self._get_min_code_length()
 
         # Base lengths by language
         base_lengths = {
@@ -1258,7 +1298,7 @@ class CodeExtractionService:
         }
 
         # Get default minimum from settings
-        default_min = await self._get_min_code_length()
+        default_min = self._get_min_code_length()
         min_length = base_lengths.get(language.lower(), default_min)
 
         # Adjust based on context clues
@@ -1420,7 +1460,7 @@ class CodeExtractionService:
             return False
 
         # Skip diagram languages if filtering is enabled
-        if await self._is_diagram_filtering_enabled():
+        if self._is_diagram_filtering_enabled():
             if language.lower() in ["mermaid", "plantuml", "graphviz", "dot", "diagram"]:
                 safe_logfire_info(f"Skipping diagram language: {language}")
                 return False
@@ -1466,7 +1506,7 @@ class CodeExtractionService:
                 indicator_details.append(name)
 
         # Require minimum code indicators
-        min_indicators = await self._get_min_code_indicators()
+        min_indicators = self._get_min_code_indicators()
         if indicator_count < min_indicators:
             safe_logfire_info(
                 f"Code has insufficient indicators: {indicator_count} found ({', '.join(indicator_details)})"
@@ -1544,8 +1584,8 @@ class CodeExtractionService:
             prose_score += matches
 
         # Check prose filtering
-        if await self._is_prose_filtering_enabled():
-            max_prose_ratio = await self._get_max_prose_ratio()
+        if self._is_prose_filtering_enabled():
+            max_prose_ratio = self._get_max_prose_ratio()
             if word_count > 0 and prose_score / word_count > max_prose_ratio:
                 safe_logfire_info(
                     f"Code appears to be prose: prose_score={prose_score}, word_count={word_count}"
@@ -1572,7 +1612,7 @@ class CodeExtractionService:
             List of summary results
         """
         # Check if code summaries are enabled
-        if not await self._is_code_summaries_enabled():
+        if not self._is_code_summaries_enabled():
             safe_logfire_info("Code summaries generation is disabled, returning default summaries")
             # Return default summaries for all code blocks
             default_summaries = []
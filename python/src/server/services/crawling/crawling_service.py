@@ -17,11 +17,13 @@ from ...config.logfire_config import get_logger, safe_logfire_error, safe_logfir
 from ...utils import get_supabase_client
 from ...utils.progress.progress_tracker import ProgressTracker
 from ..credential_service import credential_service
+from ..ingestion_settings import load_ingestion_settings, use_ingestion_settings
 
 # Import strategies
 # Import operations
 from .discovery_service import DiscoveryService
 from .document_storage_operations import DocumentStorageOperations
+from .helpers.page_change_detector import PageChangeDetector
 from .helpers.site_config import SiteConfig
 
 # Import helpers
@@ -132,6 +134,7 @@ class CrawlingService:
         self.doc_storage_ops = DocumentStorageOperations(self.supabase_client)
         self.discovery_service = DiscoveryService()
         self.page_storage_ops = PageStorageOperations(self.supabase_client)
+        self.page_change_detector = PageChangeDetector(self.supabase_client)
 
         # Track progress state across all stages to prevent UI resets
         self.progress_state = {"progressId": self.progress_id} if self.progress_id else {}
@@ -139,6 +142,9 @@ class CrawlingService:
         self.progress_mapper = ProgressMapper()
         # Cancellation support
         self._cancelled = False
+        # Incremental refresh support (populated when request["incremental"] is set)
+        self._incremental = False
+        self._unmodified_urls: set[str] = set()
 
     def set_progress_id(self, progress_id: str):
         """Set the progress ID for HTTP polling updates."""
@@ -252,6 +258,15 @@ class CrawlingService:
         link_text_fallbacks: dict[str, str] | None = None,
     ) -> list[dict[str, Any]]:
         """Batch crawl multiple URLs in parallel."""
+        if self._incremental:
+            # Skip pages whose stored validators the server still honours
+            unmodified = await self.page_change_detector.find_unmodified_urls(urls)
+            if unmodified:
+                self._unmodified_urls.update(unmodified)
+                urls = [u for u in urls if u not in unmodified]
+                safe_logfire_info(f"Incremental refresh skipping {len(unmodified)} unmodified URLs")
+            if not urls:
+                return []
         return await self.batch_strategy.crawl_batch_with_progress(
             urls,
             self.url_handler.transform_github_url,
@@ -303,7 +318,7 @@ class CrawlingService:
 
         # Start the crawl as an async task in the main event loop
         # Store the task reference for proper cancellation
-        crawl_task = asyncio.create_task(self._async_orchestrate_crawl(request, task_id))
+        crawl_task = asyncio.create_task(self._run_crawl_with_settings(request, task_id))
 
         # Set a name for the task to help with debugging
         if self.progress_id:
@@ -318,6 +333,15 @@ class CrawlingService:
             "task": crawl_task,  # Return the actual task for proper cancellation
         }
 
+    async def _run_crawl_with_settings(self, request: dict[str, Any], task_id: str):
+        """
+        Resolve ingestion settings once and run the crawl with them pinned, so
+        every stage and every task it spawns reads the same values.
+        """
+        settings = await load_ingestion_settings()
+        with use_ingestion_settings(settings):
+            return await self._async_orchestrate_crawl(request, task_id)
+
     async def _async_orchestrate_crawl(self, request: dict[str, Any], task_id: str):
         """
         Async orchestration that runs in the main event loop.
@@ -362,6 +386,11 @@ class CrawlingService:
                 f"Generated unique source_id '{original_source_id}' and display name '{source_display_name}' from URL '{url}'"
             )
 
+            # Incremental refresh: load per-page validators and hashes from the previous crawl
+            if request.get("incremental"):
+                known_pages = await self.page_change_detector.load_known_pages(original_source_id)
+                self._incremental = bool(known_pages)
+
             # Helper to update progress with mapper
             async def update_mapped_progress(
                 stage: str, stage_progress: int, message: str, **kwargs
@@ -500,9 +529,44 @@ class CrawlingService:
             # Send heartbeat after potentially long crawl operation
             await send_heartbeat_if_needed()
 
-            if not crawl_results:
+            # Incremental refresh: drop pages whose content hash is unchanged
+            unchanged_urls = sorted(self._unmodified_urls)
+            if self._incremental:
+                crawl_results, hash_unchanged = self.page_change_detector.split_changed(crawl_results)
+                unchanged_urls.extend(hash_unchanged)
+                safe_logfire_info(
+                    f"Incremental refresh | changed={len(crawl_results)} | unchanged={len(unchanged_urls)}"
+                )
+
+            if not crawl_results and not unchanged_urls:
                 raise ValueError("No content was crawled from the provided URL")
 
+            if not crawl_results:
+                # Nothing changed since the last crawl - skip storage and code extraction entirely
+                await update_mapped_progress(
+                    "completed",
+                    100,
+                    f"Refresh completed: all {len(unchanged_urls)} pages unchanged",
+                    chunks_stored=0,
+                    code_examples_found=0,
+                    pages_unchanged=len(unchanged_urls),
+                    processed_pages=len(unchanged_urls),
+                    total_pages=len(unchanged_urls),
+                )
+                if self.progress_tracker:
+                    await self.progress_tracker.complete({
+                        "chunks_stored": 0,
+                        "code_examples_found": 0,
+                        "pages_unchanged": len(unchanged_urls),
+                        "processed_pages": len(unchanged_urls),
+                        "total_pages": len(unchanged_urls),
+                        "sourceId": original_source_id,
+                        "log": "Refresh completed - no pages changed",
+                    })
+                if self.progress_id:
+                    await unregister_orchestration(self.progress_id)
+                return
+
             # Processing stage
             await update_mapped_progress("processing", 50, "Processing crawled content")
 
@@ -685,6 +749,7 @@ class CrawlingService:
                 f"Crawl completed: {actual_chunks_stored} chunks, {code_examples_count} code examples",
                 chunks_stored=actual_chunks_stored,
                 code_examples_found=code_examples_count,
+                pages_unchanged=len(unchanged_urls),
                 processed_pages=len(crawl_results),
                 total_pages=len(crawl_results),
             )
@@ -694,6 +759,7 @@ class CrawlingService:
                 await self.progress_tracker.complete({
                     "chunks_stored": actual_chunks_stored,
                     "code_examples_found": code_examples_count,
+                    "pages_unchanged": len(unchanged_urls),
                     "processed_pages": len(crawl_results),
                     "total_pages": len(crawl_results),
                     "sourceId": storage_results.get("source_id", ""),
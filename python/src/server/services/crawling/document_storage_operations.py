@@ -72,6 +72,7 @@ class DocumentStorageOperations:
         all_metadatas = []
         source_word_counts = {}
         url_to_full_document = {}
+        url_to_response_headers = {}
         processed_docs = 0
 
         # Process and chunk each document
@@ -102,6 +103,7 @@ class DocumentStorageOperations:
 
             # Store full document for code extraction context
             url_to_full_document[doc_url] = markdown_content
+            url_to_response_headers[doc_url] = doc.get("response_headers") or {}
 
             # CHUNK THE CONTENT
             chunks = await storage_service.smart_chunk_text_async(markdown_content, chunk_size=5000)
@@ -158,7 +160,13 @@ class DocumentStorageOperations:
                 await asyncio.sleep(0)
 
         # Create/update source record FIRST (required for FK constraints on pages and chunks)
-        if all_contents and all_metadatas:
+        # Incremental refreshes only carry changed pages, so keep the existing source
+        # summary rather than regenerating it from a partial view of the content
+        if request.get("incremental") and self._source_exists(original_source_id):
+            safe_logfire_info(
+                f"Incremental refresh - reusing existing source record for '{original_source_id}'"
+            )
+        elif all_contents and all_metadatas:
             await self._create_source_records(
                 all_metadatas, all_contents, source_word_counts, request,
                 source_url, source_display_name
@@ -186,6 +194,7 @@ class DocumentStorageOperations:
                 original_source_id,
                 request,
                 crawl_type="llms_full",
+                response_headers=url_to_response_headers.get(base_url),
             )
 
             # Parse sections and re-chunk each section
@@ -234,6 +243,7 @@ class DocumentStorageOperations:
                 reconstructed_crawl_results.append({
                     "url": url,
                     "markdown": markdown,
+                    "response_headers": url_to_response_headers.get(url, {}),
                 })
 
             if reconstructed_crawl_results:
@@ -288,6 +298,20 @@ class DocumentStorageOperations:
             'source_id': original_source_id
         }
 
+    def _source_exists(self, source_id: str) -> bool:
+        """Check whether a source record already exists."""
+        try:
+            result = (
+                self.supabase_client.table("archon_sources")
+                .select("source_id")
+                .eq("source_id", source_id)
+                .execute()
+            )
+            return bool(result.data)
+        except Exception as e:
+            logger.warning(f"Failed to check source existence for '{source_id}': {e}")
+            return False
+
     async def _create_source_records(
         self,
         all_metadatas: list[dict],
@@ -0,0 +1,172 @@
+"""
+Page Change Detector Helper
+
+Supports incremental recrawls by tracking per-page HTTP validators (ETag,
+Last-Modified) and content hashes stored in archon_page_metadata.
+"""
+
+import asyncio
+import hashlib
+from typing import Any
+
+import httpx
+
+from ....config.logfire_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class PageChangeDetector:
+    """Detects which pages of a source changed since the previous crawl."""
+
+    # Concurrent conditional requests issued during a refresh
+    MAX_CONCURRENT_CHECKS = 10
+    CHECK_TIMEOUT_SECONDS = 10.0
+
+    def __init__(self, supabase_client):
+        """
+        Initialize the change detector.
+
+        Args:
+            supabase_client: The Supabase client for database operations
+        """
+        self.supabase_client = supabase_client
+        self.known_pages: dict[str, dict[str, Any]] = {}
+
+    @staticmethod
+    def compute_content_hash(content: str) -> str:
+        """Return a stable SHA-256 hex digest of page content."""
+        return hashlib.sha256(content.strip().encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def extract_validators(headers: dict[str, Any] | None) -> dict[str, str | None]:
+        """
+        Pull HTTP cache validators out of a response header mapping.
+
+        Args:
+            headers: Response headers (any casing)
+
+        Returns:
+            Dict with "etag" and "last_modified" keys (None when absent)
+        """
+        normalized = {str(k).lower(): v for k, v in (headers or {}).items()}
+        return {
+            "etag": normalized.get("etag") or None,
+            "last_modified": normalized.get("last-modified") or None,
+        }
+
+    async def load_known_pages(self, source_id: str) -> dict[str, dict[str, Any]]:
+        """
+        Load stored validators and hashes for every page of a source.
+
+        Args:
+            source_id: The source whose pages should be loaded
+
+        Returns:
+            {url: {"content_hash", "etag", "last_modified"}} mapping
+        """
+        try:
+            result = (
+                self.supabase_client.table("archon_page_metadata")
+                .select("url, content_hash, etag, last_modified")
+                .eq("source_id", source_id)
+                .execute()
+            )
+            self.known_pages = {row["url"]: row for row in (result.data or [])}
+        except Exception as e:
+            # Missing columns (migration not applied) just disables incremental mode
+            logger.warning(f"Could not load page validators for source {source_id}: {e}")
+            self.known_pages = {}
+
+        logger.info(f"Loaded validators for {len(self.known_pages)} known pages | source_id={source_id}")
+        return self.known_pages
+
+    async def find_unmodified_urls(self, urls: list[str]) -> set[str]:
+        """
+        Issue conditional HEAD requests for pages with stored validators.
+
+        A URL is considered unmodified when the server answers 304, or when it
+        returns the same strong ETag that was recorded at crawl time.
+
+        Args:
+            urls: Candidate URLs about to be crawled
+
+        Returns:
+            Set of URLs that can be skipped entirely
+        """
+        candidates = [
+            url for url in urls
+            if url in self.known_pages
+            and (self.known_pages[url].get("etag") or self.known_pages[url].get("last_modified"))
+        ]
+        if not candidates:
+            return set()
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CHECKS)
+        unmodified: set[str] = set()
+
+        async def check(client: httpx.AsyncClient, url: str) -> None:
+            known = self.known_pages[url]
+            headers = {}
+            if known.get("etag"):
+                headers["If-None-Match"] = known["etag"]
+            if known.get("last_modified"):
+                headers["If-Modified-Since"] = known["last_modified"]
+
+            async with semaphore:
+                try:
+                    response = await client.head(url, headers=headers)
+                except httpx.HTTPError as e:
+                    logger.debug(f"Conditional check failed for {url}: {e}")
+                    return
+
+            if response.status_code == 304:
+                unmodified.add(url)
+                return
+            etag = response.headers.get("etag")
+            if (
+                response.status_code == 200
+                and etag
+                and not etag.startswith("W/")
+                and etag == known.get("etag")
+            ):
+                unmodified.add(url)
+
+        async with httpx.AsyncClient(
+            timeout=httpx.Timeout(self.CHECK_TIMEOUT_SECONDS), follow_redirects=True
+        ) as client:
+            await asyncio.gather(*(check(client, url) for url in candidates))
+
+        logger.info(f"Conditional checks: {len(unmodified)}/{len(candidates)} pages unmodified")
+        return unmodified
+
+    def split_changed(
+        self, crawl_results: list[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """
+        Partition crawl results by comparing content hashes with stored pages.
+
+        Args:
+            crawl_results: Freshly crawled documents with url and markdown
+
+        Returns:
+            Tuple of (changed documents, unchanged URLs)
+        """
+        changed: list[dict[str, Any]] = []
+        unchanged: list[str] = []
+
+        for doc in crawl_results:
+            url = (doc.get("url") or "").strip()
+            markdown = doc.get("markdown") or ""
+            known = self.known_pages.get(url)
+            if (
+                known
+                and known.get("content_hash")
+                and markdown.strip()
+                and known["content_hash"] == self.compute_content_hash(markdown)
+            ):
+                unchanged.append(url)
+            else:
+                changed.append(doc)
+
+        return changed, unchanged
@@ -3,11 +3,11 @@ Site Configuration Helper
 
 Handles site-specific configurations and detection.
 """
-from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
-from crawl4ai.content_filter_strategy import PruningContentFilter
-
+from ....config.lazy_imports import lazy_import
 from ....config.logfire_config import get_logger
 
+crawl4ai = lazy_import("crawl4ai")
+
 logger = get_logger(__name__)
 
 
@@ -82,7 +82,7 @@ class SiteConfig:
         Returns:
             Configured markdown generator
         """
-        return DefaultMarkdownGenerator(
+        return crawl4ai.DefaultMarkdownGenerator(
             content_source="html",  # Use raw HTML to preserve code blocks
             options={
                 "mark_code": True,         # Mark code blocks properly
@@ -106,12 +106,12 @@ class SiteConfig:
         Returns:
             Configured markdown generator
         """
-        prune_filter = PruningContentFilter(
+        prune_filter = crawl4ai.PruningContentFilter(
             threshold=0.2,
             threshold_type="fixed"
         )
 
-        return DefaultMarkdownGenerator(
+        return crawl4ai.DefaultMarkdownGenerator(
             content_source="html",  # Use raw HTML to preserve code blocks
             content_filter=prune_filter,
             options={
@@ -11,6 +11,7 @@ from postgrest.exceptions import APIError
 
 from ...config.logfire_config import get_logger, safe_logfire_error, safe_logfire_info
 from .helpers.llms_full_parser import parse_llms_full_sections
+from .helpers.page_change_detector import PageChangeDetector
 
 logger = get_logger(__name__)
 
@@ -69,6 +70,7 @@ class PageStorageOperations:
             # Prepare page record
             word_count = len(markdown.split())
             char_count = len(markdown)
+            validators = PageChangeDetector.extract_validators(doc.get("response_headers"))
 
             page_record = {
                 "source_id": source_id,
@@ -79,6 +81,9 @@ class PageStorageOperations:
                 "word_count": word_count,
                 "char_count": char_count,
                 "chunk_count": 0,  # Will be updated after chunking
+                "content_hash": PageChangeDetector.compute_content_hash(markdown),
+                "etag": validators["etag"],
+                "last_modified": validators["last_modified"],
                 "metadata": {
                     "knowledge_type": request.get("knowledge_type", "documentation"),
                     "crawl_type": crawl_type,
@@ -131,6 +136,7 @@ class PageStorageOperations:
         source_id: str,
         request: dict[str, Any],
         crawl_type: str = "llms_full",
+        response_headers: dict[str, Any] | None = None,
     ) -> dict[str, str]:
         """
         Store llms-full.txt sections as separate pages.
@@ -143,6 +149,7 @@ class PageStorageOperations:
             source_id: The source ID these sections belong to
             request: The original crawl request
             crawl_type: Type of crawl (defaults to "llms_full")
+            response_headers: Optional HTTP headers of the llms-full.txt response
 
         Returns:
             {url: page_id} mapping for FK references in chunks
@@ -162,6 +169,7 @@ class PageStorageOperations:
 
         # Prepare page records for each section
         pages_to_insert: list[dict[str, Any]] = []
+        validators = PageChangeDetector.extract_validators(response_headers)
 
         for section in sections:
             page_record = {
@@ -173,6 +181,9 @@ class PageStorageOperations:
                 "word_count": section.word_count,
                 "char_count": len(section.content),
                 "chunk_count": 0,  # Will be updated after chunking
+                "content_hash": PageChangeDetector.compute_content_hash(section.content),
+                "etag": validators["etag"],
+                "last_modified": validators["last_modified"],
                 "metadata": {
                     "knowledge_type": request.get("knowledge_type", "documentation"),
                     "crawl_type": crawl_type,
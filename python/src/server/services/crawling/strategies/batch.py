@@ -8,13 +8,19 @@ import asyncio
 from collections.abc import Awaitable, Callable
 from typing import Any
 
-from crawl4ai import CacheMode, CrawlerRunConfig, MemoryAdaptiveDispatcher
-
+from ....config.lazy_imports import lazy_import
 from ....config.logfire_config import get_logger
+from ....config.metrics import registry
 from ...credential_service import credential_service
+from ...ingestion_settings import current_ingestion_settings
+
+crawl4ai = lazy_import("crawl4ai")
 
 logger = get_logger(__name__)
 
+# Shared by every crawl strategy; rate() over it gives pages per second
+CRAWLED_PAGES = registry.counter("archon_crawl_pages_total", "Pages crawled successfully", ["strategy"])
+
 
 class BatchCrawlStrategy:
     """Strategy for crawling multiple URLs in batch."""
@@ -63,7 +69,12 @@ class BatchCrawlStrategy:
 
         # Load settings from database - fail fast on configuration errors
         try:
-            settings = await credential_service.get_credentials_by_category("rag_strategy")
+            # A running crawl pins its settings at start; standalone calls load them here
+            ingestion_settings = current_ingestion_settings()
+            if ingestion_settings is not None:
+                settings = ingestion_settings.values
+            else:
+                settings = await credential_service.get_credentials_by_category("rag_strategy")
 
             # Clamp batch_size to prevent zero step in range()
             raw_batch_size = int(settings.get("CRAWL_BATCH_SIZE", "50"))
@@ -107,8 +118,8 @@ class BatchCrawlStrategy:
         if has_doc_sites:
             logger.info("Detected documentation sites in batch, using enhanced configuration")
             # Use generic documentation selectors for batch crawling
-            crawl_config = CrawlerRunConfig(
-                cache_mode=CacheMode.BYPASS,
+            crawl_config = crawl4ai.CrawlerRunConfig(
+                cache_mode=crawl4ai.CacheMode.BYPASS,
                 stream=True,  # Enable streaming for faster parallel processing
                 markdown_generator=self.markdown_generator,
                 wait_until=settings.get("CRAWL_WAIT_STRATEGY", "domcontentloaded"),
@@ -122,8 +133,8 @@ class BatchCrawlStrategy:
             )
         else:
             # Configuration for regular batch crawling
-            crawl_config = CrawlerRunConfig(
-                cache_mode=CacheMode.BYPASS,
+            crawl_config = crawl4ai.CrawlerRunConfig(
+                cache_mode=crawl4ai.CacheMode.BYPASS,
                 stream=True,  # Enable streaming
                 markdown_generator=self.markdown_generator,
                 wait_until=settings.get("CRAWL_WAIT_STRATEGY", "domcontentloaded"),
@@ -132,7 +143,7 @@ class BatchCrawlStrategy:
                 scan_full_page=True,
             )
 
-        dispatcher = MemoryAdaptiveDispatcher(
+        dispatcher = crawl4ai.MemoryAdaptiveDispatcher(
             memory_threshold_percent=memory_threshold,
             check_interval=check_interval,
             max_session_permit=max_concurrent,
@@ -255,11 +266,13 @@ class BatchCrawlStrategy:
                         if fallback_text:
                             title = fallback_text
 
+                    CRAWLED_PAGES.inc(strategy="batch")
                     successful_results.append({
                         "url": original_url,
                         "markdown": result.markdown.fit_markdown,
                         "html": result.html,  # Use raw HTML
                         "title": title,
+                        "response_headers": getattr(result, "response_headers", None) or {},
                     })
                 else:
                     logger.warning(
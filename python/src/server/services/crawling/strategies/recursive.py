@@ -9,11 +9,14 @@ from collections.abc import Awaitable, Callable
 from typing import Any
 from urllib.parse import urldefrag
 
-from crawl4ai import CacheMode, CrawlerRunConfig, MemoryAdaptiveDispatcher
-
+from ....config.lazy_imports import lazy_import
 from ....config.logfire_config import get_logger
 from ...credential_service import credential_service
+from ...ingestion_settings import current_ingestion_settings
 from ..helpers.url_handler import URLHandler
+from .batch import CRAWLED_PAGES
+
+crawl4ai = lazy_import("crawl4ai")
 
 logger = get_logger(__name__)
 
@@ -66,7 +69,12 @@ class RecursiveCrawlStrategy:
 
         # Load settings from database - fail fast on configuration errors
         try:
-            settings = await credential_service.get_credentials_by_category("rag_strategy")
+            # A running crawl pins its settings at start; standalone calls load them here
+            ingestion_settings = current_ingestion_settings()
+            if ingestion_settings is not None:
+                settings = ingestion_settings.values
+            else:
+                settings = await credential_service.get_credentials_by_category("rag_strategy")
 
             # Clamp batch_size to prevent zero step in range()
             raw_batch_size = int(settings.get("CRAWL_BATCH_SIZE", "50"))
@@ -111,8 +119,8 @@ class RecursiveCrawlStrategy:
             logger.info(
                 "Detected documentation sites for recursive crawl, using enhanced configuration"
             )
-            run_config = CrawlerRunConfig(
-                cache_mode=CacheMode.BYPASS,
+            run_config = crawl4ai.CrawlerRunConfig(
+                cache_mode=crawl4ai.CacheMode.BYPASS,
                 stream=True,  # Enable streaming for faster parallel processing
                 markdown_generator=self.markdown_generator,
                 wait_until=settings.get("CRAWL_WAIT_STRATEGY", "domcontentloaded"),
@@ -126,8 +134,8 @@ class RecursiveCrawlStrategy:
             )
         else:
             # Configuration for regular recursive crawling
-            run_config = CrawlerRunConfig(
-                cache_mode=CacheMode.BYPASS,
+            run_config = crawl4ai.CrawlerRunConfig(
+                cache_mode=crawl4ai.CacheMode.BYPASS,
                 stream=True,  # Enable streaming
                 markdown_generator=self.markdown_generator,
                 wait_until=settings.get("CRAWL_WAIT_STRATEGY", "domcontentloaded"),
@@ -136,7 +144,7 @@ class RecursiveCrawlStrategy:
                 scan_full_page=True,
             )
 
-        dispatcher = MemoryAdaptiveDispatcher(
+        dispatcher = crawl4ai.MemoryAdaptiveDispatcher(
             memory_threshold_percent=memory_threshold,
             check_interval=check_interval,
             max_session_permit=max_concurrent,
@@ -289,11 +297,13 @@ class RecursiveCrawlStrategy:
                                 if extracted_title:
                                     title = extracted_title
 
+                        CRAWLED_PAGES.inc(strategy="recursive")
                         results_all.append({
                             "url": original_url,
                             "markdown": result.markdown.fit_markdown,
                             "html": result.html,  # Always use raw HTML for code extraction
                             "title": title,
+                            "response_headers": getattr(result, "response_headers", None) or {},
                         })
                         depth_successful += 1
 
@@ -8,9 +8,11 @@ import traceback
 from collections.abc import Awaitable, Callable
 from typing import Any
 
-from crawl4ai import CacheMode, CrawlerRunConfig
-
+from ....config.lazy_imports import lazy_import
 from ....config.logfire_config import get_logger
+from .batch import CRAWLED_PAGES
+
+crawl4ai = lazy_import("crawl4ai")
 
 logger = get_logger(__name__)
 
@@ -89,7 +91,7 @@ class SinglePageCrawlStrategy:
                     }
 
                 # Use ENABLED cache mode for better performance, BYPASS only on retries
-                cache_mode = CacheMode.BYPASS if attempt > 0 else CacheMode.ENABLED
+                cache_mode = crawl4ai.CacheMode.BYPASS if attempt > 0 else crawl4ai.CacheMode.ENABLED
 
                 # Check if this is a documentation site that needs special handling
                 is_doc_site = is_documentation_site_func(url)
@@ -99,7 +101,7 @@ class SinglePageCrawlStrategy:
                     wait_selector = self._get_wait_selector_for_docs(url)
                     logger.info(f"Detected documentation site, using wait selector: {wait_selector}")
 
-                    crawl_config = CrawlerRunConfig(
+                    crawl_config = crawl4ai.CrawlerRunConfig(
                         cache_mode=cache_mode,
                         stream=True,  # Enable streaming for faster parallel processing
                         markdown_generator=self.markdown_generator,
@@ -124,7 +126,7 @@ class SinglePageCrawlStrategy:
                     )
                 else:
                     # Configuration for regular sites
-                    crawl_config = CrawlerRunConfig(
+                    crawl_config = crawl4ai.CrawlerRunConfig(
                         cache_mode=cache_mode,
                         stream=True,  # Enable streaming
                         markdown_generator=self.markdown_generator,
@@ -191,6 +193,7 @@ class SinglePageCrawlStrategy:
                         if extracted_title:
                             title = extracted_title
 
+                CRAWLED_PAGES.inc(strategy="single_page")
                 return {
                     "success": True,
                     "url": original_url,  # Use original URL for tracking
@@ -198,7 +201,8 @@ class SinglePageCrawlStrategy:
                     "html": result.html,  # Use raw HTML instead of cleaned_html for code extraction
                     "title": title,
                     "links": result.links,
-                    "content_length": len(result.markdown)
+                    "content_length": len(result.markdown),
+                    "response_headers": getattr(result, "response_headers", None) or {},
                 }
 
             except TimeoutError:
@@ -287,8 +291,8 @@ class SinglePageCrawlStrategy:
             )
 
             # Use consistent configuration even for text files
-            crawl_config = CrawlerRunConfig(
-                cache_mode=CacheMode.ENABLED,
+            crawl_config = crawl4ai.CrawlerRunConfig(
+                cache_mode=crawl4ai.CacheMode.ENABLED,
                 stream=False
             )
 
@@ -304,7 +308,12 @@ class SinglePageCrawlStrategy:
                     processed_pages=1
                 )
 
-                return [{'url': original_url, 'markdown': result.markdown, 'html': result.html}]
+                return [{
+                    'url': original_url,
+                    'markdown': result.markdown,
+                    'html': result.html,
+                    'response_headers': getattr(result, 'response_headers', None) or {},
+                }]
             else:
                 logger.error(f"Failed to crawl {url}: {result.error_message}")
                 return []
@@ -5,11 +5,14 @@ Handles loading, storing, and accessing credentials with encryption for sensitiv
 Credentials include API keys, service credentials, and application configuration.
 """
 
+import asyncio
 import base64
 import os
 import re
 import time
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
 
 # Removed direct logging import - using unified config
 from typing import Any
@@ -36,11 +39,50 @@ class CredentialItem:
     description: str | None = None
 
 
+_TRUE_VALUES = ("true", "1", "yes", "on")
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """Immutable view of all settings with encrypted values already decrypted."""
+
+    values: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+    revision: int | None = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self.values.get(key)
+        return default if value is None else value
+
+    def get_str(self, key: str, default: str = "") -> str:
+        return str(self.get(key, default))
+
+    def get_int(self, key: str, default: int) -> int:
+        try:
+            return int(self.get(key, default))
+        except (TypeError, ValueError):
+            return default
+
+    def get_float(self, key: str, default: float) -> float:
+        try:
+            return float(self.get(key, default))
+        except (TypeError, ValueError):
+            return default
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        value = self.get(key)
+        if value is None:
+            return default
+        if isinstance(value, bool):
+            return value
+        return str(value).lower() in _TRUE_VALUES
 
 
 class CredentialService:
     """Service for managing application credentials and configuration."""
 
+    # How often the settings revision row is polled for changes made by other processes
+    REVISION_POLL_SECONDS = float(os.getenv("ARCHON_SETTINGS_POLL_SECONDS", "2.0"))
+
     def __init__(self):
         self._supabase: Client | None = None
         self._cache: dict[str, Any] = {}
@@ -48,6 +90,15 @@ class CredentialService:
         self._rag_settings_cache: dict[str, Any] | None = None
         self._rag_cache_timestamp: float | None = None
         self._rag_cache_ttl = 300  # 5 minutes TTL for RAG settings cache
+        # Key derivation (PBKDF2) is expensive, so the Fernet instance and
+        # decrypted values are kept for the life of the encryption key
+        self._fernet: tuple[str, Fernet] | None = None
+        self._decrypted_values: dict[str, str] = {}
+        self._settings_snapshot: SettingsSnapshot | None = None
+        self._settings_revision: int | None = None
+        # Cleared when the revision table is missing, which stops the watcher
+        self._revision_available = True
+        self._watcher_task: asyncio.Task | None = None
 
     def _get_supabase_client(self) -> Client:
         """
@@ -96,13 +147,21 @@ class CredentialService:
         key = base64.urlsafe_b64encode(kdf.derive(service_key.encode()))
         return key
 
+    def _get_fernet(self) -> Fernet:
+        """Return a Fernet for the current service key, deriving the key only when it changes."""
+        service_key = os.getenv("SUPABASE_SERVICE_KEY", "default-key-for-development")
+        if self._fernet is None or self._fernet[0] != service_key:
+            self._fernet = (service_key, Fernet(self._get_encryption_key()))
+            self._decrypted_values = {}
+        return self._fernet[1]
+
     def _encrypt_value(self, value: str) -> str:
         """Encrypt a sensitive value using Fernet encryption."""
         if not value:
             return ""
 
         try:
-            fernet = Fernet(self._get_encryption_key())
+            fernet = self._get_fernet()
             encrypted_bytes = fernet.encrypt(value.encode("utf-8"))
             return base64.urlsafe_b64encode(encrypted_bytes).decode("utf-8")
         except Exception as e:
@@ -115,10 +174,14 @@ class CredentialService:
             return ""
 
         try:
-            fernet = Fernet(self._get_encryption_key())
+            fernet = self._get_fernet()
+            cached = self._decrypted_values.get(encrypted_value)
+            if cached is not None:
+                return cached
             encrypted_bytes = base64.urlsafe_b64decode(encrypted_value.encode("utf-8"))
-            decrypted_bytes = fernet.decrypt(encrypted_bytes)
-            return decrypted_bytes.decode("utf-8")
+            decrypted = fernet.decrypt(encrypted_bytes).decode("utf-8")
+            self._decrypted_values[encrypted_value] = decrypted
+            return decrypted
         except Exception as e:
             logger.error(f"Error decrypting value: {e}")
             raise
@@ -149,6 +212,7 @@ class CredentialService:
 
             self._cache = credentials
             self._cache_initialized = True
+            self._settings_snapshot = None
             logger.info(f"Loaded {len(credentials)} credentials from database")
 
             return credentials
@@ -187,6 +251,58 @@ class CredentialService:
 
         return None
 
+    def get_setting(self, key: str, default: Any = None) -> Any:
+        """
+        Get an already-loaded setting without awaiting, decrypting if needed.
+
+        Returns the default when credentials have not been loaded yet, the key
+        is unknown or decryption fails.
+        """
+        if not self._cache_initialized:
+            return default
+
+        value = self._cache.get(key)
+        if isinstance(value, dict) and value.get("is_encrypted"):
+            encrypted_value = value.get("encrypted_value")
+            if not encrypted_value:
+                return default
+            try:
+                return self._decrypt_value(encrypted_value)
+            except Exception:
+                return default
+
+        return default if value is None else value
+
+    def get_bool_setting(self, key: str, default: bool = False) -> bool:
+        """Get an already-loaded setting as a boolean."""
+        value = self.get_setting(key)
+        if value is None:
+            return default
+        return str(value).lower() in _TRUE_VALUES
+
+    async def get_settings_snapshot(self) -> SettingsSnapshot:
+        """
+        Get an immutable snapshot of every setting with secrets decrypted.
+
+        The snapshot is built once and reused until settings change in this or
+        another process.
+        """
+        if not self._cache_initialized:
+            await self.load_all_credentials()
+
+        snapshot = self._settings_snapshot
+        if snapshot is None:
+            values: dict[str, Any] = {}
+            for key in self._cache:
+                value = self.get_setting(key)
+                if value is not None:
+                    values[key] = value
+            snapshot = SettingsSnapshot(
+                values=MappingProxyType(values), revision=self._settings_revision
+            )
+            self._settings_snapshot = snapshot
+        return snapshot
+
     async def set_credential(
         self,
         key: str,
@@ -235,33 +351,14 @@ class CredentialService:
                 on_conflict="key",  # Specify the unique column for conflict resolution
             ).execute()
 
+            self._settings_snapshot = None
+
             # Invalidate RAG settings cache if this is a rag_strategy setting
             if category == "rag_strategy":
                 self._rag_settings_cache = None
                 self._rag_cache_timestamp = None
                 logger.debug(f"Invalidated RAG settings cache due to update of {key}")
-
-                # Also invalidate provider service cache to ensure immediate effect
-                try:
-                    from .llm_provider_service import clear_provider_cache
-                    clear_provider_cache()
-                    logger.debug("Also cleared LLM provider service cache")
-                except Exception as e:
-                    logger.warning(f"Failed to clear provider service cache: {e}")
-
-                # Also invalidate LLM provider service cache for provider config
-                try:
-                    from . import llm_provider_service
-                    # Clear the provider config caches that depend on RAG settings
-                    cache_keys_to_clear = ["provider_config_llm", "provider_config_embedding", "rag_strategy_settings"]
-                    for cache_key in cache_keys_to_clear:
-                        if cache_key in llm_provider_service._settings_cache:
-                            del llm_provider_service._settings_cache[cache_key]
-                            logger.debug(f"Invalidated LLM provider service cache key: {cache_key}")
-                except ImportError:
-                    logger.warning("Could not import llm_provider_service to invalidate cache")
-                except Exception as e:
-                    logger.error(f"Error invalidating LLM provider service cache: {e}")
+                self._invalidate_provider_caches()
 
             logger.info(
                 f"Successfully {'encrypted and ' if is_encrypted else ''}stored credential: {key}"
@@ -284,34 +381,15 @@ class CredentialService:
             if key in self._cache:
                 del self._cache[key]
 
+            self._settings_snapshot = None
+
             # Invalidate RAG settings cache if this was a rag_strategy setting
             # We check the cache to see if the deleted key was in rag_strategy category
             if self._rag_settings_cache is not None and key in self._rag_settings_cache:
                 self._rag_settings_cache = None
                 self._rag_cache_timestamp = None
                 logger.debug(f"Invalidated RAG settings cache due to deletion of {key}")
-
-                # Also invalidate provider service cache to ensure immediate effect
-                try:
-                    from .llm_provider_service import clear_provider_cache
-                    clear_provider_cache()
-                    logger.debug("Also cleared LLM provider service cache")
-                except Exception as e:
-                    logger.warning(f"Failed to clear provider service cache: {e}")
-
-                # Also invalidate LLM provider service cache for provider config
-                try:
-                    from . import llm_provider_service
-                    # Clear the provider config caches that depend on RAG settings
-                    cache_keys_to_clear = ["provider_config_llm", "provider_config_embedding", "rag_strategy_settings"]
-                    for cache_key in cache_keys_to_clear:
-                        if cache_key in llm_provider_service._settings_cache:
-                            del llm_provider_service._settings_cache[cache_key]
-                            logger.debug(f"Invalidated LLM provider service cache key: {cache_key}")
-                except ImportError:
-                    logger.warning("Could not import llm_provider_service to invalidate cache")
-                except Exception as e:
-                    logger.error(f"Error invalidating LLM provider service cache: {e}")
+                self._invalidate_provider_caches()
 
             logger.info(f"Successfully deleted credential: {key}")
             return True
@@ -320,6 +398,106 @@ class CredentialService:
             logger.error(f"Error deleting credential {key}: {e}")
             return False
 
+    def _invalidate_provider_caches(self) -> None:
+        """Clear LLM provider caches that are derived from RAG settings."""
+        # Also invalidate provider service cache to ensure immediate effect
+        try:
+            from .llm_provider_service import clear_provider_cache
+            clear_provider_cache()
+            logger.debug("Also cleared LLM provider service cache")
+        except Exception as e:
+            logger.warning(f"Failed to clear provider service cache: {e}")
+
+        # Also invalidate LLM provider service cache for provider config
+        try:
+            from . import llm_provider_service
+            # Clear the provider config caches that depend on RAG settings
+            cache_keys_to_clear = ["provider_config_llm", "provider_config_embedding", "rag_strategy_settings"]
+            for cache_key in cache_keys_to_clear:
+                if cache_key in llm_provider_service._settings_cache:
+                    del llm_provider_service._settings_cache[cache_key]
+                    logger.debug(f"Invalidated LLM provider service cache key: {cache_key}")
+        except ImportError:
+            logger.warning("Could not import llm_provider_service to invalidate cache")
+        except Exception as e:
+            logger.error(f"Error invalidating LLM provider service cache: {e}")
+
+    def _fetch_settings_revision(self) -> int | None:
+        """Read the settings revision counter (migration 018); None if unavailable."""
+        supabase = self._get_supabase_client()
+        result = supabase.table("archon_settings_revision").select("revision").limit(1).execute()
+        rows = result.data
+        if isinstance(rows, list) and rows and isinstance(rows[0].get("revision"), int):
+            return rows[0]["revision"]
+        return None
+
+    async def refresh_if_changed(self) -> bool:
+        """
+        Reload settings if any process changed them since the last check.
+
+        Every write to archon_settings bumps a revision counter in the database,
+        so one tiny query tells whether the cached settings are stale.
+
+        Returns:
+            True if settings were reloaded
+        """
+        if not self._revision_available:
+            return False
+
+        try:
+            revision = await asyncio.to_thread(self._fetch_settings_revision)
+        except Exception as e:
+            # Imported here: src.server.utils imports services that import this module
+            from ..utils.postgrest_errors import is_missing_relation
+
+            if is_missing_relation(e):
+                self._revision_available = False
+                logger.info(
+                    "Settings revision table not found (migration 018), "
+                    "settings changed by other processes will not be picked up until restart"
+                )
+            else:
+                logger.debug(f"Settings revision unavailable: {e}")
+            return False
+
+        if revision is None or revision == self._settings_revision:
+            return False
+
+        # The first revision seen is the baseline for the settings already loaded
+        first_check = self._settings_revision is None
+        self._settings_revision = revision
+        if first_check:
+            return False
+
+        await self.load_all_credentials()
+        self._rag_settings_cache = None
+        self._rag_cache_timestamp = None
+        self._invalidate_provider_caches()
+        logger.info(f"Settings changed (revision {revision}), reloaded credentials")
+        return True
+
+    async def watch_for_changes(self, interval: float | None = None) -> None:
+        """Poll for settings changes until cancelled or the revision table is found missing."""
+        interval = interval or self.REVISION_POLL_SECONDS
+        while self._revision_available:
+            await self.refresh_if_changed()
+            await asyncio.sleep(interval)
+
+    def start_watching(self) -> None:
+        """Start the background settings watcher for this process (idempotent)."""
+        if self._watcher_task is None or self._watcher_task.done():
+            self._watcher_task = asyncio.create_task(self.watch_for_changes())
+
+    async def stop_watching(self) -> None:
+        """Cancel the background settings watcher."""
+        task, self._watcher_task = self._watcher_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
     async def get_credentials_by_category(self, category: str) -> dict[str, Any]:
         """Get all credentials for a specific category."""
         if not self._cache_initialized:
@@ -7,8 +7,7 @@ Includes proper rate limiting for OpenAI API calls.
 
 import os
 
-import openai
-
+from ...config.lazy_imports import lazy_import
 from ...config.logfire_config import search_logger
 from ..credential_service import credential_service
 from ..llm_provider_service import (
@@ -19,6 +18,8 @@ from ..llm_provider_service import (
 )
 from ..threading_service import get_threading_service
 
+openai = lazy_import("openai")
+
 
 async def generate_contextual_embedding(
     full_document: str, chunk: str, provider: str = None
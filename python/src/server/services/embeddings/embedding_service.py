@@ -13,10 +13,12 @@ from typing import Any
 
 import httpx
 import numpy as np
-import openai
 
+from ...config.lazy_imports import lazy_import
 from ...config.logfire_config import safe_span, search_logger
+from ...config.metrics import registry
 from ..credential_service import credential_service
+from ..ingestion_settings import current_ingestion_settings
 from ..llm_provider_service import get_embedding_model, get_llm_client
 from ..threading_service import get_threading_service
 from .embedding_exceptions import (
@@ -26,6 +28,8 @@ from .embedding_exceptions import (
     EmbeddingRateLimitError,
 )
 
+openai = lazy_import("openai")
+
 
 @dataclass
 class EmbeddingBatchResult:
@@ -293,6 +297,20 @@ async def create_embedding(text: str, provider: str | None = None) -> list[float
             )
 
 
+EMBEDDING_BATCH_SECONDS = registry.histogram(
+    "archon_embedding_batch_seconds", "Wall time of create_embeddings_batch calls"
+)
+EMBEDDING_TEXTS = registry.counter(
+    "archon_embedding_texts_total", "Texts processed by create_embeddings_batch", ["outcome"]
+)
+
+
+def _count_embedding_outcomes(result: EmbeddingBatchResult) -> None:
+    EMBEDDING_TEXTS.inc(result.success_count, outcome="success")
+    EMBEDDING_TEXTS.inc(result.failure_count, outcome="failure")
+
+
+@EMBEDDING_BATCH_SECONDS.time()
 async def create_embeddings_batch(
     texts: list[str],
     progress_callback: Any | None = None,
@@ -366,12 +384,17 @@ async def create_embeddings_batch(
             search_logger.info(f"Using embedding provider: '{embedding_provider}' (from EMBEDDING_PROVIDER setting)")
             async with get_llm_client(provider=embedding_provider, use_embedding_provider=True) as client:
                 # Load batch size and dimensions from settings
+                ingestion_settings = current_ingestion_settings()
                 try:
-                    rag_settings = await _maybe_await(
-                        credential_service.get_credentials_by_category("rag_strategy")
-                    )
-                    batch_size = int(rag_settings.get("EMBEDDING_BATCH_SIZE", "100"))
-                    embedding_dimensions = int(rag_settings.get("EMBEDDING_DIMENSIONS", "1536"))
+                    if ingestion_settings is not None:
+                        batch_size = ingestion_settings.embedding_batch_size
+                        embedding_dimensions = ingestion_settings.embedding_dimensions
+                    else:
+                        rag_settings = await _maybe_await(
+                            credential_service.get_credentials_by_category("rag_strategy")
+                        )
+                        batch_size = int(rag_settings.get("EMBEDDING_BATCH_SIZE", "100"))
+                        embedding_dimensions = int(rag_settings.get("EMBEDDING_DIMENSIONS", "1536"))
                 except Exception as e:
                     search_logger.warning(f"Failed to load embedding settings: {e}, using defaults")
                     batch_size = 100
@@ -507,6 +530,7 @@ async def create_embeddings_batch(
                 span.set_attribute("success", not result.has_failures)
                 span.set_attribute("total_tokens_used", total_tokens_used)
 
+                _count_embedding_outcomes(result)
                 return result
 
         except Exception as e:
@@ -521,6 +545,7 @@ async def create_embeddings_batch(
                     text, EmbeddingAPIError(f"Catastrophic failure: {str(e)}", original_error=e)
                 )
 
+            _count_embedding_outcomes(result)
             return result
 
 
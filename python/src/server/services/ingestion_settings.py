@@ -0,0 +1,167 @@
+"""
+Ingestion Settings
+
+Frozen, typed view of the settings used by the crawl and document ingestion
+pipeline. A crawl resolves it once when it starts and installs it in a context
+variable, so every stage (crawl strategies, chunk storage, embeddings and code
+extraction) reads the same values without awaiting the credential service.
+Code running outside a crawl sees no current settings and keeps loading them
+from the credential service itself.
+"""
+
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+
+from ..config.logfire_config import get_logger
+from .credential_service import SettingsSnapshot, credential_service
+
+logger = get_logger(__name__)
+
+
+def _get_flag(snapshot: SettingsSnapshot, key: str, default: bool) -> bool:
+    """Boolean setting where only "true" enables it, as the pipeline has always parsed flags."""
+    value = snapshot.get(key)
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() == "true"
+
+
+@dataclass(frozen=True)
+class IngestionSettings:
+    """Settings for one ingestion operation, resolved once at its start."""
+
+    # Crawling
+    crawl_batch_size: int = 50
+    crawl_max_concurrent: int = 10
+    memory_threshold_percent: float = 80.0
+    dispatcher_check_interval: float = 0.5
+
+    # Document storage
+    document_storage_batch_size: int = 50
+    delete_batch_size: int = 50
+    use_contextual_embeddings: bool = False
+    contextual_embeddings_max_workers: int = 4
+
+    # Embeddings
+    embedding_batch_size: int = 100
+    embedding_dimensions: int = 1536
+
+    # Code extraction
+    min_code_block_length: int = 250
+    max_code_block_length: int = 5000
+    enable_complete_block_detection: bool = True
+    enable_language_specific_patterns: bool = True
+    enable_prose_filtering: bool = True
+    max_prose_ratio: float = 0.15
+    min_code_indicators: int = 3
+    enable_diagram_filtering: bool = True
+    enable_contextual_length: bool = True
+    context_window_size: int = 1000
+    enable_code_summaries: bool = True
+
+    # Every setting by key, for stages that parse their own values
+    values: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+
+    @classmethod
+    def from_snapshot(cls, snapshot: SettingsSnapshot) -> "IngestionSettings":
+        """Build typed settings from a credential service snapshot."""
+        defaults = cls()
+        return cls(
+            crawl_batch_size=max(1, snapshot.get_int("CRAWL_BATCH_SIZE", defaults.crawl_batch_size)),
+            crawl_max_concurrent=max(
+                1, snapshot.get_int("CRAWL_MAX_CONCURRENT", defaults.crawl_max_concurrent)
+            ),
+            memory_threshold_percent=snapshot.get_float(
+                "MEMORY_THRESHOLD_PERCENT", defaults.memory_threshold_percent
+            ),
+            dispatcher_check_interval=snapshot.get_float(
+                "DISPATCHER_CHECK_INTERVAL", defaults.dispatcher_check_interval
+            ),
+            document_storage_batch_size=max(
+                1, snapshot.get_int("DOCUMENT_STORAGE_BATCH_SIZE", defaults.document_storage_batch_size)
+            ),
+            delete_batch_size=max(1, snapshot.get_int("DELETE_BATCH_SIZE", defaults.delete_batch_size)),
+            use_contextual_embeddings=_get_flag(
+                snapshot, "USE_CONTEXTUAL_EMBEDDINGS", defaults.use_contextual_embeddings
+            ),
+            contextual_embeddings_max_workers=max(
+                1,
+                snapshot.get_int(
+                    "CONTEXTUAL_EMBEDDINGS_MAX_WORKERS", defaults.contextual_embeddings_max_workers
+                ),
+            ),
+            embedding_batch_size=max(
+                1, snapshot.get_int("EMBEDDING_BATCH_SIZE", defaults.embedding_batch_size)
+            ),
+            embedding_dimensions=snapshot.get_int("EMBEDDING_DIMENSIONS", defaults.embedding_dimensions),
+            min_code_block_length=snapshot.get_int(
+                "MIN_CODE_BLOCK_LENGTH", defaults.min_code_block_length
+            ),
+            max_code_block_length=snapshot.get_int(
+                "MAX_CODE_BLOCK_LENGTH", defaults.max_code_block_length
+            ),
+            enable_complete_block_detection=_get_flag(
+                snapshot, "ENABLE_COMPLETE_BLOCK_DETECTION", defaults.enable_complete_block_detection
+            ),
+            enable_language_specific_patterns=_get_flag(
+                snapshot, "ENABLE_LANGUAGE_SPECIFIC_PATTERNS", defaults.enable_language_specific_patterns
+            ),
+            enable_prose_filtering=_get_flag(
+                snapshot, "ENABLE_PROSE_FILTERING", defaults.enable_prose_filtering
+            ),
+            max_prose_ratio=snapshot.get_float("MAX_PROSE_RATIO", defaults.max_prose_ratio),
+            min_code_indicators=snapshot.get_int("MIN_CODE_INDICATORS", defaults.min_code_indicators),
+            enable_diagram_filtering=_get_flag(
+                snapshot, "ENABLE_DIAGRAM_FILTERING", defaults.enable_diagram_filtering
+            ),
+            enable_contextual_length=_get_flag(
+                snapshot, "ENABLE_CONTEXTUAL_LENGTH", defaults.enable_contextual_length
+            ),
+            context_window_size=snapshot.get_int("CONTEXT_WINDOW_SIZE", defaults.context_window_size),
+            enable_code_summaries=_get_flag(
+                snapshot, "ENABLE_CODE_SUMMARIES", defaults.enable_code_summaries
+            ),
+            values=snapshot.values,
+        )
+
+
+_current_settings: ContextVar[IngestionSettings | None] = ContextVar(
+    "ingestion_settings", default=None
+)
+
+
+def current_ingestion_settings() -> IngestionSettings | None:
+    """Settings of the ingestion operation running in this context, if any."""
+    return _current_settings.get()
+
+
+@contextmanager
+def use_ingestion_settings(settings: IngestionSettings | None) -> Iterator[None]:
+    """
+    Make ``settings`` current for this context.
+
+    Tasks created inside the block inherit them, so wrapping the creation of a
+    crawl task pins its settings for the whole run.
+    """
+    token = _current_settings.set(settings)
+    try:
+        yield
+    finally:
+        _current_settings.reset(token)
+
+
+async def load_ingestion_settings() -> IngestionSettings | None:
+    """Resolve settings for a new ingestion operation; None if they cannot be loaded."""
+    try:
+        snapshot = await credential_service.get_settings_snapshot()
+        return IngestionSettings.from_snapshot(snapshot)
+    except Exception as e:
+        logger.warning(f"Could not resolve ingestion settings, stages will load their own: {e}")
+        return None
+
@@ -10,11 +10,12 @@ import time
 from contextlib import asynccontextmanager
 from typing import Any
 
-import openai
-
+from ..config.lazy_imports import lazy_import
 from ..config.logfire_config import get_logger
 from .credential_service import credential_service
 
+openai = lazy_import("openai")
+
 logger = get_logger(__name__)
 
 
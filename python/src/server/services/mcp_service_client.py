@@ -6,6 +6,8 @@ other services (API and Agents) instead of importing their modules directly.
 """
 
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 from urllib.parse import urljoin
 
@@ -31,6 +33,17 @@ class MCPServiceClient:
             write=30.0,
             pool=5.0,
         )
+        # Shared keep-alive client installed by the MCP lifespan; None means per-call clients
+        self.http_client: httpx.AsyncClient | None = None
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared client if one is installed, otherwise a short-lived one."""
+        if self.http_client is not None and not self.http_client.is_closed:
+            yield self.http_client
+            return
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            yield client
 
     def _get_headers(self, request_id: str | None = None) -> dict[str, str]:
         """Get common headers for internal requests"""
@@ -67,9 +80,9 @@ class MCPServiceClient:
         mcp_logger.info(f"Calling API service to crawl {url}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client() as client:
                 response = await client.post(
-                    endpoint, json=request_data, headers=self._get_headers()
+                    endpoint, json=request_data, headers=self._get_headers(), timeout=self.timeout
                 )
                 response.raise_for_status()
                 result = response.json()
@@ -120,10 +133,10 @@ class MCPServiceClient:
         mcp_logger.info(f"Calling API service to search: {query}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client() as client:
                 # First, get search results from API service
                 response = await client.post(
-                    endpoint, json=request_data, headers=self._get_headers()
+                    endpoint, json=request_data, headers=self._get_headers(), timeout=self.timeout
                 )
                 response.raise_for_status()
                 result = response.json()
@@ -201,9 +214,9 @@ class MCPServiceClient:
         # Check API service
         api_health_url = urljoin(self.api_url, "/api/health")
         try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(5.0)) as client:
+            async with self._client() as client:
                 mcp_logger.info(f"Checking API service health at: {api_health_url}")
-                response = await client.get(api_health_url)
+                response = await client.get(api_health_url, timeout=httpx.Timeout(5.0))
                 health_status["api_service"] = response.status_code == 200
                 mcp_logger.info(f"API service health check: {response.status_code}")
         except Exception as e:
@@ -212,8 +225,10 @@ class MCPServiceClient:
 
         # Check Agents service
         try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(5.0)) as client:
-                response = await client.get(urljoin(self.agents_url, "/health"))
+            async with self._client() as client:
+                response = await client.get(
+                    urljoin(self.agents_url, "/health"), timeout=httpx.Timeout(5.0)
+                )
                 health_status["agents_service"] = response.status_code == 200
         except Exception:
             pass
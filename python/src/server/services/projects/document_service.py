@@ -3,6 +3,11 @@ Document Service Module for Archon
 
 This module provides core business logic for document operations within projects
 that can be shared between MCP tools and FastAPI endpoints.
+
+Documents are elements of the archon_projects.docs JSONB array. Reads and writes
+go through the per-document database functions from migration 016, which touch a
+single element under a row lock. When those functions are not installed the
+service falls back to reading and rewriting the whole array.
 """
 
 import uuid
@@ -11,16 +16,25 @@ import uuid
 from datetime import datetime
 from typing import Any
 
+from postgrest.exceptions import APIError
+
 from src.server.utils import get_supabase_client
 
 from ...config.logfire_config import get_logger
+from ...utils.etag_utils import change_versions
 
 logger = get_logger(__name__)
 
+# PostgREST "function not in schema cache" and Postgres undefined_function
+MISSING_FUNCTION_CODES = ("PGRST202", "42883")
+
 
 class DocumentService:
     """Service class for document operations within projects"""
 
+    # Document fields callers may change through update_document
+    UPDATABLE_FIELDS = ("title", "content", "status", "tags", "author", "version")
+
     def __init__(self, supabase_client=None):
         """Initialize with optional supabase client"""
         self.supabase_client = supabase_client or get_supabase_client()
@@ -41,18 +55,6 @@ class DocumentService:
             Tuple of (success, result_dict)
         """
         try:
-            # Get current project
-            project_response = (
-                self.supabase_client.table("archon_projects")
-                .select("docs")
-                .eq("id", project_id)
-                .execute()
-            )
-            if not project_response.data:
-                return False, {"error": f"Project with ID {project_id} not found"}
-
-            current_docs = project_response.data[0].get("docs", [])
-
             # Create new document entry
             new_doc = {
                 "id": str(uuid.uuid4()),
@@ -62,35 +64,23 @@ class DocumentService:
                 "tags": tags or [],
                 "status": "draft",
                 "version": "1.0",
+                "revision": 1,
             }
 
             if author:
                 new_doc["author"] = author
 
-            # Add to docs array
-            updated_docs = current_docs + [new_doc]
-
-            # Update project
-            response = (
-                self.supabase_client.table("archon_projects")
-                .update({"docs": updated_docs})
-                .eq("id", project_id)
-                .execute()
+            result = self._call_document_rpc(
+                "add_project_document",
+                {"project_id_param": project_id, "document_param": new_doc},
             )
+            if result is None:
+                return self._add_document_to_array(project_id, new_doc)
+            if result["status"] != "ok":
+                return False, self._rpc_error(result, project_id)
 
-            if response.data:
-                return True, {
-                    "document": {
-                        "id": new_doc["id"],
-                        "project_id": project_id,
-                        "document_type": new_doc["document_type"],
-                        "title": new_doc["title"],
-                        "status": new_doc["status"],
-                        "version": new_doc["version"],
-                    }
-                }
-            else:
-                return False, {"error": "Failed to add document to project"}
+            change_versions.bump("projects")
+            return True, {"document": self._document_summary(project_id, new_doc)}
 
         except Exception as e:
             logger.error(f"Error adding document: {e}")
@@ -109,40 +99,37 @@ class DocumentService:
             Tuple of (success, result_dict)
         """
         try:
-            response = (
-                self.supabase_client.table("archon_projects")
-                .select("docs")
-                .eq("id", project_id)
-                .execute()
+            result = self._call_document_rpc(
+                "list_project_documents",
+                {"project_id_param": project_id, "include_content_param": include_content},
             )
 
-            if not response.data:
-                return False, {"error": f"Project with ID {project_id} not found"}
+            if result is None:
+                response = (
+                    self.supabase_client.table("archon_projects")
+                    .select("docs")
+                    .eq("id", project_id)
+                    .execute()
+                )
 
-            docs = response.data[0].get("docs", [])
+                if not response.data:
+                    return False, {"error": f"Project with ID {project_id} not found"}
 
-            # Format documents for response
-            documents = []
-            for doc in docs:
+                docs = response.data[0].get("docs", [])
                 if include_content:
-                    # Return full document
-                    documents.append(doc)
+                    documents = list(docs)
                 else:
-                    # Return metadata only
-                    documents.append({
-                        "id": doc.get("id"),
-                        "document_type": doc.get("document_type"),
-                        "title": doc.get("title"),
-                        "status": doc.get("status"),
-                        "version": doc.get("version"),
-                        "tags": doc.get("tags", []),
-                        "author": doc.get("author"),
-                        "created_at": doc.get("created_at"),
-                        "updated_at": doc.get("updated_at"),
-                        "stats": {
-                            "content_size": len(str(doc.get("content", {})))
-                        }
-                    })
+                    documents = [self._document_metadata(doc) for doc in docs]
+            elif result["status"] != "ok":
+                return False, self._rpc_error(result, project_id)
+            elif include_content:
+                documents = result.get("documents") or []
+            else:
+                # The database strips content and reports its size instead
+                documents = [
+                    self._document_metadata(doc, doc.get("content_size"))
+                    for doc in result.get("documents") or []
+                ]
 
             return True, {
                 "project_id": project_id,
@@ -162,6 +149,15 @@ class DocumentService:
             Tuple of (success, result_dict)
         """
         try:
+            result = self._call_document_rpc(
+                "get_project_document",
+                {"project_id_param": project_id, "doc_id_param": doc_id},
+            )
+            if result is not None:
+                if result["status"] != "ok":
+                    return False, self._rpc_error(result, project_id, doc_id)
+                return True, {"document": result["document"]}
+
             response = (
                 self.supabase_client.table("archon_projects")
                 .select("docs")
@@ -197,104 +193,61 @@ class DocumentService:
         project_id: str,
         doc_id: str,
         update_fields: dict[str, Any],
-        create_version: bool = True,
+        create_version: bool = False,
+        expected_revision: int | None = None,
     ) -> tuple[bool, dict[str, Any]]:
         """
         Update a document in a project's docs JSONB field.
 
+        Args:
+            project_id: The project ID
+            doc_id: The document ID
+            update_fields: Fields to change (see UPDATABLE_FIELDS)
+            create_version: Snapshot the docs field before updating. Off by
+                default because the snapshot holds every document in the
+                project, not just the one being edited
+            expected_revision: When given, the update is rejected with a conflict
+                unless the stored document is still at this revision
+
         Returns:
             Tuple of (success, result_dict)
         """
         try:
-            # Get current project docs
-            project_response = (
-                self.supabase_client.table("archon_projects")
-                .select("docs")
-                .eq("id", project_id)
-                .execute()
-            )
-            if not project_response.data:
-                return False, {"error": f"Project with ID {project_id} not found"}
-
-            current_docs = project_response.data[0].get("docs", [])
-
-            # Create version snapshot if requested
-            if create_version and current_docs:
-                try:
-                    from .versioning_service import VersioningService
-
-                    versioning = VersioningService(self.supabase_client)
-
-                    change_summary = self._build_change_summary(doc_id, update_fields)
-                    versioning.create_version(
-                        project_id=project_id,
-                        field_name="docs",
-                        content=current_docs,
-                        change_summary=change_summary,
-                        change_type="update",
-                        document_id=doc_id,
-                        created_by=update_fields.get("author", "system"),
-                    )
-                except Exception as version_error:
-                    logger.warning(
-                        f"Version creation failed for document {doc_id}: {version_error}"
-                    )
-
-            # Make a copy to modify
-            docs = current_docs.copy()
-
-            # Find and update the document
-            updated = False
-            for i, doc in enumerate(docs):
-                if doc.get("id") == doc_id:
-                    # Update allowed fields
-                    if "title" in update_fields:
-                        docs[i]["title"] = update_fields["title"]
-                    if "content" in update_fields:
-                        docs[i]["content"] = update_fields["content"]
-                    if "status" in update_fields:
-                        docs[i]["status"] = update_fields["status"]
-                    if "tags" in update_fields:
-                        docs[i]["tags"] = update_fields["tags"]
-                    if "author" in update_fields:
-                        docs[i]["author"] = update_fields["author"]
-                    if "version" in update_fields:
-                        docs[i]["version"] = update_fields["version"]
-
-                    docs[i]["updated_at"] = datetime.now().isoformat()
-                    updated = True
-                    break
-
-            if not updated:
-                return False, {
-                    "error": f"Document with ID {doc_id} not found in project {project_id}"
-                }
+            fields = {
+                name: update_fields[name] for name in self.UPDATABLE_FIELDS if name in update_fields
+            }
 
-            # Update the project
-            response = (
-                self.supabase_client.table("archon_projects")
-                .update({"docs": docs, "updated_at": datetime.now().isoformat()})
-                .eq("id", project_id)
-                .execute()
+            result = self._call_document_rpc(
+                "update_project_document",
+                {
+                    "project_id_param": project_id,
+                    "doc_id_param": doc_id,
+                    "fields_param": fields,
+                    "expected_revision_param": expected_revision,
+                    "include_snapshot_param": create_version,
+                },
             )
+            if result is None:
+                return self._update_document_in_array(
+                    project_id, doc_id, update_fields, fields, create_version, expected_revision
+                )
+            if result["status"] != "ok":
+                return False, self._rpc_error(result, project_id, doc_id)
 
-            if response.data:
-                # Find the updated document to return
-                updated_doc = None
-                for doc in docs:
-                    if doc.get("id") == doc_id:
-                        updated_doc = doc
-                        break
+            change_versions.bump("projects")
 
-                return True, {"document": updated_doc}
-            else:
-                return False, {"error": "Failed to update document"}
+            if create_version and result.get("previous_docs"):
+                self._create_docs_version(project_id, doc_id, result["previous_docs"], update_fields)
+
+            return True, {"document": result["document"]}
 
         except Exception as e:
             logger.error(f"Error updating document: {e}")
             return False, {"error": f"Error updating document: {str(e)}"}
 
-    def delete_document(self, project_id: str, doc_id: str) -> tuple[bool, dict[str, Any]]:
+    def delete_document(
+        self, project_id: str, doc_id: str, expected_revision: int | None = None
+    ) -> tuple[bool, dict[str, Any]]:
         """
         Delete a document from a project's docs JSONB field.
 
@@ -302,43 +255,271 @@ class DocumentService:
             Tuple of (success, result_dict)
         """
         try:
-            # Get current project docs
-            project_response = (
-                self.supabase_client.table("archon_projects")
-                .select("docs")
-                .eq("id", project_id)
-                .execute()
+            result = self._call_document_rpc(
+                "delete_project_document",
+                {
+                    "project_id_param": project_id,
+                    "doc_id_param": doc_id,
+                    "expected_revision_param": expected_revision,
+                },
             )
-            if not project_response.data:
-                return False, {"error": f"Project with ID {project_id} not found"}
+            if result is None:
+                return self._delete_document_from_array(project_id, doc_id, expected_revision)
+            if result["status"] != "ok":
+                return False, self._rpc_error(result, project_id, doc_id)
 
-            docs = project_response.data[0].get("docs", [])
+            change_versions.bump("projects")
+            return True, {"project_id": project_id, "doc_id": doc_id}
 
-            # Remove the document
-            original_length = len(docs)
-            docs = [doc for doc in docs if doc.get("id") != doc_id]
+        except Exception as e:
+            logger.error(f"Error deleting document: {e}")
+            return False, {"error": f"Error deleting document: {str(e)}"}
 
-            if len(docs) == original_length:
-                return False, {
-                    "error": f"Document with ID {doc_id} not found in project {project_id}"
-                }
+    def _call_document_rpc(self, function_name: str, params: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Call one of the per-document database functions.
 
-            # Update the project
-            response = (
-                self.supabase_client.table("archon_projects")
-                .update({"docs": docs, "updated_at": datetime.now().isoformat()})
-                .eq("id", project_id)
-                .execute()
+        Returns:
+            The function's result object, or None when the function is not
+            installed (migration 016) and the caller should use the docs array.
+
+        Raises:
+            Any other RPC failure. A timed-out write may still have committed,
+            so retrying it against the docs array could apply it twice.
+        """
+        try:
+            response = self.supabase_client.rpc(function_name, params).execute()
+        except APIError as e:
+            if e.code not in MISSING_FUNCTION_CODES:
+                raise
+            logger.debug(f"Document function {function_name} unavailable, using docs array: {e}")
+            return None
+
+        data = response.data
+        if isinstance(data, list) and len(data) == 1:
+            data = data[0]
+        if not isinstance(data, dict) or "status" not in data:
+            return None
+        return data
+
+    def _rpc_error(
+        self, result: dict[str, Any], project_id: str, doc_id: str | None = None
+    ) -> dict[str, Any]:
+        """Translate a non-ok document function status into an error dict."""
+        status = result.get("status")
+        if status == "project_not_found":
+            return {"error": f"Project with ID {project_id} not found"}
+        if status == "document_not_found":
+            return {"error": f"Document with ID {doc_id} not found in project {project_id}"}
+        if status == "conflict":
+            return self._conflict_error(doc_id, result.get("current_revision"), result.get("document"))
+        return {"error": f"Unexpected document operation status: {status}"}
+
+    @staticmethod
+    def _conflict_error(
+        doc_id: str | None, current_revision: int | None, document: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        return {
+            "error": f"Document {doc_id} was modified by another writer (current revision {current_revision})",
+            "conflict": True,
+            "current_revision": current_revision,
+            "document": document,
+        }
+
+    @staticmethod
+    def _document_summary(project_id: str, doc: dict[str, Any]) -> dict[str, Any]:
+        """Identifying fields returned after a document is created."""
+        return {
+            "id": doc["id"],
+            "project_id": project_id,
+            "document_type": doc["document_type"],
+            "title": doc["title"],
+            "status": doc["status"],
+            "version": doc["version"],
+            "revision": doc["revision"],
+        }
+
+    @staticmethod
+    def _document_metadata(doc: dict[str, Any], content_size: int | None = None) -> dict[str, Any]:
+        """Content-free view of a document for listings."""
+        if content_size is None:
+            content_size = len(str(doc.get("content", {})))
+        return {
+            "id": doc.get("id"),
+            "document_type": doc.get("document_type"),
+            "title": doc.get("title"),
+            "status": doc.get("status"),
+            "version": doc.get("version"),
+            "revision": doc.get("revision", 1),
+            "tags": doc.get("tags", []),
+            "author": doc.get("author"),
+            "created_at": doc.get("created_at"),
+            "updated_at": doc.get("updated_at"),
+            "stats": {"content_size": content_size},
+        }
+
+    def _create_docs_version(
+        self, project_id: str, doc_id: str, docs: list[dict[str, Any]], update_fields: dict[str, Any]
+    ) -> None:
+        """Snapshot the docs field as it was before an update; failures are only logged."""
+        try:
+            from .versioning_service import VersioningService
+
+            versioning = VersioningService(self.supabase_client)
+
+            change_summary = self._build_change_summary(doc_id, update_fields)
+            versioning.create_version(
+                project_id=project_id,
+                field_name="docs",
+                content=docs,
+                change_summary=change_summary,
+                change_type="update",
+                document_id=doc_id,
+                created_by=update_fields.get("author", "system"),
             )
+        except Exception as version_error:
+            logger.warning(f"Version creation failed for document {doc_id}: {version_error}")
 
-            if response.data:
-                return True, {"project_id": project_id, "doc_id": doc_id}
-            else:
-                return False, {"error": "Failed to delete document"}
+    def _add_document_to_array(
+        self, project_id: str, new_doc: dict[str, Any]
+    ) -> tuple[bool, dict[str, Any]]:
+        """Fallback add that rewrites the whole docs array."""
+        project_response = (
+            self.supabase_client.table("archon_projects")
+            .select("docs")
+            .eq("id", project_id)
+            .execute()
+        )
+        if not project_response.data:
+            return False, {"error": f"Project with ID {project_id} not found"}
+
+        current_docs = project_response.data[0].get("docs", [])
+
+        # Add to docs array
+        updated_docs = current_docs + [new_doc]
+
+        # Update project
+        response = (
+            self.supabase_client.table("archon_projects")
+            .update({"docs": updated_docs})
+            .eq("id", project_id)
+            .execute()
+        )
+        change_versions.bump("projects")
+
+        if response.data:
+            return True, {"document": self._document_summary(project_id, new_doc)}
+        else:
+            return False, {"error": "Failed to add document to project"}
 
-        except Exception as e:
-            logger.error(f"Error deleting document: {e}")
-            return False, {"error": f"Error deleting document: {str(e)}"}
+    def _update_document_in_array(
+        self,
+        project_id: str,
+        doc_id: str,
+        update_fields: dict[str, Any],
+        fields: dict[str, Any],
+        create_version: bool,
+        expected_revision: int | None,
+    ) -> tuple[bool, dict[str, Any]]:
+        """
+        Fallback update that rewrites the whole docs array.
+
+        The revision check here is best effort: without the database function
+        a concurrent writer can still slip in between the read and the write.
+        """
+        # Get current project docs
+        project_response = (
+            self.supabase_client.table("archon_projects")
+            .select("docs")
+            .eq("id", project_id)
+            .execute()
+        )
+        if not project_response.data:
+            return False, {"error": f"Project with ID {project_id} not found"}
+
+        current_docs = project_response.data[0].get("docs", [])
+
+        index = next(
+            (i for i, doc in enumerate(current_docs) if doc.get("id") == doc_id), None
+        )
+        if index is None:
+            return False, {
+                "error": f"Document with ID {doc_id} not found in project {project_id}"
+            }
+
+        current_revision = current_docs[index].get("revision", 1)
+        if expected_revision is not None and expected_revision != current_revision:
+            return False, self._conflict_error(doc_id, current_revision, current_docs[index])
+
+        # Create version snapshot if requested
+        if create_version:
+            self._create_docs_version(project_id, doc_id, current_docs, update_fields)
+
+        # Replace only the changed document so the snapshot above stays intact
+        docs = current_docs.copy()
+        docs[index] = {
+            **current_docs[index],
+            **fields,
+            "revision": current_revision + 1,
+            "updated_at": datetime.now().isoformat(),
+        }
+
+        # Update the project
+        response = (
+            self.supabase_client.table("archon_projects")
+            .update({"docs": docs, "updated_at": datetime.now().isoformat()})
+            .eq("id", project_id)
+            .execute()
+        )
+        change_versions.bump("projects")
+
+        if response.data:
+            return True, {"document": docs[index]}
+        else:
+            return False, {"error": "Failed to update document"}
+
+    def _delete_document_from_array(
+        self, project_id: str, doc_id: str, expected_revision: int | None
+    ) -> tuple[bool, dict[str, Any]]:
+        """Fallback delete that rewrites the whole docs array."""
+        # Get current project docs
+        project_response = (
+            self.supabase_client.table("archon_projects")
+            .select("docs")
+            .eq("id", project_id)
+            .execute()
+        )
+        if not project_response.data:
+            return False, {"error": f"Project with ID {project_id} not found"}
+
+        current_docs = project_response.data[0].get("docs", [])
+
+        existing = next((doc for doc in current_docs if doc.get("id") == doc_id), None)
+        if existing is None:
+            return False, {
+                "error": f"Document with ID {doc_id} not found in project {project_id}"
+            }
+
+        current_revision = existing.get("revision", 1)
+        if expected_revision is not None and expected_revision != current_revision:
+            return False, self._conflict_error(doc_id, current_revision, existing)
+
+        # Remove the document
+        docs = [doc for doc in current_docs if doc.get("id") != doc_id]
+
+        # Update the project
+        response = (
+            self.supabase_client.table("archon_projects")
+            .update({"docs": docs, "updated_at": datetime.now().isoformat()})
+            .eq("id", project_id)
+            .execute()
+        )
+        change_versions.bump("projects")
+
+        if response.data:
+            return True, {"project_id": project_id, "doc_id": doc_id}
+        else:
+            return False, {"error": "Failed to delete document"}
 
     def _build_change_summary(self, doc_id: str, update_fields: dict[str, Any]) -> str:
         """Build a human-readable change summary"""
@@ -12,6 +12,7 @@ from typing import Any
 from src.server.utils import get_supabase_client
 
 from ...config.logfire_config import get_logger
+from ...utils.etag_utils import change_versions
 
 logger = get_logger(__name__)
 
@@ -69,6 +70,7 @@ class ProjectCreationService:
 
             # Create the project in database
             response = self.supabase_client.table("archon_projects").insert(project_data).execute()
+            change_versions.bump("projects")
             if hasattr(response, "error") and response.error:
                 raise RuntimeError(f"Supabase insert failed for project '{title}': {response.error}")
             if not response.data:
@@ -83,6 +85,8 @@ class ProjectCreationService:
             ai_success = await self._generate_ai_documentation(
                 progress_id, project_id, title, description, github_repo
             )
+            # The document agent writes PRD docs to the project from its own process
+            change_versions.bump("projects")
 
             # Final success - fetch complete project data
             final_project_response = (
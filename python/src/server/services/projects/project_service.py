@@ -13,6 +13,8 @@ from typing import Any
 from src.server.utils import get_supabase_client
 
 from ...config.logfire_config import get_logger
+from ...utils.etag_utils import change_versions
+from ...utils.postgrest_errors import is_missing_column, is_missing_function
 
 logger = get_logger(__name__)
 
@@ -51,6 +53,7 @@ class ProjectService:
 
             # Insert project
             response = self.supabase_client.table("archon_projects").insert(project_data).execute()
+            change_versions.bump("projects")
 
             if not response.data:
                 logger.error("Supabase returned empty data for project creation")
@@ -73,13 +76,28 @@ class ProjectService:
             logger.error(f"Error creating project: {e}")
             return False, {"error": f"Database error: {str(e)}"}
 
-    def list_projects(self, include_content: bool = True) -> tuple[bool, dict[str, Any]]:
+    # Columns for lightweight listings; *_count/has_data are computed columns (migration 015)
+    LIGHTWEIGHT_COLUMNS = (
+        "id, title, github_repo, created_at, updated_at, pinned, description, "
+        "docs_count, features_count, has_data"
+    )
+
+    def list_projects(
+        self,
+        include_content: bool = True,
+        limit: int | None = None,
+        offset: int = 0,
+        search: str | None = None,
+    ) -> tuple[bool, dict[str, Any]]:
         """
         List all projects.
 
         Args:
             include_content: If True (default), includes docs, features, data fields.
                            If False, returns lightweight metadata only with counts.
+            limit: Maximum number of projects to return (None = all)
+            offset: Number of projects to skip (used with limit)
+            search: Case-insensitive keyword matched against title and description
 
         Returns:
             Tuple of (success, result_dict)
@@ -87,12 +105,7 @@ class ProjectService:
         try:
             if include_content:
                 # Current behavior - maintain backward compatibility
-                response = (
-                    self.supabase_client.table("archon_projects")
-                    .select("*")
-                    .order("created_at", desc=True)
-                    .execute()
-                )
+                response = self._query_projects("*", limit, offset, search)
 
                 projects = []
                 for project in response.data:
@@ -109,21 +122,30 @@ class ProjectService:
                         "data": project.get("data", []),
                     })
             else:
-                # Lightweight response for MCP - fetch all data but only return metadata + stats
-                # FIXED: N+1 query problem - now using single query
-                response = (
-                    self.supabase_client.table("archon_projects")
-                    .select("*")  # Fetch all fields in single query
-                    .order("created_at", desc=True)
-                    .execute()
-                )
+                # Lightweight response for MCP - project the columns in the database so the
+                # large JSONB fields never leave Postgres; stats come from computed columns
+                try:
+                    response = self._query_projects(self.LIGHTWEIGHT_COLUMNS, limit, offset, search)
+                except Exception as e:
+                    # Computed columns not installed yet (migration 015) - fetch full rows.
+                    # Any other failure is reported rather than retried with every JSONB blob
+                    if not (is_missing_function(e) or is_missing_column(e)):
+                        raise
+                    logger.debug(f"Lightweight project projection unavailable, selecting all columns: {e}")
+                    response = self._query_projects("*", limit, offset, search)
 
                 projects = []
                 for project in response.data:
-                    # Calculate counts from fetched data (no additional queries)
-                    docs_count = len(project.get("docs", []))
-                    features_count = len(project.get("features", []))
-                    has_data = bool(project.get("data", []))
+                    # Prefer database-computed stats; fall back to counting fetched JSONB
+                    docs_count = project.get("docs_count")
+                    if docs_count is None:
+                        docs_count = len(project.get("docs") or [])
+                    features_count = project.get("features_count")
+                    if features_count is None:
+                        features_count = len(project.get("features") or [])
+                    has_data = project.get("has_data")
+                    if has_data is None:
+                        has_data = bool(project.get("data", []))
 
                     # Return only metadata + stats, excluding large JSONB fields
                     projects.append({
@@ -141,12 +163,47 @@ class ProjectService:
                         }
                     })
 
-            return True, {"projects": projects, "total_count": len(projects)}
+            total_count = response.count if isinstance(getattr(response, "count", None), int) else None
+            if total_count is None:
+                total_count = offset + len(projects) if limit is not None else len(projects)
+
+            return True, {"projects": projects, "total_count": total_count}
 
         except Exception as e:
             logger.error(f"Error listing projects: {e}")
             return False, {"error": f"Error listing projects: {str(e)}"}
 
+    def _query_projects(self, columns: str, limit: int | None, offset: int, search: str | None):
+        """Run the project listing query with optional search and range pagination."""
+        if limit is not None:
+            query = self.supabase_client.table("archon_projects").select(columns, count="exact")
+        else:
+            query = self.supabase_client.table("archon_projects").select(columns)
+
+        if search and search.strip():
+            pattern = self._ilike_pattern(search.strip())
+            query = query.or_(f"title.ilike.{pattern},description.ilike.{pattern}")
+
+        query = query.order("created_at", desc=True)
+        if limit is not None:
+            query = query.range(offset, offset + max(limit, 1) - 1)
+
+        return query.execute()
+
+    @staticmethod
+    def _ilike_pattern(term: str) -> str:
+        """
+        Quote a search term as a PostgREST ``ilike`` value matching it anywhere.
+
+        LIKE wildcards in the term are escaped so they match literally, and the
+        pattern is double-quoted so commas, dots and parentheses cannot change
+        the ``or`` filter. PostgREST turns ``*`` into ``%`` even when quoted, so
+        a literal ``*`` becomes the single-character wildcard ``_``.
+        """
+        escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_").replace("*", "_")
+        pattern = f"%{escaped}%"
+        return '"' + pattern.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
     def get_project(self, project_id: str) -> tuple[bool, dict[str, Any]]:
         """
         Get a specific project by ID.
@@ -258,6 +315,8 @@ class ProjectService:
                 .eq("id", project_id)
                 .execute()
             )
+            # Tasks are removed by cascade, so task views change as well
+            change_versions.bump("projects", "tasks", f"tasks:{project_id}")
 
             # For DELETE operations, success is indicated by no error, not by response.data content
             # response.data will be empty list [] even on successful deletion
@@ -363,6 +422,7 @@ class ProjectService:
                 .eq("id", project_id)
                 .execute()
             )
+            change_versions.bump("projects")
 
             if response.data and len(response.data) > 0:
                 project = response.data[0]
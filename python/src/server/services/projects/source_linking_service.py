@@ -11,6 +11,7 @@ from typing import Any
 from src.server.utils import get_supabase_client
 
 from ...config.logfire_config import get_logger
+from ...utils.etag_utils import change_versions
 
 logger = get_logger(__name__)
 
@@ -126,6 +127,10 @@ class SourceLinkingService:
         except Exception as e:
             logger.error(f"Error updating project sources: {e}")
             return False, {"error": str(e), **result}
+        finally:
+            # Linked sources are part of the project listing
+            if technical_sources is not None or business_sources is not None:
+                change_versions.bump("projects")
 
     def format_project_with_sources(self, project: dict[str, Any]) -> dict[str, Any]:
         """
@@ -6,12 +6,16 @@ shared between MCP tools and FastAPI endpoints.
 """
 
 # Removed direct logging import - using unified config
+import asyncio
+import time
 from datetime import datetime
 from typing import Any
 
 from src.server.utils import get_supabase_client
 
 from ...config.logfire_config import get_logger
+from ...utils.etag_utils import change_versions
+from ...utils.postgrest_errors import is_missing_function
 
 logger = get_logger(__name__)
 
@@ -23,6 +27,14 @@ class TaskService:
 
     VALID_STATUSES = ["todo", "doing", "review", "done"]
 
+    # Spacing used when a column's rank keys are rebalanced (matches the UI's ORDER_INCREMENT)
+    TASK_ORDER_STEP = 1000
+    _background_tasks: set[asyncio.Task] = set()
+
+    # Batch task counts are polled by every open project list
+    TASK_COUNTS_CACHE_TTL_SECONDS = 5.0
+    _task_counts_cache: tuple[tuple[int, ...], float, dict[str, dict[str, int]]] | None = None
+
     def __init__(self, supabase_client=None):
         """Initialize with optional supabase client"""
         self.supabase_client = supabase_client or get_supabase_client()
@@ -90,28 +102,11 @@ class TaskService:
 
             task_status = "todo"
 
-            # REORDERING LOGIC: If inserting at a specific position, increment existing tasks
+            # ORDERING: task_order is a sparse rank key, so inserting at a position
+            # normally takes a single write. Existing tasks are only touched when
+            # the requested slot is taken and there is no room left below it.
             if task_order > 0:
-                # Get all tasks in the same project and status with task_order >= new task's order
-                existing_tasks_response = (
-                    self.supabase_client.table("archon_tasks")
-                    .select("id, task_order")
-                    .eq("project_id", project_id)
-                    .eq("status", task_status)
-                    .gte("task_order", task_order)
-                    .execute()
-                )
-
-                if existing_tasks_response.data:
-                    logger.info(f"Reordering {len(existing_tasks_response.data)} existing tasks")
-
-                    # Increment task_order for all affected tasks
-                    for existing_task in existing_tasks_response.data:
-                        new_order = existing_task["task_order"] + 1
-                        self.supabase_client.table("archon_tasks").update({
-                            "task_order": new_order,
-                            "updated_at": datetime.now().isoformat(),
-                        }).eq("id", existing_task["id"]).execute()
+                task_order = await self._allocate_task_order(project_id, task_status, task_order)
 
             task_data = {
                 "project_id": project_id,
@@ -134,7 +129,7 @@ class TaskService:
 
             if response.data:
                 task = response.data[0]
-
+                change_versions.bump("tasks", f"tasks:{task['project_id']}")
 
                 return True, {
                     "task": {
@@ -156,6 +151,92 @@ class TaskService:
             logger.error(f"Error creating task: {e}")
             return False, {"error": f"Error creating task: {str(e)}"}
 
+    async def _allocate_task_order(self, project_id: str, status: str, requested: int) -> int:
+        """
+        Pick a rank key that places a new task at ``requested`` within its column.
+
+        If no task holds ``requested`` it is used as-is. Otherwise the new task
+        takes the midpoint between the colliding task and its predecessor, which
+        preserves the old "shift everything down" ordering without rewriting
+        any rows. Only when the keys are exhausted do we fall back to shifting
+        and schedule a rebalance of the column.
+        """
+        occupied = (
+            self.supabase_client.table("archon_tasks")
+            .select("id")
+            .eq("project_id", project_id)
+            .eq("status", status)
+            .eq("task_order", requested)
+            .limit(1)
+            .execute()
+        )
+        if not occupied.data:
+            return requested
+
+        predecessor = (
+            self.supabase_client.table("archon_tasks")
+            .select("task_order")
+            .eq("project_id", project_id)
+            .eq("status", status)
+            .lt("task_order", requested)
+            .order("task_order", desc=True)
+            .limit(1)
+            .execute()
+        )
+        lower = predecessor.data[0]["task_order"] if predecessor.data else 0
+        if requested - lower > 1:
+            return lower + (requested - lower) // 2
+
+        # No gap left: shift the tail once, then respace the column in the background
+        existing_tasks_response = (
+            self.supabase_client.table("archon_tasks")
+            .select("id, task_order")
+            .eq("project_id", project_id)
+            .eq("status", status)
+            .gte("task_order", requested)
+            .execute()
+        )
+        logger.info(f"Reordering {len(existing_tasks_response.data or [])} existing tasks")
+        for existing_task in existing_tasks_response.data or []:
+            self.supabase_client.table("archon_tasks").update({
+                "task_order": existing_task["task_order"] + 1,
+                "updated_at": datetime.now().isoformat(),
+            }).eq("id", existing_task["id"]).execute()
+        change_versions.bump("tasks", f"tasks:{project_id}")
+
+        rebalance = asyncio.create_task(asyncio.to_thread(self.rebalance_task_order, project_id, status))
+        TaskService._background_tasks.add(rebalance)
+        rebalance.add_done_callback(TaskService._background_tasks.discard)
+        return requested
+
+    def rebalance_task_order(self, project_id: str, status: str) -> tuple[bool, dict[str, Any]]:
+        """
+        Respace task_order keys in one column to multiples of TASK_ORDER_STEP.
+
+        Relative order is preserved; afterwards every position has room for
+        inserts again.
+
+        Returns:
+            Tuple of (success, result_dict)
+        """
+        try:
+            response = self.supabase_client.rpc(
+                "rebalance_task_order",
+                {
+                    "project_id_param": project_id,
+                    "status_param": status,
+                    "step_param": self.TASK_ORDER_STEP,
+                },
+            ).execute()
+            change_versions.bump("tasks", f"tasks:{project_id}")
+            updated = response.data if isinstance(response.data, int) else 0
+            logger.info(f"Rebalanced task order | project_id={project_id} | status={status} | updated={updated}")
+            return True, {"project_id": project_id, "status": status, "updated": updated}
+        except Exception as e:
+            # Function not installed yet (migration 014) - ordering stays correct, just denser
+            logger.warning(f"Could not rebalance task order for project {project_id}: {e}")
+            return False, {"error": f"Error rebalancing task order: {str(e)}"}
+
     def list_tasks(
         self,
         project_id: str = None,
@@ -412,7 +493,7 @@ class TaskService:
 
             if response.data:
                 task = response.data[0]
-
+                change_versions.bump("tasks", f"tasks:{task.get('project_id')}")
 
                 return True, {"task": task, "message": "Task updated successfully"}
             else:
@@ -460,6 +541,7 @@ class TaskService:
             )
 
             if response.data:
+                change_versions.bump("tasks", f"tasks:{task.get('project_id')}")
 
                 return True, {"task_id": task_id, "message": "Task archived successfully"}
             else:
@@ -473,54 +555,96 @@ class TaskService:
         """
         Get task counts for all projects in a single optimized query.
         
-        Returns task counts grouped by project_id and status.
+        Returns task counts grouped by project_id and status. Counts are
+        aggregated in the database and cached briefly; any task write
+        invalidates the cache through the shared change counters.
         
         Returns:
             Tuple of (success, counts_dict) where counts_dict is:
             {"project-id": {"todo": 5, "doing": 2, "review": 3, "done": 10}}
         """
         try:
-            logger.debug("Fetching task counts for all projects in batch")
-
-            # Query all non-archived tasks grouped by project_id and status
-            response = (
-                self.supabase_client.table("archon_tasks")
-                .select("project_id, status")
-                .or_("archived.is.null,archived.is.false")
-                .execute()
-            )
-
-            if not response.data:
-                logger.debug("No tasks found")
-                return True, {}
+            versions = change_versions.snapshot("tasks")
+            cached = TaskService._task_counts_cache
+            if (
+                cached is not None
+                and cached[0] == versions
+                and time.monotonic() - cached[1] < self.TASK_COUNTS_CACHE_TTL_SECONDS
+            ):
+                return True, {project_id: dict(counts) for project_id, counts in cached[2].items()}
 
-            # Process results into counts by project and status
-            counts_by_project = {}
-
-            for task in response.data:
-                project_id = task.get("project_id")
-                status = task.get("status")
-
-                if not project_id or not status:
-                    continue
-
-                # Initialize project counts if not exists
-                if project_id not in counts_by_project:
-                    counts_by_project[project_id] = {
-                        "todo": 0,
-                        "doing": 0,
-                        "review": 0,
-                        "done": 0
-                    }
+            logger.debug("Fetching task counts for all projects in batch")
 
-                # Count all statuses separately
-                if status in ["todo", "doing", "review", "done"]:
-                    counts_by_project[project_id][status] += 1
+            try:
+                counts_by_project = self._fetch_grouped_task_counts()
+            except Exception as e:
+                # Only a missing function (migration 013) falls back to counting rows
+                # client-side; scanning every task after a timeout would add load
+                if not is_missing_function(e):
+                    raise
+                logger.debug(f"Grouped task count RPC unavailable, counting rows instead: {e}")
+                counts_by_project = self._count_tasks_from_rows()
 
             logger.debug(f"Task counts fetched for {len(counts_by_project)} projects")
 
-            return True, counts_by_project
+            TaskService._task_counts_cache = (versions, time.monotonic(), counts_by_project)
+            return True, {project_id: dict(counts) for project_id, counts in counts_by_project.items()}
 
         except Exception as e:
             logger.error(f"Error fetching task counts: {e}")
             return False, {"error": f"Error fetching task counts: {str(e)}"}
+
+    def _fetch_grouped_task_counts(self) -> dict[str, dict[str, int]]:
+        """Aggregate counts in the database, one row per (project, status)."""
+        response = self.supabase_client.rpc("get_project_task_counts", {}).execute()
+
+        counts_by_project: dict[str, dict[str, int]] = {}
+        for row in response.data or []:
+            project_id = row.get("project_id")
+            status = row.get("status")
+            if not project_id or status not in self.VALID_STATUSES:
+                continue
+            project_counts = counts_by_project.setdefault(
+                project_id, {"todo": 0, "doing": 0, "review": 0, "done": 0}
+            )
+            project_counts[status] += int(row.get("task_count") or 0)
+
+        return counts_by_project
+
+    def _count_tasks_from_rows(self) -> dict[str, dict[str, int]]:
+        """Fallback that downloads (project_id, status) for every active task."""
+        response = (
+            self.supabase_client.table("archon_tasks")
+            .select("project_id, status")
+            .or_("archived.is.null,archived.is.false")
+            .execute()
+        )
+
+        if not response.data:
+            logger.debug("No tasks found")
+            return {}
+
+        # Process results into counts by project and status
+        counts_by_project = {}
+
+        for task in response.data:
+            project_id = task.get("project_id")
+            status = task.get("status")
+
+            if not project_id or not status:
+                continue
+
+            # Initialize project counts if not exists
+            if project_id not in counts_by_project:
+                counts_by_project[project_id] = {
+                    "todo": 0,
+                    "doing": 0,
+                    "review": 0,
+                    "done": 0
+                }
+
+            # Count all statuses separately
+            if status in ["todo", "doing", "review", "done"]:
+                counts_by_project[project_id][status] += 1
+
+        return counts_by_project
@@ -3,8 +3,18 @@ Versioning Service Module for Archon
 
 This module provides core business logic for document versioning operations
 that can be shared between MCP tools and FastAPI endpoints.
+
+Versions are stored as JSON Patch deltas against the previous version, with a
+full snapshot every SNAPSHOT_INTERVAL versions so that reconstructing any
+version applies at most SNAPSHOT_INTERVAL - 1 deltas. Rows written before
+migration 017 carry no storage_kind and are treated as snapshots.
 """
 
+import copy
+import json
+import threading
+from collections import OrderedDict
+
 # Removed direct logging import - using unified config
 from datetime import datetime
 from typing import Any
@@ -12,13 +22,33 @@ from typing import Any
 from src.server.utils import get_supabase_client
 
 from ...config.logfire_config import get_logger
+from ...utils.etag_utils import change_versions
+from ...utils.json_patch import apply_patch, make_patch
+from ...utils.postgrest_errors import is_missing_column
 
 logger = get_logger(__name__)
 
+# Columns returned by list_versions (content can be a large snapshot or a delta)
+VERSION_LIST_COLUMNS = (
+    "id, project_id, field_name, version_number, change_summary, change_type, "
+    "document_id, created_by, created_at, storage_kind, base_version"
+)
+
 
 class VersioningService:
     """Service class for document versioning operations"""
 
+    # A full snapshot is stored for version 1 and every SNAPSHOT_INTERVAL versions after it
+    SNAPSHOT_INTERVAL = 10
+    # Deltas older than the snapshot preceding the newest VERSION_RETENTION versions are compacted away
+    VERSION_RETENTION = 100
+    _LATEST_CACHE_SIZE = 128
+
+    # (project_id, field_name) -> (version_number, content) of the newest version
+    # written or reconstructed by this process, so new deltas skip a history read
+    _latest_content: "OrderedDict[tuple[str, str], tuple[int, Any]]" = OrderedDict()
+    _latest_lock = threading.Lock()
+
     def __init__(self, supabase_client=None):
         """Initialize with optional supabase client"""
         self.supabase_client = supabase_client or get_supabase_client()
@@ -36,6 +66,9 @@ class VersioningService:
         """
         Create a version snapshot for a project JSONB field.
 
+        The content is stored as a delta against the previous version unless a
+        periodic snapshot is due or the delta would not be smaller.
+
         Returns:
             Tuple of (success, result_dict)
         """
@@ -68,13 +101,30 @@ class VersioningService:
                 "created_at": datetime.now().isoformat(),
             }
 
-            result = (
-                self.supabase_client.table("archon_document_versions")
-                .insert(version_data)
-                .execute()
-            )
+            storage = self._delta_storage(project_id, field_name, next_version, content)
+
+            try:
+                result = (
+                    self.supabase_client.table("archon_document_versions")
+                    .insert({**version_data, **storage})
+                    .execute()
+                )
+            except Exception as e:
+                # storage_kind/base_version columns missing (migration 017) - store a full copy
+                if not is_missing_column(e):
+                    raise
+                logger.debug(f"Delta version insert failed, storing full snapshot: {e}")
+                storage = {}
+                result = (
+                    self.supabase_client.table("archon_document_versions")
+                    .insert(version_data)
+                    .execute()
+                )
 
             if result.data:
+                self._remember_latest(project_id, field_name, next_version, content)
+                if storage.get("storage_kind") == "snapshot" and next_version > self.VERSION_RETENTION:
+                    self.compact_versions(project_id, field_name)
                 return True, {
                     "version": result.data[0],
                     "project_id": project_id,
@@ -92,29 +142,31 @@ class VersioningService:
         """
         Get version history for project JSONB fields.
 
+        Version content is not included; use get_version_content for that.
+
         Returns:
             Tuple of (success, result_dict)
         """
         try:
-            # Build query
-            query = (
-                self.supabase_client.table("archon_document_versions")
-                .select("*")
-                .eq("project_id", project_id)
-            )
-
-            if field_name:
-                query = query.eq("field_name", field_name)
-
-            # Get versions ordered by version number descending
-            result = query.order("version_number", desc=True).execute()
+            try:
+                result = self._query_versions(project_id, field_name, VERSION_LIST_COLUMNS)
+            except Exception as e:
+                # storage_kind/base_version columns missing (migration 017)
+                if not is_missing_column(e):
+                    raise
+                logger.debug(f"Version metadata query failed, selecting all columns: {e}")
+                result = self._query_versions(project_id, field_name, "*")
 
             if result.data is not None:
+                versions = [
+                    {key: value for key, value in version.items() if key != "content"}
+                    for version in result.data
+                ]
                 return True, {
                     "project_id": project_id,
                     "field_name": field_name,
-                    "versions": result.data,
-                    "total_count": len(result.data),
+                    "versions": versions,
+                    "total_count": len(versions),
                 }
             else:
                 return False, {"error": "Failed to retrieve version history"}
@@ -133,21 +185,12 @@ class VersioningService:
             Tuple of (success, result_dict)
         """
         try:
-            # Query for specific version
-            result = (
-                self.supabase_client.table("archon_document_versions")
-                .select("*")
-                .eq("project_id", project_id)
-                .eq("field_name", field_name)
-                .eq("version_number", version_number)
-                .execute()
-            )
+            version, content = self._reconstruct_version(project_id, field_name, version_number)
 
-            if result.data:
-                version = result.data[0]
+            if version is not None:
                 return True, {
-                    "version": version,
-                    "content": version["content"],
+                    "version": {**version, "content": content},
+                    "content": content,
                     "field_name": field_name,
                     "version_number": version_number,
                 }
@@ -169,23 +212,15 @@ class VersioningService:
         """
         try:
             # Get the version to restore
-            version_result = (
-                self.supabase_client.table("archon_document_versions")
-                .select("*")
-                .eq("project_id", project_id)
-                .eq("field_name", field_name)
-                .eq("version_number", version_number)
-                .execute()
+            version_to_restore, content_to_restore = self._reconstruct_version(
+                project_id, field_name, version_number
             )
 
-            if not version_result.data:
+            if version_to_restore is None:
                 return False, {
                     "error": f"Version {version_number} not found for {field_name} in project {project_id}"
                 }
 
-            version_to_restore = version_result.data[0]
-            content_to_restore = version_to_restore["content"]
-
             # Get current content to create backup
             current_project = (
                 self.supabase_client.table("archon_projects")
@@ -218,6 +253,7 @@ class VersioningService:
                 .eq("id", project_id)
                 .execute()
             )
+            change_versions.bump("projects")
 
             if restore_result.data:
                 # Create restore version record
@@ -242,3 +278,201 @@ class VersioningService:
         except Exception as e:
             logger.error(f"Error restoring version: {e}")
             return False, {"error": f"Error restoring version: {str(e)}"}
+
+    def compact_versions(
+        self, project_id: str, field_name: str, retain_versions: int | None = None
+    ) -> tuple[bool, dict[str, Any]]:
+        """
+        Fold old deltas into the snapshots that follow them.
+
+        Every version newer than the snapshot at or before the retention boundary
+        stays reconstructible. Older history keeps only its periodic snapshots.
+
+        Args:
+            project_id: The project ID
+            field_name: The versioned JSONB field
+            retain_versions: Number of newest versions kept in full detail
+                (defaults to VERSION_RETENTION)
+
+        Returns:
+            Tuple of (success, result_dict)
+        """
+        retain = self.VERSION_RETENTION if retain_versions is None else retain_versions
+        try:
+            latest = (
+                self.supabase_client.table("archon_document_versions")
+                .select("version_number")
+                .eq("project_id", project_id)
+                .eq("field_name", field_name)
+                .order("version_number", desc=True)
+                .limit(1)
+                .execute()
+            )
+            if not latest.data:
+                return True, {"project_id": project_id, "field_name": field_name, "removed": 0}
+
+            boundary = latest.data[0]["version_number"] - retain
+            cutoff_snapshot = (
+                self.supabase_client.table("archon_document_versions")
+                .select("version_number")
+                .eq("project_id", project_id)
+                .eq("field_name", field_name)
+                .eq("storage_kind", "snapshot")
+                .lte("version_number", boundary)
+                .order("version_number", desc=True)
+                .limit(1)
+                .execute()
+            )
+            if not cutoff_snapshot.data:
+                return True, {"project_id": project_id, "field_name": field_name, "removed": 0}
+
+            cutoff = cutoff_snapshot.data[0]["version_number"]
+            removed = (
+                self.supabase_client.table("archon_document_versions")
+                .delete()
+                .eq("project_id", project_id)
+                .eq("field_name", field_name)
+                .eq("storage_kind", "delta")
+                .lt("version_number", cutoff)
+                .execute()
+            )
+            removed_count = len(removed.data or [])
+            if removed_count:
+                logger.info(
+                    f"Compacted {removed_count} old version deltas | project_id={project_id} | field={field_name} | before={cutoff}"
+                )
+            return True, {
+                "project_id": project_id,
+                "field_name": field_name,
+                "removed": removed_count,
+                "compacted_before": cutoff,
+            }
+
+        except Exception as e:
+            logger.warning(f"Version compaction failed for {project_id}/{field_name}: {e}")
+            return False, {"error": f"Error compacting versions: {str(e)}"}
+
+    def _query_versions(self, project_id: str, field_name: str | None, columns: str):
+        query = (
+            self.supabase_client.table("archon_document_versions")
+            .select(columns)
+            .eq("project_id", project_id)
+        )
+        if field_name:
+            query = query.eq("field_name", field_name)
+        # Get versions ordered by version number descending
+        return query.order("version_number", desc=True).execute()
+
+    def _delta_storage(
+        self, project_id: str, field_name: str, version_number: int, content: Any
+    ) -> dict[str, Any]:
+        """Decide how to store a new version; returns the storage columns (and delta content)."""
+        snapshot = {"storage_kind": "snapshot", "base_version": None}
+        if version_number == 1 or (version_number - 1) % self.SNAPSHOT_INTERVAL == 0:
+            return snapshot
+
+        try:
+            previous = self._latest_cached(project_id, field_name, version_number - 1)
+            if previous is None:
+                base, previous = self._reconstruct_version(project_id, field_name, version_number - 1)
+                if base is None:
+                    return snapshot
+            patch = make_patch(previous, content)
+        except Exception as e:
+            logger.debug(f"Could not diff against version {version_number - 1}, storing snapshot: {e}")
+            return snapshot
+
+        if len(json.dumps(patch, default=str)) >= len(json.dumps(content, default=str)):
+            return snapshot
+        return {"storage_kind": "delta", "base_version": version_number - 1, "content": patch}
+
+    def _reconstruct_version(
+        self, project_id: str, field_name: str, version_number: int
+    ) -> tuple[dict[str, Any] | None, Any]:
+        """
+        Load a version row and its full content.
+
+        Reads the version and the deltas back to its snapshot in one query
+        (falling back to the whole history if the chain is longer than usual).
+
+        Returns:
+            (version_row, content), or (None, None) when the version does not exist
+        """
+        chain = self._load_chain(project_id, field_name, version_number, limit=self.SNAPSHOT_INTERVAL)
+        if chain is None:
+            chain = self._load_chain(project_id, field_name, version_number, limit=None)
+        if not chain or chain[0]["version_number"] != version_number:
+            return None, None
+
+        base = chain[-1]
+        if base.get("storage_kind", "snapshot") == "delta":
+            raise ValueError(
+                f"No snapshot found for version {version_number} of {field_name} in project {project_id}"
+            )
+
+        content = base["content"]
+        expected_base = base["version_number"]
+        for row in reversed(chain[:-1]):
+            if row.get("base_version") not in (None, expected_base):
+                raise ValueError(
+                    f"Version {row['version_number']} expects base {row['base_version']}, found {expected_base}"
+                )
+            content = apply_patch(content, row["content"])
+            expected_base = row["version_number"]
+
+        if chain[0] is base:
+            content = copy.deepcopy(content)
+        self._remember_latest(project_id, field_name, version_number, content, only_if_newer=True)
+        return chain[0], content
+
+    def _load_chain(
+        self, project_id: str, field_name: str, version_number: int, limit: int | None
+    ) -> list[dict[str, Any]] | None:
+        """Rows from version_number back to the nearest snapshot; None if not reached within limit."""
+        query = (
+            self.supabase_client.table("archon_document_versions")
+            .select("*")
+            .eq("project_id", project_id)
+            .eq("field_name", field_name)
+            .lte("version_number", version_number)
+            .order("version_number", desc=True)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        rows = query.execute().data or []
+
+        chain = []
+        for row in rows:
+            chain.append(row)
+            if row.get("storage_kind", "snapshot") != "delta":
+                return chain
+        if limit is not None and len(rows) >= limit:
+            return None
+        return chain
+
+    def _latest_cached(self, project_id: str, field_name: str, version_number: int) -> Any:
+        key = (project_id, field_name)
+        with self._latest_lock:
+            entry = VersioningService._latest_content.get(key)
+            if entry is None or entry[0] != version_number:
+                return None
+            VersioningService._latest_content.move_to_end(key)
+            return entry[1]
+
+    def _remember_latest(
+        self,
+        project_id: str,
+        field_name: str,
+        version_number: int,
+        content: Any,
+        only_if_newer: bool = False,
+    ) -> None:
+        key = (project_id, field_name)
+        with self._latest_lock:
+            entry = VersioningService._latest_content.get(key)
+            if only_if_newer and entry is not None and entry[0] >= version_number:
+                return
+            VersioningService._latest_content[key] = (version_number, copy.deepcopy(content))
+            VersioningService._latest_content.move_to_end(key)
+            while len(VersioningService._latest_content) > self._LATEST_CACHE_SIZE:
+                VersioningService._latest_content.popitem(last=False)
@@ -11,11 +11,13 @@ from typing import Any
 from urllib.parse import urlparse
 
 import aiohttp
-import openai
 
+from ..config.lazy_imports import lazy_import
 from ..config.logfire_config import get_logger
 from .credential_service import credential_service
 
+openai = lazy_import("openai")
+
 logger = get_logger(__name__)
 
 # Provider capabilities and model specifications cache
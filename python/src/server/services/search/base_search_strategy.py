@@ -10,12 +10,18 @@ from typing import Any
 from supabase import Client
 
 from ...config.logfire_config import get_logger, safe_span
+from ...config.metrics import registry
 
 logger = get_logger(__name__)
 
 # Fixed similarity threshold for vector results
 SIMILARITY_THRESHOLD = 0.05
 
+# Shared with the hybrid strategy, labelled by the search RPC
+SEARCH_RPC_SECONDS = registry.histogram(
+    "archon_vector_search_seconds", "Wall time of vector and hybrid search RPC calls", ["rpc"]
+)
+
 
 class BaseSearchStrategy:
     """Base strategy implementing fundamental vector similarity search"""
@@ -61,7 +67,8 @@ class BaseSearchStrategy:
                     rpc_params["filter"] = {}
 
                 # Execute search
-                response = self.supabase_client.rpc(table_rpc, rpc_params).execute()
+                with SEARCH_RPC_SECONDS.time(rpc=table_rpc):
+                    response = self.supabase_client.rpc(table_rpc, rpc_params).execute()
 
                 # Filter by similarity threshold
                 filtered_results = []
@@ -17,6 +17,7 @@ from supabase import Client
 
 from ...config.logfire_config import get_logger, safe_span
 from ..embeddings.embedding_service import create_embedding
+from .base_search_strategy import SEARCH_RPC_SECONDS
 
 logger = get_logger(__name__)
 
@@ -55,16 +56,17 @@ class HybridSearchStrategy:
                 source_filter = filter_json.pop("source", None) if "source" in filter_json else None
 
                 # Call the hybrid search PostgreSQL function
-                response = self.supabase_client.rpc(
-                    "hybrid_search_archon_crawled_pages",
-                    {
-                        "query_embedding": query_embedding,
-                        "query_text": query,
-                        "match_count": match_count,
-                        "filter": filter_json,
-                        "source_filter": source_filter,
-                    },
-                ).execute()
+                with SEARCH_RPC_SECONDS.time(rpc="hybrid_search_archon_crawled_pages"):
+                    response = self.supabase_client.rpc(
+                        "hybrid_search_archon_crawled_pages",
+                        {
+                            "query_embedding": query_embedding,
+                            "query_text": query,
+                            "match_count": match_count,
+                            "filter": filter_json,
+                            "source_filter": source_filter,
+                        },
+                    ).execute()
 
                 if not response.data:
                     logger.debug("No results from hybrid search")
@@ -142,16 +144,17 @@ class HybridSearchStrategy:
                     final_source_filter = filter_json.pop("source")
 
                 # Call the hybrid search PostgreSQL function
-                response = self.supabase_client.rpc(
-                    "hybrid_search_archon_code_examples",
-                    {
-                        "query_embedding": query_embedding,
-                        "query_text": query,
-                        "match_count": match_count,
-                        "filter": filter_json,
-                        "source_filter": final_source_filter,
-                    },
-                ).execute()
+                with SEARCH_RPC_SECONDS.time(rpc="hybrid_search_archon_code_examples"):
+                    response = self.supabase_client.rpc(
+                        "hybrid_search_archon_code_examples",
+                        {
+                            "query_embedding": query_embedding,
+                            "query_text": query,
+                            "match_count": match_count,
+                            "filter": filter_json,
+                            "source_filter": final_source_filter,
+                        },
+                    ).execute()
 
                 if not response.data:
                     logger.debug("No results from hybrid code search")
@@ -63,17 +63,10 @@ class RAGService:
         try:
             from ..credential_service import credential_service
 
-            if hasattr(credential_service, "_cache") and credential_service._cache_initialized:
-                cached_value = credential_service._cache.get(key)
-                if isinstance(cached_value, dict) and cached_value.get("is_encrypted"):
-                    encrypted_value = cached_value.get("encrypted_value")
-                    if encrypted_value:
-                        try:
-                            return credential_service._decrypt_value(encrypted_value)
-                        except Exception:
-                            pass
-                elif cached_value:
-                    return str(cached_value)
+            # Loaded settings, with secrets decrypted once and memoized
+            cached_value = credential_service.get_setting(key)
+            if cached_value:
+                return str(cached_value)
             # Fallback to environment variable
             return os.getenv(key, default)
         except Exception:
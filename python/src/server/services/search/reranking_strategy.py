@@ -6,26 +6,78 @@ The reranking process re-scores search results based on query-document relevance
 a trained neural model, typically improving precision over initial retrieval scores.
 
 Uses the cross-encoder/ms-marco-MiniLM-L-6-v2 model for reranking by default.
+sentence-transformers (and torch with it) is only imported when the first model
+is loaded, and loaded models are shared across RerankingStrategy instances.
 """
 
+import asyncio
 import os
+import threading
 from typing import Any
 
-try:
-    from sentence_transformers import CrossEncoder
-
-    CROSSENCODER_AVAILABLE = True
-except ImportError:
-    CrossEncoder = None
-    CROSSENCODER_AVAILABLE = False
-
+from ...config.lazy_imports import is_available
 from ...config.logfire_config import get_logger, safe_span
+from ...config.metrics import registry
+
+CROSSENCODER_AVAILABLE = is_available("sentence_transformers")
 
 logger = get_logger(__name__)
 
 # Default reranking model
 DEFAULT_RERANKING_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
 
+RERANK_SECONDS = registry.histogram("archon_rerank_seconds", "Wall time of CrossEncoder predictions in rerank_results")
+RERANK_PAIRS = registry.counter("archon_rerank_pairs_total", "Query-document pairs scored by the reranker")
+
+# Loaded CrossEncoders by model name; RAGService builds a RerankingStrategy per request
+_models: dict[str, Any] = {}
+_loading: set[str] = set()
+# Guards the two collections only, never a model load, so the event loop never waits on it
+_models_lock = threading.Lock()
+
+
+def load_cross_encoder(model_name: str = DEFAULT_RERANKING_MODEL) -> Any | None:
+    """
+    Return the shared CrossEncoder for ``model_name``, loading it on first use.
+
+    Returns None when sentence-transformers is missing, the model fails to
+    load, or another thread (the startup warm-up) is still loading it, in
+    which case queries skip reranking until the load finishes. Failures are
+    not cached, so the next call retries.
+    """
+    if not CROSSENCODER_AVAILABLE:
+        logger.warning("sentence-transformers not available - reranking disabled")
+        return None
+
+    with _models_lock:
+        model = _models.get(model_name)
+        if model is not None:
+            return model
+        if model_name in _loading:
+            logger.info(f"Reranking model {model_name} is still loading - skipping reranking")
+            return None
+        _loading.add(model_name)
+
+    try:
+        from sentence_transformers import CrossEncoder
+
+        logger.info(f"Loading reranking model: {model_name}")
+        model = CrossEncoder(model_name)
+    except Exception as e:
+        logger.error(f"Failed to load reranking model {model_name}: {e}")
+        model = None
+
+    with _models_lock:
+        _loading.discard(model_name)
+        if model is not None:
+            _models[model_name] = model
+    return model
+
+
+async def warm_up_reranker(model_name: str = DEFAULT_RERANKING_MODEL) -> bool:
+    """Load the reranking model in a worker thread so the first reranked query does not pay for it."""
+    return await asyncio.to_thread(load_cross_encoder, model_name) is not None
+
 
 class RerankingStrategy:
     """Strategy class implementing result reranking using CrossEncoder models"""
@@ -59,18 +111,9 @@ class RerankingStrategy:
         """
         return cls(model_name=model_name, model_instance=model)
 
-    def _load_model(self) -> CrossEncoder:
-        """Load the CrossEncoder model for reranking."""
-        if not CROSSENCODER_AVAILABLE:
-            logger.warning("sentence-transformers not available - reranking disabled")
-            return None
-
-        try:
-            logger.info(f"Loading reranking model: {self.model_name}")
-            return CrossEncoder(self.model_name)
-        except Exception as e:
-            logger.error(f"Failed to load reranking model {self.model_name}: {e}")
-            return None
+    def _load_model(self) -> Any | None:
+        """Load the CrossEncoder model for reranking, reusing an already loaded one."""
+        return load_cross_encoder(self.model_name)
 
     def is_available(self) -> bool:
         """Check if reranking is available (model loaded successfully)."""
@@ -173,8 +216,9 @@ class RerankingStrategy:
                     return results
 
                 # Get reranking scores from the model
-                with safe_span("crossencoder_predict"):
+                with safe_span("crossencoder_predict"), RERANK_SECONDS.time():
                     scores = self.model.predict(query_doc_pairs)
+                RERANK_PAIRS.inc(len(query_doc_pairs))
 
                 # Apply scores and sort results
                 reranked_results = self.apply_rerank_scores(results, scores, valid_indices, top_k)
@@ -9,10 +9,20 @@ import os
 from typing import Any
 
 from ...config.logfire_config import safe_span, search_logger
+from ...config.metrics import registry
 from ..embeddings.contextual_embedding_service import generate_contextual_embeddings_batch
 from ..embeddings.embedding_service import create_embeddings_batch
+from ..ingestion_settings import current_ingestion_settings
 
+DOCUMENT_STORAGE_SECONDS = registry.histogram(
+    "archon_document_storage_seconds",
+    "Wall time of add_documents_to_supabase calls, including embedding",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+)
+CHUNKS_STORED = registry.counter("archon_document_chunks_stored_total", "Document chunks stored with embeddings")
 
+
+@DOCUMENT_STORAGE_SECONDS.time()
 async def add_documents_to_supabase(
     client,
     urls: list[str],
@@ -57,11 +67,17 @@ async def add_documents_to_supabase(
                 except Exception as e:
                     search_logger.warning(f"Progress callback failed: {e}. Storage continuing...")
 
+        # Settings are pinned for the whole operation when a crawl is running
+        ingestion_settings = current_ingestion_settings()
+
         # Load settings from database
         try:
-            # Defensive import to handle any initialization issues
-            from ..credential_service import credential_service as cred_service
-            rag_settings = await cred_service.get_credentials_by_category("rag_strategy")
+            if ingestion_settings is not None:
+                rag_settings = ingestion_settings.values
+            else:
+                # Defensive import to handle any initialization issues
+                from ..credential_service import credential_service as cred_service
+                rag_settings = await cred_service.get_credentials_by_category("rag_strategy")
             if batch_size is None:
                 batch_size = int(rag_settings.get("DOCUMENT_STORAGE_BATCH_SIZE", "50"))
             # Clamp batch sizes to sane minimums to prevent crashes
@@ -144,15 +160,32 @@ async def add_documents_to_supabase(
 
         # Check if contextual embeddings are enabled (use credential_service)
 
-        try:
-            use_contextual_embeddings = await credential_service.get_credential(
-                "USE_CONTEXTUAL_EMBEDDINGS", "false", decrypt=True
-            )
-            if isinstance(use_contextual_embeddings, str):
-                use_contextual_embeddings = use_contextual_embeddings.lower() == "true"
-        except Exception:
-            # Fallback to environment variable
-            use_contextual_embeddings = os.getenv("USE_CONTEXTUAL_EMBEDDINGS", "false") == "true"
+        if ingestion_settings is not None:
+            use_contextual_embeddings = ingestion_settings.use_contextual_embeddings
+        else:
+            try:
+                use_contextual_embeddings = await credential_service.get_credential(
+                    "USE_CONTEXTUAL_EMBEDDINGS", "false", decrypt=True
+                )
+                if isinstance(use_contextual_embeddings, str):
+                    use_contextual_embeddings = use_contextual_embeddings.lower() == "true"
+            except Exception:
+                # Fallback to environment variable
+                use_contextual_embeddings = os.getenv("USE_CONTEXTUAL_EMBEDDINGS", "false") == "true"
+
+        # Resolve worker count once rather than per batch
+        max_workers = 1
+        if use_contextual_embeddings:
+            if ingestion_settings is not None:
+                max_workers = ingestion_settings.contextual_embeddings_max_workers
+            else:
+                try:
+                    max_workers = await credential_service.get_credential(
+                        "CONTEXTUAL_EMBEDDINGS_MAX_WORKERS", "4", decrypt=True
+                    )
+                    max_workers = max(1, int(max_workers))
+                except Exception:
+                    max_workers = 4
 
         # Initialize batch tracking for simplified progress
         completed_batches = 0
@@ -187,18 +220,6 @@ async def add_documents_to_supabase(
             # Simple batch progress - only track completed batches
             current_progress = int((completed_batches / total_batches) * 100)
 
-            # Get max workers setting FIRST before using it
-            if use_contextual_embeddings:
-                try:
-                    max_workers = await credential_service.get_credential(
-                        "CONTEXTUAL_EMBEDDINGS_MAX_WORKERS", "4", decrypt=True
-                    )
-                    max_workers = max(1, int(max_workers))
-                except Exception:
-                    max_workers = 4
-            else:
-                max_workers = 1
-
             # Report batch start with simplified progress
             if progress_callback and asyncio.iscoroutinefunction(progress_callback):
                 try:
@@ -330,8 +351,8 @@ async def add_documents_to_supabase(
             successful_texts = result.texts_processed
             
             # Get model information for tracking
-            from ..llm_provider_service import get_embedding_model
             from ..credential_service import credential_service
+            from ..llm_provider_service import get_embedding_model
             
             # Get embedding model name
             embedding_model_name = await get_embedding_model(provider=provider)
@@ -538,5 +559,6 @@ async def add_documents_to_supabase(
         span.set_attribute("success", True)
         span.set_attribute("total_processed", len(contents))
         span.set_attribute("total_stored", total_chunks_stored)
+        CHUNKS_STORED.inc(total_chunks_stored)
 
         return {"chunks_stored": total_chunks_stored}
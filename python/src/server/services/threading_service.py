@@ -24,10 +24,17 @@ from typing import Any
 import psutil
 
 from ..config.logfire_config import get_logger
+from ..config.metrics import registry
 
 # Get logger for this module
 logfire_logger = get_logger("threading")
 
+RATE_LIMIT_WAIT_SECONDS = registry.histogram(
+    "archon_rate_limit_wait_seconds",
+    "Time rate-limited operations waited for a concurrency slot and token budget",
+    buckets=(0.001, 0.01, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
 
 class ProcessingMode(str, Enum):
     """Processing modes for different workload types"""
@@ -463,8 +470,10 @@ class ThreadingService:
             estimated_tokens: Estimated number of tokens for the operation
             progress_callback: Optional async callback for progress updates during wait
         """
+        waiting_since = time.perf_counter()
         async with self.rate_limiter.semaphore:
             can_proceed = await self.rate_limiter.acquire(estimated_tokens, progress_callback)
+            RATE_LIMIT_WAIT_SECONDS.observe(time.perf_counter() - waiting_since)
             if not can_proceed:
                 raise Exception("Rate limit exceeded")
 
@@ -8,30 +8,17 @@ including PDF, Word documents, and plain text files.
 import io
 
 # Removed direct logging import - using unified config
+from ..config.lazy_imports import lazy_import
+from ..config.logfire_config import get_logger, logfire
 
-# Import document processing libraries with availability checks
-try:
-    import PyPDF2
-
-    PYPDF2_AVAILABLE = True
-except ImportError:
-    PYPDF2_AVAILABLE = False
-
-try:
-    import pdfplumber
-
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
-
-try:
-    from docx import Document as DocxDocument
-
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+# Document processing libraries are imported on first use, not at server startup
+PyPDF2 = lazy_import("PyPDF2")
+pdfplumber = lazy_import("pdfplumber")
+docx = lazy_import("docx")
 
-from ..config.logfire_config import get_logger, logfire
+PYPDF2_AVAILABLE = PyPDF2 is not None
+PDFPLUMBER_AVAILABLE = pdfplumber is not None
+DOCX_AVAILABLE = docx is not None
 
 logger = get_logger(__name__)
 
@@ -318,7 +305,7 @@ def extract_text_from_docx(file_content: bytes) -> str:
         raise Exception("python-docx library not available. Please install python-docx.")
 
     try:
-        doc = DocxDocument(io.BytesIO(file_content))
+        doc = docx.Document(io.BytesIO(file_content))
         text_content = []
 
         for paragraph in doc.paragraphs:
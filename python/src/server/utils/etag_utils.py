@@ -2,6 +2,9 @@
 
 import hashlib
 import json
+import threading
+import time
+from collections import OrderedDict
 from typing import Any
 
 
@@ -40,3 +43,77 @@ def check_etag(request_etag: str | None, current_etag: str) -> bool:
     # Both ETags should have quotes, compare directly
     # The If-None-Match header and our generated ETag should both be quoted
     return request_etag == current_etag
+
+
+class ChangeVersionTracker:
+    """In-process change counters that let polling endpoints answer 304 without a query.
+
+    Writers bump a scope (e.g. "projects", "tasks", "tasks:<project_id>") after
+    mutating data. Read endpoints remember the ETag they last computed for a
+    cache key together with the scope versions observed *before* querying. A
+    later request carrying that ETag can then be answered with 304 as long as
+    none of the scopes moved and the entry is younger than ``revalidate_after``
+    seconds. The age bound limits staleness from writers outside this process
+    (agents, direct database edits), which cannot bump the counters. At most
+    ``max_etags`` keys are remembered; the least recently stored are dropped.
+    """
+
+    def __init__(self, revalidate_after: float = 30.0, max_etags: int = 1024):
+        self.revalidate_after = revalidate_after
+        self.max_etags = max_etags
+        self._versions: dict[str, int] = {}
+        self._etags: OrderedDict[str, tuple[str, tuple[int, ...], float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def bump(self, *scopes: str) -> None:
+        """Record that data under the given scopes changed."""
+        with self._lock:
+            for scope in scopes:
+                self._versions[scope] = self._versions.get(scope, 0) + 1
+
+    def snapshot(self, *scopes: str) -> tuple[int, ...]:
+        """Return the current versions of the given scopes."""
+        with self._lock:
+            return tuple(self._versions.get(scope, 0) for scope in scopes)
+
+    def remember(self, key: str, etag: str, versions: tuple[int, ...]) -> None:
+        """Store the ETag computed for ``key`` from data read at ``versions``."""
+        with self._lock:
+            self._etags[key] = (etag, versions, time.monotonic())
+            self._etags.move_to_end(key)
+            while len(self._etags) > self.max_etags:
+                self._etags.popitem(last=False)
+
+    def is_not_modified(self, key: str, request_etag: str | None, *scopes: str) -> bool:
+        """Check whether ``request_etag`` is still current without touching the database.
+
+        Args:
+            key: Cache key identifying the endpoint and its parameters
+            request_etag: ETag from the If-None-Match header
+            scopes: Scopes the cached response depends on
+
+        Returns:
+            True if a 304 can be returned immediately, False if the data must be re-read
+        """
+        if not request_etag:
+            return False
+
+        with self._lock:
+            entry = self._etags.get(key)
+            if entry is None:
+                return False
+            etag, versions, stored_at = entry
+            if time.monotonic() - stored_at > self.revalidate_after:
+                return False
+            current = tuple(self._versions.get(scope, 0) for scope in scopes)
+            return check_etag(request_etag, etag) and versions == current
+
+    def reset(self) -> None:
+        """Forget all counters and remembered ETags."""
+        with self._lock:
+            self._versions.clear()
+            self._etags.clear()
+
+
+# Shared tracker used by project/task services and the projects API
+change_versions = ChangeVersionTracker()
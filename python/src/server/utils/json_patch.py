@@ -0,0 +1,161 @@
+"""
+Minimal JSON Patch (RFC 6902) utilities.
+
+Only the add, remove and replace operations are produced and applied, which is
+enough to store version history as deltas between JSON documents.
+"""
+
+import copy
+from typing import Any
+
+
+class JsonPatchError(ValueError):
+    """Raised when a patch cannot be applied to a document."""
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _same(a: Any, b: Any) -> bool:
+    # 1 == True in Python but not in JSON
+    return type(a) is type(b) and a == b
+
+
+def _diff(src: Any, dst: Any, path: str, ops: list[dict[str, Any]]) -> None:
+    if _same(src, dst):
+        return
+
+    if isinstance(src, dict) and isinstance(dst, dict):
+        for key in src:
+            if key not in dst:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(str(key))}"})
+        for key, value in dst.items():
+            child = f"{path}/{_escape(str(key))}"
+            if key not in src:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                _diff(src[key], value, child, ops)
+        return
+
+    if isinstance(src, list) and isinstance(dst, list):
+        # Only the differing middle section needs operations
+        shortest = min(len(src), len(dst))
+        prefix = 0
+        while prefix < shortest and _same(src[prefix], dst[prefix]):
+            prefix += 1
+        suffix = 0
+        while suffix < shortest - prefix and _same(src[-1 - suffix], dst[-1 - suffix]):
+            suffix += 1
+
+        old_middle = len(src) - prefix - suffix
+        new_middle = len(dst) - prefix - suffix
+        common = min(old_middle, new_middle)
+
+        for offset in range(common):
+            index = prefix + offset
+            _diff(src[index], dst[index], f"{path}/{index}", ops)
+        for _ in range(old_middle - common):
+            ops.append({"op": "remove", "path": f"{path}/{prefix + common}"})
+        for offset in range(common, new_middle):
+            index = prefix + offset
+            ops.append({"op": "add", "path": f"{path}/{index}", "value": dst[index]})
+        return
+
+    ops.append({"op": "replace", "path": path, "value": dst})
+
+
+def make_patch(src: Any, dst: Any) -> list[dict[str, Any]]:
+    """
+    Compute a JSON Patch that transforms ``src`` into ``dst``.
+
+    Args:
+        src: Original JSON-compatible value
+        dst: Target JSON-compatible value
+
+    Returns:
+        List of patch operations (empty when the values are equal)
+    """
+    ops: list[dict[str, Any]] = []
+    _diff(src, dst, "", ops)
+    return ops
+
+
+def _parse_pointer(path: str) -> list[str]:
+    if path == "":
+        return []
+    if not path.startswith("/"):
+        raise JsonPatchError(f"Invalid JSON pointer: {path!r}")
+    return [_unescape(token) for token in path[1:].split("/")]
+
+
+def _list_index(container: list, token: str, allow_end: bool) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    try:
+        index = int(token)
+    except ValueError as e:
+        raise JsonPatchError(f"Invalid array index: {token!r}") from e
+    upper = len(container) if allow_end else len(container) - 1
+    if index < 0 or index > upper:
+        raise JsonPatchError(f"Array index out of range: {index}")
+    return index
+
+
+def _apply_operation(document: Any, operation: dict[str, Any]) -> Any:
+    op = operation.get("op")
+    if op not in ("add", "remove", "replace"):
+        raise JsonPatchError(f"Unsupported patch operation: {op!r}")
+
+    tokens = _parse_pointer(operation.get("path", ""))
+    if not tokens:
+        return None if op == "remove" else copy.deepcopy(operation.get("value"))
+
+    parent = document
+    try:
+        for token in tokens[:-1]:
+            parent = parent[_list_index(parent, token, False)] if isinstance(parent, list) else parent[token]
+    except (KeyError, TypeError) as e:
+        raise JsonPatchError(f"Path not found: {operation['path']}") from e
+
+    last = tokens[-1]
+    if isinstance(parent, list):
+        index = _list_index(parent, last, op == "add")
+        if op == "add":
+            parent.insert(index, copy.deepcopy(operation.get("value")))
+        elif op == "remove":
+            del parent[index]
+        else:
+            parent[index] = copy.deepcopy(operation.get("value"))
+    elif isinstance(parent, dict):
+        if op != "add" and last not in parent:
+            raise JsonPatchError(f"Path not found: {operation['path']}")
+        if op == "remove":
+            del parent[last]
+        else:
+            parent[last] = copy.deepcopy(operation.get("value"))
+    else:
+        raise JsonPatchError(f"Cannot apply {op} below a scalar: {operation['path']}")
+
+    return document
+
+
+def apply_patch(document: Any, patch: list[dict[str, Any]]) -> Any:
+    """
+    Apply a JSON Patch to a copy of ``document``.
+
+    Args:
+        document: JSON-compatible value (left unmodified)
+        patch: Operations produced by make_patch
+
+    Returns:
+        The patched value
+    """
+    result = copy.deepcopy(document)
+    for operation in patch:
+        result = _apply_operation(result, operation)
+    return result
@@ -0,0 +1,33 @@
+"""
+PostgREST error classification.
+
+Services probe for database functions, columns and tables added by later
+migrations and fall back to older code paths when they are missing. Only
+those errors may trigger a fallback: a timeout or any other failure can mean
+a write already committed or that the database is overloaded, so it has to
+surface instead of being retried a different, more expensive way.
+"""
+
+from postgrest.exceptions import APIError
+
+# PostgREST schema cache misses and the matching Postgres SQLSTATEs
+MISSING_FUNCTION_CODES = frozenset({"PGRST202", "42883"})
+MISSING_COLUMN_CODES = frozenset({"PGRST204", "42703"})
+MISSING_RELATION_CODES = frozenset({"PGRST205", "42P01"})
+
+
+def error_code(error: BaseException) -> str | None:
+    """The PostgREST or SQLSTATE code of ``error``, if it is an API error."""
+    return error.code if isinstance(error, APIError) else None
+
+
+def is_missing_function(error: BaseException) -> bool:
+    return error_code(error) in MISSING_FUNCTION_CODES
+
+
+def is_missing_column(error: BaseException) -> bool:
+    return error_code(error) in MISSING_COLUMN_CODES
+
+
+def is_missing_relation(error: BaseException) -> bool:
+    return error_code(error) in MISSING_RELATION_CODES
@@ -3,6 +3,6 @@ Progress Tracking Utilities
 
 Provides utilities for tracking and broadcasting progress updates.
 """
-from .progress_tracker import ProgressTracker
+from .progress_tracker import ProgressSubscription, ProgressTracker
 
-__all__ = ['ProgressTracker']
+__all__ = ['ProgressSubscription', 'ProgressTracker']
@@ -1,7 +1,8 @@
 """
 Progress Tracker Utility
 
-Tracks operation progress in memory for HTTP polling access.
+Tracks operation progress in memory for HTTP polling access and publishes
+every state change to push-based subscribers (SSE streams).
 """
 
 import asyncio
@@ -11,6 +12,56 @@ from typing import Any
 from ...config.logfire_config import safe_logfire_error, safe_logfire_info
 
 
+class ProgressSubscription:
+    """
+    Coalescing subscription to a single operation's progress.
+
+    Only the latest published state is retained, so a slow consumer never
+    builds a backlog - rapid updates collapse into the most recent snapshot.
+    """
+
+    def __init__(self, progress_id: str):
+        self.progress_id = progress_id
+        self._latest: tuple[int, dict[str, Any]] | None = None
+        self._event = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+
+    def publish(self, sequence: int, state: dict[str, Any]) -> None:
+        """Replace the pending snapshot and wake the consumer."""
+        self._latest = (sequence, state)
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._event.set()
+        else:
+            # Published from a worker thread - hand off to the subscriber's loop
+            self._loop.call_soon_threadsafe(self._event.set)
+
+    async def next(
+        self, after_sequence: int, timeout: float | None = None
+    ) -> tuple[int, dict[str, Any]] | None:
+        """
+        Wait for a snapshot newer than ``after_sequence``.
+
+        Args:
+            after_sequence: Last sequence number the consumer has seen
+            timeout: Optional seconds to wait before returning None
+
+        Returns:
+            (sequence, state) tuple, or None on timeout
+        """
+        while True:
+            if self._latest is not None and self._latest[0] > after_sequence:
+                return self._latest
+            self._event.clear()
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout)
+            except TimeoutError:
+                return None
+
+
 class ProgressTracker:
     """
     Utility class for tracking progress updates in memory.
@@ -19,6 +70,10 @@ class ProgressTracker:
 
     # Class-level storage for all progress states
     _progress_states: dict[str, dict[str, Any]] = {}
+    # Monotonic per-operation sequence numbers, bumped on every state change
+    _sequences: dict[str, int] = {}
+    # Push-based subscribers keyed by progress_id
+    _subscribers: dict[str, set[ProgressSubscription]] = {}
 
     def __init__(self, progress_id: str, operation_type: str = "crawl"):
         """
@@ -46,11 +101,53 @@ class ProgressTracker:
         """Get progress state by ID."""
         return cls._progress_states.get(progress_id)
 
+    @classmethod
+    def get_sequence(cls, progress_id: str) -> int:
+        """Get the current sequence number for an operation (0 if never updated)."""
+        return cls._sequences.get(progress_id, 0)
+
     @classmethod
     def clear_progress(cls, progress_id: str) -> None:
         """Remove progress state from memory."""
         if progress_id in cls._progress_states:
             del cls._progress_states[progress_id]
+        cls._sequences.pop(progress_id, None)
+
+    @classmethod
+    def subscribe(cls, progress_id: str) -> ProgressSubscription:
+        """
+        Subscribe to state changes for an operation.
+
+        The subscription is primed with the current state so a new consumer
+        (or one resuming from an older sequence) receives it immediately.
+        """
+        subscription = ProgressSubscription(progress_id)
+        state = cls._progress_states.get(progress_id)
+        if state is not None:
+            subscription.publish(cls.get_sequence(progress_id), dict(state))
+        cls._subscribers.setdefault(progress_id, set()).add(subscription)
+        return subscription
+
+    @classmethod
+    def unsubscribe(cls, progress_id: str, subscription: ProgressSubscription) -> None:
+        """Remove a subscription created by subscribe()."""
+        subscribers = cls._subscribers.get(progress_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del cls._subscribers[progress_id]
+
+    @classmethod
+    def _publish(cls, progress_id: str, state: dict[str, Any]) -> None:
+        """Bump the sequence number and notify subscribers."""
+        sequence = cls._sequences.get(progress_id, 0) + 1
+        cls._sequences[progress_id] = sequence
+        subscribers = cls._subscribers.get(progress_id)
+        if subscribers:
+            snapshot = dict(state)
+            for subscription in subscribers:
+                subscription.publish(sequence, snapshot)
 
     @classmethod
     def list_active(cls) -> dict[str, dict[str, Any]]:
@@ -70,6 +167,7 @@ class ProgressTracker:
             # Only clean up if still in terminal state (prevent cleanup of reused IDs)
             if status in ["completed", "failed", "error", "cancelled"]:
                 del cls._progress_states[progress_id]
+                cls._sequences.pop(progress_id, None)
                 safe_logfire_info(f"Progress state cleaned up after delay | progress_id={progress_id} | status={status}")
 
     async def start(self, initial_data: dict[str, Any] | None = None):
@@ -346,6 +444,8 @@ class ProgressTracker:
         """Update progress state in memory storage."""
         # Update the class-level dictionary
         ProgressTracker._progress_states[self.progress_id] = self.state
+        # Push the new state to any streaming subscribers
+        ProgressTracker._publish(self.progress_id, self.state)
 
         safe_logfire_info(
             f"📊 [PROGRESS] Updated {self.operation_type} | ID: {self.progress_id} | "
@@ -7,7 +7,25 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.agent_work_orders.agent_executor.agent_cli_executor import AgentCLIExecutor
+from src.agent_work_orders.agent_executor.agent_cli_executor import AgentCLIExecutor, _AgentOutputStream
+
+
+def _streaming_process(stdout: bytes = b"", stderr: bytes = b"", returncode: int = 0, eof: bool = True):
+    """Mock subprocess whose stdout/stderr are real stream readers"""
+    process = MagicMock()
+    process.returncode = returncode
+    process.stdin = MagicMock()
+    process.stdin.drain = AsyncMock()
+    process.stdout = asyncio.StreamReader()
+    process.stderr = asyncio.StreamReader()
+    process.stdout.feed_data(stdout)
+    process.stderr.feed_data(stderr)
+    if eof:
+        process.stdout.feed_eof()
+        process.stderr.feed_eof()
+    process.wait = AsyncMock(return_value=returncode)
+    process.kill = MagicMock()
+    return process
 
 
 def test_build_command():
@@ -113,14 +131,8 @@ async def test_execute_async_success():
     """Test successful command execution with prompt via stdin"""
     executor = AgentCLIExecutor()
 
-    # Mock subprocess
-    mock_process = MagicMock()
-    mock_process.returncode = 0
-    mock_process.communicate = AsyncMock(
-        return_value=(
-            b'{"session_id": "session-123", "type": "init"}\n{"type": "result"}',
-            b"",
-        )
+    mock_process = _streaming_process(
+        b'{"session_id": "session-123", "type": "init"}\n{"type": "result"}'
     )
 
     with patch("asyncio.create_subprocess_shell", return_value=mock_process):
@@ -142,12 +154,7 @@ async def test_execute_async_failure():
     """Test failed command execution"""
     executor = AgentCLIExecutor()
 
-    # Mock subprocess
-    mock_process = MagicMock()
-    mock_process.returncode = 1
-    mock_process.communicate = AsyncMock(
-        return_value=(b"", b"Error: Command failed")
-    )
+    mock_process = _streaming_process(stderr=b"Error: Command failed", returncode=1)
 
     with patch("asyncio.create_subprocess_shell", return_value=mock_process):
         result = await executor.execute_async(
@@ -166,16 +173,8 @@ async def test_execute_async_timeout():
     """Test command execution timeout"""
     executor = AgentCLIExecutor()
 
-    # Mock subprocess that times out
-    mock_process = MagicMock()
-    mock_process.kill = MagicMock()
-    mock_process.wait = AsyncMock()
-
-    async def mock_communicate(input=None):
-        await asyncio.sleep(10)  # Longer than timeout
-        return (b"", b"")
-
-    mock_process.communicate = mock_communicate
+    # Mock subprocess that never finishes writing output
+    mock_process = _streaming_process(b'{"type": "init"}\n', eof=False)
 
     with patch("asyncio.create_subprocess_shell", return_value=mock_process):
         result = await executor.execute_async(
@@ -190,41 +189,43 @@ async def test_execute_async_timeout():
     assert "timed out" in result.error_message.lower()
 
 
-def test_extract_session_id():
-    """Test extracting session ID from JSONL output"""
-    executor = AgentCLIExecutor()
+def _parse_stream(jsonl_output: str) -> _AgentOutputStream:
+    stream = _AgentOutputStream(None, None, MagicMock(), tail_bytes=4096)
+    for line in jsonl_output.splitlines():
+        stream.feed_line(line.encode())
+    return stream
 
-    jsonl_output = """
+
+def test_stream_extracts_session_id_and_result():
+    """Test extracting session ID and result message from JSONL output"""
+    stream = _parse_stream("""
 {"type": "init", "session_id": "session-abc123"}
 {"type": "message", "content": "Hello"}
-{"type": "result"}
-"""
+{"type": "result", "is_error": false}
+""")
 
-    session_id = executor._extract_session_id(jsonl_output)
-    assert session_id == "session-abc123"
+    assert stream.session_id == "session-abc123"
+    assert stream.result_message == {"type": "result", "is_error": False}
+    assert stream.event_count == 3
 
 
-def test_extract_session_id_not_found():
+def test_stream_session_id_not_found():
     """Test extracting session ID when not present"""
-    executor = AgentCLIExecutor()
-
-    jsonl_output = """
+    stream = _parse_stream("""
 {"type": "message", "content": "Hello"}
 {"type": "result"}
-"""
+""")
 
-    session_id = executor._extract_session_id(jsonl_output)
-    assert session_id is None
+    assert stream.session_id is None
 
 
-def test_extract_session_id_invalid_json():
+def test_stream_ignores_invalid_json():
     """Test extracting session ID with invalid JSON"""
-    executor = AgentCLIExecutor()
-
-    jsonl_output = "Not valid JSON"
+    stream = _parse_stream("Not valid JSON")
 
-    session_id = executor._extract_session_id(jsonl_output)
-    assert session_id is None
+    assert stream.session_id is None
+    assert stream.result_message is None
+    assert stream.event_count == 0
 
 
 @pytest.mark.asyncio
@@ -236,10 +237,7 @@ async def test_execute_async_extracts_result_text():
     jsonl_output = '{"type":"session_started","session_id":"test-123"}\n{"type":"result","result":"/feature","is_error":false}'
 
     with patch("asyncio.create_subprocess_shell") as mock_subprocess:
-        mock_process = AsyncMock()
-        mock_process.communicate = AsyncMock(return_value=(jsonl_output.encode(), b""))
-        mock_process.returncode = 0
-        mock_subprocess.return_value = mock_process
+        mock_subprocess.return_value = _streaming_process(jsonl_output.encode())
 
         result = await executor.execute_async(
             "claude --print",
@@ -254,6 +252,64 @@ async def test_execute_async_extracts_result_text():
         assert '{"type":"result"' in result.stdout
 
 
+@pytest.mark.asyncio
+async def test_execute_async_streams_events_and_artifacts(tmp_path):
+    """Events are parsed and logged as they arrive; artifacts are written incrementally"""
+    import json
+
+    executor = AgentCLIExecutor()
+    executor.STDOUT_TAIL_BYTES = 200
+    executor._logger = MagicMock()
+
+    events = [{"type": "system", "session_id": "s-1"}]
+    events += [
+        {"type": "assistant", "message": {"content": [{"type": "text", "text": f"step {i} " + "x" * 50}]}}
+        for i in range(20)
+    ]
+    events.append({"type": "result", "result": "done", "is_error": False})
+    process = _streaming_process(stdout=b"", eof=False)
+
+    async def produce():
+        # Split output mid-line to exercise incremental line assembly
+        payload = "\n".join(json.dumps(e) for e in events).encode()
+        for i in range(0, len(payload), 37):
+            process.stdout.feed_data(payload[i:i + 37])
+            await asyncio.sleep(0)
+        process.stdout.feed_eof()
+        process.stderr.feed_eof()
+
+    with patch("asyncio.create_subprocess_shell", return_value=process), \
+            patch("src.agent_work_orders.agent_executor.agent_cli_executor.config") as mock_config:
+        mock_config.EXECUTION_TIMEOUT = 30
+        mock_config.ENABLE_PROMPT_LOGGING = False
+        mock_config.ENABLE_OUTPUT_ARTIFACTS = True
+        mock_config.TEMP_DIR_BASE = str(tmp_path)
+        producer = asyncio.create_task(produce())
+        result = await executor.execute_async("claude --print", "/tmp", work_order_id="wo-stream")
+        await producer
+
+    assert result.success is True
+    assert result.session_id == "s-1"
+    assert result.result_text == "done"
+    # Only a bounded tail of raw output is retained, ending with the result event
+    assert len(result.stdout) <= 400
+    assert result.stdout.endswith(json.dumps(events[-1]))
+
+    streamed = [
+        c.kwargs for c in executor._logger.info.call_args_list
+        if c.args and c.args[0] == "agent_stream_event_received"
+    ]
+    assert len(streamed) == len(events)
+    assert all(kwargs["work_order_id"] == "wo-stream" for kwargs in streamed)
+    assert streamed[1]["preview"].startswith("step 0")
+
+    output_dir = tmp_path / "wo-stream" / "outputs"
+    jsonl_file = next(output_dir.glob("*.jsonl"))
+    json_file = next(output_dir.glob("*.json"))
+    assert len(jsonl_file.read_text().splitlines()) == len(events)
+    assert json.loads(json_file.read_text()) == events
+
+
 def test_build_command_replaces_arguments_placeholder():
     """Test that $ARGUMENTS placeholder is replaced with actual arguments"""
     executor = AgentCLIExecutor()
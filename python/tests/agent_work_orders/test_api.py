@@ -417,3 +417,73 @@ def test_get_agent_work_order_steps_empty():
         data = response.json()
         assert data["agent_work_order_id"] == "wo-test123"
         assert len(data["steps"]) == 0
+
+
+def test_create_agent_work_order_queued_when_slots_busy():
+    """Work orders beyond the concurrency limit are queued and cancellable"""
+    from src.agent_work_orders.api import routes
+    from src.agent_work_orders.workflow_engine.work_order_scheduler import WorkOrderScheduler
+
+    scheduler = WorkOrderScheduler(max_concurrent=1, max_queued=1)
+    scheduler.max_concurrent = 0  # Hold every work order in the queue
+
+    with patch.object(routes, "work_order_scheduler", scheduler), \
+            patch("src.agent_work_orders.api.routes.orchestrator") as mock_orchestrator:
+        mock_orchestrator.execute_workflow = AsyncMock()
+        request_data = {
+            "repository_url": "https://github.com/owner/repo",
+            "sandbox_type": "git_branch",
+            "user_request": "Add a feature",
+            "priority": 3,
+        }
+
+        response = client.post("/api/agent-work-orders/", json=request_data)
+        assert response.status_code == 201
+        data = response.json()
+        assert data["queue_position"] == 1
+        work_order_id = data["agent_work_order_id"]
+
+        detail = client.get(f"/api/agent-work-orders/{work_order_id}").json()
+        assert detail["queue_position"] == 1
+
+        full = client.post("/api/agent-work-orders/", json=request_data)
+        assert full.status_code == 429
+
+        cancelled = client.post(f"/api/agent-work-orders/{work_order_id}/cancel")
+        assert cancelled.status_code == 200
+        detail = client.get(f"/api/agent-work-orders/{work_order_id}").json()
+        assert detail["status"] == "failed"
+        assert detail["queue_position"] is None
+
+        again = client.post(f"/api/agent-work-orders/{work_order_id}/cancel")
+        assert again.status_code == 409
+        mock_orchestrator.execute_workflow.assert_not_called()
+
+
+def test_reconcile_port_leases_fails_interrupted_work_orders():
+    """Running work orders without a live task are failed and lose their leases"""
+    import asyncio
+    from unittest.mock import MagicMock
+
+    from src.agent_work_orders.api.routes import reconcile_port_leases
+
+    def work_order(work_order_id: str) -> MagicMock:
+        return MagicMock(agent_work_order_id=work_order_id, sandbox_identifier=f"sandbox-{work_order_id}")
+
+    listed = {
+        AgentWorkOrderStatus.PENDING: [(work_order("wo-queued"), {})],
+        AgentWorkOrderStatus.RUNNING: [(work_order("wo-live"), {}), (work_order("wo-crashed"), {})],
+    }
+
+    with patch("src.agent_work_orders.api.routes.state_repository") as mock_repo, \
+            patch("src.agent_work_orders.api.routes.port_leases") as mock_leases, \
+            patch.dict("src.agent_work_orders.api.routes._workflow_tasks", {"wo-live": MagicMock()}, clear=True):
+        mock_repo.list = AsyncMock(side_effect=lambda status_filter: listed[status_filter])
+        mock_repo.update_status = AsyncMock()
+        mock_leases.reconcile.return_value = ["sandbox-wo-crashed"]
+
+        assert asyncio.run(reconcile_port_leases()) == ["sandbox-wo-crashed"]
+
+    mock_repo.update_status.assert_awaited_once()
+    assert mock_repo.update_status.await_args.args == ("wo-crashed", AgentWorkOrderStatus.FAILED)
+    mock_leases.reconcile.assert_called_once_with(["sandbox-wo-queued", "sandbox-wo-live"])
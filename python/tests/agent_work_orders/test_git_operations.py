@@ -0,0 +1,147 @@
+"""Tests for async git operations and worktree management"""
+
+import asyncio
+import subprocess
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.agent_work_orders.config import config
+from src.agent_work_orders.utils import git_operations, worktree_operations
+from src.agent_work_orders.utils.git_operations import (
+    GitResult,
+    fetch_origin,
+    get_commit_count,
+    get_files_changed,
+    run_git,
+)
+
+
+def _git(*args: str, cwd) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def origin_repo(tmp_path):
+    """A local repository with one commit on main to clone from"""
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    _git("init", "-b", "main", cwd=origin)
+    _git("config", "user.email", "test@example.com", cwd=origin)
+    _git("config", "user.name", "Test", cwd=origin)
+    (origin / "README.md").write_text("hello\n")
+    _git("add", "README.md", cwd=origin)
+    _git("commit", "-m", "initial", cwd=origin)
+    return origin
+
+
+@pytest.fixture
+def temp_dir_base(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "TEMP_DIR_BASE", str(tmp_path / "work"))
+    monkeypatch.setattr(git_operations, "_last_fetch", {})
+    monkeypatch.setattr(git_operations, "_repository_locks", {})
+    return tmp_path / "work"
+
+
+@pytest.mark.asyncio
+async def test_run_git_captures_output_and_failures(origin_repo):
+    """run_git returns decoded output and reports failures without raising"""
+    result = await run_git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=origin_repo)
+    assert result.ok
+    assert result.stdout.strip() == "main"
+
+    result = await run_git(["rev-parse", "no-such-ref"], cwd=origin_repo)
+    assert not result.ok
+    assert result.stderr
+
+
+@pytest.mark.asyncio
+async def test_fetch_origin_is_cached_per_repository():
+    """A second fetch within the cache window is skipped"""
+    calls = []
+
+    async def fake_run_git(args, cwd=None, timeout=None):
+        calls.append(str(cwd))
+        return GitResult(returncode=0, stdout="", stderr="")
+
+    with patch.object(git_operations, "run_git", side_effect=fake_run_git), \
+            patch.object(git_operations, "_last_fetch", {}):
+        assert await fetch_origin("/repo-a", MagicMock(), max_age=60)
+        assert await fetch_origin("/repo-a", MagicMock(), max_age=60)
+        assert await fetch_origin("/repo-b", MagicMock(), max_age=60)
+        assert await fetch_origin("/repo-a", MagicMock(), max_age=0)
+
+    assert calls == ["/repo-a", "/repo-b", "/repo-a"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_worktrees_share_one_clone(origin_repo, temp_dir_base):
+    """Work orders started together clone and fetch the base repository once"""
+    repository_url = str(origin_repo)
+    logger = MagicMock()
+
+    with patch.object(git_operations, "run_git", wraps=git_operations.run_git) as spy, \
+            patch.object(worktree_operations, "run_git", wraps=git_operations.run_git) as wt_spy:
+        results = await asyncio.gather(*(
+            worktree_operations.create_worktree(repository_url, f"wo-{i}", f"wo-{i}", logger)
+            for i in range(3)
+        ))
+
+    assert [error for _, error in results] == [None, None, None]
+    commands = [call.args[0][0] for call in wt_spy.call_args_list]
+    assert commands.count("clone") == 1
+    assert commands.count("worktree") == 3
+    # The clone is fresh, so the other work orders reuse it without fetching
+    assert not [call for call in spy.call_args_list if call.args[0][0] == "fetch"]
+
+    valid, error = await worktree_operations.validate_worktree(
+        repository_url, "wo-0", {"worktree_path": results[0][0]}
+    )
+    assert valid, error
+
+    removed, error = await worktree_operations.remove_worktree(repository_url, "wo-0", logger)
+    assert removed, error
+
+
+@pytest.mark.asyncio
+async def test_git_stats_queries_run_concurrently():
+    """Commit count and files changed are queried in parallel"""
+    from src.agent_work_orders.workflow_engine import workflow_orchestrator
+
+    in_flight = 0
+    peak = 0
+
+    async def slow_stat(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return 2
+
+    orchestrator = workflow_orchestrator.WorkflowOrchestrator.__new__(
+        workflow_orchestrator.WorkflowOrchestrator
+    )
+    with patch.object(workflow_orchestrator, "get_commit_count", AsyncMock(side_effect=slow_stat)), \
+            patch.object(workflow_orchestrator, "get_files_changed", AsyncMock(side_effect=slow_stat)):
+        stats = await orchestrator._calculate_git_stats("feat", "/repo")
+
+    assert stats == {"commit_count": 2, "files_changed": 2}
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_stats_helpers_count_branch_changes(origin_repo):
+    """Commit and file counts compare the branch against origin/main"""
+    clone = origin_repo.parent / "clone"
+    _git("clone", str(origin_repo), str(clone), cwd=origin_repo.parent)
+    _git("config", "user.email", "test@example.com", cwd=clone)
+    _git("config", "user.name", "Test", cwd=clone)
+    _git("checkout", "-b", "feat", cwd=clone)
+    (clone / "a.txt").write_text("a\n")
+    (clone / "b.txt").write_text("b\n")
+    _git("add", ".", cwd=clone)
+    _git("commit", "-m", "add files", cwd=clone)
+
+    assert await get_commit_count("feat", clone) == 1
+    assert await get_files_changed("feat", clone) == 2
@@ -307,3 +307,48 @@ def test_combined_filters():
     logs = buffer.get_logs("wo-123", level="info", step="execute", since=ts1)
     assert len(logs) == 1
     assert logs[0]["event"] == "event3"
+
+
+@pytest.mark.unit
+def test_get_logs_after_sequence():
+    """Entries are sequenced; retrieval returns only newer entries and a resume point"""
+    buffer = WorkOrderLogBuffer()
+    buffer.add_log("wo-123", "info", "event1", timestamp="2025-10-23T10:00:00Z")
+    buffer.add_log("wo-123", "error", "event2", timestamp="2025-10-23T10:00:00Z")
+    buffer.add_log("wo-123", "info", "event3", timestamp="2025-10-23T10:00:00Z")
+
+    first = buffer.get_logs("wo-123")[0]["sequence"]
+    logs, resume = buffer.get_logs_after("wo-123", first)
+    assert [log["event"] for log in logs] == ["event2", "event3"]
+    assert resume == buffer.get_latest_sequence("wo-123")
+
+    # Filtered-out entries still advance the resume point
+    logs, resume_errors = buffer.get_logs_after("wo-123", first, level="error")
+    assert [log["event"] for log in logs] == ["event2"]
+    assert resume_errors == resume
+
+    assert buffer.get_logs_after("wo-123", resume) == ([], resume)
+    assert buffer.get_logs_after("wo-missing", 5) == ([], 5)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_wait_for_logs_wakes_on_new_entry_from_thread():
+    """Waiters wake when any thread logs for their work order, and time out otherwise"""
+    import asyncio
+
+    buffer = WorkOrderLogBuffer()
+    assert await buffer.wait_for_logs("wo-123", 0, timeout=0.01) is False
+
+    waiter = asyncio.create_task(buffer.wait_for_logs("wo-123", 0, timeout=5))
+    await asyncio.sleep(0)
+    buffer.add_log("wo-other", "info", "unrelated")
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    thread = threading.Thread(target=buffer.add_log, args=("wo-123", "info", "threaded"))
+    thread.start()
+    thread.join()
+
+    assert await asyncio.wait_for(waiter, timeout=1) is True
+    assert not buffer._subscribers
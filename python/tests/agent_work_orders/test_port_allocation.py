@@ -8,6 +8,7 @@ from src.agent_work_orders.utils.port_allocation import (
     MAX_CONCURRENT_WORK_ORDERS,
     PORT_BASE,
     PORT_RANGE_SIZE,
+    PortLeaseRegistry,
     create_ports_env_file,
     find_available_port_range,
     get_port_range_for_work_order,
@@ -293,3 +294,63 @@ def test_max_concurrent_work_orders():
     for start, end in unique_ranges:
         assert PORT_BASE <= start < PORT_BASE + (MAX_CONCURRENT_WORK_ORDERS * PORT_RANGE_SIZE)
         assert PORT_BASE < end <= PORT_BASE + (MAX_CONCURRENT_WORK_ORDERS * PORT_RANGE_SIZE)
+
+
+@pytest.mark.unit
+def test_port_lease_registry_hands_out_disjoint_ranges(tmp_path):
+    """Leases never overlap, are stable per work order, and are persisted"""
+    state_file = tmp_path / "port_leases.json"
+    registry = PortLeaseRegistry(state_file)
+
+    with patch(
+        "src.agent_work_orders.utils.port_allocation.is_port_available",
+        return_value=True,
+    ) as probe:
+        # IDs that share a prefix map to the same deterministic slot
+        first = registry.acquire("sandbox-wo-aaaa")
+        second = registry.acquire("sandbox-wo-bbbb")
+        assert probe.call_count == 2 * PORT_RANGE_SIZE
+
+        assert first[:2] != second[:2]
+        assert registry.acquire("sandbox-wo-aaaa")[:2] == first[:2]
+
+        restored = PortLeaseRegistry(state_file)
+        assert restored.leases() == registry.leases()
+
+        registry.release("sandbox-wo-aaaa")
+        third = registry.acquire("sandbox-wo-cccc")
+        assert third[:2] == first[:2]
+
+
+@pytest.mark.unit
+def test_port_lease_registry_skips_busy_slots_and_reconciles(tmp_path):
+    """Slots held by other processes are skipped; stale leases are reclaimed"""
+    registry = PortLeaseRegistry()
+    preferred_start, preferred_end = get_port_range_for_work_order("wo-test123")
+
+    with patch(
+        "src.agent_work_orders.utils.port_allocation.is_port_available",
+        side_effect=lambda port: not preferred_start <= port <= preferred_end,
+    ):
+        start, _, available = registry.acquire("wo-test123")
+        assert start != preferred_start
+        assert len(available) == PORT_RANGE_SIZE
+
+        registry.acquire("wo-other")
+
+    assert registry.reconcile(["wo-other"]) == ["wo-test123"]
+    assert list(registry.leases()) == ["wo-other"]
+
+
+@pytest.mark.unit
+def test_port_lease_registry_exhausted():
+    """RuntimeError once every slot is leased"""
+    registry = PortLeaseRegistry()
+    with patch(
+        "src.agent_work_orders.utils.port_allocation.is_port_available",
+        return_value=True,
+    ):
+        for i in range(MAX_CONCURRENT_WORK_ORDERS):
+            registry.acquire(f"wo-{i}")
+        with pytest.raises(RuntimeError, match="No suitable port range found"):
+            registry.acquire("wo-extra")
@@ -44,6 +44,19 @@ def test_server_root_endpoint():
     assert "api" in data
 
 
+@pytest.mark.unit
+def test_server_metrics_endpoint():
+    """Test metrics endpoint serves the Prometheus text format"""
+    from src.agent_work_orders.server import app
+
+    client = TestClient(app)
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE archon_event_loop_lag_seconds histogram" in response.text
+
+
 @pytest.mark.unit
 @patch("src.agent_work_orders.server.subprocess.run")
 @patch.dict("os.environ", {"ENABLE_AGENT_WORK_ORDERS": "true"})
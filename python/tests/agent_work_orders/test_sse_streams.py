@@ -332,3 +332,30 @@ async def test_stream_no_duplicate_events():
     log2 = json.loads(events[1]["data"])
     assert log1["event"] == "event1"
     assert log2["event"] == "event2"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_delivers_entries_sharing_a_timestamp():
+    """New entries with identical timestamps are streamed once each, tagged with their sequence"""
+    buffer = WorkOrderLogBuffer()
+    ts = "2025-10-23T10:00:00Z"
+    buffer.add_log("wo-123", "info", "event1", timestamp=ts)
+
+    events = []
+
+    async def consume_stream():
+        async for event in stream_work_order_logs("wo-123", buffer):
+            events.append(event)
+            if len(events) >= 3:
+                break
+
+    async def add_new_logs():
+        await asyncio.sleep(0.01)
+        buffer.add_log("wo-123", "info", "event2", timestamp=ts)
+        buffer.add_log("wo-123", "info", "event3", timestamp=ts)
+
+    await asyncio.wait_for(asyncio.gather(consume_stream(), add_new_logs()), timeout=5)
+
+    assert [json.loads(e["data"])["event"] for e in events] == ["event1", "event2", "event3"]
+    assert [int(e["id"]) for e in events] == sorted(int(e["id"]) for e in events)
@@ -13,6 +13,8 @@ from src.agent_work_orders.models import (
     StepHistory,
     WorkflowStep,
 )
+from src.agent_work_orders.state_manager import file_state_repository
+from src.agent_work_orders.state_manager.file_state_repository import FileStateRepository
 from src.agent_work_orders.state_manager.work_order_repository import (
     WorkOrderRepository,
 )
@@ -313,3 +315,233 @@ async def test_update_step_history():
     retrieved = await repo.get_step_history("wo-test123")
     assert retrieved is not None
     assert len(retrieved.steps) == 2
+
+
+def _file_state(work_order_id: str) -> AgentWorkOrderState:
+    return AgentWorkOrderState(
+        agent_work_order_id=work_order_id,
+        repository_url="https://github.com/owner/repo",
+        sandbox_identifier=f"sandbox-{work_order_id}",
+        git_branch_name=None,
+        agent_session_id=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_file_repository_indexes_by_status_and_survives_restart(tmp_path):
+    """Filtered lists come from the status index; a new instance replays the journal"""
+    repo = FileStateRepository(str(tmp_path))
+    for i in range(3):
+        await repo.create(_file_state(f"wo-{i}"), {
+            "status": AgentWorkOrderStatus.PENDING,
+            "created_at": datetime(2025, 1, 1, 0, 0, 3 - i),
+        })
+    await repo.update_status("wo-1", AgentWorkOrderStatus.RUNNING)
+    await repo.update_git_branch("wo-1", "feat-x")
+    history = StepHistory(agent_work_order_id="wo-1")
+    history.steps.append(StepExecutionResult(
+        step=WorkflowStep.CREATE_BRANCH, agent_name="BranchCreator", success=True, duration_seconds=1.0
+    ))
+    await repo.save_step_history("wo-1", history)
+    await repo.delete("wo-2")
+
+    pending = await repo.list(status_filter=AgentWorkOrderStatus.PENDING)
+    assert [state.agent_work_order_id for state, _ in pending] == ["wo-0"]
+
+    await repo.close()
+    reopened = FileStateRepository(str(tmp_path))
+
+    assert [s.agent_work_order_id for s, _ in await reopened.list()] == ["wo-1", "wo-0"]
+    running = await reopened.list(status_filter=AgentWorkOrderStatus.RUNNING)
+    assert running[0][0].git_branch_name == "feat-x"
+    assert running[0][1]["status"] == "running"
+    assert len((await reopened.get_step_history("wo-1")).steps) == 1
+    assert await reopened.get("wo-2") is None
+    await reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_file_repository_compacts_journal_atomically(tmp_path, monkeypatch):
+    """Compaction writes snapshot files and clears the journal; torn lines are skipped"""
+    monkeypatch.setattr(file_state_repository, "JOURNAL_COMPACTION_THRESHOLD", 3)
+    repo = FileStateRepository(str(tmp_path))
+
+    await repo.create(_file_state("wo-1"), {"status": AgentWorkOrderStatus.PENDING})
+    await repo.update_status("wo-1", AgentWorkOrderStatus.RUNNING)
+    await repo.update_session_id("wo-1", "session-1")
+    await repo._compaction_task
+
+    assert (tmp_path / "wo-1.json").exists()
+    assert not (tmp_path / "journal.jsonl.compacting").exists()
+    assert (tmp_path / "journal.jsonl").read_text() == ""
+
+    await repo.update_status("wo-1", AgentWorkOrderStatus.COMPLETED)
+    repo._journal.write('{"op": "update", "id": "wo-1", "metad')
+    repo._journal.flush()
+
+    reopened = FileStateRepository(str(tmp_path))
+    state, metadata = await reopened.get("wo-1")
+    assert state.agent_session_id == "session-1"
+    assert metadata["status"] == "completed"
+
+    # Appends after the torn line start on a fresh line
+    await reopened.update_git_branch("wo-1", "feat-y")
+    repo._journal.close()
+    await reopened.close()
+    final = FileStateRepository(str(tmp_path))
+    state, _ = await final.get("wo-1")
+    assert state.git_branch_name == "feat-y"
+    await final.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_compaction_is_not_retried_on_every_write(tmp_path, monkeypatch):
+    """After a failed compaction, writes wait out the retry delay before compacting again"""
+    monkeypatch.setattr(file_state_repository, "JOURNAL_COMPACTION_THRESHOLD", 2)
+    repo = FileStateRepository(str(tmp_path))
+    attempts = []
+
+    def fail_snapshots(snapshots, deleted):
+        attempts.append(len(snapshots))
+        raise OSError("No space left on device")
+
+    repo._write_snapshots = fail_snapshots
+
+    await repo.create(_file_state("wo-1"), {"status": AgentWorkOrderStatus.PENDING})
+    await repo.update_status("wo-1", AgentWorkOrderStatus.RUNNING)
+    await repo._compaction_task
+    for i in range(5):
+        await repo.update_session_id("wo-1", f"session-{i}")
+    await repo._compaction_task
+
+    assert len(attempts) == 1
+    assert (tmp_path / "journal.jsonl.compacting").exists()
+
+    del repo._write_snapshots
+    repo._compaction_retry_at = 0.0
+    await repo.update_session_id("wo-1", "session-final")
+    await repo._compaction_task
+
+    assert (tmp_path / "wo-1.json").exists()
+    await repo.close()
+
+
+def _step(step: WorkflowStep) -> StepExecutionResult:
+    return StepExecutionResult(step=step, agent_name="agent", success=True, duration_seconds=1.0)
+
+
+@pytest.mark.asyncio
+async def test_step_history_is_appended_and_fetched_incrementally(tmp_path):
+    """Each save journals only new steps; after_step returns only later steps"""
+    import json
+
+    repo = FileStateRepository(str(tmp_path))
+    await repo.create(_file_state("wo-1"), {"status": AgentWorkOrderStatus.RUNNING})
+    history = StepHistory(agent_work_order_id="wo-1")
+    for step in (WorkflowStep.CREATE_BRANCH, WorkflowStep.PLANNING, WorkflowStep.EXECUTE):
+        history.steps.append(_step(step))
+        await repo.save_step_history("wo-1", history)
+
+    entries = [json.loads(line) for line in (tmp_path / "journal.jsonl").read_text().splitlines()]
+    appended = [len(e["steps"]) for e in entries if e["op"] == "append_steps"]
+    assert appended == [1, 1, 1]
+
+    later = await repo.get_step_history("wo-1", after_step=0)
+    assert [s.step for s in later.steps] == [WorkflowStep.PLANNING, WorkflowStep.EXECUTE]
+    await repo.close()
+
+    memory_repo = WorkOrderRepository()
+    await memory_repo.save_step_history("wo-1", history)
+    assert (await memory_repo.get_step_history("wo-1", after_step=2)).steps == []
+
+
+@pytest.mark.asyncio
+async def test_supabase_step_history_upserts_only_new_steps():
+    """The Supabase repository never deletes the whole history and writes new steps only"""
+    from unittest.mock import MagicMock
+
+    from src.agent_work_orders.state_manager.supabase_repository import (
+        SupabaseWorkOrderRepository,
+    )
+
+    repo = SupabaseWorkOrderRepository.__new__(SupabaseWorkOrderRepository)
+    repo.client = MagicMock()
+    repo.steps_table_name = "archon_agent_work_order_steps"
+    repo._persisted_step_counts = {}
+    repo._step_upsert_supported = True
+    repo._logger = MagicMock()
+    table = repo.client.table.return_value
+
+    history = StepHistory(agent_work_order_id="wo-1", steps=[_step(WorkflowStep.CREATE_BRANCH)])
+    await repo.save_step_history("wo-1", history)
+    history.steps.append(_step(WorkflowStep.PLANNING))
+    await repo.save_step_history("wo-1", history)
+
+    upserts = [call.args[0] for call in table.upsert.call_args_list]
+    assert [[row["step_order"] for row in rows] for rows in upserts] == [[0], [1]]
+    assert table.upsert.call_args.kwargs["on_conflict"] == "agent_work_order_id,step_order"
+    # Only the first save trims stale rows, and only beyond the saved history
+    table.delete.return_value.eq.return_value.gte.assert_called_once_with("step_order", 1)
+
+
+@pytest.mark.asyncio
+async def test_supabase_step_history_without_unique_index_rewrites_history():
+    """Without the step_order unique index the history is deleted and re-inserted"""
+    from unittest.mock import MagicMock
+
+    from postgrest.exceptions import APIError
+
+    from src.agent_work_orders.state_manager.supabase_repository import (
+        SupabaseWorkOrderRepository,
+    )
+
+    repo = SupabaseWorkOrderRepository.__new__(SupabaseWorkOrderRepository)
+    repo.client = MagicMock()
+    repo.steps_table_name = "archon_agent_work_order_steps"
+    repo._persisted_step_counts = {}
+    repo._step_upsert_supported = True
+    repo._logger = MagicMock()
+    table = repo.client.table.return_value
+    table.upsert.return_value.execute.side_effect = APIError({
+        "code": "42P10",
+        "message": "there is no unique or exclusion constraint matching the ON CONFLICT specification",
+    })
+
+    history = StepHistory(agent_work_order_id="wo-1", steps=[_step(WorkflowStep.CREATE_BRANCH)])
+    await repo.save_step_history("wo-1", history)
+    history.steps.append(_step(WorkflowStep.PLANNING))
+    await repo.save_step_history("wo-1", history)
+
+    # The upsert is tried once; every save then rewrites the full history
+    assert table.upsert.call_count == 1
+    inserts = [call.args[0] for call in table.insert.call_args_list]
+    assert [[row["step_order"] for row in rows] for rows in inserts] == [[0], [0, 1]]
+    assert table.delete.return_value.eq.call_count == 2
+    assert repo._persisted_step_counts["wo-1"] == 2
+
+
+@pytest.mark.asyncio
+async def test_supabase_step_history_surfaces_other_upsert_errors():
+    """Other upsert failures are raised, not retried as a delete and insert"""
+    from unittest.mock import MagicMock
+
+    from src.agent_work_orders.state_manager.supabase_repository import (
+        SupabaseWorkOrderRepository,
+    )
+
+    repo = SupabaseWorkOrderRepository.__new__(SupabaseWorkOrderRepository)
+    repo.client = MagicMock()
+    repo.steps_table_name = "archon_agent_work_order_steps"
+    repo._persisted_step_counts = {}
+    repo._step_upsert_supported = True
+    repo._logger = MagicMock()
+    table = repo.client.table.return_value
+    table.upsert.return_value.execute.side_effect = Exception("connection reset")
+
+    history = StepHistory(agent_work_order_id="wo-1", steps=[_step(WorkflowStep.CREATE_BRANCH)])
+    with pytest.raises(Exception, match="connection reset"):
+        await repo.save_step_history("wo-1", history)
+
+    table.insert.assert_not_called()
+    table.delete.assert_not_called()
+    assert repo._step_upsert_supported is True
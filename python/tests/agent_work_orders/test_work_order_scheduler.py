@@ -0,0 +1,104 @@
+"""Tests for the work order admission scheduler"""
+
+import asyncio
+
+import pytest
+
+from src.agent_work_orders.workflow_engine.work_order_scheduler import (
+    QueueFullError,
+    WorkOrderScheduler,
+)
+
+
+class _Runs:
+    """Records started work orders and lets tests finish them"""
+
+    def __init__(self):
+        self.started: list[str] = []
+        self.gates: dict[str, asyncio.Event] = {}
+
+    def factory(self, work_order_id: str):
+        gate = self.gates.setdefault(work_order_id, asyncio.Event())
+
+        async def run():
+            self.started.append(work_order_id)
+            await gate.wait()
+
+        return run
+
+    async def finish(self, work_order_id: str):
+        self.gates[work_order_id].set()
+        # Let the task complete and the scheduler dispatch the next one
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_and_queue_drains():
+    """Work orders beyond the limit wait and start as slots free up"""
+    scheduler = WorkOrderScheduler(max_concurrent=2, max_queued=10)
+    runs = _Runs()
+
+    positions = [
+        scheduler.submit(f"wo-{i}", "https://github.com/a/repo", runs.factory(f"wo-{i}"))
+        for i in range(4)
+    ]
+    await asyncio.sleep(0)
+
+    assert positions == [None, None, 1, 2]
+    assert runs.started == ["wo-0", "wo-1"]
+    assert scheduler.snapshot()["queued"] == 2
+
+    await runs.finish("wo-0")
+    assert runs.started == ["wo-0", "wo-1", "wo-2"]
+    assert scheduler.queue_position("wo-3") == 1
+
+    for work_order_id in ("wo-1", "wo-2", "wo-3"):
+        await runs.finish(work_order_id)
+    assert scheduler.running_count == 0
+
+
+@pytest.mark.asyncio
+async def test_priority_then_repository_fairness():
+    """Higher priority goes first; equal priorities alternate between repositories"""
+    scheduler = WorkOrderScheduler(max_concurrent=1, max_queued=10)
+    runs = _Runs()
+
+    scheduler.submit("wo-busy", "repo-a", runs.factory("wo-busy"))
+    scheduler.submit("wo-a1", "repo-a", runs.factory("wo-a1"))
+    scheduler.submit("wo-a2", "repo-a", runs.factory("wo-a2"))
+    scheduler.submit("wo-b1", "repo-b", runs.factory("wo-b1"))
+    scheduler.submit("wo-urgent", "repo-a", runs.factory("wo-urgent"), priority=5)
+
+    assert scheduler.queue_position("wo-urgent") == 1
+    # repo-a already holds the running slot, so repo-b's work order comes next
+    assert scheduler.queue_position("wo-b1") == 2
+    assert scheduler.queue_positions() == {"wo-urgent": 1, "wo-b1": 2, "wo-a1": 3, "wo-a2": 4}
+
+    order = ["wo-busy", "wo-urgent", "wo-b1", "wo-a1", "wo-a2"]
+    await asyncio.sleep(0)
+    for work_order_id in order:
+        await runs.finish(work_order_id)
+
+    assert runs.started == order
+
+
+@pytest.mark.asyncio
+async def test_cancel_removes_queued_work_order():
+    """Cancelled work orders never start and free their queue slot"""
+    scheduler = WorkOrderScheduler(max_concurrent=1, max_queued=1)
+    runs = _Runs()
+
+    scheduler.submit("wo-1", "repo", runs.factory("wo-1"))
+    scheduler.submit("wo-2", "repo", runs.factory("wo-2"))
+    with pytest.raises(QueueFullError):
+        scheduler.submit("wo-3", "repo", runs.factory("wo-3"))
+
+    assert scheduler.cancel("wo-2") is True
+    assert scheduler.cancel("wo-1") is False  # running, not queued
+    assert scheduler.queue_position("wo-2") is None
+    assert scheduler.can_admit()
+
+    await asyncio.sleep(0)
+    await runs.finish("wo-1")
+    assert runs.started == ["wo-1"]
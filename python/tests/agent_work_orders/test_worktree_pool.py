@@ -0,0 +1,87 @@
+"""Tests for the warm worktree pool"""
+
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.agent_work_orders.config import config
+from src.agent_work_orders.sandbox_manager.worktree_pool import WorktreePool
+from src.agent_work_orders.utils import git_operations
+from src.agent_work_orders.utils.worktree_operations import create_worktree, get_base_repo_path
+
+
+def _git(*args: str, cwd) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repository_url(tmp_path, monkeypatch):
+    """A local origin repository, with work directories under tmp_path"""
+    monkeypatch.setattr(config, "TEMP_DIR_BASE", str(tmp_path / "work"))
+    monkeypatch.setattr(git_operations, "_last_fetch", {})
+    monkeypatch.setattr(git_operations, "_repository_locks", {})
+
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    _git("init", "-b", "main", cwd=origin)
+    _git("config", "user.email", "test@example.com", cwd=origin)
+    _git("config", "user.name", "Test", cwd=origin)
+    (origin / "README.md").write_text("hello\n")
+    _git("add", "README.md", cwd=origin)
+    _git("commit", "-m", "initial", cwd=origin)
+    return str(origin)
+
+
+async def _settle(pool: WorktreePool, repository_url: str) -> None:
+    task = pool._warming.get(repository_url)
+    if task:
+        await task
+
+
+@pytest.mark.asyncio
+async def test_first_use_warms_pool_and_next_claim_is_instant(repository_url):
+    """The first work order falls back to a fresh worktree; the next one claims a warm one"""
+    pool = WorktreePool(size=1)
+
+    assert await pool.claim(repository_url, "wo-1", "wo-1") is None
+    await _settle(pool, repository_url)
+    assert pool.idle_count(repository_url) == 1
+
+    path = await pool.claim(repository_url, "wo-2", "wo-2")
+
+    assert path is not None and path.endswith(os.path.join("trees", "wo-2"))
+    assert _git("branch", "--show-current", cwd=path) == "wo-2"
+    assert Path(path, "README.md").read_text() == "hello\n"
+
+    # The claimed worktree is replaced in the background
+    await _settle(pool, repository_url)
+    assert pool.idle_count(repository_url) == 1
+
+
+@pytest.mark.asyncio
+async def test_release_resets_worktree_and_restart_adopts_it(repository_url):
+    """Released worktrees are cleaned for reuse and survive a service restart"""
+    path, error = await create_worktree(repository_url, "wo-1", "wo-1", MagicMock())
+    assert error is None
+    Path(path, "README.md").write_text("changed\n")
+    Path(path, "scratch.txt").write_text("tmp\n")
+
+    pool = WorktreePool(size=1)
+    assert await pool.release(repository_url, "wo-1") is True
+    assert not os.path.exists(path)
+
+    pooled_path = pool._idle[repository_url][0]
+    assert Path(pooled_path, "README.md").read_text() == "hello\n"
+    assert not Path(pooled_path, "scratch.txt").exists()
+    # The temporary branch is no longer checked out, so it can be deleted
+    _git("branch", "-D", "wo-1", cwd=get_base_repo_path(repository_url))
+
+    restarted = WorktreePool(size=1)
+    restarted.warm(repository_url)
+    await _settle(restarted, repository_url)
+    assert list(restarted._idle[repository_url]) == [pooled_path]
@@ -56,6 +56,19 @@ def ensure_test_environment():
     yield
     
 
+@pytest.fixture(autouse=True)
+def reset_change_versions():
+    """Start every test with empty project/task change counters and caches."""
+    from src.server.services.projects.task_service import TaskService
+    from src.server.services.projects.versioning_service import VersioningService
+    from src.server.utils.etag_utils import change_versions
+
+    change_versions.reset()
+    TaskService._task_counts_cache = None
+    VersioningService._latest_content.clear()
+    yield
+
+
 @pytest.fixture(autouse=True)
 def prevent_real_db_calls():
     """Automatically prevent any real database calls in all tests."""
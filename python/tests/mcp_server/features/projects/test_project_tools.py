@@ -149,6 +149,34 @@ async def test_find_projects_success(mock_mcp, mock_context):
         assert result_data["count"] == 2
 
 
+@pytest.mark.asyncio
+async def test_find_projects_pushes_pagination_to_server(mock_mcp, mock_context):
+    """Test list mode requests one lightweight page and reports the server total."""
+    register_project_tools(mock_mcp)
+    find_projects = mock_mcp._tools.get("find_projects")
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "projects": [{"id": "proj-3", "title": "Auth", "created_at": "2024-01-03"}],
+        "count": 1,
+        "total": 21,
+    }
+
+    with patch("src.mcp_server.features.projects.project_tools.httpx.AsyncClient") as mock_client:
+        mock_async_client = AsyncMock()
+        mock_async_client.get.return_value = mock_response
+        mock_client.return_value.__aenter__.return_value = mock_async_client
+
+        result = await find_projects(mock_context, query="auth", page=3, per_page=10)
+
+        result_data = json.loads(result)
+        assert result_data["total"] == 21
+        assert result_data["count"] == 1
+        params = mock_async_client.get.call_args[1]["params"]
+        assert params == {"include_content": False, "limit": 10, "offset": 20, "q": "auth"}
+
+
 @pytest.mark.asyncio
 async def test_get_project_not_found(mock_mcp, mock_context):
     """Test getting a non-existent project."""
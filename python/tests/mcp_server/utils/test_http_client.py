@@ -0,0 +1,73 @@
+"""Unit tests for the shared MCP HTTP client pool."""
+
+import httpx
+import pytest
+
+from src.mcp_server.utils.http_client import (
+    HTTPClientPool,
+    PooledClient,
+    get_http_client,
+    set_http_client_pool,
+)
+
+
+@pytest.fixture
+def pool():
+    """Install a pool backed by a mock transport for the duration of a test."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.path == "/boom":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"path": request.url.path})
+
+    pool = HTTPClientPool(limits=httpx.Limits(max_connections=5, max_keepalive_connections=2))
+    pool.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    pool.seen = seen
+    set_http_client_pool(pool)
+    yield pool
+    set_http_client_pool(None)
+
+
+@pytest.mark.asyncio
+async def test_get_http_client_reuses_shared_pool(pool):
+    """Tool calls share one client and report usage through pool stats."""
+    timeout = httpx.Timeout(3.0)
+
+    async with get_http_client(timeout=timeout) as client:
+        assert isinstance(client, PooledClient)
+        response = await client.get("http://archon-server/api/projects")
+    async with get_http_client() as client:
+        await client.post("http://archon-server/api/tasks", json={"title": "x"})
+
+    assert response.json() == {"path": "/api/projects"}
+    assert [r.method for r in pool.seen] == ["GET", "POST"]
+    assert pool.seen[0].extensions["timeout"]["read"] == 3.0
+
+    stats = pool.get_stats()
+    assert stats["requests_total"] == 2
+    assert stats["errors_total"] == 0
+    assert stats["in_flight"] == 0
+    assert stats["max_connections"] == 5
+    assert stats["max_keepalive_connections"] == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_counts_transport_errors(pool):
+    """Failed requests are counted and still propagate to the tool."""
+    async with get_http_client() as client:
+        with pytest.raises(httpx.ConnectError):
+            await client.get("http://archon-server/boom")
+
+    assert pool.get_stats()["errors_total"] == 1
+    assert pool.get_stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_http_client_without_pool_uses_short_lived_client():
+    """Outside a running server a regular client is created per call."""
+    set_http_client_pool(None)
+    async with get_http_client() as client:
+        assert isinstance(client, httpx.AsyncClient)
+    assert client.is_closed
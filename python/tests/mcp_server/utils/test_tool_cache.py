@@ -0,0 +1,137 @@
+"""Unit tests for the MCP read-through tool cache."""
+
+import json
+
+import httpx
+import pytest
+
+from src.mcp_server.utils.tool_cache import (
+    ToolResponseCache,
+    cached_get,
+    invalidates_tool_cache,
+    set_tool_cache,
+)
+
+
+class FakeClient:
+    """Minimal client recording GETs and answering with a versioned ETag."""
+
+    def __init__(self):
+        self.calls = []
+        self.version = 1
+
+    async def get(self, url, params=None, headers=None):
+        self.calls.append({"url": url, "params": params, "headers": headers})
+        etag = f'"v{self.version}"'
+        request = httpx.Request("GET", url)
+        if headers and headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag}, request=request)
+        return httpx.Response(
+            200, json={"version": self.version}, headers={"ETag": etag}, request=request
+        )
+
+
+@pytest.fixture
+def cache():
+    cache = ToolResponseCache(ttl_seconds=60, max_entries=2)
+    set_tool_cache(cache)
+    yield cache
+    set_tool_cache(None)
+
+
+@pytest.mark.asyncio
+async def test_identical_calls_hit_cache_regardless_of_param_order(cache):
+    """Repeated calls with the same normalized arguments skip the HTTP round trip."""
+    client = FakeClient()
+
+    await cached_get(client, "find_tasks", "http://api/tasks", params={"a": 1, "b": 2})
+    response = await cached_get(
+        client, "find_tasks", "http://api/tasks", params={"b": 2, "a": 1, "q": None}
+    )
+
+    assert response.json() == {"version": 1}
+    assert len(client.calls) == 1
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_revalidate_with_etag(cache):
+    """Stale entries are refreshed with If-None-Match; a 304 reuses the cached body."""
+    client = FakeClient()
+    cache.ttl_seconds = 0
+
+    await cached_get(client, "find_projects", "http://api/projects")
+    response = await cached_get(client, "find_projects", "http://api/projects")
+
+    assert client.calls[1]["headers"] == {"If-None-Match": '"v1"'}
+    assert response.status_code == 200
+    assert response.json() == {"version": 1}
+    assert cache.get_stats()["revalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_revalidation_refetches_instead_of_returning_304(cache):
+    """A write that lands while If-None-Match is in flight must not leak the 304 to the tool."""
+    client = FakeClient()
+    cache.ttl_seconds = 0
+    await cached_get(client, "find_tasks", "http://api/tasks")
+
+    class RacingClient(FakeClient):
+        async def get(self, url, params=None, headers=None):
+            if headers:
+                cache.invalidate()
+            return await client.get(url, params=params, headers=headers)
+
+    response = await cached_get(RacingClient(), "find_tasks", "http://api/tasks")
+
+    assert response.status_code == 200
+    assert response.json() == {"version": 1}
+    assert client.calls[1]["headers"] == {"If-None-Match": '"v1"'}
+    assert client.calls[2]["headers"] is None
+    assert cache.get_stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_successful_manage_tool_invalidates_cache(cache):
+    """Writes reported as successful clear cached reads; failed writes do not."""
+    client = FakeClient()
+    await cached_get(client, "find_tasks", "http://api/tasks")
+
+    @invalidates_tool_cache
+    async def manage_task(ok: bool) -> str:
+        return json.dumps({"success": ok})
+
+    await manage_task(False)
+    assert cache.get_stats()["entries"] == 1
+
+    await manage_task(True)
+    client.version = 2
+    response = await cached_get(client, "find_tasks", "http://api/tasks")
+
+    assert response.json() == {"version": 2}
+    assert cache.get_stats()["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded(cache):
+    """The least recently used entry is evicted beyond max_entries."""
+    client = FakeClient()
+    for path in ("a", "b", "c"):
+        await cached_get(client, "rag_list_pages_for_source", f"http://api/{path}")
+
+    assert cache.get_stats()["entries"] == 2
+    await cached_get(client, "rag_list_pages_for_source", "http://api/a")
+    assert len(client.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_cached_get_without_cache_calls_through():
+    """Outside a running server requests go straight to the client."""
+    set_tool_cache(None)
+    client = FakeClient()
+
+    await cached_get(client, "find_tasks", "http://api/tasks")
+    await cached_get(client, "find_tasks", "http://api/tasks")
+
+    assert len(client.calls) == 2
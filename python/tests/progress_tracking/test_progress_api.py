@@ -256,4 +256,34 @@ class TestProgressAPI:
             response = client.get(f"/api/progress/test-{case['type']}")
             
             assert response.status_code == status.HTTP_200_OK
-            mock_create_response.assert_called_with(case["type"], mock_progress_data)
\ No newline at end of file
+            mock_create_response.assert_called_with(case["type"], mock_progress_data)
+    def test_stream_progress_not_found(self, client):
+        """Streaming an unknown operation returns 404."""
+        response = client.get("/api/progress/does-not-exist/stream")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_stream_progress_emits_sequenced_event_and_closes_on_terminal_state(self):
+        """The SSE stream sends the current state with its sequence id and ends when complete."""
+        import httpx
+        from fastapi import FastAPI
+
+        app = FastAPI()
+        app.include_router(router)
+
+        tracker = ProgressTracker("stream-123", operation_type="crawl")
+        await tracker.start({"url": "https://example.com"})
+        await tracker.complete({"chunks_stored": 5})
+        sequence = ProgressTracker.get_sequence("stream-123")
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+            response = await async_client.get("/api/progress/stream-123/stream")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/event-stream")
+        body = response.text
+        assert f"id: {sequence}" in body
+        assert "event: progress" in body
+        assert '"status": "completed"' in body
@@ -223,4 +223,63 @@ class TestProgressTracker:
         # Clearing one shouldn't affect the other
         ProgressTracker.clear_progress("tracker-1")
         assert ProgressTracker.get_progress("tracker-1") is None
-        assert ProgressTracker.get_progress("tracker-2") is not None
\ No newline at end of file
+        assert ProgressTracker.get_progress("tracker-2") is not None
+
+class TestProgressSubscriptions:
+    """Test suite for push-based progress subscriptions"""
+
+    @pytest.mark.asyncio
+    async def test_subscriber_receives_current_state_immediately(self):
+        """A new subscriber is primed with the latest state"""
+        tracker = ProgressTracker("sub-1", operation_type="crawl")
+        await tracker.update(status="crawling", progress=10, log="Crawling")
+
+        subscription = ProgressTracker.subscribe("sub-1")
+        try:
+            sequence, state = await subscription.next(-1, timeout=1)
+            assert sequence == ProgressTracker.get_sequence("sub-1")
+            assert state["progress"] == 10
+        finally:
+            ProgressTracker.unsubscribe("sub-1", subscription)
+
+    @pytest.mark.asyncio
+    async def test_rapid_updates_are_coalesced(self):
+        """Only the most recent state is delivered to a slow consumer"""
+        tracker = ProgressTracker("sub-2", operation_type="crawl")
+        subscription = ProgressTracker.subscribe("sub-2")
+        try:
+            for pct in (10, 20, 30):
+                await tracker.update(status="crawling", progress=pct, log=f"{pct}%")
+
+            sequence, state = await subscription.next(-1, timeout=1)
+            assert state["progress"] == 30
+            assert sequence == ProgressTracker.get_sequence("sub-2")
+        finally:
+            ProgressTracker.unsubscribe("sub-2", subscription)
+
+    @pytest.mark.asyncio
+    async def test_resume_from_sequence_waits_for_newer_state(self):
+        """Consumers that already saw the latest sequence block until a new update"""
+        tracker = ProgressTracker("sub-3", operation_type="crawl")
+        await tracker.update(status="crawling", progress=10, log="Crawling")
+        seen = ProgressTracker.get_sequence("sub-3")
+
+        subscription = ProgressTracker.subscribe("sub-3")
+        try:
+            assert await subscription.next(seen, timeout=0.05) is None
+
+            await tracker.update(status="crawling", progress=40, log="More crawling")
+            sequence, state = await subscription.next(seen, timeout=1)
+            assert sequence == seen + 1
+            assert state["progress"] == 40
+        finally:
+            ProgressTracker.unsubscribe("sub-3", subscription)
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_removes_subscriber(self):
+        """Unsubscribing cleans up the subscriber registry"""
+        ProgressTracker("sub-4", operation_type="crawl")
+        subscription = ProgressTracker.subscribe("sub-4")
+        ProgressTracker.unsubscribe("sub-4", subscription)
+
+        assert "sub-4" not in ProgressTracker._subscribers
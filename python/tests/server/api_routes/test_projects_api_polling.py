@@ -7,6 +7,8 @@ import pytest
 from fastapi import HTTPException, Response
 from fastapi.testclient import TestClient
 
+from src.server.utils.etag_utils import change_versions
+
 
 @pytest.fixture
 def test_client():
@@ -114,7 +116,8 @@ class TestProjectsListPolling:
             await list_projects(response=response1, if_none_match=None)
             etag1 = response1.headers["ETag"]
             
-            # Modified data
+            # Modified data (writes go through ProjectService, which bumps the counter)
+            change_versions.bump("projects")
             projects2 = [{"id": "proj-1", "name": "Project 1 Updated"}]
             mock_proj_service.list_projects.return_value = (True, {"projects": projects2})
             mock_source_service.format_projects_with_sources.return_value = projects2
@@ -126,6 +129,41 @@ class TestProjectsListPolling:
             assert etag1 != etag2
             assert response2.status_code != 304
 
+    @pytest.mark.asyncio
+    async def test_list_projects_304_skips_query_when_unchanged(self):
+        """A matching ETag is answered from the change counters without querying."""
+        from src.server.api_routes.projects_api import list_projects
+
+        with patch("src.server.api_routes.projects_api.ProjectService") as mock_proj_class, \
+             patch("src.server.api_routes.projects_api.SourceLinkingService") as mock_source_class:
+
+            mock_proj_service = MagicMock()
+            mock_proj_class.return_value = mock_proj_service
+            mock_source_service = MagicMock()
+            mock_source_class.return_value = mock_source_service
+
+            projects = [{"id": "proj-1", "name": "Project 1"}]
+            mock_proj_service.list_projects.return_value = (True, {"projects": projects})
+            mock_source_service.format_projects_with_sources.return_value = projects
+
+            response1 = Response()
+            await list_projects(response=response1, if_none_match=None)
+            etag = response1.headers["ETag"]
+
+            response2 = Response()
+            result = await list_projects(response=response2, if_none_match=etag)
+            assert result is None
+            assert response2.status_code == 304
+            assert response2.headers["ETag"] == etag
+            assert mock_proj_service.list_projects.call_count == 1
+
+            # After a write the data is re-read and compared again
+            change_versions.bump("projects")
+            response3 = Response()
+            await list_projects(response=response3, if_none_match=etag)
+            assert response3.status_code == 304
+            assert mock_proj_service.list_projects.call_count == 2
+
     def test_list_projects_http_with_etag(self, test_client):
         """Test projects endpoint via HTTP with ETag support."""
         with patch("src.server.api_routes.projects_api.ProjectService") as mock_proj_class, \
@@ -0,0 +1,43 @@
+"""Unit tests for deferred imports of heavy dependencies."""
+
+import sys
+
+import pytest
+
+from src.server.config.lazy_imports import is_available, lazy_import
+
+
+@pytest.fixture
+def heavy_package(tmp_path, monkeypatch):
+    """A throwaway package that records when its module code runs."""
+    package = tmp_path / "archon_heavy_fixture"
+    package.mkdir()
+    (package / "__init__.py").write_text("import builtins\nbuiltins.archon_heavy_loads += 1\nVALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr("builtins.archon_heavy_loads", 0, raising=False)
+    yield "archon_heavy_fixture"
+    sys.modules.pop("archon_heavy_fixture", None)
+
+
+def test_module_code_runs_on_first_attribute_access(heavy_package):
+    import builtins
+
+    module = lazy_import(heavy_package)
+
+    assert builtins.archon_heavy_loads == 0
+    assert sys.modules[heavy_package] is module
+    assert module.VALUE == 42
+    assert builtins.archon_heavy_loads == 1
+    assert lazy_import(heavy_package) is module
+    assert builtins.archon_heavy_loads == 1
+
+
+def test_missing_package_is_reported_without_raising():
+    assert lazy_import("archon_package_that_does_not_exist") is None
+    assert not is_available("archon_package_that_does_not_exist")
+    assert is_available("json")
+
+
+def test_only_top_level_packages_are_deferred():
+    with pytest.raises(ValueError):
+        lazy_import("os.path")
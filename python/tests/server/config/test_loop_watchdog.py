@@ -0,0 +1,69 @@
+"""Unit tests for the event loop watchdog."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.server.config import loop_watchdog
+from src.server.config.loop_watchdog import LOOP_BLOCKS, EventLoopWatchdog, watchdog_from_env
+
+
+def block_the_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_is_attributed_logged_and_counted(caplog):
+    watchdog = EventLoopWatchdog(threshold=0.05, interval=0.01)
+    watchdog.start()
+    try:
+        await asyncio.sleep(0.03)
+        block_the_loop(0.2)
+        await asyncio.sleep(0.05)
+    finally:
+        watchdog.stop()
+
+    [blocker] = watchdog.top_blockers()
+    assert blocker["site"].endswith("test_loop_watchdog.py:13 block_the_loop")
+    assert blocker["count"] == 1
+    assert 0.1 < blocker["max_seconds"] < 0.5
+    assert "time.sleep(seconds)" in blocker["stack"][-1]
+    assert LOOP_BLOCKS.value(site=blocker["site"]) >= 1
+    assert any("Event loop blocked" in record.message for record in caplog.records)
+
+
+@pytest.mark.asyncio
+async def test_short_pauses_are_ignored():
+    watchdog = EventLoopWatchdog(threshold=0.2, interval=0.01)
+    watchdog.start()
+    try:
+        block_the_loop(0.03)
+        await asyncio.sleep(0.05)
+    finally:
+        watchdog.stop()
+
+    assert watchdog.top_blockers() == []
+    assert not watchdog.running
+
+
+def test_watchdog_reads_toggle_and_threshold_from_env(monkeypatch):
+    monkeypatch.setenv("EVENT_LOOP_WATCHDOG_THRESHOLD_MS", "500")
+    assert watchdog_from_env().threshold == 0.5
+
+    monkeypatch.setenv("EVENT_LOOP_WATCHDOG_ENABLED", "false")
+    assert watchdog_from_env() is None
+
+
+def test_sites_beyond_the_label_limit_are_counted_as_other(monkeypatch):
+    monkeypatch.setattr(loop_watchdog, "MAX_SITES", 1)
+    watchdog = EventLoopWatchdog()
+
+    for site in ("a.py:1 first", "b.py:2 second"):
+        episode = loop_watchdog._Episode(blocked_since=0.0)
+        episode.sites[site] += 1
+        episode.stacks[site] = []
+        watchdog._record(episode, 0.3)
+
+    assert LOOP_BLOCKS.value(site="other") >= 1
+    assert {blocker["site"] for blocker in watchdog.top_blockers()} == {"a.py:1 first", "b.py:2 second"}
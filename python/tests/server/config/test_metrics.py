@@ -0,0 +1,113 @@
+"""Unit tests for the in-process metrics registry and its Prometheus rendering."""
+
+import asyncio
+
+import pytest
+
+from src.server.config import metrics
+from src.server.config.metrics import MetricsRegistry
+
+
+class TestCounter:
+    """Tests for counters."""
+
+    def test_counter_renders_labelled_totals(self):
+        registry = MetricsRegistry()
+        pages = registry.counter("test_pages_total", "Pages crawled", ["strategy"])
+
+        pages.inc(strategy="batch")
+        pages.inc(2, strategy="batch")
+        pages.inc(strategy='odd"name')
+
+        assert pages.value(strategy="batch") == 3
+        assert registry.render().splitlines() == [
+            "# HELP test_pages_total Pages crawled",
+            "# TYPE test_pages_total counter",
+            'test_pages_total{strategy="batch"} 3.0',
+            'test_pages_total{strategy="odd\\"name"} 1.0',
+        ]
+
+    def test_counter_rejects_decrease_and_wrong_labels(self):
+        counter = MetricsRegistry().counter("test_total", "Total", ["outcome"])
+
+        with pytest.raises(ValueError):
+            counter.inc(-1, outcome="success")
+        with pytest.raises(ValueError):
+            counter.inc(table="pages")
+
+
+class TestHistogram:
+    """Tests for histograms."""
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("test_seconds", "Latency", buckets=(0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value)
+
+        lines = registry.render().splitlines()
+        assert lines[2:] == [
+            'test_seconds_bucket{le="0.1"} 2',
+            'test_seconds_bucket{le="1.0"} 3',
+            'test_seconds_bucket{le="+Inf"} 4',
+            "test_seconds_sum 3.65",
+            "test_seconds_count 4",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_time_decorates_coroutines_and_blocks(self):
+        latency = MetricsRegistry().histogram("test_seconds", "Latency", ["rpc"])
+
+        @latency.time(rpc="match")
+        async def search():
+            return "done"
+
+        assert await search() == "done"
+        with latency.time(rpc="match"):
+            pass
+
+        assert search.__name__ == "search"
+        assert latency.count(rpc="match") == 2
+
+
+def test_registering_a_name_again_returns_the_same_metric():
+    registry = MetricsRegistry()
+    first = registry.counter("test_total", "Total")
+
+    assert registry.counter("test_total", "Total") is first
+    with pytest.raises(ValueError):
+        registry.histogram("test_total", "Total")
+
+
+def test_hot_path_metrics_are_registered():
+    # Importing the instrumented modules registers their metrics
+    from src.server.services.embeddings import embedding_service  # noqa: F401
+    from src.server.services.search import hybrid_search_strategy, reranking_strategy  # noqa: F401
+    from src.server.services.storage import document_storage_service  # noqa: F401
+
+    rendered = metrics.render_metrics()
+
+    for name in (
+        "archon_embedding_batch_seconds",
+        "archon_vector_search_seconds",
+        "archon_rerank_seconds",
+        "archon_document_storage_seconds",
+        "archon_rate_limit_wait_seconds",
+        "archon_event_loop_lag_seconds",
+    ):
+        assert f"# TYPE {name} histogram" in rendered
+
+
+@pytest.mark.asyncio
+async def test_event_loop_lag_monitor_is_started_once_per_loop():
+    before = metrics.EVENT_LOOP_LAG.count()
+
+    monitor = metrics.start_event_loop_lag_monitor(interval=0.001)
+    try:
+        assert metrics.start_event_loop_lag_monitor() is monitor
+        await asyncio.sleep(0.02)
+    finally:
+        monitor.cancel()
+
+    assert metrics.EVENT_LOOP_LAG.count() > before
@@ -0,0 +1,183 @@
+"""Tests for DocumentService per-document storage and revision checks."""
+
+from unittest.mock import MagicMock
+
+import httpx
+from postgrest.exceptions import APIError
+
+from src.server.services.projects.document_service import DocumentService
+from src.server.utils.etag_utils import change_versions
+
+
+def _rpc_client(result):
+    client = MagicMock()
+    client.rpc.return_value.execute.return_value.data = result
+    return client
+
+
+def _array_client(docs):
+    """Client whose document functions are missing, so the docs array is used."""
+    client = MagicMock()
+    client.rpc.side_effect = APIError(
+        {"code": "PGRST202", "message": "Could not find the function public.update_project_document"}
+    )
+    client.table.return_value.select.return_value.eq.return_value.execute.return_value.data = [
+        {"docs": docs}
+    ]
+    client.table.return_value.update.return_value.eq.return_value.execute.return_value.data = [
+        {"id": "p1"}
+    ]
+    return client
+
+
+def test_add_document_appends_through_rpc():
+    """New documents are appended in the database without reading the array."""
+    client = _rpc_client({"status": "ok", "document": {}})
+
+    success, result = DocumentService(client).add_document("p1", "spec", "API Spec")
+
+    assert success
+    assert result["document"]["title"] == "API Spec"
+    assert result["document"]["revision"] == 1
+    name, params = client.rpc.call_args.args
+    assert name == "add_project_document"
+    assert params["document_param"]["id"] == result["document"]["id"]
+    client.table.assert_not_called()
+    assert change_versions.snapshot("projects") == (1,)
+
+
+def test_rpc_timeout_does_not_fall_back_to_docs_array():
+    """A write that may have committed is reported as failed, not re-applied to the array."""
+    client = MagicMock()
+    client.rpc.return_value.execute.side_effect = httpx.ReadTimeout("timed out")
+
+    success, result = DocumentService(client).add_document("p1", "spec", "API Spec")
+
+    assert not success
+    assert "timed out" in result["error"]
+    client.table.assert_not_called()
+
+
+def test_database_errors_do_not_fall_back_to_docs_array():
+    client = MagicMock()
+    client.rpc.side_effect = APIError({"code": "40001", "message": "could not serialize access"})
+
+    success, _ = DocumentService(client).delete_document("p1", "d1")
+
+    assert not success
+    client.table.assert_not_called()
+
+
+def test_list_documents_uses_content_free_rpc_rows():
+    """Listings take metadata and content size from the database function."""
+    client = _rpc_client({
+        "status": "ok",
+        "documents": [{"id": "d1", "title": "Spec", "revision": 3, "content_size": 4096}],
+    })
+
+    success, result = DocumentService(client).list_documents("p1")
+
+    assert success
+    doc = result["documents"][0]
+    assert "content" not in doc
+    assert doc["revision"] == 3
+    assert doc["stats"]["content_size"] == 4096
+    client.table.assert_not_called()
+
+
+def test_get_document_reports_missing_document():
+    """A single-document fetch maps the function status to the usual error."""
+    client = _rpc_client({"status": "document_not_found"})
+
+    success, result = DocumentService(client).get_document("p1", "d9")
+
+    assert not success
+    assert "not found" in result["error"]
+
+
+def test_update_document_conflict_is_reported():
+    """A stale expected_revision is rejected without writing."""
+    client = _rpc_client({
+        "status": "conflict",
+        "current_revision": 4,
+        "document": {"id": "d1", "revision": 4},
+    })
+
+    success, result = DocumentService(client).update_document(
+        "p1", "d1", {"title": "New"}, expected_revision=3
+    )
+
+    assert not success
+    assert result["conflict"] is True
+    assert result["current_revision"] == 4
+    assert "not found" not in result["error"]
+    assert change_versions.snapshot("projects") == (0,)
+
+
+def test_update_document_versions_previous_docs_from_rpc():
+    """The version snapshot uses the pre-update array returned by the function."""
+    previous_docs = [{"id": "d1", "title": "Old", "revision": 1}]
+    client = _rpc_client({
+        "status": "ok",
+        "document": {"id": "d1", "title": "New", "revision": 2},
+        "previous_docs": previous_docs,
+    })
+    version_table = client.table.return_value
+    version_table.select.return_value.eq.return_value.eq.return_value.order.return_value.limit.return_value.execute.return_value.data = []
+    version_table.insert.return_value.execute.return_value.data = [{"id": "v1"}]
+
+    success, result = DocumentService(client).update_document(
+        "p1", "d1", {"title": "New", "revision": 99}, create_version=True, expected_revision=1
+    )
+
+    assert success
+    assert result["document"]["revision"] == 2
+    params = client.rpc.call_args.args[1]
+    assert params["fields_param"] == {"title": "New"}
+    assert params["expected_revision_param"] == 1
+    assert params["include_snapshot_param"] is True
+    client.table.assert_called_with("archon_document_versions")
+    assert version_table.insert.call_args.args[0]["content"] == previous_docs
+
+
+def test_update_document_does_not_snapshot_docs_by_default():
+    """Plain edits neither request the pre-update array nor write a version."""
+    client = _rpc_client({"status": "ok", "document": {"id": "d1", "title": "New", "revision": 2}})
+
+    success, _ = DocumentService(client).update_document("p1", "d1", {"title": "New"})
+
+    assert success
+    assert client.rpc.call_args.args[1]["include_snapshot_param"] is False
+    client.table.assert_not_called()
+
+
+def test_update_document_falls_back_to_docs_array():
+    """Without the functions, only the target document changes and its revision advances."""
+    docs = [
+        {"id": "d1", "title": "Old", "revision": 2},
+        {"id": "d2", "title": "Other"},
+    ]
+    client = _array_client(docs)
+
+    success, result = DocumentService(client).update_document(
+        "p1", "d1", {"title": "New"}, create_version=False, expected_revision=2
+    )
+
+    assert success
+    assert result["document"]["title"] == "New"
+    assert result["document"]["revision"] == 3
+    written = client.table.return_value.update.call_args.args[0]["docs"]
+    assert written[1] == {"id": "d2", "title": "Other"}
+    assert docs[0]["title"] == "Old"
+
+
+def test_delete_document_fallback_checks_revision():
+    """The array fallback still honours expected_revision."""
+    client = _array_client([{"id": "d1", "title": "Doc"}])
+
+    success, result = DocumentService(client).delete_document("p1", "d1", expected_revision=5)
+
+    assert not success
+    assert result["conflict"] is True
+    assert result["current_revision"] == 1
+    client.table.return_value.update.assert_not_called()
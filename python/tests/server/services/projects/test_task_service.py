@@ -0,0 +1,132 @@
+"""Tests for TaskService batch task counts."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import httpx
+from postgrest.exceptions import APIError
+
+from src.server.services.projects.task_service import TaskService
+from src.server.utils.etag_utils import change_versions
+
+
+def _rpc_client(rows):
+    client = MagicMock()
+    client.rpc.return_value.execute.return_value.data = rows
+    return client
+
+
+def test_task_counts_use_grouped_rpc():
+    """Counts come from one row per (project, status) aggregated in the database."""
+    client = _rpc_client([
+        {"project_id": "p1", "status": "todo", "task_count": 3},
+        {"project_id": "p1", "status": "done", "task_count": 1},
+        {"project_id": "p2", "status": "review", "task_count": 2},
+    ])
+
+    success, counts = TaskService(client).get_all_project_task_counts()
+
+    assert success
+    assert counts == {
+        "p1": {"todo": 3, "doing": 0, "review": 0, "done": 1},
+        "p2": {"todo": 0, "doing": 0, "review": 2, "done": 0},
+    }
+    client.rpc.assert_called_once_with("get_project_task_counts", {})
+    client.table.assert_not_called()
+
+
+def test_task_counts_fall_back_to_row_counting():
+    """Without the migration applied, rows are counted client-side."""
+    client = MagicMock()
+    client.rpc.side_effect = APIError(
+        {"code": "PGRST202", "message": "Could not find the function public.get_project_task_counts"}
+    )
+    client.table.return_value.select.return_value.or_.return_value.execute.return_value.data = [
+        {"project_id": "p1", "status": "todo"},
+        {"project_id": "p1", "status": "doing"},
+        {"project_id": "p1", "status": "doing"},
+    ]
+
+    success, counts = TaskService(client).get_all_project_task_counts()
+
+    assert success
+    assert counts == {"p1": {"todo": 1, "doing": 2, "review": 0, "done": 0}}
+
+
+def test_task_count_timeout_does_not_scan_task_rows():
+    """Only a missing function falls back; other RPC failures are reported as errors."""
+    client = MagicMock()
+    client.rpc.return_value.execute.side_effect = httpx.ReadTimeout("timed out")
+
+    success, result = TaskService(client).get_all_project_task_counts()
+
+    assert not success
+    assert "timed out" in result["error"]
+    client.table.assert_not_called()
+
+
+def test_task_counts_cache_is_invalidated_by_task_writes():
+    """Repeated polls hit the cache until a task write bumps the change counter."""
+    client = _rpc_client([{"project_id": "p1", "status": "todo", "task_count": 1}])
+    service = TaskService(client)
+
+    _, first = service.get_all_project_task_counts()
+    first["p1"]["todo"] = 99  # callers cannot corrupt the cached copy
+    _, second = service.get_all_project_task_counts()
+    assert second["p1"]["todo"] == 1
+    assert client.rpc.call_count == 1
+
+    change_versions.bump("tasks", "tasks:p1")
+    service.get_all_project_task_counts()
+    assert client.rpc.call_count == 2
+
+
+def _column_client(occupied, predecessor=None, tail=None):
+    """Mock the three task_order lookups made when inserting into a column."""
+    client = MagicMock()
+    column = client.table.return_value.select.return_value.eq.return_value.eq.return_value
+    column.eq.return_value.limit.return_value.execute.return_value.data = occupied
+    column.lt.return_value.order.return_value.limit.return_value.execute.return_value.data = predecessor or []
+    column.gte.return_value.execute.return_value.data = tail or []
+    return client
+
+
+async def test_allocate_task_order_uses_free_slot_without_writes():
+    """A requested position nobody holds is used as-is."""
+    client = _column_client(occupied=[])
+
+    order = await TaskService(client)._allocate_task_order("p1", "todo", 3000)
+
+    assert order == 3000
+    client.table.return_value.update.assert_not_called()
+
+
+async def test_allocate_task_order_takes_midpoint_below_occupied_slot():
+    """An occupied position is resolved by a key between the neighbours, not by shifting."""
+    client = _column_client(occupied=[{"id": "t2"}], predecessor=[{"task_order": 1000}])
+
+    order = await TaskService(client)._allocate_task_order("p1", "todo", 2000)
+
+    assert order == 1500
+    client.table.return_value.update.assert_not_called()
+
+
+async def test_allocate_task_order_shifts_and_rebalances_when_keys_exhausted():
+    """Without a gap the tail is shifted once and the column is respaced in the background."""
+    client = _column_client(
+        occupied=[{"id": "t2"}],
+        predecessor=[{"task_order": 1}],
+        tail=[{"id": "t2", "task_order": 2}, {"id": "t3", "task_order": 3}],
+    )
+    client.rpc.return_value.execute.return_value.data = 3
+    service = TaskService(client)
+
+    order = await service._allocate_task_order("p1", "todo", 2)
+    await asyncio.gather(*TaskService._background_tasks)
+
+    assert order == 2
+    assert client.table.return_value.update.call_count == 2
+    client.rpc.assert_called_once_with(
+        "rebalance_task_order",
+        {"project_id_param": "p1", "status_param": "todo", "step_param": TaskService.TASK_ORDER_STEP},
+    )
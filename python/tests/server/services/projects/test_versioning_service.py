@@ -0,0 +1,211 @@
+"""Tests for delta-encoded document version history."""
+
+from unittest.mock import MagicMock
+
+from postgrest.exceptions import APIError
+
+from src.server.services.projects.versioning_service import VersioningService
+
+
+class _VersionQuery:
+    """Just enough of the PostgREST query builder for archon_document_versions."""
+
+    def __init__(self, table):
+        self.table = table
+        self.filters = []
+        self.descending = False
+        self.row_limit = None
+        self.action = "select"
+        self.payload = None
+
+    def select(self, columns="*"):
+        return self
+
+    def insert(self, row):
+        self.action, self.payload = "insert", row
+        return self
+
+    def delete(self):
+        self.action = "delete"
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column, "snapshot" if column == "storage_kind" else None) == value)
+        return self
+
+    def lte(self, column, value):
+        self.filters.append(lambda row: row[column] <= value)
+        return self
+
+    def lt(self, column, value):
+        self.filters.append(lambda row: row[column] < value)
+        return self
+
+    def order(self, column, desc=False):
+        self.descending = desc
+        return self
+
+    def limit(self, count):
+        self.row_limit = count
+        return self
+
+    def execute(self):
+        response = MagicMock()
+        if self.action == "insert":
+            self.table.inserts += 1
+            if self.table.insert_errors:
+                raise self.table.insert_errors.pop(0)
+            self.table.rows.append(dict(self.payload))
+            response.data = [dict(self.payload)]
+            return response
+
+        matched = [row for row in self.table.rows if all(f(row) for f in self.filters)]
+        if self.action == "delete":
+            self.table.rows = [row for row in self.table.rows if row not in matched]
+            response.data = matched
+            return response
+
+        matched.sort(key=lambda row: row["version_number"], reverse=self.descending)
+        if self.row_limit is not None:
+            matched = matched[: self.row_limit]
+        self.table.reads += 1
+        response.data = [dict(row) for row in matched]
+        return response
+
+
+class _VersionTable:
+    def __init__(self):
+        self.rows = []
+        self.reads = 0
+        self.inserts = 0
+        self.insert_errors = []
+
+
+def _service():
+    table = _VersionTable()
+    client = MagicMock()
+    client.table.side_effect = lambda name: _VersionQuery(table)
+    return VersioningService(client), table
+
+
+def _docs(revision):
+    return [
+        {"id": "d1", "title": f"Spec r{revision}", "content": {"body": "x" * 500}},
+        {"id": "d2", "title": "Design", "content": {"body": "y" * 500}},
+    ]
+
+
+def test_versions_are_stored_as_deltas_between_snapshots():
+    """Version 1 and every SNAPSHOT_INTERVAL-th version are full; the rest are patches."""
+    service, table = _service()
+    for revision in range(1, 13):
+        assert service.create_version("p1", "docs", _docs(revision))[0]
+
+    kinds = {row["version_number"]: row["storage_kind"] for row in table.rows}
+    assert kinds[1] == "snapshot"
+    assert kinds[11] == "snapshot"
+    assert all(kinds[v] == "delta" for v in range(2, 11))
+    delta = next(row for row in table.rows if row["version_number"] == 5)
+    assert delta["base_version"] == 4
+    assert len(str(delta["content"])) < len(str(_docs(5)))
+
+
+def test_get_version_content_reconstructs_from_snapshot():
+    """Delta versions are rebuilt from the nearest snapshot in a single read."""
+    service, table = _service()
+    for revision in range(1, 8):
+        service.create_version("p1", "docs", _docs(revision))
+
+    VersioningService._latest_content.clear()
+    table.reads = 0
+    success, result = service.get_version_content("p1", "docs", 6)
+
+    assert success
+    assert result["content"] == _docs(6)
+    assert result["version"]["content"] == _docs(6)
+    assert table.reads == 1
+
+
+def test_delta_written_without_cache_reads_history():
+    """A fresh process can still diff against the previous version."""
+    service, table = _service()
+    service.create_version("p1", "docs", _docs(1))
+    VersioningService._latest_content.clear()
+
+    service.create_version("p1", "docs", _docs(2))
+
+    assert table.rows[-1]["storage_kind"] == "delta"
+    assert service.get_version_content("p1", "docs", 2)[1]["content"] == _docs(2)
+
+
+def test_list_versions_omits_content():
+    """Listings never return snapshots or patches."""
+    service, _ = _service()
+    service.create_version("p1", "docs", _docs(1))
+    service.create_version("p1", "docs", _docs(2))
+
+    success, result = service.list_versions("p1", "docs")
+
+    assert success
+    assert [v["version_number"] for v in result["versions"]] == [2, 1]
+    assert all("content" not in v for v in result["versions"])
+
+
+def test_compaction_keeps_recent_history_reconstructible():
+    """Old deltas are dropped; snapshots and every recent version remain."""
+    service, table = _service()
+    service.VERSION_RETENTION = 5
+    for revision in range(1, 26):
+        service.create_version("p1", "docs", _docs(revision))
+
+    success, result = service.compact_versions("p1", "docs")
+
+    assert success
+    remaining = {row["version_number"] for row in table.rows}
+    # Latest is 25, boundary 20, so history before snapshot 11 keeps only snapshots
+    assert {1, 11} <= remaining
+    assert not remaining & set(range(2, 11))
+    VersioningService._latest_content.clear()
+    for version in range(11, 26):
+        assert service.get_version_content("p1", "docs", version)[1]["content"] == _docs(version)
+
+
+def test_legacy_rows_without_storage_kind_are_snapshots():
+    """Versions written before the migration are read as full copies."""
+    service, table = _service()
+    table.rows.append({
+        "project_id": "p1", "field_name": "docs", "version_number": 1, "content": _docs(1)
+    })
+
+    success, result = service.get_version_content("p1", "docs", 1)
+
+    assert success
+    assert result["content"] == _docs(1)
+
+
+def test_missing_delta_columns_store_a_full_snapshot():
+    """Before migration 017 the version is inserted without storage columns."""
+    service, table = _service()
+    table.insert_errors.append(
+        APIError({"code": "PGRST204", "message": "Could not find the 'storage_kind' column"})
+    )
+
+    success, _ = service.create_version("p1", "docs", _docs(1))
+
+    assert success
+    assert table.inserts == 2
+    assert "storage_kind" not in table.rows[0]
+    assert table.rows[0]["content"] == _docs(1)
+
+
+def test_other_insert_errors_are_not_retried_as_snapshots():
+    """A failed delta insert is reported instead of being rewritten as a full copy."""
+    service, table = _service()
+    table.insert_errors.append(Exception("canceling statement due to statement timeout"))
+
+    success, result = service.create_version("p1", "docs", _docs(1))
+
+    assert not success
+    assert "statement timeout" in result["error"]
+    assert table.inserts == 1
+    assert table.rows == []
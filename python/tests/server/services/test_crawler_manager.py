@@ -0,0 +1,60 @@
+"""Tests for shared crawler initialization."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.server.services import crawler_manager
+
+
+class SlowCrawler:
+    launches = 0
+
+    def __init__(self, config):
+        self.config = config
+
+    async def __aenter__(self):
+        SlowCrawler.launches += 1
+        await asyncio.sleep(0.05)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    fake_crawl4ai = SimpleNamespace(BrowserConfig=lambda **kwargs: kwargs, AsyncWebCrawler=SlowCrawler)
+    monkeypatch.setattr(crawler_manager, "crawl4ai", fake_crawl4ai)
+    SlowCrawler.launches = 0
+    manager = crawler_manager.CrawlerManager()
+    yield manager
+    manager._crawler = None
+    manager._initialized = False
+    manager._initializing = None
+
+
+@pytest.mark.asyncio
+async def test_warm_up_and_first_crawl_share_one_browser_launch(manager):
+    warm_up = asyncio.create_task(crawler_manager.warm_up_crawler())
+    await asyncio.sleep(0)
+
+    crawlers = await asyncio.gather(manager.get_crawler(), manager.get_crawler())
+    await warm_up
+
+    assert SlowCrawler.launches == 1
+    assert crawlers[0] is crawlers[1] is manager._crawler
+
+
+@pytest.mark.asyncio
+async def test_failed_warm_up_is_retried_on_demand(manager, monkeypatch):
+    monkeypatch.setattr(crawler_manager, "crawl4ai", None)
+    await crawler_manager.warm_up_crawler()
+    assert not manager._initialized
+
+    monkeypatch.setattr(
+        crawler_manager, "crawl4ai", SimpleNamespace(BrowserConfig=lambda **kwargs: kwargs, AsyncWebCrawler=SlowCrawler)
+    )
+    assert await manager.get_crawler() is not None
+    assert SlowCrawler.launches == 1
@@ -0,0 +1,130 @@
+"""Tests for the per-operation ingestion settings snapshot."""
+
+import asyncio
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.server.services.crawling.code_extraction_service import CodeExtractionService
+from src.server.services.credential_service import SettingsSnapshot
+from src.server.services.ingestion_settings import (
+    IngestionSettings,
+    current_ingestion_settings,
+    use_ingestion_settings,
+)
+
+
+def _snapshot(**values):
+    return SettingsSnapshot(values=MappingProxyType(values), revision=1)
+
+
+def test_from_snapshot_parses_and_clamps_values():
+    """String settings become typed fields; unusable values fall back to defaults."""
+    settings = IngestionSettings.from_snapshot(_snapshot(
+        CRAWL_BATCH_SIZE="0",
+        EMBEDDING_BATCH_SIZE="64",
+        USE_CONTEXTUAL_EMBEDDINGS="true",
+        MAX_PROSE_RATIO="0.3",
+        MIN_CODE_BLOCK_LENGTH="not a number",
+    ))
+
+    assert settings.crawl_batch_size == 1
+    assert settings.embedding_batch_size == 64
+    assert settings.use_contextual_embeddings is True
+    assert settings.max_prose_ratio == 0.3
+    assert settings.min_code_block_length == 250
+    assert settings.values["EMBEDDING_BATCH_SIZE"] == "64"
+
+
+def test_flags_are_only_enabled_by_true():
+    """Flags keep the pipeline's "true"-only parsing; "1", "yes" and "on" do not enable them."""
+    settings = IngestionSettings.from_snapshot(_snapshot(
+        USE_CONTEXTUAL_EMBEDDINGS="1",
+        ENABLE_PROSE_FILTERING="yes",
+        ENABLE_CODE_SUMMARIES="TRUE",
+    ))
+
+    assert settings.use_contextual_embeddings is False
+    assert settings.enable_prose_filtering is False
+    assert settings.enable_code_summaries is True
+    assert settings.enable_diagram_filtering is True
+
+
+def test_settings_are_immutable():
+    """A resolved snapshot cannot be changed mid-operation."""
+    settings = IngestionSettings()
+    with pytest.raises(AttributeError):
+        settings.crawl_batch_size = 5
+
+
+async def test_tasks_inherit_pinned_settings():
+    """Tasks created while settings are in use keep them after the block exits."""
+    settings = IngestionSettings(embedding_batch_size=7)
+
+    async def read():
+        await asyncio.sleep(0)
+        return current_ingestion_settings()
+
+    with use_ingestion_settings(settings):
+        task = asyncio.create_task(read())
+
+    assert current_ingestion_settings() is None
+    assert await task is settings
+
+
+async def test_embeddings_use_pinned_settings_without_lookup():
+    """create_embeddings_batch skips the rag_strategy lookup during a crawl."""
+    from src.server.services.embeddings import embedding_service
+
+    adapter = MagicMock()
+    adapter.create_embeddings = AsyncMock(side_effect=lambda texts, model, **kwargs: [[0.1] * 3 for _ in texts])
+    client = MagicMock()
+    client_cm = MagicMock()
+    client_cm.__aenter__ = AsyncMock(return_value=client)
+    client_cm.__aexit__ = AsyncMock(return_value=None)
+    threading = MagicMock()
+    rate_limited = MagicMock()
+    rate_limited.__aenter__ = AsyncMock(return_value=None)
+    rate_limited.__aexit__ = AsyncMock(return_value=None)
+    threading.rate_limited_operation.return_value = rate_limited
+
+    with patch.object(embedding_service, "credential_service") as mock_cred, \
+            patch.object(embedding_service, "get_llm_client", return_value=client_cm), \
+            patch.object(embedding_service, "get_threading_service", return_value=threading), \
+            patch.object(embedding_service, "get_embedding_model", AsyncMock(return_value="m")), \
+            patch.object(embedding_service, "_get_embedding_adapter", return_value=adapter):
+        mock_cred.get_active_provider = AsyncMock(return_value={"provider": "openai"})
+        mock_cred.get_credentials_by_category = AsyncMock(return_value={})
+
+        with use_ingestion_settings(IngestionSettings(embedding_batch_size=2)):
+            result = await embedding_service.create_embeddings_batch(["a", "b", "c"])
+
+    mock_cred.get_credentials_by_category.assert_not_called()
+    assert adapter.create_embeddings.await_count == 2
+    assert result.success_count == 3
+
+
+async def test_code_extraction_resolves_settings_once():
+    """Standalone extraction loads each setting once, not per code block."""
+    service = CodeExtractionService(MagicMock())
+    service._get_setting = AsyncMock(side_effect=lambda key, default: default)
+    service._extract_code_blocks_from_documents = AsyncMock(return_value=[])
+
+    await service.extract_and_store_code_examples([], {}, "src")
+
+    assert service._get_setting.await_count == len(CodeExtractionService._SETTING_KEYS)
+    assert service._get_min_code_length() == 250
+
+
+async def test_code_extraction_uses_pinned_settings():
+    """During a crawl the extraction filters read the pinned snapshot."""
+    service = CodeExtractionService(MagicMock())
+    service._get_setting = AsyncMock()
+    service._extract_code_blocks_from_documents = AsyncMock(return_value=[])
+
+    with use_ingestion_settings(IngestionSettings(min_code_block_length=40)):
+        await service.extract_and_store_code_examples([], {}, "src")
+
+    service._get_setting.assert_not_called()
+    assert service._get_min_code_length() == 40
@@ -0,0 +1,104 @@
+"""
+Tests for incremental recrawl change detection
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src.server.services.crawling.helpers.page_change_detector import PageChangeDetector
+
+
+def _mock_client(rows):
+    client = MagicMock()
+    client.table.return_value.select.return_value.eq.return_value.execute.return_value.data = rows
+    return client
+
+
+def test_compute_content_hash_ignores_surrounding_whitespace():
+    """Hashes are stable across trailing whitespace differences"""
+    assert PageChangeDetector.compute_content_hash("# Title\nBody") == (
+        PageChangeDetector.compute_content_hash("  # Title\nBody\n\n")
+    )
+    assert PageChangeDetector.compute_content_hash("a") != PageChangeDetector.compute_content_hash("b")
+
+
+def test_extract_validators_is_case_insensitive():
+    """ETag and Last-Modified are read regardless of header casing"""
+    validators = PageChangeDetector.extract_validators(
+        {"ETag": '"abc"', "last-modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    )
+    assert validators == {"etag": '"abc"', "last_modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    assert PageChangeDetector.extract_validators(None) == {"etag": None, "last_modified": None}
+
+
+@pytest.mark.asyncio
+async def test_split_changed_skips_pages_with_matching_hash():
+    """Only pages whose content hash differs are returned for re-processing"""
+    unchanged_content = "# Unchanged\nSame as before"
+    detector = PageChangeDetector(_mock_client([
+        {
+            "url": "https://example.com/a",
+            "content_hash": PageChangeDetector.compute_content_hash(unchanged_content),
+            "etag": None,
+            "last_modified": None,
+        },
+        {
+            "url": "https://example.com/b",
+            "content_hash": PageChangeDetector.compute_content_hash("old content"),
+            "etag": None,
+            "last_modified": None,
+        },
+    ]))
+    await detector.load_known_pages("source-1")
+
+    changed, unchanged = detector.split_changed([
+        {"url": "https://example.com/a", "markdown": unchanged_content},
+        {"url": "https://example.com/b", "markdown": "new content"},
+        {"url": "https://example.com/c", "markdown": "brand new page"},
+    ])
+
+    assert unchanged == ["https://example.com/a"]
+    assert [doc["url"] for doc in changed] == ["https://example.com/b", "https://example.com/c"]
+
+
+@pytest.mark.asyncio
+async def test_load_known_pages_tolerates_missing_columns():
+    """A database error disables incremental mode instead of failing the crawl"""
+    client = MagicMock()
+    client.table.return_value.select.return_value.eq.return_value.execute.side_effect = Exception(
+        "column content_hash does not exist"
+    )
+    detector = PageChangeDetector(client)
+
+    assert await detector.load_known_pages("source-1") == {}
+
+
+@pytest.mark.asyncio
+async def test_find_unmodified_urls_uses_conditional_requests():
+    """304 responses mark a page as unmodified; URLs without validators are not checked"""
+    detector = PageChangeDetector(_mock_client([
+        {"url": "https://example.com/a", "content_hash": "h1", "etag": '"v1"', "last_modified": None},
+        {"url": "https://example.com/b", "content_hash": "h2", "etag": '"v2"', "last_modified": None},
+        {"url": "https://example.com/c", "content_hash": "h3", "etag": None, "last_modified": None},
+    ]))
+    await detector.load_known_pages("source-1")
+
+    requests_seen = []
+
+    async def fake_head(url, headers=None):
+        requests_seen.append((url, headers))
+        status = 304 if url.endswith("/a") else 200
+        return httpx.Response(status, headers={"etag": '"v3"'}, request=httpx.Request("HEAD", url))
+
+    with patch.object(httpx.AsyncClient, "head", new=AsyncMock(side_effect=fake_head)):
+        unmodified = await detector.find_unmodified_urls([
+            "https://example.com/a",
+            "https://example.com/b",
+            "https://example.com/c",
+        ])
+
+    assert unmodified == {"https://example.com/a"}
+    assert sorted(url for url, _ in requests_seen) == ["https://example.com/a", "https://example.com/b"]
+    assert dict(requests_seen)["https://example.com/a"] == {"If-None-Match": '"v1"'}
@@ -0,0 +1,53 @@
+"""Tests for shared CrossEncoder loading."""
+
+import asyncio
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.server.services.search import reranking_strategy
+from src.server.services.search.reranking_strategy import RerankingStrategy, warm_up_reranker
+
+
+@pytest.fixture
+def slow_cross_encoder(monkeypatch):
+    """A CrossEncoder stand-in whose load blocks until released."""
+    release = threading.Event()
+    loads = []
+
+    class SlowCrossEncoder:
+        def __init__(self, model_name):
+            loads.append(model_name)
+            release.wait(5)
+
+    monkeypatch.setitem(sys.modules, "sentence_transformers", SimpleNamespace(CrossEncoder=SlowCrossEncoder))
+    monkeypatch.setattr(reranking_strategy, "CROSSENCODER_AVAILABLE", True)
+    monkeypatch.setattr(reranking_strategy, "_models", {})
+    monkeypatch.setattr(reranking_strategy, "_loading", set())
+    yield release, loads
+    release.set()
+
+
+@pytest.mark.asyncio
+async def test_queries_skip_reranking_instead_of_waiting_for_warm_up(slow_cross_encoder):
+    """A strategy built while the warm-up loads the model returns at once without a model"""
+    release, loads = slow_cross_encoder
+    warm_up = asyncio.create_task(warm_up_reranker("model"))
+    while not loads:
+        await asyncio.sleep(0.01)
+
+    started = time.perf_counter()
+    during_load = RerankingStrategy("model")
+
+    assert time.perf_counter() - started < 0.5
+    assert not during_load.is_available()
+
+    release.set()
+    assert await warm_up is True
+    after_load = RerankingStrategy("model")
+    assert after_load.is_available()
+    assert after_load.model is RerankingStrategy("model").model
+    assert loads == ["model"]
@@ -4,7 +4,7 @@ import json
 
 import pytest
 
-from src.server.utils.etag_utils import check_etag, generate_etag
+from src.server.utils.etag_utils import ChangeVersionTracker, check_etag, generate_etag
 
 
 class TestGenerateEtag:
@@ -188,4 +188,50 @@ class TestEtagIntegration:
         etag3 = generate_etag(progress_data)
         
         assert etag2 != etag3
-        assert not check_etag(etag2, etag3)
\ No newline at end of file
+        assert not check_etag(etag2, etag3)
+
+
+class TestChangeVersionTracker:
+    """Tests for the change counters behind 304 short-circuits."""
+
+    def test_remembered_etag_is_not_modified_until_bump(self):
+        """A remembered ETag stays valid until one of its scopes is bumped."""
+        tracker = ChangeVersionTracker()
+        versions = tracker.snapshot("tasks:p1")
+        tracker.remember("tasks:p1", '"abc"', versions)
+
+        assert tracker.is_not_modified("tasks:p1", '"abc"', "tasks:p1") is True
+        assert tracker.is_not_modified("tasks:p1", '"other"', "tasks:p1") is False
+        assert tracker.is_not_modified("tasks:p1", None, "tasks:p1") is False
+
+        tracker.bump("tasks", "tasks:p2")
+        assert tracker.is_not_modified("tasks:p1", '"abc"', "tasks:p1") is True
+
+        tracker.bump("tasks:p1")
+        assert tracker.is_not_modified("tasks:p1", '"abc"', "tasks:p1") is False
+
+    def test_write_during_read_invalidates_remembered_etag(self):
+        """Versions are captured before the read, so concurrent writes are not masked."""
+        tracker = ChangeVersionTracker()
+        versions = tracker.snapshot("projects")
+        tracker.bump("projects")  # write lands while the query is running
+        tracker.remember("projects", '"abc"', versions)
+
+        assert tracker.is_not_modified("projects", '"abc"', "projects") is False
+
+    def test_entries_expire_after_revalidation_window(self):
+        """Old entries force a re-read to pick up out-of-process writes."""
+        tracker = ChangeVersionTracker(revalidate_after=-1)
+        tracker.remember("projects", '"abc"', tracker.snapshot("projects"))
+
+        assert tracker.is_not_modified("projects", '"abc"', "projects") is False
+
+    def test_remembered_etags_are_bounded(self):
+        """Only the most recently stored keys are kept."""
+        tracker = ChangeVersionTracker(max_etags=2)
+        for key in ("tasks:p1", "tasks:p2", "tasks:p3"):
+            tracker.remember(key, '"abc"', tracker.snapshot(key))
+
+        assert tracker.is_not_modified("tasks:p1", '"abc"', "tasks:p1") is False
+        assert tracker.is_not_modified("tasks:p3", '"abc"', "tasks:p3") is True
+        assert len(tracker._etags) == 2
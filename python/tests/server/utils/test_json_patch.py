@@ -0,0 +1,50 @@
+"""Tests for the JSON Patch helpers used by delta version storage."""
+
+import pytest
+
+from src.server.utils.json_patch import JsonPatchError, apply_patch, make_patch
+
+
+@pytest.mark.parametrize(
+    "src,dst",
+    [
+        ({"a": 1}, {"a": 1}),
+        ({"a": 1, "b": 2}, {"a": 1, "c": 3}),
+        ({"a": {"b": [1, 2, 3]}}, {"a": {"b": [1, 4, 3]}}),
+        ([1, 2, 3], [1, 2, 3, 4, 5]),
+        ([1, 2, 3, 4, 5], [1, 5]),
+        ([{"id": "d1", "title": "A"}, {"id": "d2"}], [{"id": "d1", "title": "B"}, {"id": "d2"}]),
+        ({"a/b": 1, "c~d": 2}, {"a/b": 2}),
+        ({"flag": 1}, {"flag": True}),
+        ([], {"now": "an object"}),
+    ],
+)
+def test_patch_round_trip(src, dst):
+    """Applying the generated patch reproduces the target value."""
+    assert apply_patch(src, make_patch(src, dst)) == dst
+
+
+def test_single_document_edit_produces_small_patch():
+    """Editing one element of a large array only touches that element."""
+    docs = [{"id": f"d{i}", "content": {"body": "x" * 200}} for i in range(20)]
+    updated = [dict(doc) for doc in docs]
+    updated[7] = {**docs[7], "title": "New"}
+
+    patch = make_patch(docs, updated)
+
+    assert patch == [{"op": "add", "path": "/7/title", "value": "New"}]
+
+
+def test_apply_patch_does_not_mutate_input():
+    """The source document is copied before patching."""
+    src = {"items": [1, 2]}
+    apply_patch(src, [{"op": "add", "path": "/items/-", "value": 3}])
+    assert src == {"items": [1, 2]}
+
+
+def test_apply_patch_rejects_missing_paths():
+    """Patches that do not match the document raise JsonPatchError."""
+    with pytest.raises(JsonPatchError):
+        apply_patch({"a": 1}, [{"op": "replace", "path": "/b", "value": 2}])
+    with pytest.raises(JsonPatchError):
+        apply_patch([1], [{"op": "remove", "path": "/3"}])
@@ -10,6 +10,14 @@ def test_health_endpoint(client):
     assert data["status"] in ["healthy", "initializing"]
 
 
+def test_metrics_endpoint(client):
+    """Test that metrics are served in the Prometheus text format."""
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE archon_embedding_batch_seconds histogram" in response.text
+
+
 def test_create_project(client, test_project, mock_supabase_client):
     """Test creating a new project via API."""
     # Set up mock to return a project
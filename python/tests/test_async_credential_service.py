@@ -10,6 +10,7 @@ import os
 from unittest.mock import MagicMock, patch
 
 import pytest
+from postgrest.exceptions import APIError
 
 from src.server.services.credential_service import (
     credential_service,
@@ -336,3 +337,122 @@ class TestAsyncCredentialService:
         result2 = await get_credential("PERSISTENT_KEY", "default")
         assert result2 == "persistent_value"
         assert result1 == result2
+
+
+class TestCredentialCaching:
+    """Tests for decrypted-value caching, settings snapshots and change detection"""
+
+    @pytest.fixture(autouse=True)
+    def reset_service(self):
+        """Start each test with empty caches and no known settings revision"""
+        credential_service._cache = {}
+        credential_service._cache_initialized = False
+        credential_service._settings_snapshot = None
+        credential_service._settings_revision = None
+        credential_service._revision_available = True
+        yield
+        credential_service._cache = {}
+        credential_service._cache_initialized = False
+        credential_service._settings_snapshot = None
+        credential_service._settings_revision = None
+        credential_service._revision_available = True
+
+    def test_decryption_derives_key_once(self):
+        """Repeated decrypts reuse the derived key and the decrypted value"""
+        encrypted = credential_service._encrypt_value("sk-secret")
+
+        with patch.object(
+            credential_service, "_get_encryption_key", wraps=credential_service._get_encryption_key
+        ) as derive:
+            credential_service._fernet = None
+            assert credential_service._decrypt_value(encrypted) == "sk-secret"
+            assert credential_service._decrypt_value(encrypted) == "sk-secret"
+            assert derive.call_count == 1
+
+    def test_get_setting_is_sync_and_decrypts(self):
+        """Loaded settings can be read without awaiting"""
+        credential_service._cache = {
+            "MODEL_CHOICE": "gpt-4.1-nano",
+            "USE_RERANKING": "true",
+            "OPENAI_API_KEY": {
+                "encrypted_value": credential_service._encrypt_value("sk-test"),
+                "is_encrypted": True,
+            },
+        }
+        credential_service._cache_initialized = True
+
+        assert credential_service.get_setting("MODEL_CHOICE") == "gpt-4.1-nano"
+        assert credential_service.get_setting("OPENAI_API_KEY") == "sk-test"
+        assert credential_service.get_setting("MISSING", "fallback") == "fallback"
+        assert credential_service.get_bool_setting("USE_RERANKING") is True
+
+    @pytest.mark.asyncio
+    async def test_settings_snapshot_is_typed_and_immutable(self):
+        """Snapshots are reused until settings change and cannot be modified"""
+        credential_service._cache = {"MAX_WORKERS": "4", "USE_HYBRID_SEARCH": "false"}
+        credential_service._cache_initialized = True
+
+        snapshot = await credential_service.get_settings_snapshot()
+        assert snapshot.get_int("MAX_WORKERS", 1) == 4
+        assert snapshot.get_bool("USE_HYBRID_SEARCH", True) is False
+        assert snapshot.get_float("MISSING", 0.5) == 0.5
+        assert await credential_service.get_settings_snapshot() is snapshot
+        with pytest.raises(TypeError):
+            snapshot.values["MAX_WORKERS"] = "8"
+
+    @pytest.mark.asyncio
+    async def test_refresh_reloads_when_revision_changes(self):
+        """A bumped revision from another process reloads the settings"""
+        credential_service._cache = {"MODEL_CHOICE": "old"}
+        credential_service._cache_initialized = True
+        credential_service._settings_revision = 3
+
+        async def reload():
+            credential_service._cache = {"MODEL_CHOICE": "new"}
+            credential_service._cache_initialized = True
+
+        with patch.object(credential_service, "_fetch_settings_revision", return_value=3), \
+                patch.object(credential_service, "load_all_credentials", side_effect=reload) as load:
+            assert await credential_service.refresh_if_changed() is False
+            load.assert_not_called()
+
+        with patch.object(credential_service, "_fetch_settings_revision", return_value=4), \
+                patch.object(credential_service, "load_all_credentials", side_effect=reload):
+            assert await credential_service.refresh_if_changed() is True
+
+        assert credential_service._settings_revision == 4
+        assert credential_service.get_setting("MODEL_CHOICE") == "new"
+
+    @pytest.mark.asyncio
+    async def test_first_revision_is_recorded_without_reloading(self):
+        """Settings loaded at startup are not loaded again by the first check"""
+        credential_service._cache_initialized = True
+
+        with patch.object(credential_service, "_fetch_settings_revision", return_value=7), \
+                patch.object(credential_service, "load_all_credentials") as load:
+            assert await credential_service.refresh_if_changed() is False
+            load.assert_not_called()
+
+        assert credential_service._settings_revision == 7
+
+    @pytest.mark.asyncio
+    async def test_refresh_ignores_transient_revision_errors(self):
+        """A failed revision query is retried on the next poll"""
+        with patch.object(
+            credential_service, "_fetch_settings_revision", side_effect=Exception("connection reset")
+        ) as fetch:
+            assert await credential_service.refresh_if_changed() is False
+            assert await credential_service.refresh_if_changed() is False
+
+        assert fetch.call_count == 2
+        assert credential_service._revision_available is True
+
+    @pytest.mark.asyncio
+    async def test_watcher_stops_when_revision_table_is_missing(self):
+        """Without the migration the watcher queries once and exits"""
+        missing = APIError({"code": "42P01", "message": 'relation "archon_settings_revision" does not exist'})
+        with patch.object(credential_service, "_fetch_settings_revision", side_effect=missing) as fetch:
+            await asyncio.wait_for(credential_service.watch_for_changes(interval=0.01), timeout=1)
+
+        assert fetch.call_count == 1
+        assert credential_service._revision_available is False
@@ -0,0 +1,66 @@
+"""Smoke tests for the offline ingestion benchmark harness."""
+
+import pytest
+
+from benchmarks.ingestion import (
+    HIGHER_IS_BETTER,
+    LOWER_IS_BETTER,
+    IngestionBenchmarkConfig,
+    run_ingestion_benchmark,
+)
+from benchmarks.results import compare_results
+from benchmarks.stand_ins import FixtureSite, InMemorySupabaseClient, hashed_embedding
+from src.server.services.credential_service import credential_service
+
+
+def test_fixture_site_depth_reaches_every_page():
+    site = FixtureSite(pages=21, fanout=4)
+
+    assert site.depth == 3
+    assert site.children(0) == [1, 2, 3, 4]
+    assert site.children(5) == [] and site.children(4) == [17, 18, 19, 20]
+    assert site.index_for(site.url_for(20)) == 20
+    assert site.index_for(f"{site.base_url}/docs/page-21") is None
+
+
+def test_in_memory_supabase_upsert_and_filters():
+    client = InMemorySupabaseClient()
+
+    first = client.table("pages").upsert([{"url": "a", "n": 1}, {"url": "b", "n": 2}], on_conflict="url").execute()
+    again = client.table("pages").upsert({"url": "a", "n": 3}, on_conflict="url").execute()
+
+    assert again.data[0]["id"] == first.data[0]["id"]
+    assert [row["n"] for row in client.table("pages").select("*").order("n", desc=True).execute().data] == [3, 2]
+    assert client.table("pages").delete().in_("url", ["b"]).execute().data[0]["url"] == "b"
+    assert client.table("pages").select("*", count="exact").execute().count == 1
+
+
+def test_hashed_embeddings_are_deterministic_and_normalized():
+    vector = hashed_embedding("async worker pipeline", 64)
+
+    assert vector == hashed_embedding("async worker pipeline", 64)
+    assert abs(sum(value * value for value in vector) - 1.0) < 1e-9
+
+
+@pytest.mark.asyncio
+async def test_benchmark_runs_full_pipeline_offline():
+    """A tiny site is crawled, chunked, embedded and stored without external services"""
+    cache_before = credential_service._cache
+
+    result = await run_ingestion_benchmark(IngestionBenchmarkConfig(pages=6, fanout=2, embedding_dimensions=768))
+
+    metrics = result["metrics"]
+    assert metrics["pages"] == 6
+    assert metrics["chunks_stored"] >= 6
+    assert metrics["code_examples"] > 0
+    assert metrics["texts_embedded"] >= metrics["chunks_stored"]
+    assert metrics["pages_per_second"] > 0
+    for stage in ("crawl", "chunking", "chunk_storage", "embedding", "code_extraction"):
+        assert result["stages"][stage]["calls"] > 0
+    assert credential_service._cache is cache_before
+
+    assert compare_results(result, result, HIGHER_IS_BETTER, LOWER_IS_BETTER) == []
+    slower = {**result, "metrics": {**metrics, "pages_per_second": metrics["pages_per_second"] / 2}}
+    assert [r.metric for r in compare_results(slower, result, HIGHER_IS_BETTER, LOWER_IS_BETTER)] == [
+        "pages_per_second"
+    ]
@@ -0,0 +1,63 @@
+"""Smoke tests for the offline RAG query benchmark harness."""
+
+import pytest
+
+from benchmarks.rag import RagBenchmarkConfig, build_schedule, run_rag_benchmark
+from benchmarks.stand_ins import InMemorySupabaseClient, InMemoryVectorSearch, hashed_embedding
+from benchmarks.timing import percentile
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(n) for n in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 95) == 0.0
+
+
+def test_schedule_is_deterministic_and_weighted():
+    queries = [{"kind": "rag", "query": "a", "weight": 9}, {"kind": "code", "query": "b", "weight": 1}]
+
+    schedule = build_schedule(queries, 200, seed=3)
+
+    assert schedule == build_schedule(queries, 200, seed=3)
+    assert sum(entry["query"] == "a" for entry in schedule) > 150
+
+
+def test_in_memory_hybrid_search_labels_match_types():
+    client = InMemorySupabaseClient()
+    for content in ("deploy workers on kubernetes", "kubernetes", "install the client library"):
+        client.table("archon_crawled_pages").insert(
+            {"content": content, "metadata": {}, "source_id": "s", "embedding_768": hashed_embedding(content, 768)}
+        ).execute()
+    InMemoryVectorSearch(client).install()
+
+    params = {"query_embedding": hashed_embedding("deploy workers", 768), "query_text": "kubernetes", "match_count": 5}
+    results = client.rpc("hybrid_search_archon_crawled_pages", params).execute().data
+
+    assert [(r["content"], r["match_type"]) for r in results] == [
+        ("deploy workers on kubernetes", "hybrid"),
+        ("kubernetes", "keyword"),
+    ]
+    vector_only = client.rpc("match_archon_crawled_pages", params).execute().data
+    assert [r["content"] for r in vector_only] == ["deploy workers on kubernetes"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("hybrid", [True, False])
+async def test_benchmark_replays_query_mix_offline(hybrid):
+    """Queries run through RAGService against an ingested corpus without external services"""
+    config = RagBenchmarkConfig(
+        requests=24, concurrency=3, corpus_pages=6, hybrid=hybrid, embedding_dimensions=768, rerank_latency_per_pair=0
+    )
+
+    result = await run_rag_benchmark(config)
+
+    metrics = result["metrics"]
+    assert metrics["errors"] == 0, result.get("errors")
+    assert metrics["requests"] == 24 and metrics["throughput_qps"] > 0
+    stages = result["stages"]
+    assert stages["query.rag"]["calls"] + stages["query.code"]["calls"] == 24
+    for stage in ("embed", "vector_rpc", "rerank", "hybrid_fusion" if hybrid else "vector_search"):
+        assert stages[stage]["calls"] > 0
+        assert stages[stage]["p50_ms"] <= stages[stage]["p99_ms"] <= stages[stage]["max_ms"]
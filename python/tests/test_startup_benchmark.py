@@ -0,0 +1,32 @@
+"""Smoke tests for the server startup benchmark."""
+
+from benchmarks.startup import StartupBenchmarkConfig, package_of, parse_importtime, run_probe
+
+
+def test_parse_importtime_and_grouping():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   fastapi.routing\n"
+        "import time:      3000 |       3120 | src.server.services.crawling.code_extraction_service\n"
+        "some log line\n"
+    )
+
+    timings = parse_importtime(stderr)
+
+    assert timings == {
+        "fastapi.routing": (120, 120),
+        "src.server.services.crawling.code_extraction_service": (3000, 3120),
+    }
+    assert package_of("fastapi.routing") == "fastapi"
+    assert package_of("src.server.services.crawling.code_extraction_service") == "src.server.services.crawling"
+
+
+def test_server_starts_without_heavy_imports_or_waiting_for_the_browser():
+    """Importing the server defers crawl4ai/openai/PDF libraries and readiness skips the browser launch"""
+    config = StartupBenchmarkConfig(repeat=1, browser_launch=3.0)
+
+    report, timings = run_probe(config)
+
+    assert report["loaded"] == []
+    assert "src.server.main" in timings
+    assert report["ready_seconds"] - report["import_seconds"] < config.browser_launch
@@ -3,6 +3,8 @@
 import time
 from unittest.mock import MagicMock, patch
 
+from postgrest.exceptions import APIError
+
 
 def test_batch_task_counts_endpoint_exists(client):
     """Test that batch task counts endpoint exists and responds."""
@@ -40,6 +42,10 @@ def test_batch_task_counts_endpoint(client, mock_supabase_client):
     mock_or.execute.return_value = mock_execute
     mock_select.or_.return_value = mock_or
     mock_supabase_client.table.return_value.select.return_value = mock_select
+    # Grouped count function not installed: exercise the row-counting fallback
+    mock_supabase_client.rpc.side_effect = APIError(
+        {"code": "PGRST202", "message": "Could not find the function public.get_project_task_counts"}
+    )
     
     # Explicitly patch the client creation for this specific test to ensure isolation
     with patch("src.server.utils.get_supabase_client", return_value=mock_supabase_client):
@@ -95,6 +101,10 @@ def test_batch_task_counts_etag_caching(client, mock_supabase_client):
     mock_or.execute.return_value = mock_execute
     mock_select.or_.return_value = mock_or
     mock_supabase_client.table.return_value.select.return_value = mock_select
+    # Grouped count function not installed: exercise the row-counting fallback
+    mock_supabase_client.rpc.side_effect = APIError(
+        {"code": "PGRST202", "message": "Could not find the function public.get_project_task_counts"}
+    )
     
     # Explicitly patch the client creation for this specific test to ensure isolation
     with patch("src.server.utils.get_supabase_client", return_value=mock_supabase_client):
@@ -5,7 +5,9 @@ Ensures backward compatibility and validates token reduction.
 
 import json
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
+
+from postgrest.exceptions import APIError
 
 from src.server.services.projects import ProjectService
 from src.server.services.projects.task_service import TaskService
@@ -115,9 +117,103 @@ class TestProjectServiceOptimization:
         assert project["stats"]["features_count"] == 2
         assert project["stats"]["has_data"] is True
         
-        # Verify SELECT * was used (after N+1 fix, we fetch all data in one query)
-        mock_table.select.assert_called_with("*")
+        # Verify the lightweight columns were projected in the single query
+        mock_table.select.assert_called_with(ProjectService.LIGHTWEIGHT_COLUMNS)
         assert mock_client.table.call_count == 1  # Only one query now!
+
+    @patch('src.server.utils.get_supabase_client')
+    def test_list_projects_paginates_in_database(self, mock_supabase):
+        """Test limit/offset/search are pushed into the query with an exact count."""
+        mock_client = MagicMock()
+        mock_supabase.return_value = mock_client
+
+        mock_response = Mock()
+        mock_response.data = [{
+            "id": "p-11",
+            "title": "Auth service",
+            "description": "",
+            "github_repo": None,
+            "created_at": "2024-01-01",
+            "updated_at": "2024-01-01",
+            "pinned": False,
+            "docs_count": 4,
+            "features_count": 1,
+            "has_data": False,
+        }]
+        mock_response.count = 42
+
+        query = mock_client.table.return_value.select.return_value
+        query.or_.return_value.order.return_value.range.return_value.execute.return_value = mock_response
+
+        service = ProjectService(mock_client)
+        success, result = service.list_projects(
+            include_content=False, limit=10, offset=10, search="auth"
+        )
+
+        assert success
+        assert result["total_count"] == 42
+        assert result["projects"][0]["stats"] == {
+            "docs_count": 4,
+            "features_count": 1,
+            "has_data": False,
+        }
+        mock_client.table.return_value.select.assert_called_with(
+            ProjectService.LIGHTWEIGHT_COLUMNS, count="exact"
+        )
+        query.or_.assert_called_with('title.ilike."%auth%",description.ilike."%auth%"')
+        query.or_.return_value.order.return_value.range.assert_called_with(10, 19)
+
+    def test_search_term_is_escaped_and_quoted(self):
+        """Test wildcards match literally and filter delimiters stay inside the quoted value."""
+        assert ProjectService._ilike_pattern("50%_off") == '"%50\\\\%\\\\_off%"'
+        assert ProjectService._ilike_pattern("a,b.(c)") == '"%a,b.(c)%"'
+        assert ProjectService._ilike_pattern('say "hi"') == '"%say \\"hi\\"%"'
+        assert ProjectService._ilike_pattern("a*b") == '"%a_b%"'
+
+    @patch('src.server.utils.get_supabase_client')
+    def test_list_projects_does_not_fall_back_on_other_errors(self, mock_supabase):
+        """Test only a missing column/function retries the query with every column."""
+        mock_client = MagicMock()
+        mock_supabase.return_value = mock_client
+        mock_table = mock_client.table.return_value
+        mock_table.select.return_value.order.return_value.execute.side_effect = Exception(
+            "canceling statement due to statement timeout"
+        )
+
+        service = ProjectService(mock_client)
+        success, result = service.list_projects(include_content=False)
+
+        assert not success
+        assert "statement timeout" in result["error"]
+        mock_table.select.assert_called_once_with(ProjectService.LIGHTWEIGHT_COLUMNS)
+
+    @patch('src.server.utils.get_supabase_client')
+    def test_list_projects_falls_back_when_computed_columns_are_missing(self, mock_supabase):
+        """Test a missing computed column (migration 015 not applied) selects full rows."""
+        mock_client = MagicMock()
+        mock_supabase.return_value = mock_client
+        mock_table = mock_client.table.return_value
+        full_response = Mock()
+        full_response.data = [{
+            "id": "p-1",
+            "title": "P",
+            "created_at": "2024-01-01",
+            "updated_at": "2024-01-01",
+            "docs": [{"id": "d"}],
+            "features": [],
+            "data": [],
+        }]
+        mock_table.select.return_value.order.return_value.execute.side_effect = [
+            APIError({"code": "42703", "message": "column archon_projects.docs_count does not exist"}),
+            full_response,
+        ]
+
+        service = ProjectService(mock_client)
+        success, result = service.list_projects(include_content=False)
+
+        assert success
+        assert result["projects"][0]["stats"]["docs_count"] == 1
+        assert mock_table.select.call_args_list[-1].args == ("*",)
     
     def test_token_reduction(self):
         """Verify token count reduction."""